@@ -8,6 +8,7 @@ from typing import List, Dict, Any
 from pydantic import BaseModel
 from fastapi import HTTPException
 
+from core.config.deadline import DeadlineExceededError
 from core.workflow.batch_question_generator import generate_questions_batch, BatchQuestionItem
 
 
@@ -84,6 +85,8 @@ async def batch_generate_questions(
             performance_improvement=improvement
         )
 
+    except (DeadlineExceededError, HTTPException):
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
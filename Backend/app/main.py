@@ -1,8 +1,8 @@
+import copy
 import time
 import json
 import os
 import re
-import httpx
 import tempfile
 import hashlib
 import asyncio
@@ -11,31 +11,55 @@ from pathlib import Path
 # ThreadPoolExecutor removed - using asyncio.gather for parallel async operations
 from fastapi import FastAPI, HTTPException, UploadFile, File, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse, JSONResponse, Response
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 from pydantic import BaseModel
-from typing import Optional
-from google import genai
-from openai import OpenAI
+from typing import Any, Optional
 from dotenv import load_dotenv
 from formats.toon import to_toon, from_toon
-from app.config import get_toon_prompt, get_json_prompt, get_cv_prompt, get_detailed_gap_analysis_prompt, get_compressed_gap_analysis_prompt, get_question_generation_prompt, get_answer_analysis_prompt, get_resume_rewrite_prompt, get_domain_finder_prompt
-from core.caching.embeddings import calculate_overall_compatibility
+from app.config import get_toon_prompt, get_detailed_gap_analysis_prompt, get_compressed_gap_analysis_prompt, get_question_generation_prompt, get_answer_analysis_prompt, get_resume_rewrite_prompt, get_domain_finder_prompt
+from core.caching.embeddings import calculate_overall_compatibility, update_overall_compatibility
 from core.caching.vector_store import get_qdrant_manager
 from core.caching.cache import get_cache
-from core.caching.gemini_cache import generate_with_cache, get_prompt_cache_stats
+from core.utils import fast_json
+from core.caching.role_classifier import get_role_classifier
+from core.caching.industry_gazetteer import get_industry_gazetteer
+from core.persistence.cold_store import get_cold_store
+from core.caching.result_cache import get_result_raw, get_results_raw_batch, store_result_raw
+from core.caching.document_store import DOCUMENT_KINDS, get_document_store, is_valid_doc_id, content_hash, doc_id_hash
+from core.caching.context_selection import budget_cv_context
+from core.config.model_routing import select_route, record_invalid_output
+from core.workflow.stage_graph import StageGraph, StageGraphRun
+from core.workflow.job_queue import get_job_queue
+from core.caching.gemini_cache import generate_with_cache_async, get_prompt_cache_stats
 from core.config.llm_fallback import (
     generate_with_fallback,
     generate_with_fallback_async,
     generate_validated_json_async,
+    stream_with_fallback_async,
+    stream_json_sections_async,
     gemini_client as fallback_gemini_client,
     JSONValidationError,
 )
-from core.config.json_validators import ScoreMessageResponse, AnswerEvaluationResponse
+from core.config.json_validators import ScoreMessageResponse, AnswerEvaluationResponse, IndustryBatchResponse, RoleBatchResponse
+from core.config.settings import settings
+from core.config.clients import get_gemini_client, get_openai_client, get_http_client
 from core.caching.embeddings_fallback import get_embedding_with_fallback
 from core.monitoring.metrics_collector import get_metrics_collector
+from core.monitoring.token_usage import current_endpoint
+from core.config.deadline import (
+    DEADLINE_HEADER,
+    DeadlineExceededError,
+    deadline_exceeded,
+    get_endpoint_budget,
+    reset_deadline,
+    set_deadline,
+)
 from app.metrics_endpoints import router as metrics_router
+from app.models.parsing import ParseResponse, CVParseResponse
+from app.services.parsing import DOC_ID_PATTERN, PARSE_MIN_CHARS, normalize_parse_input, parse_cache_key, run_parse
 
 # Load environment variables
 load_dotenv()
@@ -67,27 +91,134 @@ app.add_middleware(
 # Include metrics endpoints router (Phase 3.1)
 app.include_router(metrics_router)
 
-# Create persistent HTTP/2 client with connection pooling for performance
-# This reuses connections and enables HTTP/2 for 30-50% speed improvement
-http_client = httpx.Client(
-    http2=True,  # Enable HTTP/2 for faster requests
-    timeout=30.0,  # Longer timeout for LLM requests
-    limits=httpx.Limits(
-        max_keepalive_connections=10,  # Connection pool size
-        keepalive_expiry=30.0  # Keep connections alive for 30 seconds
-    )
-)
 
-# Initialize clients with optimized HTTP client
-gemini_client = genai.Client(api_key=os.getenv("GEMINI_API_KEY"))
-openai_client = OpenAI(
-    api_key=os.getenv("OPENAI_API_KEY"),
-    http_client=http_client  # Use persistent HTTP/2 client
-)
+@app.middleware("http")
+async def tag_endpoint_for_token_usage(request: Request, call_next):
+    """Tag LLM token usage recorded during this request with its endpoint path."""
+    token = current_endpoint.set(request.url.path)
+    try:
+        return await call_next(request)
+    finally:
+        current_endpoint.reset(token)
+
+
+@app.middleware("http")
+async def apply_request_deadline(request: Request, call_next):
+    """
+    Start the request's time budget (per-endpoint default, or a shorter
+    X-Request-Timeout-Ms from the client). LLM queue waits, retries and
+    embedding batches downstream all read the same deadline.
+    """
+    budget = get_endpoint_budget(request.url.path, request.headers.get(DEADLINE_HEADER))
+    token = set_deadline(budget)
+    try:
+        return await call_next(request)
+    finally:
+        reset_deadline(token)
+
+
+async def deadline_exceeded_handler(request: Request, exc: DeadlineExceededError):
+    """Deadline errors that escape an endpoint become 504s instead of generic 500s."""
+    return JSONResponse(status_code=504, content={"detail": str(exc)})
+
+
+app.add_exception_handler(DeadlineExceededError, deadline_exceeded_handler)
+
+
+# Shared provider clients from the pooled registry (HTTP/2 keep-alive pools sized
+# from settings). Parsing, scoring, embeddings and transcription all reuse the
+# same sockets and TLS sessions instead of each module opening its own pool.
+gemini_client = get_gemini_client()
+openai_client = get_openai_client()
 
 # Initialize cache for score caching (99% speedup on cache hits)
 cache = get_cache()
 
+# COLD TIER: parse/score results are also kept in Postgres (when configured), so
+# Redis only holds the hot set (settings.result_hot_ttl) and misses read through
+# (get_result_raw / store_result_raw in core.caching.result_cache).
+cold_store = get_cold_store()
+
+# ZERO-COPY: cached endpoint results (parse, domain finder, score, streamed
+# generations) are stored as serialized JSON bytes and served as-is on a hit:
+# no json.loads, no model rebuild, no response_model validation/re-serialization.
+TIME_SECONDS_PATTERN = re.compile(rb'"time_seconds":\s*-?[0-9][0-9.eE+-]*')
+
+
+def patch_time_seconds(raw: bytes, elapsed: float) -> bytes:
+    """
+    Replace the top-level time_seconds of a cached response with `elapsed`.
+    The top-level field is serialized after every nested object, so it is the last match.
+    """
+    matches = list(TIME_SECONDS_PATTERN.finditer(raw))
+    if not matches:
+        return raw
+    last = matches[-1]
+    return raw[:last.start()] + b'"time_seconds":' + str(round(elapsed, 3)).encode() + raw[last.end():]
+
+
+def cached_json_response(raw: bytes, start_time: float | None = None) -> Response:
+    """
+    Serve cached response JSON bytes directly.
+
+    Args:
+        raw: Stored JSON of a response model
+        start_time: Request start; if given, time_seconds reports this hit's duration
+    """
+    if start_time is not None:
+        raw = patch_time_seconds(raw, time.time() - start_time)
+    return Response(content=raw, media_type="application/json", headers={"X-Cache": "HIT"})
+
+
+# Role categorization tiers in front of the LLM (lookup table, token index, embedding kNN)
+role_classifier = get_role_classifier()
+
+# Industry extraction tiers in front of the LLM (seeded gazetteer, keywords, embedding kNN)
+industry_gazetteer = get_industry_gazetteer()
+
+
+# DOCUMENT STORE: parsed CVs/JDs stored under a content hash. Parse endpoints
+# return the doc_id, downstream endpoints accept cv_id / jd_id instead of the
+# full parsed dicts (inline dicts still work and take precedence).
+document_store = get_document_store()
+
+
+def resolve_document_refs(body: BaseModel) -> None:
+    """
+    Fill parsed_cv / parsed_jd from cv_id / jd_id on a request model (in place).
+
+    Inline documents take precedence; their ID field is cleared so a stale ID
+    never keys cached results for different content.
+
+    Raises:
+        HTTPException: 422 if neither form is given or the ID is malformed,
+            404 if the ID is unknown or expired (client re-parses or sends inline)
+    """
+    for kind in DOCUMENT_KINDS:
+        field, id_field = f"parsed_{kind}", f"{kind}_id"
+        if id_field not in type(body).model_fields:
+            continue
+        if getattr(body, field) is not None:
+            setattr(body, id_field, None)
+            continue
+        doc_id = getattr(body, id_field)
+        if not doc_id:
+            raise HTTPException(status_code=422, detail=f"Either {field} or {id_field} is required")
+        if not is_valid_doc_id(doc_id, kind):
+            raise HTTPException(status_code=422, detail=f"Invalid {id_field}: '{doc_id}'")
+        document = document_store.get(doc_id)
+        if document is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Unknown or expired {id_field} '{doc_id}' - parse the document again or send {field}"
+            )
+        setattr(body, field, document)
+
+
+def document_toon(document: dict, doc_id: str | None) -> str:
+    """TOON text of a parsed document, memoized by content (the doc_id's hash when known)."""
+    return document_store.content_artifact(document, "toon", lambda: to_toon(document), doc_id)
+
 # TOON format schema example
 TOON_EXAMPLE = """company_name: string or null
 position_title: string or null
@@ -292,18 +423,11 @@ async def root():
     }
 
 # New simple parse endpoint for frontend
+# (cache -> near-duplicate -> LLM pipeline lives in app.services.parsing, shared with app.routers.parsing)
 class ParseRequest(BaseModel):
     job_description: str
     language: str = "english"  # Default to English
 
-class ParseResponse(BaseModel):
-    success: bool
-    data: dict | None = None
-    error: str | None = None
-    time_seconds: float
-    model: str
-    language: str
-
 @app.post("/api/parse", response_model=ParseResponse)
 @limiter.limit("30/minute")  # Rate limit: 30 requests per minute per IP
 async def parse_job(request: Request, body: ParseRequest):
@@ -314,117 +438,19 @@ async def parse_job(request: Request, body: ParseRequest):
     """
     try:
         # Validate input
-        if not body.job_description or len(body.job_description.strip()) < 50:
+        if not body.job_description or len(body.job_description.strip()) < PARSE_MIN_CHARS:
             raise HTTPException(
                 status_code=400,
-                detail="Job description must be at least 50 characters"
+                detail=f"Job description must be at least {PARSE_MIN_CHARS} characters"
             )
 
-        # Auto-truncate if over 6200 characters
-        job_description = body.job_description[:6200] if len(body.job_description) > 6200 else body.job_description
-
-        # Validate language
-        supported_languages = ["english", "french", "german", "spanish"]
-        language = body.language.lower()
-        if language not in supported_languages:
-            language = "english"
-
-        # CACHE: Check if this JD parsing is cached
-        # NON-BLOCKING: Cache failures don't crash JD parsing
-        jd_hash = hashlib.md5(job_description.encode()).hexdigest()
-        cache_key = f"parse:jd:{jd_hash}:{language}"
-
-        try:
-            cached_result = cache.get(cache_key)
-            if cached_result:
-                result_dict = json.loads(cached_result) if isinstance(cached_result, str) else cached_result
-                print(f"✅ Cache HIT for JD parsing (instant response)")
-                return ParseResponse(**result_dict)
-        except Exception as cache_error:
-            print(f"⚠️  JD cache retrieval failed: {cache_error}. Falling back to fresh parsing.")
-            # Continue to fresh parsing below
-
-        # Generate JSON prompt using shared config with language
-        prompt = get_json_prompt(job_description, language)
+        job_description, language = normalize_parse_input(body.job_description, body.language)
+        _, result = await run_parse("jd", job_description, language)
 
-        # Call Gemini 2.5 Flash-Lite with GPT-3.5 fallback
-        start_time = time.time()
-        model_name = "gemini-2.5-flash-lite"
-
-        response_text, provider = await generate_with_fallback_async(
-            prompt=prompt,
-            model_gemini=model_name,
-            temperature=0.2
-        )
-
-        elapsed_time = time.time() - start_time
-        print(f"✅ JD parsing completed using {provider} (async) in {elapsed_time:.2f}s")
-
-        # Record metrics for Grafana
-        metrics = get_metrics_collector()
-        metrics.record_performance(
-            operation="parse_job_description",
-            duration_ms=elapsed_time * 1000,
-            metadata={"success": True}
-        )
-
-        # Parse JSON response
-        try:
-            # Remove markdown code blocks if present
-            cleaned_text = response_text.strip()
-
-            if cleaned_text.startswith("```"):
-                lines = cleaned_text.split("\n")
-                if len(lines) > 1:
-                    lines = lines[1:]
-                if lines and lines[-1].strip() == "```":
-                    lines = lines[:-1]
-                elif lines and lines[-1].strip().endswith("```"):
-                    lines[-1] = lines[-1].replace("```", "").strip()
-                cleaned_text = "\n".join(lines).strip()
-
-            # Parse JSON
-            parsed_data = json.loads(cleaned_text)
-
-            if parsed_data and len(parsed_data) >= 5:
-                result = ParseResponse(
-                    success=True,
-                    data=parsed_data,
-                    time_seconds=round(elapsed_time, 3),
-                    model=model_name,
-                    language=language
-                )
-
-                # CACHE: Store successful parse result (30 days TTL)
-                # NON-BLOCKING: Cache storage failures don't crash parsing
-                try:
-                    cache.set(cache_key, json.dumps(result.dict()), ttl=2592000)
-                    print(f"✅ Cached JD parsing result (TTL: 30 days)")
-                except Exception as cache_error:
-                    print(f"⚠️  JD cache storage failed: {cache_error}. Result not cached, but returned to user.")
-
-                return result
-            else:
-                return ParseResponse(
-                    success=False,
-                    data={"raw_response": response_text[:500]},
-                    error="Failed to parse JSON completely",
-                    time_seconds=round(elapsed_time, 3),
-                    model=model_name,
-                    language=language
-                )
-
-        except Exception as parse_error:
-            return ParseResponse(
-                success=False,
-                data={"raw_response": response_text[:500]},
-                error=f"Parse error: {str(parse_error)}",
-                time_seconds=round(elapsed_time, 3),
-                model=model_name,
-                language=language
-            )
+        # ZERO-COPY: a cache hit is the stored response bytes
+        return cached_json_response(result) if isinstance(result, bytes) else result
 
-    except HTTPException:
+    except (DeadlineExceededError, HTTPException):
         raise
     except Exception as e:
         raise HTTPException(
@@ -437,14 +463,6 @@ class CVParseRequest(BaseModel):
     resume_text: str
     language: str = "english"
 
-class CVParseResponse(BaseModel):
-    success: bool
-    data: dict | None = None
-    error: str | None = None
-    time_seconds: float
-    model: str
-    language: str
-
 @app.post("/api/parse-cv", response_model=CVParseResponse)
 @limiter.limit("30/minute")  # Rate limit: 30 requests per minute per IP
 async def parse_cv(request: Request, body: CVParseRequest):
@@ -454,123 +472,166 @@ async def parse_cv(request: Request, body: CVParseRequest):
     """
     try:
         # Validate input
-        if not body.resume_text or len(body.resume_text.strip()) < 50:
+        if not body.resume_text or len(body.resume_text.strip()) < PARSE_MIN_CHARS:
             raise HTTPException(
                 status_code=400,
-                detail="Resume text must be at least 50 characters"
+                detail=f"Resume text must be at least {PARSE_MIN_CHARS} characters"
             )
 
-        # Auto-truncate if over 6200 characters
-        resume_text = body.resume_text[:6200] if len(body.resume_text) > 6200 else body.resume_text
+        resume_text, language = normalize_parse_input(body.resume_text, body.language)
+        _, result = await run_parse("cv", resume_text, language)
 
-        # Validate language
-        supported_languages = ["english", "french", "german", "spanish"]
-        language = body.language.lower()
-        if language not in supported_languages:
-            language = "english"
+        # ZERO-COPY: a cache hit is the stored response bytes
+        return cached_json_response(result) if isinstance(result, bytes) else result
 
-        # CACHE: Check if this CV parsing is cached
-        # NON-BLOCKING: Cache failures don't crash CV parsing
-        cv_hash = hashlib.md5(resume_text.encode()).hexdigest()
-        cache_key = f"parse:cv:{cv_hash}:{language}"
+    except (DeadlineExceededError, HTTPException):
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Internal server error: {str(e)}"
+        )
 
-        try:
-            cached_result = cache.get(cache_key)
-            if cached_result:
-                result_dict = json.loads(cached_result) if isinstance(cached_result, str) else cached_result
-                print(f"✅ Cache HIT for CV parsing (instant response)")
-                return CVParseResponse(**result_dict)
-        except Exception as cache_error:
-            print(f"⚠️  CV cache retrieval failed: {cache_error}. Falling back to fresh parsing.")
-            # Continue to fresh parsing below
 
-        # Generate CV prompt using shared config with language
-        prompt = get_cv_prompt(resume_text, language)
+# PARSE BATCH: ingestion jobs push hundreds of scraped documents. One request
+# carries up to parse_batch_max_items documents; identical documents are parsed
+# once, cache hits are streamed immediately and misses run with bounded
+# concurrency. Per-item results stream as NDJSON in completion order, followed
+# by a summary line with the per-source breakdown and total time.
+class ParseBatchRequest(BaseModel):
+    documents: list[str]
+    language: str = "english"
 
-        # Call Gemini 2.5 Flash-Lite with GPT-3.5 fallback
-        start_time = time.time()
-        model_name = "gemini-2.5-flash-lite"
 
-        response_text, provider = await generate_with_fallback_async(
-            prompt=prompt,
-            model_gemini=model_name,
-            temperature=0.2
+PARSE_BATCH_SOURCES = ("cache", "near_duplicate", "llm", "duplicate", "invalid", "error")
+
+
+def ndjson_parse_line(index: int, source: str, result: bytes | None = None, **fields) -> bytes:
+    """One NDJSON result line. `result` is spliced in as already-serialized JSON (ZERO-COPY for cache hits)."""
+    head = fast_json.dumpb({"index": index, "source": source, **fields})
+    if result is None:
+        return head + b"\n"
+    return head[:-1] + b',"result":' + result + b"}\n"
+
+
+def validate_parse_batch(body: ParseBatchRequest) -> None:
+    """Reject empty or oversized batches (per-document problems are reported per item)."""
+    if not body.documents:
+        raise HTTPException(status_code=400, detail="A parse batch needs at least one document")
+    if len(body.documents) > settings.parse_batch_max_items:
+        raise HTTPException(
+            status_code=400,
+            detail=f"A parse batch may contain at most {settings.parse_batch_max_items} documents"
         )
 
-        elapsed_time = time.time() - start_time
-        print(f"✅ CV parsing completed using {provider} (async) in {elapsed_time:.2f}s")
-
-        # Record metrics for Grafana
-        metrics = get_metrics_collector()
-        metrics.record_performance(
-            operation="parse_resume",
-            duration_ms=elapsed_time * 1000,
-            metadata={"success": True}
+
+async def stream_parse_batch(kind: str, documents: list[str], language: str):
+    """
+    Parse a batch of JDs or CVs, yielding NDJSON lines in completion order.
+
+    Lines: {"index", "source", "result" | "error", ["duplicate_of"]} per document,
+    where source is cache, near_duplicate, llm, duplicate, invalid or error,
+    then {"summary": {...counts per source, "documents", "unique", "time_seconds"}}.
+    """
+    start_time = time.time()
+    counts = dict.fromkeys(PARSE_BATCH_SOURCES, 0)
+    language = normalize_parse_input("", language)[1]
+
+    # De-duplicate by content: identical documents share one parse cache key
+    groups: dict[str, list[int]] = {}
+    texts: dict[str, str] = {}
+    for index, document in enumerate(documents):
+        if not document or len(document.strip()) < PARSE_MIN_CHARS:
+            counts["invalid"] += 1
+            yield ndjson_parse_line(index, "invalid", error=f"Document must be at least {PARSE_MIN_CHARS} characters")
+            continue
+        text, _ = normalize_parse_input(document, language)
+        cache_key = parse_cache_key(kind, text, language)
+        groups.setdefault(cache_key, []).append(index)
+        texts.setdefault(cache_key, text)
+
+    def group_lines(cache_key: str, source: str, result: bytes | None, error: str | None = None) -> bytes:
+        first, *duplicates = groups[cache_key]
+        counts[source] += 1
+        counts["duplicate"] += len(duplicates)
+        fields = {"error": error} if error else {}
+        return ndjson_parse_line(first, source, result, **fields) + b"".join(
+            ndjson_parse_line(index, "duplicate", result, duplicate_of=first, **fields) for index in duplicates
         )
 
-        # Parse JSON response
-        try:
-            # Remove markdown code blocks if present
-            cleaned_text = response_text.strip()
+    # CACHE: one pipelined lookup for every unique document; hits go out immediately
+    # NON-BLOCKING: Cache failures fall through to parsing
+    try:
+        hits = await get_results_raw_batch(list(groups))
+    except Exception as cache_error:
+        print(f"⚠️  Parse batch cache retrieval failed: {cache_error}. Parsing all documents.")
+        hits = {}
+
+    misses = []
+    for cache_key in groups:
+        raw = hits.get(cache_key)
+        if raw is not None and DOC_ID_PATTERN.search(raw):
+            yield group_lines(cache_key, "cache", raw)
+        else:
+            misses.append(cache_key)
 
-            if cleaned_text.startswith("```"):
-                lines = cleaned_text.split("\n")
-                if len(lines) > 1:
-                    lines = lines[1:]
-                if lines and lines[-1].strip() == "```":
-                    lines = lines[:-1]
-                elif lines and lines[-1].strip().endswith("```"):
-                    lines[-1] = lines[-1].replace("```", "").strip()
-                cleaned_text = "\n".join(lines).strip()
+    semaphore = asyncio.Semaphore(settings.parse_batch_concurrency)
 
-            # Parse JSON
-            parsed_data = json.loads(cleaned_text)
+    async def parse_one(cache_key: str):
+        async with semaphore:
+            try:
+                # Hits without a doc_id (parsed before doc_ids existed) are upgraded by the runner
+                source, result = await run_parse(kind, texts[cache_key], language, check_cache=cache_key in hits)
+                return cache_key, source, result if isinstance(result, bytes) else result.model_dump_json().encode(), None
+            except Exception as e:
+                return cache_key, "error", None, str(e)
 
-            if parsed_data and len(parsed_data) >= 3:
-                result = CVParseResponse(
-                    success=True,
-                    data=parsed_data,
-                    time_seconds=round(elapsed_time, 3),
-                    model=model_name,
-                    language=language
-                )
+    tasks = [asyncio.create_task(parse_one(cache_key)) for cache_key in misses]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield group_lines(*await next_done)
+    finally:
+        # Client went away: stop the remaining parses
+        for task in tasks:
+            task.cancel()
+
+    elapsed_time = time.time() - start_time
+    get_metrics_collector().record_performance(
+        operation=f"parse_batch_{kind}",
+        duration_ms=elapsed_time * 1000,
+        metadata={"documents": len(documents), **counts}
+    )
+    print(f"📦 Parse batch ({kind}): {len(documents)} documents, {len(groups)} unique, "
+          f"{counts['cache']} cached, {counts['llm']} parsed in {elapsed_time:.2f}s")
 
-                # CACHE: Store successful parse result (30 days TTL)
-                # NON-BLOCKING: Cache storage failures don't crash parsing
-                try:
-                    cache.set(cache_key, json.dumps(result.dict()), ttl=2592000)
-                    print(f"✅ Cached CV parsing result (TTL: 30 days)")
-                except Exception as cache_error:
-                    print(f"⚠️  CV cache storage failed: {cache_error}. Result not cached, but returned to user.")
+    yield fast_json.dumpb({"summary": {
+        "documents": len(documents),
+        "unique": len(groups),
+        **counts,
+        "time_seconds": round(elapsed_time, 3),
+    }}) + b"\n"
 
-                return result
-            else:
-                return CVParseResponse(
-                    success=False,
-                    data={"raw_response": response_text[:500]},
-                    error="Failed to parse CV JSON completely",
-                    time_seconds=round(elapsed_time, 3),
-                    model=model_name,
-                    language=language
-                )
 
-        except Exception as parse_error:
-            return CVParseResponse(
-                success=False,
-                data={"raw_response": response_text[:500]},
-                error=f"Parse error: {str(parse_error)}",
-                time_seconds=round(elapsed_time, 3),
-                model=model_name,
-                language=language
-            )
+@app.post("/api/parse/batch")
+@limiter.limit("10/minute")
+async def parse_job_batch(request: Request, body: ParseBatchRequest):
+    """
+    Parse many job descriptions in one request (same rules as /api/parse).
+    Streams NDJSON: one line per document in completion order, then a summary line.
+    """
+    validate_parse_batch(body)
+    return StreamingResponse(stream_parse_batch("jd", body.documents, body.language), media_type="application/x-ndjson")
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Internal server error: {str(e)}"
-        )
+
+@app.post("/api/parse-cv/batch")
+@limiter.limit("10/minute")
+async def parse_cv_batch(request: Request, body: ParseBatchRequest):
+    """
+    Parse many resumes in one request (same rules as /api/parse-cv).
+    Streams NDJSON: one line per document in completion order, then a summary line.
+    """
+    validate_parse_batch(body)
+    return StreamingResponse(stream_parse_batch("cv", body.documents, body.language), media_type="application/x-ndjson")
 
 
 # Domain Finder endpoint
@@ -637,11 +698,11 @@ async def find_domains(request: DomainFinderRequest, bypass_cache: bool = False)
 
         if not bypass_cache:
             try:
-                cached_result = cache.get(cache_key)
+                cached_result = cache.get_raw(cache_key)
                 if cached_result:
-                    result_dict = json.loads(cached_result) if isinstance(cached_result, str) else cached_result
                     print(f"✅ Cache HIT for domain finder (instant response)")
-                    return DomainFinderResponse(**result_dict)
+                    # ZERO-COPY: the stored bytes are the response
+                    return cached_json_response(cached_result)
             except Exception as cache_error:
                 print(f"⚠️  Domain cache retrieval failed: {cache_error}. Falling back to fresh generation.")
                 # Continue to fresh generation below
@@ -651,12 +712,15 @@ async def find_domains(request: DomainFinderRequest, bypass_cache: bool = False)
 
         # Call Gemini 2.5 Flash-Lite with GPT-3.5 fallback
         start_time = time.time()
-        model_name = "gemini-2.5-flash-lite"
+        # ROUTING: model and output cap follow the input's complexity
+        routing = select_route("domain_finder", resume_text, document="cv")
+        model_name = routing.model_gemini
 
         response_text, provider = await generate_with_fallback_async(
             prompt=prompt,
-            model_gemini=model_name,
-            temperature=0.3
+            temperature=0.3,
+            call_site="domain_finder",
+            routing=routing
         )
 
         elapsed_time = time.time() - start_time
@@ -696,13 +760,14 @@ async def find_domains(request: DomainFinderRequest, bypass_cache: bool = False)
                 # CACHE: Store successful result (1 hour TTL for easier testing/updates)
                 # NON-BLOCKING: Cache storage failures don't crash domain finder
                 try:
-                    cache.set(cache_key, json.dumps(result.dict()), ttl=3600)
+                    cache.set_raw(cache_key, result.model_dump_json().encode(), ttl=3600)
                     print(f"✅ Cached domain finder result (TTL: 1 hour)")
                 except Exception as cache_error:
                     print(f"⚠️  Domain cache storage failed: {cache_error}. Result not cached, but returned to user.")
 
                 return result
             else:
+                record_invalid_output(routing)
                 return DomainFinderResponse(
                     success=False,
                     domains=None,
@@ -714,6 +779,7 @@ async def find_domains(request: DomainFinderRequest, bypass_cache: bool = False)
                 )
 
         except Exception as parse_error:
+            record_invalid_output(routing)
             return DomainFinderResponse(
                 success=False,
                 domains=None,
@@ -724,7 +790,7 @@ async def find_domains(request: DomainFinderRequest, bypass_cache: bool = False)
                 language=language
             )
 
-    except HTTPException:
+    except (DeadlineExceededError, HTTPException):
         raise
     except Exception as e:
         raise HTTPException(
@@ -769,8 +835,10 @@ class ApplicationViability(BaseModel):
 
 # Request/Response models
 class ScoreRequest(BaseModel):
-    parsed_cv: dict
-    parsed_jd: dict
+    parsed_cv: dict | None = None
+    parsed_jd: dict | None = None
+    cv_id: str | None = None  # doc_id from /api/parse-cv (instead of parsed_cv)
+    jd_id: str | None = None  # doc_id from /api/parse (instead of parsed_jd)
     language: str = "english"
 
 class ScoreMessage(BaseModel):
@@ -789,6 +857,7 @@ class ScoreResponse(BaseModel):
     similarity_metrics: dict  # Keep for backward compatibility
     time_seconds: float
     model: str
+    degraded: bool = False  # True if AI analysis was cut short (request deadline or truncated stream)
 
 
 # ===== COVER LETTER GENERATION MODELS =====
@@ -828,8 +897,10 @@ class QuestionItem(BaseModel):
     examples: list[str]
 
 class GenerateQuestionsRequest(BaseModel):
-    parsed_cv: dict
-    parsed_jd: dict
+    parsed_cv: dict | None = None
+    parsed_jd: dict | None = None
+    cv_id: str | None = None
+    jd_id: str | None = None
     score_result: dict  # Full ScoreResponse from Phase 3
     language: str = "english"
 
@@ -851,8 +922,10 @@ class QuestionAnswer(BaseModel):
     transcription_time: float | None = None  # If voice
 
 class SubmitAnswersRequest(BaseModel):
-    parsed_cv: dict
-    parsed_jd: dict
+    parsed_cv: dict | None = None
+    parsed_jd: dict | None = None
+    cv_id: str | None = None
+    jd_id: str | None = None
     questions: list[QuestionItem]
     answers: list[QuestionAnswer]
     original_score: int
@@ -867,6 +940,8 @@ class SubmitAnswersResponse(BaseModel):
     updated_cv: dict  # CV with updates from answers
     time_seconds: float
     model: str
+    category_scores_before: dict[str, int] = {}  # Per-category score of the original CV
+    category_scores_after: dict[str, int] = {}  # Per-category score of the updated CV
 
 class EvaluateAnswerRequest(BaseModel):
     question_id: str
@@ -902,7 +977,8 @@ class RewriteResumeRequest(BaseModel):
     updated_cv: dict  # CV with updates from answers
     questions: list[QuestionItem]  # Questions that were asked
     answers: list[QuestionAnswer]  # User's answers
-    parsed_jd: dict  # Job description
+    parsed_jd: dict | None = None  # Job description
+    jd_id: str | None = None  # Or its doc_id
     language: str = "english"
 
 class RewriteResumeResponse(BaseModel):
@@ -1206,110 +1282,63 @@ def calculate_logistics_match(cv: dict, jd: dict) -> int:
 # Old: _industry_cache = {}, _role_cache = {}
 # Now using cache.get()/cache.set() with "ind:" and "role:" prefixes
 
+# OPTIMIZATION #3: Batched classification
+# A CV used to trigger 20-40 single-item industry/role prompts per score.
+# All items are now checked against the cache in one pipelined read, every miss
+# is sent in ONE JSON-array prompt (stable integer IDs in, labels out), and each
+# validated label is written back to the cache per item.
 
-async def extract_industries_with_ai(text: str) -> list[str]:
-    """
-    Use Gemini AI to extract and normalize industries from text.
-    Returns list of standard industry names.
-
-    OPTIMIZATION #2: Uses persistent Redis cache (10-15% improvement)
-    """
-    if not text or len(text.strip()) < 3:
-        return []
-
-    # OPTIMIZATION #2: Check persistent Redis cache first
-    # NON-BLOCKING: Cache failures don't crash industry extraction
-    cache_key = f"ind:{text[:100]}"  # Prefix for industry extraction
-    try:
-        cached_result = cache.get(cache_key)
-        if cached_result:
-            # Redis cache stores JSON, deserialize if string
-            industries = json.loads(cached_result) if isinstance(cached_result, str) else cached_result
-            print(f"✅ Cache HIT for industry extraction")
-            return industries
-    except Exception as cache_error:
-        print(f"⚠️  Industry cache retrieval failed: {cache_error}. Falling back to AI extraction.")
-        # Continue to AI extraction below
-
-    try:
-        prompt = f"""Extract and normalize the industry or business sector from this text.
-
-Text: "{text}"
-
-Instructions:
-- Identify the primary industry/sector (e.g., Technology, Healthcare, Finance, Education, Retail, Manufacturing, etc.)
-- Return ONLY a JSON array of industry names, no other text
-- Use standard industry categories
-- If multiple industries, list all (max 3)
-- If unclear, return empty array []
-
-Example output: ["Technology", "Software"]
-Example output: ["Healthcare", "Medical"]
-Example output: ["Finance"]
-
-Return only the JSON array:"""
+VALID_ROLE_CATEGORIES = {
+    'developer', 'manager', 'designer', 'data scientist',
+    'doctor', 'nurse', 'teacher', 'sales', 'marketing', 'other'
+}
 
-        result_text, provider = await generate_with_fallback_async(
-            prompt=prompt,
-            model_gemini="gemini-2.5-flash-lite",
-            temperature=0.1  # Low temperature for consistency
-        )
-        print(f"✅ Industry extraction completed using {provider} (async)")
 
-        result_text = result_text.strip()
+def normalize_role_category(category: str) -> str:
+    """Map a model-returned label onto one of VALID_ROLE_CATEGORIES."""
+    category = (category or "").strip().lower()
 
-        # Parse JSON response
-        industries = json.loads(result_text)
+    if category not in VALID_ROLE_CATEGORIES:
+        # Try to match partial
+        for valid in VALID_ROLE_CATEGORIES:
+            if valid in category or category in valid:
+                return valid
+        return 'other'
 
-        if not isinstance(industries, list):
-            industries = []
+    return category
 
-        # Normalize to lowercase for comparison
-        industries = [ind.lower().strip() for ind in industries if ind]
 
-        # OPTIMIZATION #2: Store in persistent Redis cache (TTL: 30 days)
-        # NON-BLOCKING: Cache storage failures don't crash the extraction
-        try:
-            cache.set(cache_key, json.dumps(industries), ttl=2592000)
-            print(f"✅ Cached industry extraction (TTL: 30 days)")
-        except Exception as cache_error:
-            print(f"⚠️  Industry cache storage failed: {cache_error}. Result not cached, but returned.")
+def chunk_items(items: list, size: int) -> list[list]:
+    """Split items into consecutive chunks of at most `size`."""
+    return [items[i:i + size] for i in range(0, len(items), size)]
 
-        return industries
 
-    except Exception as e:
-        print(f"Error extracting industries with AI: {e}")
-        return []
+def build_industry_batch_prompt(items: list[tuple[int, str]]) -> str:
+    """Build a single JSON-array prompt classifying many texts into industries."""
+    payload = json.dumps([{"id": item_id, "text": text} for item_id, text in items], ensure_ascii=False)
+    return f"""Extract and normalize the industry or business sector for EACH item below.
 
+Items (JSON array):
+{payload}
 
-async def extract_role_category_with_ai(role: str) -> str:
-    """
-    Use Gemini AI to categorize a job role into a standard category.
-    Returns normalized role category.
+Instructions:
+- For each item, identify the primary industry/sector (e.g., Technology, Healthcare, Finance, Education, Retail, Manufacturing, etc.)
+- Use standard industry categories
+- If multiple industries, list all (max 3)
+- If unclear, use an empty array []
+- Return exactly one result per item, echoing its "id"
 
-    OPTIMIZATION #2: Uses persistent Redis cache (10-15% improvement)
-    """
-    if not role or len(role.strip()) < 2:
-        return ""
+Return ONLY this JSON object:
+{{"results": [{{"id": 0, "industries": ["Technology", "Software"]}}, {{"id": 1, "industries": []}}]}}"""
 
-    # OPTIMIZATION #2: Check persistent Redis cache first
-    # NON-BLOCKING: Cache failures don't crash role categorization
-    role_key = f"role:{role.lower().strip()}"  # Prefix for role extraction
-    try:
-        cached_result = cache.get(role_key)
-        if cached_result:
-            # Redis cache stores JSON, deserialize if string
-            role_category = json.loads(cached_result).strip('"') if isinstance(cached_result, str) else str(cached_result)
-            print(f"✅ Cache HIT for role categorization")
-            return role_category
-    except Exception as cache_error:
-        print(f"⚠️  Role cache retrieval failed: {cache_error}. Falling back to AI categorization.")
-        # Continue to AI categorization below
 
-    try:
-        prompt = f"""Categorize this job role into ONE standard category.
+def build_role_batch_prompt(items: list[tuple[int, str]]) -> str:
+    """Build a single JSON-array prompt categorizing many job roles."""
+    payload = json.dumps([{"id": item_id, "role": role} for item_id, role in items], ensure_ascii=False)
+    return f"""Categorize EACH job role below into ONE standard category.
 
-Role: "{role}"
+Roles (JSON array):
+{payload}
 
 Standard categories:
 - Developer (software engineers, programmers, coders)
@@ -1323,51 +1352,212 @@ Standard categories:
 - Marketing (growth, brand, content marketers)
 - Other (if none of the above fit)
 
-Return ONLY the category name, nothing else. One word only.
-
-Example: Developer
-Example: Doctor
-Example: Marketing
+Return exactly one result per role, echoing its "id". Return ONLY this JSON object:
+{{"results": [{{"id": 0, "category": "Developer"}}, {{"id": 1, "category": "Doctor"}}]}}"""
 
-Return:"""
 
-        result_text, provider = await generate_with_fallback_async(
-            prompt=prompt,
-            model_gemini="gemini-2.5-flash-lite",
-            temperature=0.1  # Low temperature for consistency
-        )
-        print(f"✅ Role categorization completed using {provider} (async)")
+def get_cached_labels(cache_keys: list[str], cache_label: str) -> dict[str, Any]:
+    """
+    Labels the LLM already gave, in one pipelined cache read.
+    NON-BLOCKING: Cache failures return no labels (everything is classified).
 
-        category = result_text.strip().lower()
+    Returns:
+        Dict mapping cache key -> label for the cached keys
+    """
+    labels = {}
+    try:
+        for key, value in cache.get_batch(cache_keys).items():
+            labels[key] = json.loads(value) if isinstance(value, str) else value
+    except Exception as cache_error:
+        print(f"⚠️  {cache_label} batch cache retrieval failed: {cache_error}. Classifying all items.")
+    return labels
+
+
+async def classify_batch_with_ai(
+    misses: list[str],
+    inputs: dict[str, str],
+    build_prompt,
+    validator,
+    extract_label,
+    cache_label: str
+) -> dict[str, Any]:
+    """
+    Generic batched classifier for cache misses; stores every label it gets.
+    Callers look up cached labels first (get_cached_labels).
 
-        # Validate category
-        valid_categories = {
-            'developer', 'manager', 'designer', 'data scientist',
-            'doctor', 'nurse', 'teacher', 'sales', 'marketing', 'other'
-        }
+    Args:
+        misses: Deduplicated cache keys with no cached label
+        inputs: Maps cache key -> text sent to the model
+        build_prompt: Callable (list[(id, text)]) -> prompt
+        validator: Pydantic schema for the {"results": [...]} response
+        extract_label: Callable (result_item_dict) -> normalized label
+        cache_label: Short name used in log lines
 
-        if category not in valid_categories:
-            # Try to match partial
-            for valid in valid_categories:
-                if valid in category or category in valid:
-                    category = valid
-                    break
-            else:
-                category = 'other'
+    Returns:
+        Dict mapping cache key -> label. Keys the model failed to label are absent.
+    """
+    print(f"✅ {cache_label} classification: {len(misses)} to classify")
+    if not misses:
+        return {}
 
-        # OPTIMIZATION #2: Store in persistent Redis cache (TTL: 30 days)
-        # NON-BLOCKING: Cache storage failures don't crash the categorization
+    async def classify_chunk(chunk_keys: list[str]) -> dict[str, Any]:
+        # Stable integer IDs within the chunk map results back to cache keys
+        items = list(enumerate(inputs[key] for key in chunk_keys))
         try:
-            cache.set(role_key, json.dumps(category), ttl=2592000)
-            print(f"✅ Cached role categorization (TTL: 30 days)")
-        except Exception as cache_error:
-            print(f"⚠️  Role cache storage failed: {cache_error}. Result not cached, but returned.")
+            result, provider = await generate_validated_json_async(
+                prompt=build_prompt(items),
+                validator=validator,
+                model_gemini="gemini-2.5-flash-lite",
+                temperature=0.1,  # Low temperature for consistency
+                call_site=f"classify_{cache_label.lower()}"
+            )
+            print(f"✅ Batched {cache_label} classification of {len(chunk_keys)} items using {provider}")
+        except Exception as e:
+            print(f"Error in batched {cache_label} classification: {e}")
+            return {}
+
+        chunk_labels = {}
+        for item in result.get("results", []):
+            item_id = item.get("id")
+            if isinstance(item_id, int) and 0 <= item_id < len(chunk_keys):
+                chunk_labels[chunk_keys[item_id]] = extract_label(item)
+        return chunk_labels
+
+    chunk_results = await asyncio.gather(*[
+        classify_chunk(chunk) for chunk in chunk_items(misses, settings.classification_batch_size)
+    ])
+
+    fresh = {}
+    for chunk_labels in chunk_results:
+        fresh.update(chunk_labels)
+
+    # CACHE: Store each validated label (TTL: 30 days). Unlabelled items are
+    # left uncached so they are retried next time.
+    # NON-BLOCKING: Cache storage failures don't affect the result
+    try:
+        cache.set_batch({key: json.dumps(label) for key, label in fresh.items()}, ttl=2592000)
+    except Exception as cache_error:
+        print(f"⚠️  {cache_label} batch cache storage failed: {cache_error}. Results not cached, but returned.")
 
-        return category
+    return fresh
+
+
+async def extract_industries_batch_with_ai(texts: list[str]) -> list[list[str]]:
+    """
+    Extract normalized industries for many texts with at most one LLM call per
+    `classification_batch_size` cache misses.
+
+    Returns:
+        One lowercase industry list per input text (same order)
+    """
+    keys_by_index = {}
+    inputs = {}
+    for i, text in enumerate(texts):
+        if text and len(text.strip()) >= 3:
+            cache_key = f"ind:{text[:100]}"  # Prefix for industry extraction
+            keys_by_index[i] = cache_key
+            inputs.setdefault(cache_key, text)
+
+    if not inputs:
+        return [[] for _ in texts]
+
+    def extract_label(item: dict) -> list[str]:
+        # Normalize to lowercase for comparison
+        return [ind.lower().strip() for ind in item.get("industries", []) if ind]
+
+    async def classify_with_llm(pending_texts: list[str]) -> list[list[str] | None]:
+        # Only cache misses get here (cached labels are read below, before the gazetteer)
+        cache_keys = [f"ind:{text[:100]}" for text in pending_texts]
+        labels = await classify_batch_with_ai(
+            misses=cache_keys,
+            inputs=inputs,
+            build_prompt=build_industry_batch_prompt,
+            validator=IndustryBatchResponse,
+            extract_label=extract_label,
+            cache_label="Industry"
+        )
+        return [labels.get(key) for key in cache_keys]
+
+    # CACHE: Labels the LLM already gave win over the gazetteer's cruder tiers
+    labels = get_cached_labels(list(inputs), "Industry")
+
+    # GAZETTEER: known companies, issuers and keywords, then embedding kNN over
+    # labeled examples; only the remaining texts reach the LLM classifier, and
+    # its labels are learned by the gazetteer
+    cache_keys = [key for key in inputs if key not in labels]
+    if cache_keys:
+        industries = await industry_gazetteer.classify(
+            [inputs[key] for key in cache_keys],
+            llm_fallback=classify_with_llm
+        )
+        labels.update(zip(cache_keys, industries))
+
+    return [labels[keys_by_index[i]] if i in keys_by_index else [] for i in range(len(texts))]
+
+
+async def extract_role_categories_batch_with_ai(roles: list[str]) -> list[str]:
+    """
+    Categorize many job roles with at most one LLM call per
+    `classification_batch_size` cache misses.
+
+    Returns:
+        One role category per input role (same order); "" for empty roles and
+        'other' for roles the model failed to label
+    """
+    keys_by_index = {}
+    inputs = {}
+    for i, role in enumerate(roles):
+        if role and len(role.strip()) >= 2:
+            role_key = f"role:{role.lower().strip()}"  # Prefix for role extraction
+            keys_by_index[i] = role_key
+            inputs.setdefault(role_key, role)
+
+    if not inputs:
+        return ["" for _ in roles]
+
+    async def classify_with_llm(pending_roles: list[str]) -> list[str]:
+        role_keys = [f"role:{role.lower().strip()}" for role in pending_roles]
+        labels = get_cached_labels(role_keys, "Role")
+        labels.update(await classify_batch_with_ai(
+            misses=[key for key in role_keys if key not in labels],
+            inputs=inputs,
+            build_prompt=build_role_batch_prompt,
+            validator=RoleBatchResponse,
+            extract_label=lambda item: normalize_role_category(item.get("category", "")),
+            cache_label="Role"
+        ))
+        return [str(labels.get(key, 'other')).strip('"') for key in role_keys]
+
+    # ROLE TIERS: lookup table, token index and embedding kNN answer common
+    # titles; only the remaining role keys reach the (cached) LLM classifier
+    role_keys = list(inputs)
+    categories = await role_classifier.classify(
+        [inputs[key] for key in role_keys],
+        llm_fallback=classify_with_llm
+    )
+    labels = dict(zip(role_keys, categories))
+
+    return [labels[keys_by_index[i]] if i in keys_by_index else "" for i in range(len(roles))]
+
+
+async def extract_industries_with_ai(text: str) -> list[str]:
+    """
+    Use Gemini AI to extract and normalize industries from text.
+    Returns list of standard industry names.
+
+    Single-item convenience wrapper over extract_industries_batch_with_ai.
+    """
+    return (await extract_industries_batch_with_ai([text]))[0]
 
-    except Exception as e:
-        print(f"Error extracting role category with AI: {e}")
-        return 'other'
+
+async def extract_role_category_with_ai(role: str) -> str:
+    """
+    Use Gemini AI to categorize a job role into a standard category.
+    Returns normalized role category.
+
+    Single-item convenience wrapper over extract_role_categories_batch_with_ai.
+    """
+    return (await extract_role_categories_batch_with_ai([role]))[0]
 
 
 async def calculate_industry_match(cv: dict, jd: dict) -> int:
@@ -1389,117 +1579,79 @@ async def calculate_industry_match(cv: dict, jd: dict) -> int:
     if 'company_type' in jd:
         jd_industries.add(jd['company_type'].lower().strip())
 
-    # Source 3: ALWAYS extract from company name (in addition to above)
+    # Collect every text to classify (JD company + CV experience, projects,
+    # certifications) so industry extraction is ONE batched classification
     company_name = jd.get('company_name', '')
-    if company_name:
-        extracted_industries = await extract_industries_with_ai(company_name)
-        if extracted_industries:
-            jd_industries.update(i.lower().strip() for i in extracted_industries)
+    if not jd_industries and not company_name:
+        return 50  # Nothing to compare against - skip classification entirely
 
-    # Still no industries? Return neutral score
-    if not jd_industries:
-        return 50
+    cv_texts = []
 
-    # OPTIMIZATION: Extract CV industries from work experience using parallel AI calls
-    cv_industries = set()
+    # Work experience: company, role and achievements for industry context
     work_exp = cv.get('work_experience', [])
-
-    if isinstance(work_exp, list) and work_exp:
-        # Collect ALL texts to extract (companies, roles, achievements)
-        extraction_tasks = []
-
+    if isinstance(work_exp, list):
         for exp in work_exp:
-            # Extract industries from company name
             if 'company' in exp:
-                extraction_tasks.append(str(exp['company']))
-
-            # Extract industries from role title
+                cv_texts.append(str(exp['company']))
             if 'role' in exp:
-                extraction_tasks.append(str(exp['role']))
-
-            # Also check achievements for industry context
+                cv_texts.append(str(exp['role']))
             if 'achievements' in exp and isinstance(exp['achievements'], list):
                 achievements_text = ' '.join(str(a) for a in exp['achievements'][:2])
                 if achievements_text.strip():
-                    extraction_tasks.append(achievements_text)
-
-        # PARALLEL EXECUTION: Run all extractions concurrently using asyncio.gather
-        if extraction_tasks:
-            results = await asyncio.gather(*[extract_industries_with_ai(task) for task in extraction_tasks])
+                    cv_texts.append(achievements_text)
 
-            # Aggregate all results
-            for industries_list in results:
-                cv_industries.update(industries_list)
-
-    # OPTIMIZATION: Extract CV industries from PROJECTS (personal/portfolio/side projects)
     # Projects demonstrate domain interest and practical knowledge, especially for career changers
     projects = cv.get('projects', [])
-
-    # DEBUG: Log projects found
-    print(f"[DEBUG] Found {len(projects) if isinstance(projects, list) else 0} projects in CV")
-
-    if isinstance(projects, list) and projects:
-        project_tasks = []
-
+    if isinstance(projects, list):
         for proj in projects:
             if isinstance(proj, dict):
-                # Extract industries from project name (e.g., "HealthTrack App" → Healthcare)
+                # Project name (e.g., "HealthTrack App" → Healthcare)
                 if 'name' in proj:
-                    project_tasks.append(str(proj['name']))
-
-                # Extract industries from project description (e.g., "health tracking mobile app" → HealthTech)
+                    cv_texts.append(str(proj['name']))
+                # Project description (e.g., "health tracking mobile app" → HealthTech)
                 if 'description' in proj:
-                    project_tasks.append(str(proj['description']))
-
-                # Extract from technologies/tech stack (e.g., "WCAG accessibility" → Healthcare signal)
+                    cv_texts.append(str(proj['description']))
+                # Tech stack (e.g., "WCAG accessibility" → Healthcare signal)
                 if 'technologies' in proj and isinstance(proj['technologies'], list):
                     tech_text = ' '.join(str(t) for t in proj['technologies'][:5])  # Limit to first 5 to avoid noise
                     if tech_text.strip():
-                        project_tasks.append(tech_text)
-
-        # PARALLEL EXECUTION: Run all project extractions concurrently using asyncio.gather
-        if project_tasks:
-            results = await asyncio.gather(*[extract_industries_with_ai(task) for task in project_tasks])
-
-            # Aggregate project industry results
-            for industries_list in results:
-                cv_industries.update(industries_list)
+                        cv_texts.append(tech_text)
 
-            # DEBUG: Log extracted industries from projects
-            print(f"[DEBUG] Extracted {len(cv_industries)} industries from projects: {cv_industries}")
-
-    # OPTIMIZATION: Extract CV industries from CERTIFICATIONS
     # Certifications demonstrate formal domain knowledge and commitment to industry
     certifications = cv.get('certifications', [])
-
-    if isinstance(certifications, list) and certifications:
-        cert_tasks = []
-
+    if isinstance(certifications, list):
         for cert in certifications:
             if isinstance(cert, dict):
-                # Extract industries from certification name (e.g., "AWS Certified Solutions Architect" → Cloud)
+                # Name (e.g., "AWS Certified Solutions Architect" → Cloud)
                 if 'name' in cert:
-                    cert_tasks.append(str(cert['name']))
-
-                # Extract from issuing organization (e.g., "Project Management Institute" → Project Management)
+                    cv_texts.append(str(cert['name']))
+                # Issuer (e.g., "Project Management Institute" → Project Management)
                 if 'issuer' in cert:
-                    cert_tasks.append(str(cert['issuer']))
-
-                # Extract from certification description if available
+                    cv_texts.append(str(cert['issuer']))
                 if 'description' in cert:
-                    cert_tasks.append(str(cert['description']))
-
+                    cv_texts.append(str(cert['description']))
             elif isinstance(cert, str):
                 # Handle simple string certifications
-                cert_tasks.append(cert)
+                cv_texts.append(cert)
 
-        # PARALLEL EXECUTION: Run all certification extractions concurrently using asyncio.gather
-        if cert_tasks:
-            results = await asyncio.gather(*[extract_industries_with_ai(task) for task in cert_tasks])
+    if jd_industries:
+        # OPTIMIZATION #3: One cache pipeline + one LLM call for all cache misses
+        results = await extract_industries_batch_with_ai([company_name] + cv_texts)
+        company_industries, cv_results = results[0], results[1:]
+    else:
+        # Only the company name can give the JD an industry: classify it first,
+        # and skip the CV entirely when it gives none (nothing to compare against)
+        company_industries = await extract_industries_with_ai(company_name)
+        if not company_industries:
+            return 50
+        cv_results = await extract_industries_batch_with_ai(cv_texts)
 
-            # Aggregate certification industry results
-            for industries_list in results:
-                cv_industries.update(industries_list)
+    # Source 3: ALWAYS use company name industries (in addition to above)
+    jd_industries.update(i.lower().strip() for i in company_industries)
+
+    cv_industries = set()
+    for industries_list in cv_results:
+        cv_industries.update(industries_list)
 
     # Calculate overlap using semantic embeddings
     if not cv_industries:
@@ -1567,11 +1719,10 @@ async def calculate_role_similarity(cv: dict, jd: dict) -> int:
     if not cv_roles:
         return 0  # No work experience
 
-    # OPTIMIZATION: Parallelize role category extraction using asyncio.gather
-    # Categorize JD role + all CV roles concurrently
+    # OPTIMIZATION #3: Categorize JD role + all CV roles in one batched classification
     all_roles = [jd_role] + cv_roles
 
-    categories = await asyncio.gather(*[extract_role_category_with_ai(role) for role in all_roles])
+    categories = await extract_role_categories_batch_with_ai(all_roles)
 
     jd_category = categories[0]  # First result is JD role category
     cv_categories = categories[1:]  # Rest are CV role categories
@@ -1597,40 +1748,108 @@ async def calculate_role_similarity(cv: dict, jd: dict) -> int:
     return min(100, max_score)
 
 
-async def calculate_category_scores_from_metrics(
-    similarity_metrics: dict,
+def calculate_rule_based_scores(
     parsed_cv: dict,
     parsed_jd: dict,
-    language: str = 'english'
-) -> dict[str, CategoryScore]:
+    language: str = 'english',
+    categories: Optional[set] = None
+) -> dict[str, int]:
     """
-    Calculate category scores using hybrid approach (embeddings + rules).
-    Much faster than asking Gemini - essentially instant.
+    Category scores that need neither embeddings nor an LLM (keyword/rule based).
+    Independent of similarity metrics, so they can run alongside embeddings.
+
+    Args:
+        categories: Only compute these categories (incremental re-scoring); all by default
     """
+    def wanted(category: str) -> bool:
+        return categories is None or category in categories
 
-    # Hard Skills (30% weight - reduced from 35%) - from hybrid embedding matching
-    hard_skills_score = int(similarity_metrics['skills_cosine_similarity'] * 100)
+    scores = {}
 
     # Soft Skills (10% weight - reduced from 15%) - using fuzzy token-based matching
-    soft_skills_score = calculate_soft_skills_match(
-        parsed_cv.get('soft_skills', []),
-        parsed_jd.get('soft_skills_required', []),
-        language=language
-    )
+    if wanted("soft_skills"):
+        scores["soft_skills"] = calculate_soft_skills_match(
+            parsed_cv.get('soft_skills', []),
+            parsed_jd.get('soft_skills_required', []),
+            language=language
+        )
 
     # Experience Level (15% weight - reduced from 20%) - from years comparison with domain relevance
-    cv_years = calculate_total_experience_years(parsed_cv)
-    jd_years = parsed_jd.get('experience_years_required', 0) or 0  # Handle None values
-    if jd_years > 0:
-        experience_ratio = min(1.2, cv_years / jd_years)  # Cap at 1.2 (20% bonus for extra experience)
-        # Lower base multiplier from 85 to 70
-        experience_score = int(experience_ratio * 70)  # More conservative
-    else:
-        experience_score = 0  # Changed from 70 to 0
-    experience_score = min(100, experience_score)
+    if wanted("experience_level"):
+        cv_years = calculate_total_experience_years(parsed_cv)
+        jd_years = parsed_jd.get('experience_years_required', 0) or 0  # Handle None values
+        if jd_years > 0:
+            experience_ratio = min(1.2, cv_years / jd_years)  # Cap at 1.2 (20% bonus for extra experience)
+            # Lower base multiplier from 85 to 70
+            experience_score = int(experience_ratio * 70)  # More conservative
+        else:
+            experience_score = 0  # Changed from 70 to 0
+        scores["experience_level"] = min(100, experience_score)
 
     # Domain Expertise (10% weight - reduced from 15%) - from keyword matching
-    domain_score = calculate_domain_match(parsed_cv, parsed_jd)
+    if wanted("domain_expertise"):
+        scores["domain_expertise"] = calculate_domain_match(parsed_cv, parsed_jd)
+
+    # Portfolio Quality (7% weight - reduced from 10%) - from achievements & projects
+    if wanted("portfolio_quality"):
+        scores["portfolio_quality"] = calculate_portfolio_quality(parsed_cv)
+
+    # Location/Logistics (3% weight - reduced from 5%) - from location match
+    if wanted("location_logistics"):
+        scores["location_logistics"] = calculate_logistics_match(parsed_cv, parsed_jd)
+
+    return scores
+
+
+CATEGORY_WEIGHTS = {
+    "hard_skills": 0.30,  # 30%
+    "soft_skills": 0.10,  # 10%
+    "experience_level": 0.15,  # 15%
+    "domain_expertise": 0.10,  # 10%
+    "industry_match": 0.15,  # 15% (NEW!)
+    "role_similarity": 0.10,  # 10% (NEW!)
+    "portfolio_quality": 0.07,  # 7%
+    "location_logistics": 0.03,  # 3%
+}
+
+
+def build_category_scores(
+    similarity_metrics: dict,
+    rule_scores: dict[str, int],
+    industry_score: int,
+    role_score: int
+) -> dict[str, CategoryScore]:
+    """Assemble weighted CategoryScores from the independently computed parts."""
+    # Hard Skills (30% weight - reduced from 35%) - from hybrid embedding matching
+    hard_skills_score = int(similarity_metrics['skills_cosine_similarity'] * 100)
+
+    return weigh_category_scores({
+        "hard_skills": hard_skills_score,
+        **rule_scores,
+        "industry_match": industry_score,
+        "role_similarity": role_score,
+    })
+
+
+def weigh_category_scores(scores: dict[str, int]) -> dict[str, CategoryScore]:
+    """Attach CATEGORY_WEIGHTS and status labels to raw 0-100 category scores."""
+    return {
+        name: CategoryScore(score=scores[name], weight=weight, status=get_status_label(scores[name]))
+        for name, weight in CATEGORY_WEIGHTS.items()
+    }
+
+
+async def calculate_category_scores_from_metrics(
+    similarity_metrics: dict,
+    parsed_cv: dict,
+    parsed_jd: dict,
+    language: str = 'english'
+) -> dict[str, CategoryScore]:
+    """
+    Calculate category scores using hybrid approach (embeddings + rules).
+    Much faster than asking Gemini - essentially instant.
+    """
+    rule_scores = calculate_rule_based_scores(parsed_cv, parsed_jd, language)
 
     # Industry Match (15% weight - NEW!) - from industry/sector matching
     # Role Similarity (10% weight - NEW!) - from job title/role matching
@@ -1640,54 +1859,7 @@ async def calculate_category_scores_from_metrics(
         calculate_role_similarity(parsed_cv, parsed_jd)
     )
 
-    # Portfolio Quality (7% weight - reduced from 10%) - from achievements & projects
-    portfolio_score = calculate_portfolio_quality(parsed_cv)
-
-    # Location/Logistics (3% weight - reduced from 5%) - from location match
-    logistics_score = calculate_logistics_match(parsed_cv, parsed_jd)
-
-    return {
-        "hard_skills": CategoryScore(
-            score=hard_skills_score,
-            weight=0.30,  # 30%
-            status=get_status_label(hard_skills_score)
-        ),
-        "soft_skills": CategoryScore(
-            score=soft_skills_score,
-            weight=0.10,  # 10%
-            status=get_status_label(soft_skills_score)
-        ),
-        "experience_level": CategoryScore(
-            score=experience_score,
-            weight=0.15,  # 15%
-            status=get_status_label(experience_score)
-        ),
-        "domain_expertise": CategoryScore(
-            score=domain_score,
-            weight=0.10,  # 10%
-            status=get_status_label(domain_score)
-        ),
-        "industry_match": CategoryScore(
-            score=industry_score,
-            weight=0.15,  # 15% (NEW!)
-            status=get_status_label(industry_score)
-        ),
-        "role_similarity": CategoryScore(
-            score=role_score,
-            weight=0.10,  # 10% (NEW!)
-            status=get_status_label(role_score)
-        ),
-        "portfolio_quality": CategoryScore(
-            score=portfolio_score,
-            weight=0.07,  # 7%
-            status=get_status_label(portfolio_score)
-        ),
-        "location_logistics": CategoryScore(
-            score=logistics_score,
-            weight=0.03,  # 3%
-            status=get_status_label(logistics_score)
-        )
-    }
+    return build_category_scores(similarity_metrics, rule_scores, industry_score, role_score)
 
 
 def calculate_weighted_score(category_scores: dict[str, CategoryScore]) -> int:
@@ -1836,7 +2008,8 @@ Return ONLY valid JSON with this exact structure:
             validator=ScoreMessageResponse,
             model_gemini="gemini-2.5-flash-lite",
             temperature=0.7,  # Slightly creative for varied messages
-            max_validation_retries=2
+            max_validation_retries=2,
+            call_site="score_message"
         )
         print(f"✅ Waiting message generation completed using {provider} (async)")
 
@@ -1990,13 +2163,13 @@ def convert_parsed_resume_to_text(parsed_resume: dict) -> str:
     return text
 
 
-async def generate_cover_letter(
+def build_cover_letter_prompt(
     parsed_resume: dict,
     parsed_jd: dict,
     score_data: dict = None
-) -> str:
+) -> tuple[str, str, str]:
     """
-    Generate a personalized cover letter using Gemini AI.
+    Build the cover letter prompt (shared by blocking and streaming endpoints).
 
     Args:
         parsed_resume: The parsed/rewritten resume in structured format
@@ -2004,7 +2177,7 @@ async def generate_cover_letter(
         score_data: Optional score analysis data (gaps and strengths)
 
     Returns:
-        str: Generated cover letter (300-400 words, 4 paragraphs)
+        tuple: (prompt, company_name, job_title)
     """
     # Convert parsed resume to text
     rewritten_resume = convert_parsed_resume_to_text(parsed_resume)
@@ -2085,11 +2258,33 @@ Sincerely,
 
 NOW GENERATE THE COVER LETTER:"""
 
+    return prompt, company_name, job_title
+
+
+async def generate_cover_letter(
+    parsed_resume: dict,
+    parsed_jd: dict,
+    score_data: dict = None
+) -> str:
+    """
+    Generate a personalized cover letter using Gemini AI.
+
+    Args:
+        parsed_resume: The parsed/rewritten resume in structured format
+        parsed_jd: Parsed job description
+        score_data: Optional score analysis data (gaps and strengths)
+
+    Returns:
+        str: Generated cover letter (300-400 words, 4 paragraphs)
+    """
+    prompt, company_name, job_title = build_cover_letter_prompt(parsed_resume, parsed_jd, score_data)
+
     try:
         cover_letter, provider = await generate_with_fallback_async(
             prompt=prompt,
             model_gemini="gemini-2.5-flash-lite",
-            temperature=0.7
+            temperature=0.7,
+            call_site="cover_letter"
         )
         print(f"✅ Cover letter generation completed using {provider} (async)")
 
@@ -2122,208 +2317,478 @@ Sincerely,
 [Your Name]"""
 
 
-@app.post("/api/calculate-score", response_model=ScoreResponse)
-@limiter.limit("20/minute")  # Rate limit: 20 requests per minute per IP (most expensive operation)
-async def calculate_score(request: Request, body: ScoreRequest, bypass_cache: bool = False):
+GAP_CATEGORIES = ("critical", "important", "nice_to_have", "logistical")
+
+
+def get_fallback_gap_analysis() -> dict:
+    """Minimal valid gap analysis used for sections the model didn't deliver"""
+    return {
+        "gaps": {category: [] for category in GAP_CATEGORIES},
+        "strengths": [],
+        "application_viability": {
+            "current_likelihood": "medium",
+            "recommendation": "Review the job requirements and your experience",
+            "key_blockers": []
+        }
+    }
+
+
+def get_fallback_similarity() -> dict:
+    """Neutral similarity metrics used when the embedding stage can't finish in time"""
+    return {
+        "overall_embedding_similarity": 0.5,
+        "skills_cosine_similarity": 0.5,
+        "experience_cosine_similarity": 0.5,
+        "experience_weighted_similarity": 0.5,
+        "critical_skills_match": 0.5,
+        "important_skills_match": 0.5,
+        "exact_keyword_match": 0.5,
+        "fuzzy_keyword_match": 0.5,
+        "semantic_skills_match": 0.5,
+        "missing_critical_skills": [],
+        "missing_important_skills": [],
+        "matched_skills": [],
+        "cache_stats": {},
+    }
+
+
+def get_fallback_rule_scores() -> dict[str, int]:
+    """Neutral rule-based category scores (same 50 as the industry/role fallbacks)"""
+    return {name: 50 for name in CATEGORY_WEIGHTS if name not in ("hard_skills", "industry_match", "role_similarity")}
+
+
+def get_fallback_gap_stage() -> dict:
+    """Gap analysis stage result when the stream can't even start in time"""
+    return {
+        "analysis": get_fallback_gap_analysis(),
+        "gap_items": {},
+        "complete": False,
+        "model": "fallback",
+        "score_message_task": None,
+    }
+
+
+async def run_gap_analysis(toon: dict, similarity: dict, category_scores: dict, language: str) -> dict:
     """
-    Calculate compatibility score between CV and JD using hybrid approach:
-    - Vector embeddings for quantitative similarity
-    - Gemini for qualitative analysis
+    Stream the gap analysis and start the score message as soon as it can be written.
 
-    OPTIMIZATION: Full result caching with CV+JD hash (99% speedup on cache hits)
+    Returns:
+        dict: analysis (sections that closed), gap_items (parsed per category),
+        complete (all sections arrived), model, score_message_task (or None)
     """
+    overall_score = category_scores["overall_score"]
+    overall_status = category_scores["overall_status"]
+
+    # Phase 2b: Full Gemini AI analysis for gaps + strengths
+    # Uses TOON text format (created in Step 0) for AI prompts
+    print("🤖 Phase 2b: Preparing Gemini gap analysis...")
+
+    # Use compressed prompt (60% smaller - only gaps + strengths)
+    analysis_prompt = get_compressed_gap_analysis_prompt(
+        cv_toon=toon["cv"],
+        jd_toon=toon["jd"],
+        similarity_metrics=similarity,
+        overall_score=overall_score,  # Pass score for adaptive gap requirements
+        language=language
+    )
+    print(f"   Prompt length: {len(analysis_prompt)} chars")
+
+    # ROUTING: long, jargon-heavy JDs get the stronger model and a larger output cap
+    routing = select_route("gap_analysis", toon["jd"])
+    model_name = routing.model_gemini
+    print(f"   Streaming {model_name} gap analysis ({routing.tier}, complexity {routing.complexity})...")
+    # STREAMING: the gap analysis JSON is parsed incrementally. Each gap
+    # category becomes GapItems as soon as its array closes, and the score
+    # message (critical gaps + strengths only) starts generating while
+    # application_viability is still streaming.
+    # DEADLINE: if the request budget runs out, return the computed scores
+    # with whatever sections closed in time instead of answering late
+    analysis_result = {}
+    gap_items: dict[str, list[GapItem]] = {}
+    score_message_task = None
     try:
-        start_time = time.time()
-        print(f"\n{'='*60}")
-        print(f"🔄 Starting score calculation")
-        print(f"{'='*60}")
+        async for path, value, provider in stream_json_sections_async(
+            prompt=analysis_prompt,
+            temperature=0.1,
+            max_depth=2,  # ("gaps", "critical") etc.
+            call_site="gap_analysis",
+            routing=routing
+        ):
+            if len(path) == 1:
+                analysis_result[path[0]] = value
+            elif path[0] == "gaps":
+                analysis_result.setdefault("gaps", {})[path[1]] = value
+                if path[1] in GAP_CATEGORIES:
+                    gap_items[path[1]] = [GapItem(**gap) for gap in value]
+                    print(f"   ✅ {path[1]} gaps ready ({len(value)})")
+
+            if path == ("strengths",) and score_message_task is None:
+                # Everything the score message needs has arrived
+                score_message_task = asyncio.create_task(generate_score_message(
+                    overall_score=overall_score,
+                    gaps=analysis_result.get("gaps", {}),
+                    strengths=value,
+                    overall_status=overall_status
+                ))
+        print(f"✅ Gap analysis stream completed using {provider}")
+    except DeadlineExceededError as deadline_error:
+        print(f"⚠️  {deadline_error}. Returning scores with {len(analysis_result)} completed analysis sections.")
+    except Exception as stream_error:
+        if not analysis_result:
+            await cancel_score_message(score_message_task)
+            raise
+        # Truncated stream: keep every section that closed before the cut
+        print(f"⚠️  Gap analysis stream cut short: {stream_error}. Using {len(analysis_result)} completed sections.")
+    except asyncio.CancelledError:
+        # Stage timeout or request cancelled mid-stream: don't leave the message generating
+        await cancel_score_message(score_message_task)
+        raise
 
-        # OPTIMIZATION #1: Check cache first (99% speedup on cache hits)
-        # Generate deterministic cache key from CV + JD content + language
-        cv_hash = hashlib.md5(json.dumps(body.parsed_cv, sort_keys=True).encode()).hexdigest()
-        jd_hash = hashlib.md5(json.dumps(body.parsed_jd, sort_keys=True).encode()).hexdigest()
-        cache_key = f"score:{cv_hash}:{jd_hash}:{body.language}"
+    analysis_complete = all(key in analysis_result for key in ("gaps", "strengths", "application_viability"))
+    if not analysis_complete:
+        print(f"⚠️  Gap analysis incomplete, filling missing sections with defaults")
+        if not deadline_exceeded():
+            record_invalid_output(routing)  # Truncated/broken output, not a budget cut
+    # Missing sections fall back to a minimal valid structure
+    for key, default in get_fallback_gap_analysis().items():
+        analysis_result.setdefault(key, default)
 
-        # Check cache (skip if bypass_cache=True)
-        # NON-BLOCKING: Cache failures don't crash the app, we fall back to fresh calculation
-        if not bypass_cache:
-            try:
-                cached_result = cache.get(cache_key)
-                if cached_result:
-                    # Deserialize cached result using Pydantic's built-in method
-                    # This properly reconstructs all nested Pydantic models
-                    if isinstance(cached_result, str):
-                        cached_response = ScoreResponse.model_validate_json(cached_result)
-                    else:
-                        # L2 cache might return dict
-                        cached_response = ScoreResponse.model_validate(cached_result)
-                    # Update time to show it was instant
-                    cached_response.time_seconds = round(time.time() - start_time, 3)
-                    print(f"✅ Cache HIT for {cache_key[:20]}... (instant response)")
-                    return cached_response
-            except Exception as cache_error:
-                # Log warning but continue to fresh calculation - don't crash!
-                print(f"⚠️  Cache retrieval failed: {cache_error}. Falling back to fresh calculation.")
-                # Continue below to fresh calculation
+    return {
+        "analysis": analysis_result,
+        "gap_items": gap_items,
+        "complete": analysis_complete,
+        "model": model_name,
+        "score_message_task": score_message_task,
+    }
+
+
+async def cancel_score_message(task: asyncio.Task | None) -> None:
+    """Cancel an in-flight score message generation and wait for it to unwind."""
+    if task is not None and not task.done():
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+
+async def finish_score_message(gap_analysis: dict, category_scores: dict) -> dict:
+    """Phase 4: the score message (usually already in flight since the strengths section closed)."""
+    print("💬 Phase 4: Generating score message...")
+    if gap_analysis["score_message_task"] is not None:
+        return await gap_analysis["score_message_task"]
+    analysis = gap_analysis["analysis"]
+    return await generate_score_message(
+        overall_score=category_scores["overall_score"],
+        gaps=analysis.get("gaps", {}),
+        strengths=analysis.get("strengths", []),
+        overall_status=category_scores["overall_status"]
+    )
 
-        # STEP 0: Convert to TOON format ONCE at the beginning
-        # TOON = plain text representation for AI prompts (40-50% token reduction)
-        # We keep BOTH formats: JSON for calculations, TOON text for AI
+
+def build_score_graph(body: ScoreRequest) -> StageGraph:
+    """
+    The calculate-score pipeline as a dependency graph.
+
+        toon ───────┬─> prompt_context ───────┐
+        similarity ─┴┐                        ├─> gap_analysis ─> score_message
+        rule_scores ─┼─> category_scores ─────┘
+        industry ────┤
+        role ────────┘
+
+    Stage timeouts come from settings.score_stage_timeouts (clamped to the
+    request deadline). Every stage the deadline can cut short has a neutral
+    fallback, so a slow stage degrades the result (degraded=True, not cached)
+    instead of failing the request.
+    """
+    timeouts = settings.score_stage_timeouts
+    cv, jd = body.parsed_cv, body.parsed_jd
+
+    def _toon() -> dict:
+        # STEP 0: TOON = plain text representation for AI prompts (40-50% token reduction)
         print("📝 Converting CV and JD to TOON text format...")
-        cv_toon = to_toon(body.parsed_cv)
-        jd_toon = to_toon(body.parsed_jd)
-        print(f"   ✅ TOON conversion complete")
-        print(f"   CV: {len(cv_toon)} chars (plain text)")
-        print(f"   JD: {len(jd_toon)} chars (plain text)")
-
-        # Phase 1: Calculate embedding-based similarity (fast - ~1-2s)
-        # Uses JSON format for structured access
+        toon = {"cv": document_toon(cv, body.cv_id), "jd": document_toon(jd, body.jd_id)}
+        print(f"   ✅ TOON conversion complete (CV: {len(toon['cv'])} chars, JD: {len(toon['jd'])} chars)")
+        return toon
+
+    def _similarity() -> dict:
+        # Phase 1: Calculate embedding-based similarity (uses JSON format for structured access)
         print("📊 Phase 1: Calculating embedding-based similarity...")
-        similarity_metrics = calculate_overall_compatibility(
-            body.parsed_cv,
-            body.parsed_jd
-        )
+        metrics = calculate_overall_compatibility(cv, jd)
         print(f"✅ Phase 1 complete - similarity metrics calculated")
+        return metrics
 
-        # Phase 2a: Calculate category scores using hybrid approach (instant!)
-        # Uses JSON format for structured calculations
-        print("📈 Phase 2a: Calculating category scores from metrics...")
-        category_scores = await calculate_category_scores_from_metrics(
-            similarity_metrics,
-            body.parsed_cv,  # JSON format
-            body.parsed_jd,  # JSON format
-            language=body.language
-        )
-        overall_score = calculate_weighted_score(category_scores)
+    def _prompt_context(toon: dict, similarity: dict) -> dict:
+        # After similarity: the JD requirement embeddings that rank CV items are cached by then
+        return {**toon, "cv": budget_cv_context("gap_analysis", toon["cv"], cv, jd, body.cv_id, body.jd_id)}
+
+    def _category_scores(similarity: dict, rule_scores: dict, industry: int, role: int) -> dict:
+        # Phase 2a: Category scores from the hybrid parts (instant once they exist)
+        scores = build_category_scores(similarity, rule_scores, industry, role)
+        overall_score = calculate_weighted_score(scores)
         overall_status = get_overall_status(overall_score)
         print(f"✅ Phase 2a complete - Overall score: {overall_score}% ({overall_status})")
+        return {"scores": scores, "overall_score": overall_score, "overall_status": overall_status}
 
-        # Phase 2b: Full Gemini AI analysis for gaps + strengths
-        # Uses TOON text format (created in Step 0) for AI prompts
-        print("🤖 Phase 2b: Preparing Gemini gap analysis...")
+    graph = StageGraph("calculate_score")
+    graph.add(
+        "toon", _toon, blocking=True, timeout=timeouts.get("toon"),
+        # Plain JSON still works in the prompts, just with more tokens
+        fallback=lambda: {"cv": json.dumps(cv), "jd": json.dumps(jd)}
+    )
+    # Neutral metrics/scores instead of failing the request when the deadline cuts these short
+    graph.add(
+        "similarity", _similarity, blocking=True, timeout=timeouts.get("similarity"),
+        fallback=get_fallback_similarity
+    )
+    # None -> the full TOON CV: a slow embedding provider must not hold up the gap analysis
+    graph.add(
+        "prompt_context", _prompt_context, deps=("toon", "similarity"), blocking=True,
+        timeout=timeouts.get("prompt_context"), fallback=None
+    )
+    graph.add(
+        "rule_scores", lambda: calculate_rule_based_scores(cv, jd, body.language), blocking=True,
+        fallback=get_fallback_rule_scores
+    )
+    # Neutral scores if classification can't finish in time
+    graph.add("industry", lambda: calculate_industry_match(cv, jd), timeout=timeouts.get("industry"), fallback=50)
+    graph.add("role", lambda: calculate_role_similarity(cv, jd), timeout=timeouts.get("role"), fallback=50)
+    graph.add(
+        "category_scores", _category_scores,
+        deps=("similarity", "rule_scores", "industry", "role")
+    )
+    graph.add(
+        "gap_analysis",
+        lambda toon, prompt_context, similarity, category_scores: run_gap_analysis(
+            prompt_context or toon, similarity, category_scores, body.language
+        ),
+        deps=("toon", "prompt_context", "similarity", "category_scores"),
+        fallback=get_fallback_gap_stage
+    )
+    # None -> get_fallback_message(overall_score) when the response is assembled
+    graph.add(
+        "score_message", finish_score_message,
+        deps=("gap_analysis", "category_scores"),
+        timeout=timeouts.get("score_message"), fallback=None
+    )
+    return graph
 
-        # Use compressed prompt (60% smaller - only gaps + strengths)
-        analysis_prompt = get_compressed_gap_analysis_prompt(
-            cv_toon=cv_toon,
-            jd_toon=jd_toon,
-            similarity_metrics=similarity_metrics,
-            overall_score=overall_score,  # Pass score for adaptive gap requirements
-            language=body.language
-        )
-        print(f"   Prompt length: {len(analysis_prompt)} chars")
 
-        model_name = "gemini-2.5-flash-lite"
-        print(f"   Calling {model_name} for gap analysis...")
-        # Use explicit prompt caching for 90% discount on repeated prompts with GPT-3.5 fallback
-        response_text, provider = generate_with_cache(
-            prompt=analysis_prompt,
-            model=model_name,
-            temperature=0.1,
-            cache_ttl=300  # 5 minutes cache
-        )
-        print(f"✅ Gap analysis completed using {provider}")
+async def run_score_graph(body: ScoreRequest, on_stage_complete=None) -> StageGraphRun:
+    """
+    Run the calculate-score graph, cleaning up the score message it starts early.
 
-        # Parse response
-        cleaned_text = response_text.strip()
-        if cleaned_text.startswith("```"):
-            lines = cleaned_text.split("\n")
-            if len(lines) > 1:
-                lines = lines[1:]
-            if lines and lines[-1].strip() == "```":
-                lines = lines[:-1]
-            cleaned_text = "\n".join(lines).strip()
+    run_gap_analysis creates the score message task mid-stream, outside the graph.
+    If the run fails or is cancelled before the score_message stage consumes it,
+    the task is cancelled and awaited here instead of generating in the background.
+    """
+    score_message_tasks = []
 
-        # Parse JSON with error handling
-        # NOTE: Gemini sometimes returns invalid/incomplete JSON for complex job descriptions
-        # containing currency symbols, technical jargon, or references to AI models.
-        # See score message parsing (line ~1817) for detailed explanation of failure cases.
-        try:
-            analysis_result = json.loads(cleaned_text)
-        except json.JSONDecodeError as json_err:
-            print(f"⚠️  Gap analysis JSON parsing failed: {json_err}")
-            print(f"⚠️  AI returned: {cleaned_text[:200]}...")
-            # Return minimal valid structure
-            analysis_result = {
-                "gaps": {
-                    "critical": [],
-                    "important": [],
-                    "nice_to_have": [],
-                    "logistical": []
-                },
-                "strengths": [],
-                "application_viability": {
-                    "current_likelihood": "medium",
-                    "recommendation": "Review the job requirements and your experience",
-                    "key_blockers": []
-                }
-            }
+    def _on_stage_complete(name: str, result):
+        if name == "gap_analysis" and result["score_message_task"] is not None:
+            score_message_tasks.append(result["score_message_task"])
+        if on_stage_complete is not None:
+            on_stage_complete(name, result)
 
-        elapsed_time = time.time() - start_time
+    try:
+        return await build_score_graph(body).run(on_stage_complete=_on_stage_complete)
+    finally:
+        for task in score_message_tasks:
+            await cancel_score_message(task)
 
-        # Parse categorized gaps
-        print("📋 Phase 3: Parsing gap analysis results...")
-        gaps_data = analysis_result.get("gaps", {})
-        categorized_gaps = CategorizedGaps(
-            critical=[GapItem(**gap) for gap in gaps_data.get("critical", [])],
-            important=[GapItem(**gap) for gap in gaps_data.get("important", [])],
-            nice_to_have=[GapItem(**gap) for gap in gaps_data.get("nice_to_have", [])],
-            logistical=[GapItem(**gap) for gap in gaps_data.get("logistical", [])]
-        )
-        print(f"   Gaps: {len(gaps_data.get('critical', []))} critical, {len(gaps_data.get('important', []))} important, {len(gaps_data.get('nice_to_have', []))} nice-to-have")
-
-        # Parse strengths
-        strengths_data = analysis_result.get("strengths", [])
-        strengths = [StrengthItem(**strength) for strength in strengths_data]
-        print(f"   Strengths: {len(strengths_data)} identified")
-
-        # Parse application viability
-        viability_data = analysis_result.get("application_viability", {})
-        application_viability = ApplicationViability(**viability_data)
-        print(f"   Viability: {viability_data.get('current_likelihood', 'N/A')}")
-
-        # Generate AI-powered encouraging message for the score
-        print("💬 Phase 4: Generating score message...")
-        score_message_dict = await generate_score_message(
-            overall_score=overall_score,
-            gaps=gaps_data,
-            strengths=strengths_data,
-            overall_status=overall_status
-        )
-        score_message = ScoreMessage(**score_message_dict)
-        print(f"   Message: '{score_message.title}'")
 
-        # Build response
-        response = ScoreResponse(
-            success=True,
-            overall_score=overall_score,  # From hybrid calculation
-            overall_status=overall_status,  # From hybrid calculation
-            score_message=score_message,  # AI-generated encouraging message
-            category_scores=category_scores,  # From hybrid calculation
-            gaps=categorized_gaps,  # From Gemini
-            strengths=strengths,  # From Gemini
-            application_viability=application_viability,  # From Gemini
-            similarity_metrics=similarity_metrics,
-            time_seconds=round(elapsed_time, 3),
-            model=model_name
-        )
+def get_score_cache_key(body: ScoreRequest) -> str:
+    """
+    Deterministic score cache key from CV + JD content + language.
+    DOCUMENT STORE: documents sent by ID are not re-hashed; the ID carries the same content hash.
+    """
+    cv_hash = doc_id_hash(body.cv_id) if body.cv_id else content_hash(body.parsed_cv)
+    jd_hash = doc_id_hash(body.jd_id) if body.jd_id else content_hash(body.parsed_jd)
+    return f"score:{cv_hash}:{jd_hash}:{body.language}"
+
+
+async def get_cached_score_json(cache_key: str) -> bytes | None:
+    """
+    Cached ScoreResponse as stored JSON bytes, or None on a miss (reads through to the cold tier).
+    NON-BLOCKING: Cache failures don't crash the app, callers fall back to fresh calculation.
+    """
+    try:
+        cached_result = await get_result_raw(cache_key)
+        if cached_result:
+            print(f"✅ Cache HIT for {cache_key[:20]}... (instant response)")
+            return cached_result
+    except Exception as cache_error:
+        # Log warning but continue to fresh calculation - don't crash!
+        print(f"⚠️  Cache retrieval failed: {cache_error}. Falling back to fresh calculation.")
+    return None
 
-        # OPTIMIZATION #1: Store in cache (TTL: 30 days = 2592000 seconds)
-        # This provides 99% speedup on subsequent requests with same CV+JD
-        # Use Pydantic's model_dump_json() to properly serialize nested models
-        # NON-BLOCKING: Cache storage failures don't crash the app
-        print("💾 Caching result...")
-        try:
-            cache.set(cache_key, response.model_dump_json(), ttl=2592000)
-            print(f"✅ Cached result for {cache_key[:20]}... (TTL: 30 days)")
-        except Exception as cache_error:
-            # Log warning but don't crash - user still gets their response
-            print(f"⚠️  Cache storage failed: {cache_error}. Result not cached, but returned to user.")
-
-        print(f"{'='*60}")
-        print(f"✅ Score calculation complete - {elapsed_time:.2f}s")
-        print(f"{'='*60}\n")
-        return response
 
+async def get_cached_score(cache_key: str) -> ScoreResponse | None:
+    """
+    Cached ScoreResponse model, or None on a miss (for callers that need the fields;
+    endpoints answering with the whole response use get_cached_score_json).
+    """
+    cached_result = await get_cached_score_json(cache_key)
+    if cached_result is None:
+        return None
+    try:
+        # Deserialize cached result using Pydantic's built-in method
+        # This properly reconstructs all nested Pydantic models
+        return ScoreResponse.model_validate_json(cached_result)
+    except Exception as cache_error:
+        print(f"⚠️  Cached score unreadable: {cache_error}. Falling back to fresh calculation.")
+    return None
+
+
+def build_gap_sections(gap_analysis: dict) -> dict:
+    """Phase 3: GapItems / StrengthItems / ApplicationViability from the gap analysis stage."""
+    if "sections" in gap_analysis:
+        return gap_analysis["sections"]  # Already built (e.g. streamed as an event)
+    analysis_result = gap_analysis["analysis"]
+
+    # Assemble categorized gaps (categories already parsed while streaming)
+    print("📋 Phase 3: Parsing gap analysis results...")
+    gap_items = gap_analysis["gap_items"]
+    gaps_data = analysis_result.get("gaps", {})
+    for category in GAP_CATEGORIES:
+        if category not in gap_items:
+            gap_items[category] = [GapItem(**gap) for gap in gaps_data.get(category, [])]
+    categorized_gaps = CategorizedGaps(**gap_items)
+    print(f"   Gaps: {len(gap_items['critical'])} critical, {len(gap_items['important'])} important, {len(gap_items['nice_to_have'])} nice-to-have")
+
+    # Parse strengths
+    strengths_data = analysis_result.get("strengths", [])
+    strengths = [StrengthItem(**strength) for strength in strengths_data]
+    print(f"   Strengths: {len(strengths_data)} identified")
+
+    # Parse application viability
+    viability_data = analysis_result.get("application_viability", {})
+    application_viability = ApplicationViability(**viability_data)
+    print(f"   Viability: {viability_data.get('current_likelihood', 'N/A')}")
+
+    gap_analysis["sections"] = {
+        "gaps": categorized_gaps,
+        "strengths": strengths,
+        "application_viability": application_viability,
+    }
+    return gap_analysis["sections"]
+
+
+def build_score_response(run: StageGraphRun, elapsed_time: float) -> ScoreResponse:
+    """Assemble the ScoreResponse from a completed score graph run."""
+    category_result = run.results["category_scores"]
+    gap_analysis = run.results["gap_analysis"]
+    sections = build_gap_sections(gap_analysis)
+
+    score_message = ScoreMessage(**(run.results["score_message"] or get_fallback_message(category_result["overall_score"])))
+    print(f"   Message: '{score_message.title}'")
+
+    return ScoreResponse(
+        success=True,
+        overall_score=category_result["overall_score"],  # From hybrid calculation
+        overall_status=category_result["overall_status"],  # From hybrid calculation
+        score_message=score_message,  # AI-generated encouraging message
+        category_scores=category_result["scores"],  # From hybrid calculation
+        gaps=sections["gaps"],  # From Gemini
+        strengths=sections["strengths"],  # From Gemini
+        application_viability=sections["application_viability"],  # From Gemini
+        similarity_metrics=run.results["similarity"],
+        time_seconds=round(elapsed_time, 3),
+        model=gap_analysis["model"],
+        # Any stage cut short by the deadline (embeddings, classification,
+        # gap analysis, message) leaves the deadline passed by now; a
+        # truncated gap analysis stream or a stage fallback is degraded too
+        degraded=deadline_exceeded() or not gap_analysis["complete"] or run.degraded
+    )
+
+
+def cache_score_response(cache_key: str, response: ScoreResponse) -> None:
+    """
+    OPTIMIZATION #1: Store in cache (Redis for the hot TTL, plus the cold tier when configured)
+    This provides 99% speedup on subsequent requests with same CV+JD.
+    NON-BLOCKING: Cache storage failures don't crash the app.
+    Degraded (deadline-truncated or partial) results are never cached.
+    """
+    if response.degraded:
+        print("⚠️  Degraded result - returning without caching")
+        return
+    print("💾 Caching result...")
+    try:
+        # Use Pydantic's model_dump_json() to properly serialize nested models;
+        # stored as bytes so hits are served without deserializing (ZERO-COPY)
+        store_result_raw(cache_key, response.model_dump_json().encode())
+        print(f"✅ Cached result for {cache_key[:20]}... (TTL: {cold_store.hot_ttl}s)")
+    except Exception as cache_error:
+        # Log warning but don't crash - user still gets their response
+        print(f"⚠️  Cache storage failed: {cache_error}. Result not cached, but returned to user.")
+
+
+async def compute_score(
+    body: ScoreRequest,
+    bypass_cache: bool = False,
+    cache_key: str | None = None
+) -> ScoreResponse:
+    """
+    Cached-or-fresh ScoreResponse for a resolved ScoreRequest.
+    Shared by /api/calculate-score and bulk scoring jobs.
+    """
+    start_time = time.time()
+    print(f"\n{'='*60}")
+    print(f"🔄 Starting score calculation")
+    print(f"{'='*60}")
+
+    # OPTIMIZATION #1: Check cache first (99% speedup on cache hits)
+    # Deterministic cache key from CV + JD content + language
+    cache_key = cache_key or get_score_cache_key(body)
+
+    # Check cache (skip if bypass_cache=True)
+    if not bypass_cache:
+        cached_response = await get_cached_score(cache_key)
+        if cached_response:
+            # Update time to show it was instant
+            cached_response.time_seconds = round(time.time() - start_time, 3)
+            return cached_response
+
+    # OPTIMIZATION: the pipeline runs as a dependency graph. TOON conversion,
+    # embedding similarity, rule-based scores and industry/role classification
+    # all start immediately; gap analysis starts once the overall score exists.
+    run = await run_score_graph(body)
+    print(f"⏱️  Critical path: {run.summary()}")
+
+    elapsed_time = time.time() - start_time
+    response = build_score_response(run, elapsed_time)
+    cache_score_response(cache_key, response)
+
+    print(f"{'='*60}")
+    print(f"✅ Score calculation complete - {elapsed_time:.2f}s")
+    print(f"{'='*60}\n")
+    return response
+
+
+@app.post("/api/calculate-score", response_model=ScoreResponse)
+@limiter.limit("20/minute")  # Rate limit: 20 requests per minute per IP (most expensive operation)
+async def calculate_score(request: Request, body: ScoreRequest, bypass_cache: bool = False):
+    """
+    Calculate compatibility score between CV and JD using hybrid approach:
+    - Vector embeddings for quantitative similarity
+    - Gemini for qualitative analysis
+
+    OPTIMIZATION: Full result caching with CV+JD hash (99% speedup on cache hits)
+    """
+    # DOCUMENT STORE: documents may be sent as cv_id / jd_id
+    resolve_document_refs(body)
+    try:
+        start_time = time.time()
+        cache_key = get_score_cache_key(body)
+
+        # ZERO-COPY: a hit returns the stored bytes with time_seconds patched in place
+        if not bypass_cache:
+            cached_result = await get_cached_score_json(cache_key)
+            if cached_result:
+                return cached_json_response(cached_result, start_time)
+
+        # Cache already checked above
+        return await compute_score(body, bypass_cache=True, cache_key=cache_key)
+
+    except (DeadlineExceededError, HTTPException):
+        raise
     except Exception as e:
         print(f"\n{'='*60}")
         print(f"❌ ERROR in calculate_score:")
@@ -2344,6 +2809,8 @@ async def generate_questions(request: GenerateQuestionsRequest):
     Phase 4: Generate personalized questions based on gaps from Phase 3.
     Uses RAG (Qdrant) to find similar past experiences and improve question quality.
     """
+    # DOCUMENT STORE: documents may be sent as cv_id / jd_id
+    resolve_document_refs(request)
     try:
         start_time = time.time()
 
@@ -2399,9 +2866,13 @@ async def generate_questions(request: GenerateQuestionsRequest):
                 if len(unique_rag_context) >= 5:  # Max 5 RAG examples
                     break
 
-        # Step 4: Convert CV and JD to TOON format
-        cv_toon = to_toon(request.parsed_cv)
-        jd_toon = to_toon(request.parsed_jd)
+        # Step 4: Convert CV and JD to TOON format (long CVs: most JD-relevant items within the token budget)
+        cv_toon = document_toon(request.parsed_cv, request.cv_id)
+        jd_toon = document_toon(request.parsed_jd, request.jd_id)
+        cv_toon = await asyncio.to_thread(
+            budget_cv_context, "question_generation", cv_toon,
+            request.parsed_cv, request.parsed_jd, request.cv_id, request.jd_id
+        )
 
         # Step 5: Generate question prompt
         overall_score = request.score_result.get("overall_score", None)
@@ -2416,11 +2887,12 @@ async def generate_questions(request: GenerateQuestionsRequest):
 
         # Step 6: Call Gemini to generate questions (with explicit prompt caching and GPT-3.5 fallback)
         model_name = "gemini-2.5-flash-lite"  # Faster model for better performance
-        response_text, provider = generate_with_cache(
+        response_text, provider = await generate_with_cache_async(
             prompt=question_prompt,
             model=model_name,
             temperature=0.3,  # Balanced creativity and consistency
-            cache_ttl=300  # 5 minutes cache
+            cache_ttl=300,  # 5 minutes cache
+            call_site="question_generation"
         )
         print(f"✅ Question generation completed using {provider}")
 
@@ -2461,6 +2933,8 @@ async def generate_questions(request: GenerateQuestionsRequest):
             model=model_name
         )
 
+    except (DeadlineExceededError, HTTPException):
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -2510,7 +2984,7 @@ async def transcribe_audio(audio_file: UploadFile = File(...)):
             try:
                 # Call Parakeet service
                 with open(temp_file_path, "rb") as audio_file_obj:
-                    parakeet_response = httpx.post(
+                    parakeet_response = get_http_client().post(
                         f"{parakeet_url}/transcribe",
                         files={"file": (audio_file.filename, audio_file_obj, audio_file.content_type)},
                         data={"language": request.language} if request.language else {},
@@ -2555,7 +3029,7 @@ async def transcribe_audio(audio_file: UploadFile = File(...)):
             model=model_used
         )
 
-    except HTTPException:
+    except (DeadlineExceededError, HTTPException):
         raise
     except Exception as e:
         elapsed_time = time.time() - start_time
@@ -2747,7 +3221,8 @@ Language: {request.language}
             validator=AnswerEvaluationResponse,
             model_gemini="gemini-2.0-flash-exp",
             temperature=0.2,
-            max_validation_retries=2
+            max_validation_retries=2,
+            call_site="answer_evaluation"
         )
         print(f"✅ Answer quality evaluation completed using {provider} (async)")
 
@@ -2771,6 +3246,8 @@ Language: {request.language}
             model="gemini-2.0-flash-exp"
         )
 
+    except (DeadlineExceededError, HTTPException):
+        raise
     except JSONValidationError as e:
         print(f"JSON validation failed after retries: {str(e)}")
         return EvaluateAnswerResponse(
@@ -2803,6 +3280,130 @@ Language: {request.language}
         )
 
 
+# INCREMENTAL RE-SCORING: CV sections each category score reads.
+# After submit-answers edits the CV, only categories whose inputs changed are
+# recomputed; the rest are reused from the score of the original CV.
+CATEGORY_CV_INPUTS = {
+    "hard_skills": ("technical_skills",),
+    "soft_skills": ("soft_skills",),
+    "experience_level": ("work_experience",),
+    "domain_expertise": ("professional_summary", "work_experience"),
+    "industry_match": ("work_experience", "projects", "certifications"),
+    "role_similarity": ("work_experience",),
+    "portfolio_quality": ("work_experience", "projects", "publications", "certifications"),
+    "location_logistics": ("personal_info",),
+}
+
+
+def diff_cv_sections(original_cv: dict, updated_cv: dict) -> set[str]:
+    """Top-level CV sections whose content differs between the two versions."""
+    return {
+        section for section in set(original_cv) | set(updated_cv)
+        if original_cv.get(section) != updated_cv.get(section)
+    }
+
+
+async def score_categories_incrementally(
+    parsed_cv: dict,
+    parsed_jd: dict,
+    language: str,
+    categories: set[str],
+    similarity_metrics: dict | None = None,
+    changed_sections: set[str] | None = None
+) -> tuple[dict[str, int], dict | None]:
+    """
+    Compute the given category scores for a CV.
+
+    Args:
+        categories: Categories to compute
+        similarity_metrics: Metrics of the previous CV version; with changed_sections,
+            only the changed half (skills / experience) is recomputed
+        changed_sections: CV sections changed since similarity_metrics were computed
+
+    Returns:
+        (category -> score, similarity metrics or None if hard_skills was not requested)
+    """
+    scores = calculate_rule_based_scores(parsed_cv, parsed_jd, language, categories=categories)
+
+    async def _similarity():
+        if "hard_skills" not in categories:
+            return None
+        if similarity_metrics is not None and changed_sections is not None:
+            return await asyncio.to_thread(
+                update_overall_compatibility, similarity_metrics, parsed_cv, parsed_jd, changed_sections
+            )
+        return await asyncio.to_thread(calculate_overall_compatibility, parsed_cv, parsed_jd)
+
+    async def _only(category: str, fn):
+        return await fn(parsed_cv, parsed_jd) if category in categories else None
+
+    metrics, industry_score, role_score = await asyncio.gather(
+        _similarity(),
+        _only("industry_match", calculate_industry_match),
+        _only("role_similarity", calculate_role_similarity),
+    )
+    if metrics is not None:
+        scores["hard_skills"] = int(metrics['skills_cosine_similarity'] * 100)
+    if industry_score is not None:
+        scores["industry_match"] = industry_score
+    if role_score is not None:
+        scores["role_similarity"] = role_score
+    return scores, metrics
+
+
+async def rescore_incrementally(
+    original_cv: dict,
+    updated_cv: dict,
+    parsed_jd: dict,
+    language: str = 'english',
+    cv_id: str | None = None,
+    jd_id: str | None = None
+) -> dict[str, Any]:
+    """
+    Re-score an edited CV against the same JD, recomputing only affected categories.
+
+    The "before" scores come from the cached ScoreResponse of the original CV when
+    calculate-score already ran for it (the usual flow), otherwise they are computed
+    once. Unchanged categories are reused; per-text embedding and industry/role
+    caches make the recomputed ones cheap for unchanged items.
+
+    Returns:
+        Dict with before/after category scores, before/after overall score and
+        the recomputed categories
+    """
+    cached = await get_cached_score(get_score_cache_key(
+        ScoreRequest(parsed_cv=original_cv, parsed_jd=parsed_jd, cv_id=cv_id, jd_id=jd_id, language=language)
+    ))
+    if cached is not None:
+        before = {name: details.score for name, details in cached.category_scores.items()}
+        baseline_metrics = cached.similarity_metrics
+    else:
+        before, baseline_metrics = await score_categories_incrementally(
+            original_cv, parsed_jd, language, set(CATEGORY_CV_INPUTS)
+        )
+
+    changed_sections = diff_cv_sections(original_cv, updated_cv)
+    stale = {
+        category for category, sections in CATEGORY_CV_INPUTS.items()
+        if changed_sections.intersection(sections) or category not in before
+    }
+    recomputed, _ = await score_categories_incrementally(
+        updated_cv, parsed_jd, language, stale,
+        similarity_metrics=baseline_metrics, changed_sections=changed_sections
+    )
+    after = {**before, **recomputed}
+
+    print(f"🔁 Incremental re-score: sections changed {sorted(changed_sections)}, "
+          f"recomputed {sorted(stale)}, reused {len(CATEGORY_WEIGHTS) - len(stale)} ({'cached' if cached else 'fresh'} baseline)")
+    return {
+        "before": before,
+        "after": after,
+        "overall_before": cached.overall_score if cached is not None else calculate_weighted_score(weigh_category_scores(before)),
+        "overall_after": calculate_weighted_score(weigh_category_scores(after)),
+        "recomputed": sorted(stale),
+    }
+
+
 @app.post("/api/submit-answers", response_model=SubmitAnswersResponse)
 async def submit_answers(request: SubmitAnswersRequest):
     """
@@ -2810,6 +3411,8 @@ async def submit_answers(request: SubmitAnswersRequest):
     update CV, and recalculate compatibility score.
     """
     start_time = time.time()
+    # DOCUMENT STORE: documents may be sent as cv_id / jd_id
+    resolve_document_refs(request)
 
     try:
         # Step 1: Format questions and answers for analysis
@@ -2831,9 +3434,13 @@ async def submit_answers(request: SubmitAnswersRequest):
                     "answer_type": answer.answer_type
                 })
 
-        # Step 2: Convert CV/JD to TOON format
-        cv_toon = to_toon(request.parsed_cv)
-        jd_toon = to_toon(request.parsed_jd)
+        # Step 2: Convert CV/JD to TOON format (long CVs: most JD-relevant items within the token budget)
+        cv_toon = document_toon(request.parsed_cv, request.cv_id)
+        jd_toon = document_toon(request.parsed_jd, request.jd_id)
+        cv_toon = await asyncio.to_thread(
+            budget_cv_context, "answer_analysis", cv_toon,
+            request.parsed_cv, request.parsed_jd, request.cv_id, request.jd_id
+        )
 
         # Step 3: Generate answer analysis prompt
         analysis_prompt = get_answer_analysis_prompt(
@@ -2844,7 +3451,8 @@ async def submit_answers(request: SubmitAnswersRequest):
         response_text, provider = await generate_with_fallback_async(
             prompt=analysis_prompt,
             model_gemini="gemini-2.0-flash-exp",
-            temperature=0.3
+            temperature=0.3,
+            call_site="answer_analysis"
         )
         print(f"✅ Answer analysis completed using {provider} (async)")
 
@@ -2857,18 +3465,20 @@ async def submit_answers(request: SubmitAnswersRequest):
         cv_updates = analysis_data.get("cv_updates", {})
 
         # Step 6: Update the parsed CV with new information
-        updated_cv = request.parsed_cv.copy()
+        # Deep copy: the original CV is the "before" side of the incremental re-score
+        updated_cv = copy.deepcopy(request.parsed_cv)
 
-        # Add new skills
+        # Add new skills (the CV schema and skill scoring use "technical_skills")
         new_skills = cv_updates.get("skills", [])
         if new_skills:
-            if "skills" not in updated_cv:
-                updated_cv["skills"] = []
+            if "technical_skills" not in updated_cv:
+                updated_cv["technical_skills"] = []
             # Add skills that aren't already present
-            existing_skills_lower = [s.lower() for s in updated_cv.get("skills", [])]
+            existing_skills_lower = {s.lower() for s in updated_cv["technical_skills"] if isinstance(s, str)}
             for skill in new_skills:
-                if skill.lower() not in existing_skills_lower:
-                    updated_cv["skills"].append(skill)
+                if isinstance(skill, str) and skill.lower() not in existing_skills_lower:
+                    updated_cv["technical_skills"].append(skill)
+                    existing_skills_lower.add(skill.lower())
 
         # Add new projects
         new_projects = cv_updates.get("projects", [])
@@ -2892,38 +3502,21 @@ async def submit_answers(request: SubmitAnswersRequest):
                             updated_cv[section][index]["additional_notes"] = []
                         updated_cv[section][index]["additional_notes"].append(additional_info)
 
-        # Step 7: Recalculate score with updated CV
-        # Calculate new compatibility score
-        new_score_result = calculate_overall_compatibility(
-            parsed_cv=updated_cv,
-            parsed_jd=request.parsed_jd
+        # Step 7: Re-score incrementally - only categories whose CV sections changed
+        rescore = await rescore_incrementally(
+            request.parsed_cv, updated_cv, request.parsed_jd, request.language,
+            cv_id=request.cv_id, jd_id=request.jd_id
         )
-
-        new_overall_score = new_score_result.get('overall_score', request.original_score)
-
-        # Step 8: Calculate improvements
-        score_improvement = new_overall_score - request.original_score
-
-        # Calculate category improvements (simplified - you could do detailed per-category)
-        category_improvements = {}
-
-        # Map uncovered experiences to categories
-        for exp in uncovered_experiences_list:
-            category = exp.get("category", "other")
-            impact_level = exp.get("impact_level", "WEAK")
-
-            # Estimate category improvement based on impact level
-            impact_points = 0
-            if impact_level == "STRONG":
-                impact_points = 5
-            elif impact_level == "MODERATE":
-                impact_points = 3
-            elif impact_level == "WEAK":
-                impact_points = 1
-
-            if category not in category_improvements:
-                category_improvements[category] = 0
-            category_improvements[category] += impact_points
+        new_overall_score = rescore["overall_after"]
+
+        # Step 8: Calculate improvements (real per-category deltas, not estimates)
+        # Measured against the re-scored baseline so the delta only reflects the CV edits
+        score_improvement = new_overall_score - rescore["overall_before"]
+        category_improvements = {
+            category: rescore["after"][category] - rescore["before"][category]
+            for category in rescore["recomputed"]
+            if rescore["after"][category] != rescore["before"][category]
+        }
 
         # Step 9: Format uncovered experiences for response
         uncovered_text_list = []
@@ -2958,9 +3551,13 @@ async def submit_answers(request: SubmitAnswersRequest):
             uncovered_experiences=uncovered_text_list,
             updated_cv=updated_cv,
             time_seconds=round(elapsed_time, 3),
-            model="gemini-2.0-flash-exp"
+            model="gemini-2.0-flash-exp",
+            category_scores_before=rescore["before"],
+            category_scores_after=rescore["after"]
         )
 
+    except (DeadlineExceededError, HTTPException):
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -3060,6 +3657,70 @@ def convert_sample_to_parsed_format(sample_format: dict) -> dict:
     }
 
 
+def build_resume_rewrite_prompt(request: RewriteResumeRequest) -> str:
+    """
+    Build the resume rewrite prompt (shared by blocking and streaming endpoints).
+    Matches questions with answers and renders CV/JD in TOON format.
+    """
+    # Match questions with answers
+    questions_and_answers = []
+    for question in request.questions:
+        answer = next(
+            (a for a in request.answers if a.question_id == question.id),
+            None
+        )
+        if answer:
+            questions_and_answers.append({
+                'question': question.question_text,
+                'answer': answer.answer_text
+            })
+
+    # Convert CV and JD to TOON format for the prompt
+    cv_toon = document_toon(request.updated_cv, None)
+    jd_toon = document_toon(request.parsed_jd, request.jd_id)
+
+    # Generate resume rewrite prompt with TOON format
+    return get_resume_rewrite_prompt(
+        updated_cv_toon=cv_toon,
+        answers=questions_and_answers,
+        jd_toon=jd_toon,
+        language=request.language
+    )
+
+
+def build_rewrite_response(response_text: str, start_time: float, model_name: str) -> RewriteResumeResponse:
+    """
+    Parse a completed rewrite generation into a RewriteResumeResponse.
+
+    Raises:
+        json.JSONDecodeError: If the model output is not valid JSON
+    """
+    cleaned_text = response_text.strip()
+    if cleaned_text.startswith("```"):
+        lines = cleaned_text.split("\n")
+        if len(lines) > 1:
+            lines = lines[1:]
+        if lines and lines[-1].strip() == "```":
+            lines = lines[:-1]
+        cleaned_text = "\n".join(lines).strip()
+
+    result = json.loads(cleaned_text)
+
+    # Convert sample_format to parsed_format (strip HTML, camelCase -> snake_case)
+    parsed_format = convert_sample_to_parsed_format(result.get("sample_format", {}))
+
+    elapsed_time = time.time() - start_time
+
+    return RewriteResumeResponse(
+        success=True,
+        sample_format=result.get("sample_format", {}),
+        parsed_format=parsed_format,
+        enhancements_made=result.get("enhancements_made", []),
+        time_seconds=round(elapsed_time, 3),
+        model=model_name
+    )
+
+
 @app.post("/api/rewrite-resume", response_model=RewriteResumeResponse)
 async def rewrite_resume(request: RewriteResumeRequest):
     """
@@ -3067,70 +3728,28 @@ async def rewrite_resume(request: RewriteResumeRequest):
     Generates sample.json format (camelCase, HTML) and converts to parsed CV format (snake_case).
     Uses TOON format in prompt to reduce tokens and faster model for performance.
     """
+    # DOCUMENT STORE: documents may be sent as cv_id / jd_id
+    resolve_document_refs(request)
     try:
         start_time = time.time()
 
-        # Match questions with answers
-        questions_and_answers = []
-        for question in request.questions:
-            answer = next(
-                (a for a in request.answers if a.question_id == question.id),
-                None
-            )
-            if answer:
-                questions_and_answers.append({
-                    'question': question.question_text,
-                    'answer': answer.answer_text
-                })
-
-        # Convert CV and JD to TOON format for the prompt
-        cv_toon = to_toon(request.updated_cv)
-        jd_toon = to_toon(request.parsed_jd)
-
-        # Generate resume rewrite prompt with TOON format
-        rewrite_prompt = get_resume_rewrite_prompt(
-            updated_cv_toon=cv_toon,
-            answers=questions_and_answers,
-            jd_toon=jd_toon,
-            language=request.language
-        )
+        rewrite_prompt = build_resume_rewrite_prompt(request)
 
         # Call Gemini AI to rewrite resume (with explicit prompt caching and GPT-3.5 fallback)
         model_name = "gemini-2.5-flash-lite"
-        response_text, provider = generate_with_cache(
+        response_text, provider = await generate_with_cache_async(
             prompt=rewrite_prompt,
             model=model_name,
             temperature=0.3,  # Slightly creative for better writing
-            cache_ttl=300  # 5 minutes cache
+            cache_ttl=300,  # 5 minutes cache
+            call_site="resume_rewrite"
         )
         print(f"✅ Resume rewrite completed using {provider}")
 
-        # Parse response
-        cleaned_text = response_text.strip()
-        if cleaned_text.startswith("```"):
-            lines = cleaned_text.split("\n")
-            if len(lines) > 1:
-                lines = lines[1:]
-            if lines and lines[-1].strip() == "```":
-                lines = lines[:-1]
-            cleaned_text = "\n".join(lines).strip()
-
-        result = json.loads(cleaned_text)
-
-        # Convert sample_format to parsed_format (strip HTML, camelCase -> snake_case)
-        parsed_format = convert_sample_to_parsed_format(result.get("sample_format", {}))
-
-        elapsed_time = time.time() - start_time
-
-        return RewriteResumeResponse(
-            success=True,
-            sample_format=result.get("sample_format", {}),
-            parsed_format=parsed_format,
-            enhancements_made=result.get("enhancements_made", []),
-            time_seconds=round(elapsed_time, 3),
-            model=model_name
-        )
+        return build_rewrite_response(response_text, start_time, model_name)
 
+    except (DeadlineExceededError, HTTPException):
+        raise
     except Exception as e:
         print(f"Error rewriting resume: {str(e)}")
         raise HTTPException(
@@ -3176,7 +3795,7 @@ async def generate_cover_letter_endpoint(request: CoverLetterRequest):
             model="gemini-2.5-flash-lite"
         )
 
-    except HTTPException:
+    except (DeadlineExceededError, HTTPException):
         raise
     except Exception as e:
         print(f"Error generating cover letter: {str(e)}")
@@ -3186,6 +3805,479 @@ async def generate_cover_letter_endpoint(request: CoverLetterRequest):
         )
 
 
+# ============= Streaming (SSE) Variants for Long Generations =============
+# Time to first byte drops from full generation time to first-token latency.
+# Event protocol:
+#   event: meta   -> {"provider": ..., "cached": bool}   (sent once, before tokens)
+#   event: token  -> {"text": "..."}                       (raw provider chunks)
+#   event: done   -> final response model as JSON          (assembled + validated)
+#   event: error  -> {"detail": "..."}
+
+def sse_event(event: str, data: dict) -> str:
+    """Format a single server-sent event frame."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+def sse_event_raw(event: str, raw: bytes) -> str:
+    """Server-sent event frame for already-serialized (single-line) JSON, e.g. a cached result."""
+    return f"event: {event}\ndata: {raw.decode('utf-8')}\n\n"
+
+
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no",  # Disable proxy buffering so tokens flush immediately
+}
+
+
+def get_stream_cache_key(namespace: str, payload: dict) -> str:
+    """Build a deterministic cache key for a streamed generation's final result."""
+    payload_hash = hashlib.md5(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+    return f"stream:{namespace}:{payload_hash}"
+
+
+async def relay_llm_stream(
+    request: Request,
+    prompt: str,
+    cache_key: str,
+    finalize,
+    call_site: str,
+    model_gemini: str = "gemini-2.5-flash-lite",
+    temperature: float = None,
+    start_time: float | None = None,
+):
+    """
+    Relay a provider token stream to the client as SSE, then emit the final result.
+
+    Gemini → OpenAI fallback happens inside stream_with_fallback_async before the
+    first token, so clients never see output from two providers. When the stream
+    completes, `finalize(full_text, provider)` assembles the response dict, which
+    is cached so a repeat request is answered with a single `done` event.
+    If the client disconnects, the upstream stream is closed (releasing the LLM
+    semaphore and HTTP connection) and nothing is cached.
+
+    Args:
+        request: Incoming request (used for disconnect detection)
+        prompt: Prompt text to stream
+        cache_key: Cache key for the final result
+        finalize: Callable (full_text, provider) -> dict producing the final payload
+        call_site: Tag for token accounting (e.g. "cover_letter")
+        model_gemini: Primary Gemini model
+        temperature: Generation temperature
+        start_time: Request start; a replayed result's time_seconds reports the
+            replay's duration (default: when the relay starts)
+
+    Yields:
+        SSE-formatted strings
+    """
+    start_time = start_time if start_time is not None else time.time()
+
+    # CACHE: Replay a previously completed generation (Redis, then the cold tier)
+    # NON-BLOCKING: Cache failures fall through to a fresh stream
+    try:
+        cached_result = await get_result_raw(cache_key)
+        if cached_result:
+            print(f"✅ Cache HIT for streamed generation ({cache_key.split(':')[1]})")
+            yield sse_event("meta", {"provider": None, "cached": True})
+            yield sse_event_raw("done", patch_time_seconds(cached_result, time.time() - start_time))
+            return
+    except Exception as cache_error:
+        print(f"⚠️  Stream cache retrieval failed: {cache_error}. Streaming fresh generation.")
+
+    chunks = []
+    provider = None
+    stream = stream_with_fallback_async(
+        prompt=prompt,
+        model_gemini=model_gemini,
+        temperature=temperature,
+        call_site=call_site
+    )
+    try:
+        async for chunk, provider in stream:
+            if await request.is_disconnected():
+                print(f"⚠️  Client disconnected mid-stream, closing {provider} stream")
+                return
+            if not chunks:
+                yield sse_event("meta", {"provider": provider, "cached": False})
+            chunks.append(chunk)
+            yield sse_event("token", {"text": chunk})
+    except Exception as e:
+        print(f"Error during streamed generation: {e}")
+        yield sse_event("error", {"detail": str(e)})
+        return
+    finally:
+        # Close upstream on completion, error or disconnect (GeneratorExit)
+        await stream.aclose()
+
+    try:
+        result_dict = finalize("".join(chunks), provider)
+    except Exception as e:
+        print(f"Error assembling streamed result: {e}")
+        yield sse_event("error", {"detail": f"Failed to assemble result: {str(e)}"})
+        return
+
+    # CACHE: Store the assembled result (hot TTL in Redis, long-term in the cold tier)
+    # NON-BLOCKING: Cache failures don't affect the response
+    try:
+        store_result_raw(cache_key, fast_json.dumpb(result_dict))
+    except Exception as cache_error:
+        print(f"⚠️  Failed to cache streamed result: {cache_error}")
+
+    print(f"✅ Streamed generation completed using {provider}")
+    yield sse_event("done", result_dict)
+
+
+@app.post("/api/generate-cover-letter/stream")
+async def generate_cover_letter_stream(request: Request, body: CoverLetterRequest):
+    """
+    Streaming variant of /api/generate-cover-letter (server-sent events).
+    Tokens are relayed as they are generated; the final `done` event carries a
+    CoverLetterResponse.
+    """
+    if not body.parsed_resume or not body.parsed_jd:
+        raise HTTPException(
+            status_code=400,
+            detail="Both parsed_resume and parsed_jd are required"
+        )
+
+    start_time = time.time()
+    model_name = "gemini-2.5-flash-lite"
+    prompt, company_name, job_title = build_cover_letter_prompt(
+        body.parsed_resume, body.parsed_jd, body.score_data
+    )
+
+    def finalize(full_text: str, provider: str) -> dict:
+        cover_letter_text = full_text.strip()
+        if len(cover_letter_text) <= 100:
+            cover_letter_text = get_fallback_cover_letter(company_name, job_title)
+        return CoverLetterResponse(
+            success=True,
+            cover_letter=cover_letter_text,
+            word_count=len(cover_letter_text.split()),
+            time_seconds=round(time.time() - start_time, 3),
+            model=model_name
+        ).model_dump()
+
+    return StreamingResponse(
+        relay_llm_stream(
+            request,
+            prompt=prompt,
+            cache_key=get_stream_cache_key("cover", body.model_dump()),
+            finalize=finalize,
+            call_site="cover_letter",
+            model_gemini=model_name,
+            temperature=0.7,
+            start_time=start_time
+        ),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS
+    )
+
+
+@app.post("/api/rewrite-resume/stream")
+async def rewrite_resume_stream(request: Request, body: RewriteResumeRequest):
+    """
+    Streaming variant of /api/rewrite-resume (server-sent events).
+    Token events carry raw JSON text; the final `done` event carries a
+    validated RewriteResumeResponse.
+    """
+    # DOCUMENT STORE: documents may be sent as cv_id / jd_id
+    resolve_document_refs(body)
+    start_time = time.time()
+    model_name = "gemini-2.5-flash-lite"
+    rewrite_prompt = build_resume_rewrite_prompt(body)
+
+    def finalize(full_text: str, provider: str) -> dict:
+        return build_rewrite_response(full_text, start_time, model_name).model_dump()
+
+    return StreamingResponse(
+        relay_llm_stream(
+            request,
+            prompt=rewrite_prompt,
+            cache_key=get_stream_cache_key("rewrite", body.model_dump()),
+            finalize=finalize,
+            call_site="resume_rewrite",
+            model_gemini=model_name,
+            temperature=0.3,
+            start_time=start_time
+        ),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS
+    )
+
+
+async def progressive_score_events(request: Request, body: ScoreRequest, bypass_cache: bool):
+    """
+    Run the score graph and emit each part of the result as soon as its stage finishes.
+
+    Yields:
+        SSE-formatted strings (see calculate_score_stream for the protocol)
+    """
+    start_time = time.time()
+    cache_key = get_score_cache_key(body)
+
+    # CACHE: A previously completed score is a single `done` event
+    if not bypass_cache:
+        cached_result = await get_cached_score_json(cache_key)
+        if cached_result:
+            yield sse_event("meta", {"cached": True})
+            yield sse_event_raw("done", patch_time_seconds(cached_result, time.time() - start_time))
+            return
+
+    yield sse_event("meta", {"cached": False})
+
+    # Stage results are pushed from the graph as they complete; None marks the end
+    completed: asyncio.Queue = asyncio.Queue()
+    graph_task = asyncio.create_task(
+        run_score_graph(body, on_stage_complete=lambda name, result: completed.put_nowait((name, result)))
+    )
+    graph_task.add_done_callback(lambda _: completed.put_nowait(None))
+
+    overall_score = None
+    try:
+        while (item := await completed.get()) is not None:
+            if await request.is_disconnected():
+                print("⚠️  Client disconnected during progressive scoring, cancelling pipeline")
+                return
+            name, result = item
+            if name == "category_scores":
+                overall_score = result["overall_score"]
+                print(f"📤 Streaming scores ({time.time() - start_time:.2f}s)")
+                yield sse_event("scores", {
+                    "overall_score": result["overall_score"],
+                    "overall_status": result["overall_status"],
+                    "category_scores": {key: score.model_dump() for key, score in result["scores"].items()},
+                })
+            elif name == "gap_analysis":
+                sections = build_gap_sections(result)
+                print(f"📤 Streaming gaps and strengths ({time.time() - start_time:.2f}s)")
+                yield sse_event("analysis", {
+                    "gaps": sections["gaps"].model_dump(),
+                    "strengths": [strength.model_dump() for strength in sections["strengths"]],
+                    "application_viability": sections["application_viability"].model_dump(),
+                })
+            elif name == "score_message":
+                yield sse_event("message", result or get_fallback_message(overall_score))
+        run = graph_task.result()
+    except Exception as e:
+        print(f"❌ ERROR in progressive scoring: {type(e).__name__}: {e}")
+        yield sse_event("error", {"detail": f"Error calculating score: {str(e)}"})
+        return
+    finally:
+        # Client disconnect (GeneratorExit) or error: stop the remaining stages
+        if not graph_task.done():
+            graph_task.cancel()
+
+    print(f"⏱️  Critical path: {run.summary()}")
+    response = build_score_response(run, time.time() - start_time)
+    # Same cache entry as /api/calculate-score, so later calls take the instant path
+    cache_score_response(cache_key, response)
+    yield sse_event("done", json.loads(response.model_dump_json()))
+
+
+@app.post("/api/calculate-score/stream")
+@limiter.limit("20/minute")  # Same budget as /api/calculate-score
+async def calculate_score_stream(request: Request, body: ScoreRequest, bypass_cache: bool = False):
+    """
+    Progressive variant of /api/calculate-score (server-sent events).
+
+    Numeric scores are ready after the embedding/classification stages, long
+    before the LLM text, so they are sent first:
+
+        event: meta      -> {"cached": bool}
+        event: scores    -> overall_score, overall_status, category_scores
+        event: analysis  -> gaps, strengths, application_viability
+        event: message   -> score_message {"title", "subtitle"}
+        event: done      -> complete ScoreResponse (cached like /api/calculate-score)
+        event: error     -> {"detail": "..."}
+
+    A cache hit is answered with `meta` + `done` only.
+    """
+    # DOCUMENT STORE: documents may be sent as cv_id / jd_id
+    resolve_document_refs(body)
+    return StreamingResponse(
+        progressive_score_events(request, body, bypass_cache),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS
+    )
+
+
+# ========================================
+# Bulk Scoring Jobs
+# ========================================
+
+# JOB QUEUE: many (CV, JD) pairs scored in the background on a bounded worker
+# pool. Clients submit once and poll, page or stream results instead of looping
+# over the rate-limited /api/calculate-score.
+job_queue = get_job_queue()
+
+
+class BulkScoreItem(BaseModel):
+    parsed_cv: dict | None = None
+    parsed_jd: dict | None = None
+    cv_id: str | None = None
+    jd_id: str | None = None
+    language: str | None = None  # Defaults to the job's language
+
+
+class BulkScoreRequest(BaseModel):
+    items: list[BulkScoreItem]
+    language: str = "english"
+
+
+class BulkJobResponse(BaseModel):
+    job_id: str
+    kind: str
+    status: str  # queued, running, completed, cancelled
+    total: int
+    completed: int
+    failed: int
+    progress: float  # 0.0 - 1.0
+    created_at: float
+    updated_at: float
+
+
+class BulkJobResultsResponse(BaseModel):
+    job_id: str
+    status: str
+    offset: int
+    limit: int
+    total: int
+    results: list[dict]  # {"index", "status": ok|error|pending, "result" | "error"}
+
+
+async def score_bulk_item(item: dict, params: dict) -> dict:
+    """
+    JOB QUEUE handler: score one pair of a bulk job.
+    Each item gets the calculate-score budget and its token usage is tagged
+    with the bulk endpoint. Errors (e.g. an unknown doc_id) fail only this item.
+    """
+    body = ScoreRequest(**{**item, "language": item.get("language") or params.get("language", "english")})
+    resolve_document_refs(body)
+    deadline_token = set_deadline(settings.endpoint_budgets.get("/api/calculate-score"))
+    endpoint_token = current_endpoint.set("/api/jobs/score")
+    try:
+        response = await compute_score(body)
+        return response.model_dump()
+    finally:
+        current_endpoint.reset(endpoint_token)
+        reset_deadline(deadline_token)
+
+
+job_queue.register_handler("score", score_bulk_item)
+
+
+def get_job_or_404(job_id: str) -> dict:
+    """Job metadata or a 404 for unknown/expired jobs."""
+    job = job_queue.get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown or expired job '{job_id}'")
+    return job
+
+
+def to_job_response(job: dict) -> BulkJobResponse:
+    return BulkJobResponse(**{field: job[field] for field in BulkJobResponse.model_fields})
+
+
+@app.post("/api/jobs/score", response_model=BulkJobResponse)
+@limiter.limit("10/minute")
+async def submit_bulk_score_job(request: Request, body: BulkScoreRequest):
+    """
+    Submit a batch of (CV, JD) pairs for background scoring.
+    Each item carries parsed_cv/cv_id and parsed_jd/jd_id (as /api/calculate-score).
+    Returns the job to poll (GET /api/jobs/{job_id}), page, stream or cancel.
+    """
+    if not body.items:
+        raise HTTPException(status_code=400, detail="A bulk job needs at least one item")
+    if len(body.items) > settings.bulk_job_max_items:
+        raise HTTPException(
+            status_code=400,
+            detail=f"A bulk job may contain at most {settings.bulk_job_max_items} items"
+        )
+    for index, item in enumerate(body.items):
+        if (item.parsed_cv is None and not item.cv_id) or (item.parsed_jd is None and not item.jd_id):
+            raise HTTPException(
+                status_code=422,
+                detail=f"Item {index}: parsed_cv or cv_id and parsed_jd or jd_id are required"
+            )
+
+    job_id = await job_queue.submit(
+        "score",
+        [item.model_dump(exclude_none=True) for item in body.items],
+        {"language": body.language}
+    )
+    print(f"📦 Bulk score job {job_id} submitted ({len(body.items)} items)")
+    return to_job_response(get_job_or_404(job_id))
+
+
+@app.get("/api/jobs/{job_id}", response_model=BulkJobResponse)
+async def get_bulk_job(job_id: str):
+    """Status and progress of a bulk job."""
+    return to_job_response(get_job_or_404(job_id))
+
+
+@app.get("/api/jobs/{job_id}/results", response_model=BulkJobResultsResponse)
+async def get_bulk_job_results(job_id: str, offset: int = 0, limit: int = 50):
+    """
+    Page through per-item results in submission order.
+    Items that have not finished yet are returned with status "pending".
+    """
+    job = get_job_or_404(job_id)
+    limit = max(1, min(limit, 200))
+    return BulkJobResultsResponse(
+        job_id=job_id,
+        status=job["status"],
+        offset=offset,
+        limit=limit,
+        total=job["total"],
+        results=job_queue.get_results(job_id, offset, limit)
+    )
+
+
+@app.get("/api/jobs/{job_id}/stream")
+async def stream_bulk_job(request: Request, job_id: str):
+    """
+    Stream a bulk job's results as they finish (server-sent events):
+
+        event: result    -> {"index", "status", "result" | "error"} (finish order)
+        event: progress  -> job status and counters, after each batch of results
+        event: done      -> final job status (completed or cancelled)
+
+    Results that finished before the client connected are sent first.
+    """
+    get_job_or_404(job_id)
+
+    async def events():
+        sent: set[int] = set()
+        while True:
+            if await request.is_disconnected():
+                return
+            job = job_queue.get_job(job_id)
+            if job is None:
+                yield sse_event("error", {"detail": f"Unknown or expired job '{job_id}'"})
+                return
+            results = job_queue.finished_results(job_id, sent)
+            for result in results:
+                sent.add(result["index"])
+                yield sse_event("result", result)
+            if job["status"] in ("completed", "cancelled"):
+                yield sse_event("done", to_job_response(job).model_dump())
+                return
+            if results:
+                yield sse_event("progress", to_job_response(job).model_dump())
+            await asyncio.sleep(0.5)
+
+    return StreamingResponse(events(), media_type="text/event-stream", headers=SSE_HEADERS)
+
+
+@app.post("/api/jobs/{job_id}/cancel", response_model=BulkJobResponse)
+async def cancel_bulk_job(job_id: str):
+    """Cancel a bulk job. Finished item results stay available."""
+    get_job_or_404(job_id)
+    if job_queue.cancel(job_id):
+        print(f"🛑 Bulk job {job_id} cancelled")
+    return to_job_response(get_job_or_404(job_id))
+
+
 @app.get("/health")
 async def health():
     """Detailed health check"""
@@ -3228,10 +4320,11 @@ async def get_cache_stats():
         print(f"⚠️  Prompt cache stats retrieval failed: {cache_error}. Returning error response.")
         prompt_cache_stats = {"error": str(cache_error)}
 
-    # Combine both
+    # Combine both (plus the Postgres cold tier behind Redis)
     return {
         **app_cache_stats,
-        "prompt_caching": prompt_cache_stats
+        "prompt_caching": prompt_cache_stats,
+        "cold_tier": cold_store.get_stats()
     }
 
 @app.post("/api/cache/clear-domains")
@@ -3309,8 +4402,10 @@ class StartAdaptiveQuestionRequest(BaseModel):
     question_data: dict
     gap_info: dict
     user_id: str
-    parsed_cv: dict
-    parsed_jd: dict
+    parsed_cv: dict | None = None
+    parsed_jd: dict | None = None
+    cv_id: str | None = None
+    jd_id: str | None = None
     experience_check_response: str  # "yes" or "no"
     language: str = "english"
 
@@ -3339,6 +4434,8 @@ async def start_adaptive_question(request: StartAdaptiveQuestionRequest):
     - "yes" → Returns deep_dive_prompts for detailed questioning
     - "no" → Skips the question
     """
+    # DOCUMENT STORE: documents may be sent as cv_id / jd_id
+    resolve_document_refs(request)
     try:
         from core.workflow.adaptive_question_graph import AdaptiveQuestionWorkflow, create_initial_state
 
@@ -3390,6 +4487,8 @@ async def start_adaptive_question(request: StartAdaptiveQuestionRequest):
 
         return AdaptiveQuestionResponse(**response_data)
 
+    except (DeadlineExceededError, HTTPException):
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Workflow error: {str(e)}")
 
@@ -3467,6 +4566,8 @@ async def submit_structured_inputs(request: SubmitStructuredInputsRequest):
             error=state.get("error")
         )
 
+    except (DeadlineExceededError, HTTPException):
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Answer generation error: {str(e)}")
 
@@ -3535,6 +4636,8 @@ async def refine_answer(request: SubmitRefinementDataRequest):
             error=state.get("error")
         )
 
+    except (DeadlineExceededError, HTTPException):
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Refinement error: {str(e)}")
 
@@ -3572,19 +4675,55 @@ async def format_answer_endpoint(request: FormatAnswerRequest):
 
         return formatted
 
+    except (DeadlineExceededError, HTTPException):
+        raise
     except json.JSONDecodeError as e:
         raise HTTPException(status_code=500, detail=f"Failed to parse AI response: {str(e)}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Formatting error: {str(e)}")
 
 
+@app.post("/api/format-answer/stream")
+async def format_answer_stream(request: Request, body: FormatAnswerRequest):
+    """
+    Streaming variant of /api/format-answer (server-sent events).
+    Token events carry raw JSON text; the final `done` event carries a FormattedAnswer.
+    """
+    from core.workflow.answer_formatter import build_formatting_prompt, parse_formatted_answer
+
+    prompt = build_formatting_prompt(
+        question_text=body.question_text,
+        answer_text=body.answer_text,
+        gap_info=body.gap_info,
+        refinement_data=body.refinement_data,
+        language=body.language
+    )
+
+    def finalize(full_text: str, provider: str) -> dict:
+        return parse_formatted_answer(full_text, body.answer_text).model_dump()
+
+    return StreamingResponse(
+        relay_llm_stream(
+            request,
+            prompt=prompt,
+            cache_key=get_stream_cache_key("format", body.model_dump()),
+            finalize=finalize,
+            call_site="answer_formatting"
+        ),
+        media_type="text/event-stream",
+        headers=SSE_HEADERS
+    )
+
+
 # ============= Skill Gap Analysis (No Experience) =============
 
 class SkillGapAnalysisRequest(BaseModel):
     question_id: str
     question_title: str  # e.g., "Docker", "React"
-    parsed_cv: dict
-    parsed_jd: dict
+    parsed_cv: dict | None = None
+    parsed_jd: dict | None = None
+    cv_id: str | None = None
+    jd_id: str | None = None
 
 
 class SkillGapAnalysisResponse(BaseModel):
@@ -3604,6 +4743,8 @@ async def analyze_skill_gap(request: SkillGapAnalysisRequest):
 
     Used when user clicks "I have no experience" button.
     """
+    # DOCUMENT STORE: documents may be sent as cv_id / jd_id
+    resolve_document_refs(request)
     try:
         from app.config import get_skill_gap_analysis_prompt
 
@@ -3619,7 +4760,8 @@ async def analyze_skill_gap(request: SkillGapAnalysisRequest):
         response_text, provider = await generate_with_fallback_async(
             prompt=prompt,
             model_gemini=model_name,
-            temperature=0.3  # Slightly higher for creative, personalized messages
+            temperature=0.3,  # Slightly higher for creative, personalized messages
+            call_site="skill_gap_analysis"
         )
         print(f"✅ Skill gap analysis completed using {provider} (async)")
         response_text = response_text.strip()
@@ -3641,6 +4783,8 @@ async def analyze_skill_gap(request: SkillGapAnalysisRequest):
             message=analysis['message']
         )
 
+    except (DeadlineExceededError, HTTPException):
+        raise
     except json.JSONDecodeError as e:
         raise HTTPException(
             status_code=500,
@@ -3719,3 +4863,20 @@ async def startup_event():
         print(f"   Cache will NOT be shared across workers/restarts")
         print(f"   Set REDIS_URL in .env to enable shared caching")
     print(f"{'='*60}\n")
+
+    # GAZETTEER: seed + learned industry entries into memory before the first request
+    industry_gazetteer.load()
+
+    # COLD TIER: Postgres behind Redis for parse/score results (no-op without DATABASE_URL)
+    if await cold_store.start():
+        print(f"📦 Cold tier: ENABLED (Redis result TTL {settings.result_hot_ttl}s, Postgres {settings.result_cache_ttl}s)")
+
+    # JOB QUEUE: resume bulk jobs left unfinished by a restart
+    await job_queue.start()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop local bulk job runners (unfinished jobs resume on the next start) and flush the cold tier."""
+    await job_queue.stop()
+    await cold_store.stop()
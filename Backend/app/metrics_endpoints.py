@@ -37,6 +37,12 @@ class CostMetricsResponse(BaseModel):
     costs: Dict[str, Any] = Field(description="Cost statistics")
 
 
+class TokenUsageMetricsResponse(BaseModel):
+    """Token usage metrics response."""
+    metadata: MetricsMetadata
+    token_usage: Dict[str, Any] = Field(description="Token usage and latency grouped by tag")
+
+
 class QualityMetricsResponse(BaseModel):
     """Quality metrics response."""
     metadata: MetricsMetadata
@@ -49,6 +55,42 @@ class CacheMetricsResponse(BaseModel):
     cache: Dict[str, Any] = Field(description="Cache hit rates")
 
 
+class CircuitBreakerMetricsResponse(BaseModel):
+    """Circuit breaker metrics response."""
+    metadata: MetricsMetadata
+    circuit_breakers: Dict[str, Any] = Field(description="State, window failure rate and trip/recovery timings per breaker")
+
+
+class ClientPoolMetricsResponse(BaseModel):
+    """Shared HTTP connection pool metrics response."""
+    metadata: MetricsMetadata
+    pools: Dict[str, Any] = Field(description="Connection and request counts per shared pool")
+
+
+class NearDuplicateMetricsResponse(BaseModel):
+    """Near-duplicate parse cache metrics response."""
+    metadata: MetricsMetadata
+    near_duplicate: Dict[str, Any] = Field(description="Hit rate and best-candidate similarity histogram")
+
+
+class RoleClassifierMetricsResponse(BaseModel):
+    """Tiered role classifier metrics response."""
+    metadata: MetricsMetadata
+    role_classifier: Dict[str, Any] = Field(description="Hits per tier and embedding-tier similarity histogram")
+
+
+class IndustryGazetteerMetricsResponse(BaseModel):
+    """Industry gazetteer metrics response."""
+    metadata: MetricsMetadata
+    industry_gazetteer: Dict[str, Any] = Field(description="Hits per tier, index size and embedding-tier similarity histogram")
+
+
+class ModelRoutingMetricsResponse(BaseModel):
+    """Complexity routing metrics response."""
+    metadata: MetricsMetadata
+    model_routing: Dict[str, Any] = Field(description="Latency, failures and invalid outputs per route and tier")
+
+
 class HealthMetricsResponse(BaseModel):
     """System health response."""
     metadata: MetricsMetadata
@@ -60,6 +102,7 @@ class DashboardMetricsResponse(BaseModel):
     metadata: MetricsMetadata
     performance: Dict[str, Any]
     costs: Dict[str, Any]
+    token_usage: Dict[str, Any]
     quality: Dict[str, Any]
     cache: Dict[str, Any]
     health: Dict[str, Any]
@@ -104,6 +147,7 @@ async def get_dashboard_metrics(
             metadata=metadata,
             performance=summary["performance"],
             costs=summary["costs"],
+            token_usage=summary["token_usage"],
             quality=summary["quality"],
             cache=summary["cache"],
             health=summary["health"]
@@ -216,6 +260,59 @@ async def get_cost_metrics(
         )
 
 
+async def get_token_usage_metrics(
+    time_window_minutes: int = Query(default=60, ge=1, le=1440),
+    group_by: str = Query(default="endpoint", description="Group by endpoint, call_site, model or provider")
+) -> TokenUsageMetricsResponse:
+    """
+    Get token usage metrics.
+
+    Returns provider-reported input, output and cached tokens with call
+    latency, aggregated by endpoint, call site, model or provider.
+
+    Args:
+        time_window_minutes: Time window for metrics
+        group_by: Metadata tag to aggregate on
+
+    Returns:
+        TokenUsageMetricsResponse with per-group token and latency stats
+
+    Example:
+        GET /api/metrics/tokens?group_by=call_site&time_window_minutes=60
+    """
+    if group_by not in ("endpoint", "call_site", "model", "provider"):
+        raise HTTPException(
+            status_code=400,
+            detail="group_by must be one of: endpoint, call_site, model, provider"
+        )
+
+    try:
+        from datetime import datetime
+
+        collector = get_metrics_collector()
+
+        token_usage = collector.get_token_usage_stats(
+            group_by=group_by,
+            time_window_minutes=time_window_minutes
+        )
+
+        metadata = MetricsMetadata(
+            timestamp=datetime.utcnow().isoformat(),
+            time_window_minutes=time_window_minutes
+        )
+
+        return TokenUsageMetricsResponse(
+            metadata=metadata,
+            token_usage=token_usage
+        )
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to retrieve token usage metrics: {str(e)}"
+        )
+
+
 async def get_quality_metrics(
     time_window_minutes: int = Query(default=60, ge=1, le=1440),
     gap_priority: Optional[str] = Query(
@@ -301,6 +398,213 @@ async def get_cache_metrics() -> CacheMetricsResponse:
         )
 
 
+async def get_circuit_breaker_metrics() -> CircuitBreakerMetricsResponse:
+    """
+    Get circuit breaker metrics.
+
+    Returns per-service/per-model breaker state, sliding-window failure rate,
+    trip counts and the duration of the most recent open period.
+
+    Returns:
+        CircuitBreakerMetricsResponse with breaker statistics
+
+    Example:
+        GET /api/metrics/circuit-breakers
+    """
+    try:
+        from datetime import datetime
+        from core.config.circuit_breaker import get_all_circuit_breaker_stats
+
+        metadata = MetricsMetadata(
+            timestamp=datetime.utcnow().isoformat(),
+            time_window_minutes=0  # Breaker stats are current state
+        )
+
+        return CircuitBreakerMetricsResponse(
+            metadata=metadata,
+            circuit_breakers=get_all_circuit_breaker_stats()
+        )
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to retrieve circuit breaker metrics: {str(e)}"
+        )
+
+
+async def get_client_pool_metrics() -> ClientPoolMetricsResponse:
+    """
+    Get shared HTTP connection pool metrics.
+
+    Returns active/idle/HTTP2 connection counts, in-flight and queued requests
+    and utilization for the sync and async pools behind every provider client.
+
+    Returns:
+        ClientPoolMetricsResponse with pool statistics
+
+    Example:
+        GET /api/metrics/clients
+    """
+    try:
+        from datetime import datetime
+        from core.config.clients import ClientFactory
+
+        metadata = MetricsMetadata(
+            timestamp=datetime.utcnow().isoformat(),
+            time_window_minutes=0  # Pool stats are a current snapshot
+        )
+
+        return ClientPoolMetricsResponse(
+            metadata=metadata,
+            pools=ClientFactory.get_pool_stats()
+        )
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to retrieve client pool metrics: {str(e)}"
+        )
+
+
+async def get_near_duplicate_metrics() -> NearDuplicateMetricsResponse:
+    """
+    Get near-duplicate parse cache metrics.
+
+    Returns lookups, hits, misses, hit rate and the distribution of the best
+    candidate similarity per lookup, for tuning the JD/CV thresholds.
+
+    Returns:
+        NearDuplicateMetricsResponse with index statistics
+
+    Example:
+        GET /api/metrics/near-duplicate
+    """
+    try:
+        from datetime import datetime
+        from core.caching.near_duplicate import get_near_duplicate_index
+
+        metadata = MetricsMetadata(
+            timestamp=datetime.utcnow().isoformat(),
+            time_window_minutes=0  # Counters since process start
+        )
+
+        return NearDuplicateMetricsResponse(
+            metadata=metadata,
+            near_duplicate=get_near_duplicate_index().get_stats()
+        )
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to retrieve near-duplicate metrics: {str(e)}"
+        )
+
+
+async def get_role_classifier_metrics() -> RoleClassifierMetricsResponse:
+    """
+    Get tiered role classifier metrics.
+
+    Returns titles classified per tier (exact, token, embedding, llm), the
+    share that reached the LLM and the best-neighbour similarity distribution
+    of embedding-tier lookups, for tuning the kNN threshold.
+
+    Returns:
+        RoleClassifierMetricsResponse with classifier statistics
+
+    Example:
+        GET /api/metrics/role-classifier
+    """
+    try:
+        from datetime import datetime
+        from core.caching.role_classifier import get_role_classifier
+
+        metadata = MetricsMetadata(
+            timestamp=datetime.utcnow().isoformat(),
+            time_window_minutes=0  # Counters since process start
+        )
+
+        return RoleClassifierMetricsResponse(
+            metadata=metadata,
+            role_classifier=get_role_classifier().get_stats()
+        )
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to retrieve role classifier metrics: {str(e)}"
+        )
+
+
+async def get_industry_gazetteer_metrics() -> IndustryGazetteerMetricsResponse:
+    """
+    Get industry gazetteer metrics.
+
+    Returns texts classified per tier (exact, keyword, embedding, llm), the
+    share that reached the LLM, seed / learned entry counts and the
+    best-neighbour similarity distribution of embedding-tier lookups.
+
+    Returns:
+        IndustryGazetteerMetricsResponse with gazetteer statistics
+
+    Example:
+        GET /api/metrics/industry-gazetteer
+    """
+    try:
+        from datetime import datetime
+        from core.caching.industry_gazetteer import get_industry_gazetteer
+
+        metadata = MetricsMetadata(
+            timestamp=datetime.utcnow().isoformat(),
+            time_window_minutes=0  # Counters since process start
+        )
+
+        return IndustryGazetteerMetricsResponse(
+            metadata=metadata,
+            industry_gazetteer=get_industry_gazetteer().get_stats()
+        )
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to retrieve industry gazetteer metrics: {str(e)}"
+        )
+
+
+async def get_model_routing_metrics() -> ModelRoutingMetricsResponse:
+    """
+    Get complexity-aware model routing metrics.
+
+    Returns, per route (parse_jd, parse_cv, gap_analysis, domain_finder) and
+    tier: calls, provider usage, fallbacks, failures, invalid outputs,
+    average input complexity and latency percentiles, plus the active policy.
+
+    Returns:
+        ModelRoutingMetricsResponse with routing statistics
+
+    Example:
+        GET /api/metrics/model-routing
+    """
+    try:
+        from datetime import datetime
+        from core.config.model_routing import get_route_stats
+
+        metadata = MetricsMetadata(
+            timestamp=datetime.utcnow().isoformat(),
+            time_window_minutes=0  # Counters since process start
+        )
+
+        return ModelRoutingMetricsResponse(
+            metadata=metadata,
+            model_routing=get_route_stats()
+        )
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to retrieve model routing metrics: {str(e)}"
+        )
+
+
 async def get_health_metrics() -> HealthMetricsResponse:
     """
     Get system health metrics (Phase 3.1).
@@ -355,6 +659,7 @@ async def dashboard_endpoint(
     Returns all metric types in a single response:
     - Performance (latency, throughput)
     - Costs (LLM usage, projections)
+    - Token usage (per endpoint)
     - Quality (scores, refinement rates)
     - Cache (hit rates)
     - Health (component status)
@@ -411,6 +716,27 @@ async def costs_endpoint(
     """
     return await get_cost_metrics(time_window_minutes, operation)
 
+@router.get("/api/metrics/tokens", response_model=TokenUsageMetricsResponse)
+async def tokens_endpoint(
+    time_window_minutes: int = Query(default=60, ge=1, le=1440),
+    group_by: str = Query(default="endpoint")
+):
+    """
+    Get token usage metrics.
+
+    Returns per group (endpoint, call_site, model or provider):
+    - Call count
+    - Input / output / cached tokens (from provider usage metadata)
+    - Cost (USD)
+    - Average and p95 call latency
+
+    Useful for:
+    - Per-endpoint token and latency budgets
+    - Finding prompts worth trimming
+    - Prompt cache effectiveness
+    """
+    return await get_token_usage_metrics(time_window_minutes, group_by)
+
 @router.get("/api/metrics/quality", response_model=QualityMetricsResponse)
 async def quality_endpoint(
     time_window_minutes: int = Query(default=60, ge=1, le=1440),
@@ -450,6 +776,103 @@ async def cache_endpoint():
     """
     return await get_cache_metrics()
 
+@router.get("/api/metrics/circuit-breakers", response_model=CircuitBreakerMetricsResponse)
+async def circuit_breakers_endpoint():
+    """
+    Get circuit breaker state.
+
+    Returns per breaker (e.g. "gemini:gemini-2.5-flash-lite"):
+    - State (closed / open / half_open)
+    - Sliding-window calls, failures and failure rate
+    - Trip count, last trip / recovery time, last open duration
+
+    Useful for:
+    - Provider outage detection
+    - Fallback tuning
+    """
+    return await get_circuit_breaker_metrics()
+
+@router.get("/api/metrics/clients", response_model=ClientPoolMetricsResponse)
+async def clients_endpoint():
+    """
+    Get shared HTTP connection pool utilization.
+
+    Returns per pool (sync / async):
+    - Active, idle and HTTP/2 connections
+    - In-flight and queued requests
+    - Utilization against http_max_connections
+
+    Useful for:
+    - Pool sizing (queued requests > 0 means the pool is too small)
+    - Verifying keep-alive reuse across subsystems
+    """
+    return await get_client_pool_metrics()
+
+@router.get("/api/metrics/near-duplicate", response_model=NearDuplicateMetricsResponse)
+async def near_duplicate_endpoint():
+    """
+    Get near-duplicate parse cache effectiveness.
+
+    Returns:
+    - Lookups, hits, misses and hit rate
+    - Histogram of the best candidate similarity per lookup
+    - Current JD / CV thresholds and LSH parameters
+
+    Useful for:
+    - Threshold tuning (mass just below the threshold = missed duplicates)
+    - Estimating LLM parse calls saved
+    """
+    return await get_near_duplicate_metrics()
+
+@router.get("/api/metrics/role-classifier", response_model=RoleClassifierMetricsResponse)
+async def role_classifier_endpoint():
+    """
+    Get tiered role classifier effectiveness.
+
+    Returns:
+    - Titles answered by each tier (exact, token, embedding, llm)
+    - Share of titles that still reached the LLM
+    - Histogram of the best embedding-neighbour similarity
+
+    Useful for:
+    - kNN threshold tuning (mass just below the threshold = avoidable LLM calls)
+    - Spotting common titles worth adding to the lookup table
+    """
+    return await get_role_classifier_metrics()
+
+@router.get("/api/metrics/industry-gazetteer", response_model=IndustryGazetteerMetricsResponse)
+async def industry_gazetteer_endpoint():
+    """
+    Get industry gazetteer effectiveness.
+
+    Returns:
+    - Texts answered by each tier (exact, keyword, embedding, llm)
+    - Share of texts that still reached the LLM (should fall over time)
+    - Seed, learned and embedded entry counts
+    - Histogram of the best embedding-neighbour similarity
+
+    Useful for:
+    - kNN threshold tuning
+    - Confirming LLM labels are being learned
+    """
+    return await get_industry_gazetteer_metrics()
+
+@router.get("/api/metrics/model-routing", response_model=ModelRoutingMetricsResponse)
+async def model_routing_endpoint():
+    """
+    Get complexity-aware model routing effectiveness.
+
+    Returns per route and tier (simple / standard / complex):
+    - Calls, provider usage, fallbacks and failures
+    - Invalid outputs (JSON that failed to parse or validate)
+    - Average complexity and latency p50/p95/p99
+
+    Useful for:
+    - Moving tier boundaries (invalid outputs concentrated in one tier)
+    - Checking the stronger model is only paid for where it helps
+    """
+    return await get_model_routing_metrics()
+
 @router.get("/api/metrics/health", response_model=HealthMetricsResponse)
 async def health_endpoint():
     """
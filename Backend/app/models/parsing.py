@@ -20,6 +20,7 @@ class ParseResponse(BaseModel):
     time_seconds: float
     model: str
     language: str
+    doc_id: Optional[str] = None  # Content-addressed ID of the parsed document (send as jd_id downstream)
 
 
 class CVParseRequest(BaseModel):
@@ -36,6 +37,7 @@ class CVParseResponse(BaseModel):
     time_seconds: float
     model: str
     language: str
+    doc_id: Optional[str] = None  # Content-addressed ID of the parsed document (send as cv_id downstream)
 
 
 class ParsedJobDescription(BaseModel):
@@ -0,0 +1,11 @@
+"""
+Services shared by the gateway (app.main) and the routers.
+"""
+
+from app.services.parsing import normalize_parse_input, parse_cache_key, run_parse
+
+__all__ = [
+    'normalize_parse_input',
+    'parse_cache_key',
+    'run_parse',
+]
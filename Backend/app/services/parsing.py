@@ -0,0 +1,289 @@
+"""
+JD/CV parsing service shared by the gateway (app.main) and the parsing router.
+
+One async pipeline per document: exact result cache (Redis, then the Postgres
+cold tier), then the near-duplicate index, then the LLM in JSON mode. Every
+fresh parse goes through the same JSON fast path (app.utils.markdown), gets a
+doc_id from the document store, is cached and indexed, and is recorded with
+the metrics collector.
+"""
+
+import hashlib
+import re
+import time
+from typing import Optional
+
+from app.config import get_cv_prompt, get_json_prompt
+from app.models.parsing import CVParseResponse, ParseResponse
+from app.utils.markdown import parse_json_response
+from app.utils.validation import MAX_TEXT_LENGTH, MIN_TEXT_LENGTH, SUPPORTED_LANGUAGES, validate_language
+from core.caching.document_store import get_document_store
+from core.caching.near_duplicate import get_near_duplicate_index
+from core.caching.result_cache import get_result_raw, store_result_raw
+from core.config.llm_fallback import generate_with_fallback_async
+from core.config.logging_config import logger
+from core.config.model_routing import record_invalid_output, select_route
+from core.config.settings import settings
+from core.monitoring.metrics_collector import get_metrics_collector
+from core.utils import fast_json
+
+# Parse input limits (shared by the single-document and batch endpoints)
+PARSE_MIN_CHARS = MIN_TEXT_LENGTH
+PARSE_MAX_CHARS = MAX_TEXT_LENGTH
+SUPPORTED_PARSE_LANGUAGES = SUPPORTED_LANGUAGES
+
+# ZERO-COPY: stored parse results that already carry a doc_id are served as-is
+DOC_ID_PATTERN = re.compile(rb'"doc_id":\s*"')
+
+# NEAR-DUPLICATE: CV contact details (a one-token edit barely moves the similarity)
+EMAIL_PATTERN = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+PHONE_PATTERN = re.compile(r"\+?\d[\d\s().-]{7,}\d")
+MIN_PHONE_DIGITS = 9
+
+# Per-kind differences of the pipeline
+PARSE_KINDS = {
+    "jd": {
+        "label": "JD",
+        "prompt": get_json_prompt,
+        "response_model": ParseResponse,
+        "min_fields": 5,
+        "operation": "parse_job_description",
+        "incomplete_error": "Failed to parse JSON completely",
+    },
+    "cv": {
+        "label": "CV",
+        "prompt": get_cv_prompt,
+        "response_model": CVParseResponse,
+        "min_fields": 3,
+        "operation": "parse_resume",
+        "incomplete_error": "Failed to parse CV JSON completely",
+    },
+}
+
+near_duplicate_index = get_near_duplicate_index()
+document_store = get_document_store()
+
+
+def normalize_parse_input(text: str, language: str) -> tuple[str, str]:
+    """Auto-truncate a document to PARSE_MAX_CHARS and map unsupported languages to english."""
+    return text[:PARSE_MAX_CHARS], validate_language(language)
+
+
+def parse_cache_key(kind: str, text: str, language: str) -> str:
+    """Exact parse cache key ("parse:jd:<md5>:<language>") of a normalized document."""
+    return f"parse:{kind}:{hashlib.md5(text.encode()).hexdigest()}:{language}"
+
+
+def put_parsed_document(kind: str, data: dict | None) -> str | None:
+    """
+    Store a successfully parsed document and return its doc_id.
+    NON-BLOCKING: Store failures return None, the parse result is still returned.
+    """
+    if not data:
+        return None
+    try:
+        return document_store.put(kind, data)
+    except Exception as e:
+        logger.warning(f"Document store failed for {kind.upper()}: {e}. Returning parse without doc_id.")
+        return None
+
+
+def contact_fingerprint(text: str) -> str:
+    """Hash of the emails and phone numbers in a document (order and formatting ignored)."""
+    emails = {email.lower() for email in EMAIL_PATTERN.findall(text)}
+    phones = {re.sub(r"\D", "", phone) for phone in PHONE_PATTERN.findall(text)}
+    contacts = sorted(emails) + sorted(phone for phone in phones if len(phone) >= MIN_PHONE_DIGITS)
+    return hashlib.md5("|".join(contacts).encode()).hexdigest()[:16]
+
+
+def near_duplicate_namespace(kind: str, text: str, language: str) -> str:
+    """
+    Near-duplicate index partition of a document.
+    CVs are also partitioned by their contact details: a CV that differs only
+    in an email or phone number must not get another person's parse.
+    """
+    if kind == "cv":
+        return f"cv:{language}:{contact_fingerprint(text)}"
+    return f"{kind}:{language}"
+
+
+def _same_person(parsed: dict, text: str) -> bool:
+    """True if the parsed CV's name (when it has one) appears in the new text."""
+    personal_info = (parsed.get("data") or {}).get("personal_info") or {}
+    name = personal_info.get("name") if isinstance(personal_info, dict) else None
+    if not isinstance(name, str) or not name.strip():
+        return True
+    return " ".join(name.split()).casefold() in " ".join(text.split()).casefold()
+
+
+async def find_near_duplicate_parse(kind: str, text: str, language: str):
+    """
+    Look up a previous parse of a near-identical document (after an exact-key miss).
+
+    Args:
+        kind: "jd" or "cv" (selects the similarity threshold)
+        text: Document text as sent to the parser
+        language: Parse language (documents never match across languages)
+
+    Returns:
+        tuple: (cached result dict or None, signature to index after a fresh parse)
+    """
+    if not settings.near_duplicate_enabled:
+        return None, None
+
+    # NON-BLOCKING: Fingerprint/index failures just mean a fresh parse
+    try:
+        threshold = settings.near_duplicate_threshold_jd if kind == "jd" else settings.near_duplicate_threshold_cv
+        signature = near_duplicate_index.fingerprint(text)
+        match = near_duplicate_index.lookup(near_duplicate_namespace(kind, text, language), signature, threshold)
+        if match:
+            matched_key, similarity = match
+            cached_result = await get_result_raw(matched_key)
+            if cached_result:
+                result = fast_json.loads(cached_result)
+                if kind == "cv" and not _same_person(result, text):
+                    logger.info(f"Near-duplicate CV match rejected: different name (similarity {similarity:.3f})")
+                    return None, signature
+                logger.info(f"Near-duplicate HIT for {kind.upper()} parsing (similarity {similarity:.3f})")
+                return result, signature
+        return None, signature
+    except Exception as e:
+        logger.warning(f"Near-duplicate lookup failed: {e}. Falling back to fresh parsing.")
+        return None, None
+
+
+def index_parsed_document(kind: str, text: str, language: str, signature, cache_key: str) -> None:
+    """Index a freshly cached parse so near-identical documents can reuse it."""
+    if signature is None:
+        return
+    try:
+        near_duplicate_index.add(near_duplicate_namespace(kind, text, language), signature, cache_key)
+    except Exception as e:
+        logger.warning(f"Near-duplicate indexing failed: {e}")
+
+
+async def run_parse(kind: str, text: str, language: str, check_cache: bool = True):
+    """
+    Parse one JD or CV: cache, then near-duplicate index, then LLM.
+
+    Args:
+        kind: "jd" or "cv"
+        text: Validated, truncated text (see normalize_parse_input)
+        language: Supported language
+        check_cache: False when the caller already looked up the cache key
+
+    Returns:
+        (source, result): source is "cache", "near_duplicate" or "llm"; result is
+        a ParseResponse / CVParseResponse, or for a cache hit the stored
+        response bytes (ZERO-COPY)
+    """
+    config = PARSE_KINDS[kind]
+    label, response_model = config["label"], config["response_model"]
+
+    # CACHE: Check if this document was parsed before
+    # NON-BLOCKING: Cache failures don't crash parsing
+    cache_key = parse_cache_key(kind, text, language)
+    try:
+        cached_result = await get_result_raw(cache_key) if check_cache else None
+        if cached_result:
+            logger.info(f"Cache HIT for {label} parsing")
+            if DOC_ID_PATTERN.search(cached_result):
+                # ZERO-COPY: the stored bytes are the response
+                return "cache", cached_result
+            # Parsed before doc_ids existed: add one and re-store so the next hit is zero-copy
+            result_dict = fast_json.loads(cached_result)
+            if result_dict.get("success"):
+                result_dict["doc_id"] = put_parsed_document(kind, result_dict.get("data"))
+                store_result_raw(cache_key, fast_json.dumpb(result_dict))
+            return "cache", response_model(**result_dict)
+    except Exception as cache_error:
+        logger.warning(f"{label} cache retrieval failed: {cache_error}. Falling back to fresh parsing.")
+
+    # NEAR-DUPLICATE: Same document re-scraped or re-pasted with different formatting
+    lookup_start = time.time()
+    near_duplicate_result, signature = await find_near_duplicate_parse(kind, text, language)
+    if near_duplicate_result:
+        # This request's time, not the original parse's
+        near_duplicate_result["time_seconds"] = round(time.time() - lookup_start, 3)
+        if not near_duplicate_result.get("doc_id"):
+            near_duplicate_result["doc_id"] = put_parsed_document(kind, near_duplicate_result.get("data"))
+        try:
+            store_result_raw(cache_key, fast_json.dumpb(near_duplicate_result))
+        except Exception as cache_error:
+            logger.warning(f"{label} cache storage failed: {cache_error}")
+        return "near_duplicate", response_model(**near_duplicate_result)
+
+    # ROUTING: model and output cap follow the input's complexity
+    start_time = time.time()
+    routing = select_route(f"parse_{kind}", text, document=kind)
+    model_name = routing.model_gemini
+
+    # JSON mode: Gemini returns bare JSON, so the fast path below skips fence stripping
+    response_text, provider = await generate_with_fallback_async(
+        prompt=config["prompt"](text, language),
+        temperature=settings.parsing_temperature,
+        call_site=f"parse_{kind}",
+        routing=routing,
+        response_mime_type="application/json",
+    )
+
+    elapsed_time = time.time() - start_time
+    logger.info(f"{label} parsing completed using {provider} in {elapsed_time:.2f}s")
+
+    # Record metrics for Grafana
+    get_metrics_collector().record_performance(
+        operation=config["operation"],
+        duration_ms=elapsed_time * 1000,
+        metadata={"success": True}
+    )
+
+    def failure(error: str):
+        record_invalid_output(routing)
+        return "llm", response_model(
+            success=False,
+            data={"raw_response": response_text[:500]},
+            error=error,
+            time_seconds=round(elapsed_time, 3),
+            model=model_name,
+            language=language
+        )
+
+    try:
+        parsed_data = parse_json_response(response_text)
+    except Exception as parse_error:
+        return failure(f"Parse error: {str(parse_error)}")
+    if not isinstance(parsed_data, dict) or len(parsed_data) < config["min_fields"]:
+        return failure(config["incomplete_error"])
+
+    result = response_model(
+        success=True,
+        data=parsed_data,
+        time_seconds=round(elapsed_time, 3),
+        model=model_name,
+        language=language,
+        doc_id=put_parsed_document(kind, parsed_data)
+    )
+
+    # CACHE: Store successful parse result
+    # NON-BLOCKING: Cache storage failures don't crash parsing
+    try:
+        store_result_raw(cache_key, result.model_dump_json().encode())
+        index_parsed_document(kind, text, language, signature, cache_key)
+    except Exception as cache_error:
+        logger.warning(f"{label} cache storage failed: {cache_error}. Result not cached, but returned to user.")
+
+    return "llm", result
+
+
+__all__ = [
+    'DOC_ID_PATTERN',
+    'PARSE_KINDS',
+    'PARSE_MAX_CHARS',
+    'PARSE_MIN_CHARS',
+    'SUPPORTED_PARSE_LANGUAGES',
+    'near_duplicate_namespace',
+    'normalize_parse_input',
+    'parse_cache_key',
+    'put_parsed_document',
+    'run_parse',
+]
@@ -2,7 +2,7 @@
 Utility functions for the HireHubAI Backend.
 """
 
-from app.utils.markdown import strip_markdown_code_blocks
+from app.utils.markdown import strip_markdown_code_blocks, extract_json_from_text, parse_json_response
 from app.utils.validation import (
     validate_language,
     validate_min_length,
@@ -11,6 +11,8 @@ from app.utils.validation import (
 
 __all__ = [
     'strip_markdown_code_blocks',
+    'extract_json_from_text',
+    'parse_json_response',
     'validate_language',
     'validate_min_length',
     'SUPPORTED_LANGUAGES',
@@ -3,6 +3,10 @@ Markdown processing utilities.
 Single source of truth for markdown cleanup functions.
 """
 
+from typing import Any
+
+from core.utils import fast_json
+
 
 def strip_markdown_code_blocks(text: str) -> str:
     """
@@ -81,6 +85,32 @@ def extract_json_from_text(text: str) -> str:
     return cleaned
 
 
+def parse_json_response(text: str) -> Any:
+    """
+    Decode the JSON in an LLM response.
+
+    Fast path: JSON-mode responses are bare JSON and are decoded directly.
+    Only when that fails is the text stripped of code fences and the
+    outermost object/array extracted (see extract_json_from_text).
+
+    Args:
+        text: LLM response text
+
+    Returns:
+        Decoded JSON value
+
+    Raises:
+        ValueError: If no JSON can be decoded (json.JSONDecodeError is a ValueError)
+    """
+    cleaned = text.strip() if text else ""
+    if cleaned[:1] in ("{", "["):
+        try:
+            return fast_json.loads(cleaned)
+        except ValueError:
+            pass
+    return fast_json.loads(extract_json_from_text(cleaned))
+
+
 def truncate_text(text: str, max_length: int = 6200) -> str:
     """
     Truncate text to a maximum length.
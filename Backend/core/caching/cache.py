@@ -8,17 +8,20 @@ Performance optimizations for 5,000+ concurrent users:
 - Atomic counters for statistics (no locking for stats)
 - Write lock only for L1 eviction (rare operation)
 - No lock held during Redis I/O operations
+- Large values are compressed in Redis (core.caching.compression); L1 keeps
+  them uncompressed so zero-copy hits stay free
 """
 
 import hashlib
-import json
 import time
 import threading
 from functools import lru_cache
 from typing import Optional, Tuple, Any
 
 from core.config.logging_config import logger
+from core.caching.compression import ValueCompressor
 from core.config.settings import settings
+from core.utils import fast_json
 
 # Try to import Redis, fall back gracefully if not available
 try:
@@ -30,6 +33,12 @@ except ImportError:
     BlockingConnectionPool = None
     logger.warning("redis package not installed, using in-memory cache only")
 
+# Keys with these prefixes are stored as-is; anything else is treated as text and hashed
+DIRECT_KEY_PREFIXES = ('ind:', 'role:', 'score:', 'doc:')
+
+# Compression stats namespaces (key prefix); every other key counts as "emb"
+VALUE_NAMESPACES = ('parse', 'domains', 'stream', 'score', 'ind', 'role', 'doc')
+
 
 class AtomicCounter:
     """Lock-free atomic counter using threading primitives."""
@@ -116,11 +125,28 @@ class EmbeddingCache:
                 logger.warning(f"Redis connection failed: {e}, falling back to in-memory cache only")
                 self.redis_client = None
 
+        # Redis values above the size threshold are stored compressed (header-flagged)
+        self.compressor = ValueCompressor(dict_store=self.redis_client)
+
     @staticmethod
     def _hash_text(text: str) -> str:
         """Generate MD5 hash of text for cache key."""
         return hashlib.md5(text.encode('utf-8')).hexdigest()
 
+    @staticmethod
+    def namespace(text: str) -> str:
+        """Value namespace of a key ("score:..." -> "score", embedding texts -> "emb")."""
+        prefix = text.split(":", 1)[0]
+        return prefix if prefix in VALUE_NAMESPACES and len(prefix) < len(text) else "emb"
+
+    def _encode(self, text: str, data: bytes) -> bytes:
+        """Redis form of a value (compressed above the size threshold)."""
+        return self.compressor.encode(self.namespace(text), data)
+
+    def _decode(self, text: str, stored: bytes) -> Optional[bytes]:
+        """Value bytes of a Redis entry, or None if it cannot be decompressed (treated as a miss)."""
+        return self.compressor.decode(self.namespace(text), stored)
+
     def get(self, text: str) -> Optional[Any]:
         """
         Get embedding from cache (L1 → L2 → miss).
@@ -135,7 +161,7 @@ class EmbeddingCache:
         self._total_requests.increment()
 
         # Support both hashed and direct keys
-        if text.startswith(('ind:', 'role:', 'score:')):
+        if text.startswith(DIRECT_KEY_PREFIXES):
             cache_key = text
         else:
             cache_key = self._hash_text(text)
@@ -156,10 +182,12 @@ class EmbeddingCache:
         # Try L2 (Redis) - no lock needed, Redis is thread-safe
         if self.redis_client:
             try:
-                redis_key = cache_key if text.startswith(('ind:', 'role:', 'score:')) else f"emb:{cache_key}"
+                redis_key = cache_key if text.startswith(DIRECT_KEY_PREFIXES) else f"emb:{cache_key}"
                 cached_data = self.redis_client.get(redis_key)
                 if cached_data:
-                    embedding = json.loads(cached_data)
+                    cached_data = self._decode(text, cached_data)
+                if cached_data:
+                    embedding = fast_json.loads(cached_data)
                     self._l2_hits.increment()
                     # Promote to L1 (atomic dict assignment, no lock needed)
                     self._l1_cache[cache_key] = embedding
@@ -183,11 +211,28 @@ class EmbeddingCache:
             ttl: Optional custom TTL in seconds (uses default if not specified)
         """
         # Support both hashed and direct keys
-        if text.startswith(('ind:', 'role:', 'score:')):
+        if text.startswith(DIRECT_KEY_PREFIXES):
             cache_key = text
         else:
             cache_key = self._hash_text(text)
 
+        self._l1_put(cache_key, embedding)
+
+        # Store in L2 (Redis) - no lock needed, Redis is thread-safe
+        if self.redis_client:
+            try:
+                actual_ttl = ttl if ttl is not None else self.ttl
+                redis_key = cache_key if text.startswith(DIRECT_KEY_PREFIXES) else f"emb:{cache_key}"
+                self.redis_client.setex(
+                    redis_key,
+                    actual_ttl,
+                    self._encode(text, fast_json.dumpb(embedding))
+                )
+            except Exception as e:
+                logger.debug(f"Redis set error: {e}")
+
+    def _l1_put(self, cache_key: str, value: Any) -> None:
+        """Insert into L1, evicting the least recently used entry when full."""
         # Check if eviction needed (lock only for eviction)
         needs_eviction = len(self._l1_cache) >= self.max_l1_size
 
@@ -208,19 +253,129 @@ class EmbeddingCache:
                             pass
 
         # LOCK-FREE WRITE: dict.__setitem__ is atomic in CPython
-        self._l1_cache[cache_key] = embedding
+        self._l1_cache[cache_key] = value
         self._l1_cache_access_time[cache_key] = time.time()
 
-        # Store in L2 (Redis) - no lock needed, Redis is thread-safe
+    def _keys(self, text: str) -> Tuple[str, str]:
+        """(L1 key, Redis key) for a direct key or a text to hash."""
+        if text.startswith(DIRECT_KEY_PREFIXES):
+            return text, text
+        cache_key = self._hash_text(text)
+        return cache_key, f"emb:{cache_key}"
+
+    def get_raw(self, text: str) -> Optional[bytes]:
+        """
+        ZERO-COPY: Get a serialized JSON value exactly as stored (L1 → L2 → miss).
+
+        Values written with set_raw() come back as the same bytes object from L1
+        and as the stored bytes from Redis, ready to be sent as a response body
+        without deserializing. Values written with set() (e.g. before set_raw
+        existed) are re-encoded once and promoted.
+
+        Args:
+            text: Direct cache key ("score:...") or text key (hashed like get())
+
+        Returns:
+            JSON bytes or None if not found
+        """
+        self._total_requests.increment()
+        cache_key, redis_key = self._keys(text)
+
+        raw = self._l1_get_raw(cache_key)
+        if raw is not None:
+            return raw
+
         if self.redis_client:
             try:
-                actual_ttl = ttl if ttl is not None else self.ttl
-                redis_key = cache_key if text.startswith(('ind:', 'role:', 'score:')) else f"emb:{cache_key}"
-                self.redis_client.setex(
-                    redis_key,
-                    actual_ttl,
-                    json.dumps(embedding)
-                )
+                raw = self.redis_client.get(redis_key)
+                if raw:
+                    raw = self._decode(text, raw)
+                if raw:
+                    return self._promote_raw(cache_key, raw)
+            except Exception as e:
+                logger.debug(f"Redis get error: {e}")
+
+        self._misses.increment()
+        return None
+
+    def get_raw_batch(self, texts: list[str]) -> dict[str, bytes]:
+        """
+        ZERO-COPY: get_raw() for many keys, with one Redis pipeline for the L1 misses.
+
+        Args:
+            texts: Direct cache keys or text keys
+
+        Returns:
+            Dictionary mapping text to JSON bytes (only found items)
+        """
+        results = {}
+        to_fetch = []
+
+        for text in texts:
+            self._total_requests.increment()
+            cache_key, redis_key = self._keys(text)
+            raw = self._l1_get_raw(cache_key)
+            if raw is not None:
+                results[text] = raw
+            else:
+                to_fetch.append((text, cache_key, redis_key))
+
+        if to_fetch and self.redis_client:
+            try:
+                pipe = self.redis_client.pipeline(transaction=False)
+                for _, _, redis_key in to_fetch:
+                    pipe.get(redis_key)
+                for (text, cache_key, _), raw in zip(to_fetch, pipe.execute()):
+                    if raw:
+                        raw = self._decode(text, raw)
+                    if raw:
+                        results[text] = self._promote_raw(cache_key, raw)
+            except Exception as e:
+                logger.debug(f"Redis batch get error: {e}")
+
+        for text, _, _ in to_fetch:
+            if text not in results:
+                self._misses.increment()
+        return results
+
+    def _l1_get_raw(self, cache_key: str) -> Optional[bytes]:
+        """L1 value as JSON bytes (counts the hit), or None."""
+        cached_value = self._l1_cache.get(cache_key)
+        if cached_value is None:
+            return None
+        self._l1_hits.increment()
+        self._l1_cache_access_time[cache_key] = time.time()
+        if isinstance(cached_value, bytes):
+            return cached_value
+        # Legacy value stored with set(): a JSON string or a plain object
+        raw = cached_value.encode("utf-8") if isinstance(cached_value, str) else fast_json.dumpb(cached_value)
+        self._l1_cache[cache_key] = raw
+        return raw
+
+    def _promote_raw(self, cache_key: str, raw: bytes) -> bytes:
+        """Redis value as JSON bytes, promoted to L1 (counts the hit)."""
+        if raw[:1] == b'"':
+            # Legacy value stored with set(): JSON-encoded JSON string
+            raw = fast_json.loads(raw).encode("utf-8")
+        self._l2_hits.increment()
+        self._l1_put(cache_key, raw)
+        return raw
+
+    def set_raw(self, text: str, data: bytes, ttl: Optional[int] = None) -> None:
+        """
+        Store serialized JSON bytes as-is in L1 and L2 (read back with get_raw()).
+
+        Args:
+            text: Direct cache key or text key
+            data: JSON document as bytes
+            ttl: Optional custom TTL in seconds (uses default if not specified)
+        """
+        cache_key, redis_key = self._keys(text)
+        self._l1_put(cache_key, data)
+
+        if self.redis_client:
+            try:
+                self.redis_client.setex(redis_key, ttl if ttl is not None else self.ttl, self._encode(text, data))
             except Exception as e:
                 logger.debug(f"Redis set error: {e}")
 
@@ -250,7 +405,8 @@ class EmbeddingCache:
                 "l1_hit_rate": 0.0,
                 "l2_hit_rate": 0.0,
                 "l1_size": len(self._l1_cache),
-                "l1_max_size": self.max_l1_size
+                "l1_max_size": self.max_l1_size,
+                "compression": self.compressor.get_stats()
             }
 
         total_hits = l1_hits + l2_hits
@@ -266,7 +422,8 @@ class EmbeddingCache:
             "l1_hit_rate": round((l1_hits / total) * 100, 2),
             "l2_hit_rate": round((l2_hits / total) * 100, 2),
             "l1_size": len(self._l1_cache),
-            "l1_max_size": self.max_l1_size
+            "l1_max_size": self.max_l1_size,
+            "compression": self.compressor.get_stats()
         }
 
     def record_zero_vector_fallback(self) -> None:
@@ -294,7 +451,7 @@ class EmbeddingCache:
         # First check L1 cache (lock-free)
         for text in texts:
             self._total_requests.increment()
-            if text.startswith(('ind:', 'role:', 'score:')):
+            if text.startswith(DIRECT_KEY_PREFIXES):
                 cache_key = text
             else:
                 cache_key = self._hash_text(text)
@@ -314,7 +471,7 @@ class EmbeddingCache:
             try:
                 pipe = self.redis_client.pipeline(transaction=False)
                 for text, cache_key in texts_to_fetch_from_redis:
-                    redis_key = cache_key if text.startswith(('ind:', 'role:', 'score:')) else f"emb:{cache_key}"
+                    redis_key = cache_key if text.startswith(DIRECT_KEY_PREFIXES) else f"emb:{cache_key}"
                     pipe.get(redis_key)
 
                 redis_results = pipe.execute()
@@ -322,7 +479,9 @@ class EmbeddingCache:
                 for i, (text, cache_key) in enumerate(texts_to_fetch_from_redis):
                     cached_data = redis_results[i]
                     if cached_data:
-                        embedding = json.loads(cached_data)
+                        cached_data = self._decode(text, cached_data)
+                    if cached_data:
+                        embedding = fast_json.loads(cached_data)
                         self._l2_hits.increment()
                         # Promote to L1
                         self._l1_cache[cache_key] = embedding
@@ -355,7 +514,7 @@ class EmbeddingCache:
 
         # Store in L1 (with eviction if needed)
         for text, embedding in items.items():
-            if text.startswith(('ind:', 'role:', 'score:')):
+            if text.startswith(DIRECT_KEY_PREFIXES):
                 cache_key = text
             else:
                 cache_key = self._hash_text(text)
@@ -380,14 +539,14 @@ class EmbeddingCache:
             try:
                 pipe = self.redis_client.pipeline(transaction=False)
                 for text, embedding in items.items():
-                    if text.startswith(('ind:', 'role:', 'score:')):
+                    if text.startswith(DIRECT_KEY_PREFIXES):
                         cache_key = text
                         redis_key = cache_key
                     else:
                         cache_key = self._hash_text(text)
                         redis_key = f"emb:{cache_key}"
 
-                    pipe.setex(redis_key, actual_ttl, json.dumps(embedding))
+                    pipe.setex(redis_key, actual_ttl, self._encode(text, fast_json.dumpb(embedding)))
 
                 pipe.execute()
                 logger.debug(f"Batch stored {len(items)} items in Redis")
@@ -403,7 +562,7 @@ class EmbeddingCache:
 
         if self.redis_client:
             try:
-                patterns = ["emb:*", "domains:*", "parse:*", "score:*", "ind:*", "role:*"]
+                patterns = ["emb:*", "domains:*", "parse:*", "score:*", "ind:*", "role:*", "doc:*"]
                 for pattern in patterns:
                     for key in self.redis_client.scan_iter(pattern):
                         self.redis_client.delete(key)
@@ -0,0 +1,294 @@
+"""
+Transparent compression of large cached values.
+
+Score, parse and domain-finder results are multi-KB JSON documents with the
+same shape every time, so they compress well. Values at or above
+settings.cache_compression_min_bytes are compressed before they go to Redis
+(and the Postgres cold tier); smaller values are stored as-is.
+
+Stored format:
+    uncompressed:  the JSON bytes (never start with 0x00)
+    compressed:    b"\\x00" + codec byte + payload
+                   codec 1 = zlib, codec 2 = zstd frame (may reference a dictionary)
+
+Entries written before compression existed have no header and decode as-is.
+
+zstd (the zstandard package) is used when installed, zlib otherwise. Once
+settings.cache_compression_dict_samples values of a namespace have been seen,
+a zstd dictionary is trained for it in a background thread. The dictionary is
+shared through Redis (zdict:<namespace>, first writer wins) so every worker
+compresses with the same one and can decode the others' values. A frame whose
+dictionary cannot be found decodes to None (a cache miss).
+
+Dictionaries only live as long as Redis keeps them, so they are only used
+for values that live in Redis too:
+- Without a shared store (no Redis) no dictionary is trained: a private one
+  would make values unreadable for other workers and after a restart.
+- Values that outlive Redis (the Postgres cold tier) are encoded with
+  dictionary=False, as plain zstd frames that always decode.
+
+Each EmbeddingCache owns one ValueCompressor (cache.compressor). Ratio and CPU
+time are tracked per namespace (cache.get_stats()["compression"]).
+"""
+
+import threading
+import time
+import zlib
+from typing import Any, Dict, List, Optional
+
+from core.config.logging_config import logger
+from core.config.settings import settings
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
+HEADER = b"\x00"
+CODEC_ZLIB = 1
+CODEC_ZSTD = 2
+
+# Redis key of a namespace's shared zstd dictionary
+DICT_KEY_PREFIX = "zdict:"
+
+
+class _NamespaceCodec:
+    """Compression state and counters for one namespace."""
+
+    def __init__(self, level: int):
+        self.level = level
+        self.lock = threading.Lock()
+        self.compressor = zstandard.ZstdCompressor(level=level) if ZSTD_AVAILABLE else None
+        # Dictionary-free frames for values that outlive the shared dictionaries
+        self.plain_compressor = zstandard.ZstdCompressor(level=level) if ZSTD_AVAILABLE else None
+        self.dict_id = 0
+        self.dict_checked = False
+        self.training = False
+        self.samples: List[bytes] = []
+        self.stats = {
+            "compressed": 0,
+            "skipped": 0,
+            "bytes_in": 0,
+            "bytes_out": 0,
+            "compress_seconds": 0.0,
+            "decompressed": 0,
+            "decompress_seconds": 0.0,
+            "undecodable": 0,
+        }
+
+
+class ValueCompressor:
+    """Header-flagged zstd/zlib codec with per-namespace dictionaries and stats."""
+
+    def __init__(
+        self,
+        enabled: Optional[bool] = None,
+        min_bytes: Optional[int] = None,
+        level: Optional[int] = None,
+        dict_samples: Optional[int] = None,
+        dict_size: Optional[int] = None,
+        dict_store=None,
+    ):
+        """
+        Args:
+            enabled: Compress new values (decoding always works)
+            min_bytes: Smaller values are stored uncompressed
+            level: zstd compression level
+            dict_samples: Values sampled per namespace before training a dictionary (0 disables)
+            dict_size: Trained dictionary size in bytes
+            dict_store: Redis-like client (get/set) sharing dictionaries between workers
+        """
+        self.enabled = settings.cache_compression_enabled if enabled is None else enabled
+        self.min_bytes = min_bytes if min_bytes is not None else settings.cache_compression_min_bytes
+        self.level = level if level is not None else settings.cache_compression_level
+        self.dict_samples = dict_samples if dict_samples is not None else settings.cache_compression_dict_samples
+        self.dict_size = dict_size or settings.cache_compression_dict_size
+        self.dict_store = dict_store
+
+        self._codecs: Dict[str, _NamespaceCodec] = {}
+        self._codecs_lock = threading.Lock()
+        # dict_id -> decompressor (shared across namespaces; dict ids are content hashes)
+        self._decompressors: Dict[int, Any] = {0: zstandard.ZstdDecompressor()} if ZSTD_AVAILABLE else {}
+        self._decompress_lock = threading.Lock()
+
+    def _codec(self, namespace: str) -> _NamespaceCodec:
+        codec = self._codecs.get(namespace)
+        if codec is None:
+            with self._codecs_lock:
+                codec = self._codecs.setdefault(namespace, _NamespaceCodec(self.level))
+        return codec
+
+    # ------------------------------------------------------------------
+    # Encode / decode
+    # ------------------------------------------------------------------
+
+    def encode(self, namespace: str, data: bytes, dictionary: bool = True) -> bytes:
+        """
+        Stored form of `data`: compressed with a header when that pays off, else unchanged.
+
+        Args:
+            namespace: Value namespace (selects the dictionary and the stats)
+            data: Value bytes
+            dictionary: False for values stored outside Redis (they must not
+                depend on a dictionary Redis may evict)
+        """
+        if not self.enabled or len(data) < self.min_bytes:
+            if self.enabled:
+                self._codec(namespace).stats["skipped"] += 1
+            return data
+
+        codec = self._codec(namespace)
+        if ZSTD_AVAILABLE and dictionary:
+            self._maybe_use_dictionary(namespace, codec, data)
+
+        started = time.perf_counter()
+        with codec.lock:
+            compressor = codec.compressor if dictionary else codec.plain_compressor
+            if compressor is not None:
+                stored = HEADER + bytes((CODEC_ZSTD,)) + compressor.compress(data)
+            else:
+                stored = HEADER + bytes((CODEC_ZLIB,)) + zlib.compress(data, 6)
+        elapsed = time.perf_counter() - started
+
+        stats = codec.stats
+        stats["compress_seconds"] += elapsed
+        if len(stored) >= len(data):
+            stats["skipped"] += 1
+            return data
+        stats["compressed"] += 1
+        stats["bytes_in"] += len(data)
+        stats["bytes_out"] += len(stored)
+        return stored
+
+    def decode(self, namespace: str, stored: bytes) -> Optional[bytes]:
+        """
+        Original bytes of a stored value.
+
+        Returns:
+            The value, or None when it cannot be decoded (unknown dictionary,
+            zstd unavailable, corrupt payload)
+        """
+        if stored[:1] != HEADER:
+            return stored  # Uncompressed (or written before compression existed)
+
+        codec = self._codec(namespace)
+        started = time.perf_counter()
+        try:
+            codec_id, payload = stored[1], memoryview(stored)[2:]
+            if codec_id == CODEC_ZLIB:
+                data = zlib.decompress(payload)
+            elif codec_id == CODEC_ZSTD and ZSTD_AVAILABLE:
+                decompressor = self._decompressor(namespace, zstandard.get_frame_parameters(payload).dict_id)
+                if decompressor is None:
+                    codec.stats["undecodable"] += 1
+                    return None
+                with self._decompress_lock:
+                    data = decompressor.decompress(payload)
+            else:
+                codec.stats["undecodable"] += 1
+                return None
+        except Exception as e:
+            codec.stats["undecodable"] += 1
+            logger.debug(f"Cached value for {namespace} could not be decompressed: {e}")
+            return None
+
+        codec.stats["decompressed"] += 1
+        codec.stats["decompress_seconds"] += time.perf_counter() - started
+        return data
+
+    # ------------------------------------------------------------------
+    # Dictionaries
+    # ------------------------------------------------------------------
+
+    def _decompressor(self, namespace: str, dict_id: int):
+        """Decompressor for a frame's dictionary (loaded from the shared store on first sight)."""
+        decompressor = self._decompressors.get(dict_id)
+        if decompressor is None:
+            dictionary = self._load_dictionary(namespace)
+            if dictionary is not None and dictionary.dict_id() == dict_id:
+                decompressor = zstandard.ZstdDecompressor(dict_data=dictionary)
+                self._decompressors[dict_id] = decompressor
+        return decompressor
+
+    def _load_dictionary(self, namespace: str):
+        if self.dict_store is None:
+            return None
+        try:
+            data = self.dict_store.get(DICT_KEY_PREFIX + namespace)
+            return zstandard.ZstdCompressionDict(data) if data else None
+        except Exception as e:
+            logger.debug(f"Compression dictionary for {namespace} could not be loaded: {e}")
+            return None
+
+    def _use_dictionary(self, codec: _NamespaceCodec, dictionary) -> None:
+        dict_id = dictionary.dict_id()
+        self._decompressors.setdefault(dict_id, zstandard.ZstdDecompressor(dict_data=dictionary))
+        with codec.lock:
+            codec.compressor = zstandard.ZstdCompressor(level=codec.level, dict_data=dictionary)
+            codec.dict_id = dict_id
+            codec.samples = []
+
+    def _maybe_use_dictionary(self, namespace: str, codec: _NamespaceCodec, data: bytes) -> None:
+        """Adopt another worker's dictionary, or sample values and train one (shared store only)."""
+        if codec.dict_id or codec.training or self.dict_samples <= 0 or self.dict_store is None:
+            return
+        if not codec.dict_checked:
+            codec.dict_checked = True
+            dictionary = self._load_dictionary(namespace)
+            if dictionary is not None:
+                self._use_dictionary(codec, dictionary)
+                return
+
+        codec.samples.append(bytes(data))
+        if len(codec.samples) >= self.dict_samples:
+            codec.training = True
+            threading.Thread(target=self._train, args=(namespace, codec), daemon=True).start()
+
+    def _train(self, namespace: str, codec: _NamespaceCodec) -> None:
+        samples, codec.samples = codec.samples, []
+        try:
+            dictionary = zstandard.train_dictionary(self.dict_size, samples)
+            # First writer wins: adopt the shared dictionary if another worker got there first
+            if not self.dict_store.set(DICT_KEY_PREFIX + namespace, dictionary.as_bytes(), nx=True):
+                dictionary = self._load_dictionary(namespace)
+                if dictionary is None:
+                    return  # Store unreadable: keep plain zstd rather than a private dictionary
+            self._use_dictionary(codec, dictionary)
+            logger.info(f"Cache compression: {namespace} dictionary ready (id {dictionary.dict_id()}, {len(samples)} samples)")
+        except Exception as e:
+            # Too few/uniform samples or store failure: keep plain zstd
+            logger.debug(f"Cache compression: {namespace} dictionary training failed: {e}")
+        finally:
+            codec.training = False
+
+    # ------------------------------------------------------------------
+    # Stats
+    # ------------------------------------------------------------------
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Per-namespace compression ratio and CPU time."""
+        namespaces = {}
+        for namespace, codec in list(self._codecs.items()):
+            stats = dict(codec.stats)
+            stats["ratio"] = round(stats["bytes_in"] / stats["bytes_out"], 2) if stats["bytes_out"] else 0.0
+            stats["bytes_saved"] = stats["bytes_in"] - stats["bytes_out"]
+            stats["compress_ms_avg"] = round(stats["compress_seconds"] * 1000 / max(stats["compressed"] + stats["skipped"], 1), 4)
+            stats["decompress_ms_avg"] = round(stats["decompress_seconds"] * 1000 / max(stats["decompressed"], 1), 4)
+            stats["compress_seconds"] = round(stats["compress_seconds"], 4)
+            stats["decompress_seconds"] = round(stats["decompress_seconds"], 4)
+            stats["dictionary"] = bool(codec.dict_id)
+            namespaces[namespace] = stats
+        return {
+            "enabled": self.enabled,
+            "codec": "zstd" if ZSTD_AVAILABLE else "zlib",
+            "min_bytes": self.min_bytes,
+            "namespaces": namespaces,
+        }
+
+
+__all__ = [
+    'ValueCompressor',
+    'ZSTD_AVAILABLE',
+]
@@ -0,0 +1,198 @@
+"""
+Relevance-Based CV Context for LLM Prompts.
+
+The gap analysis, question generation and answer analysis prompts include the
+CV as TOON text. A senior CV with ten roles and 80 achievements inflates every
+one of them, so prompt cost and latency grow with CV length, not relevance.
+
+When a CV's TOON text is over the prompt's token budget
+(settings.prompt_context_budgets, counted with formats.toon.count_tokens), its
+rankable items (work experience achievements, projects, internships,
+publications) are ranked by embedding similarity to the JD requirements
+(responsibilities and hard skills, already embedded and cached by the
+similarity stage), and the budget is filled with the most relevant ones. Contact
+details, summary, skills, education and role headers with dates are always
+kept; kept items stay in CV order and the CV notes how many were omitted.
+
+Selections are memoized in the document store per CV content, JD content and
+budget, so prompts with the same budget share one selection.
+"""
+
+import time
+from typing import List, Optional, Tuple
+
+from core.caching.document_store import content_hash, doc_id_hash, get_document_store, is_valid_doc_id
+from core.caching.embeddings import calculate_cosine_similarity_matrix, get_embeddings_batch
+from core.config.logging_config import logger
+from core.config.settings import settings
+from core.monitoring.metrics_collector import get_metrics_collector
+from formats.toon import count_tokens, to_toon
+
+# CV sections whose entries are ranked as a whole (achievements are ranked individually)
+RANKED_SECTIONS = ("projects", "internships", "publications")
+OMITTED_NOTE_KEY = "omitted_for_length"
+# Indentation, list marker and newline around one item in the TOON text
+ITEM_OVERHEAD_TOKENS = 3
+MAX_ITEM_TEXT_CHARS = 512
+
+
+def _rankable_items(cv: dict) -> List[Tuple[tuple, str, int]]:
+    """(location, text to embed, token cost) of every item the selector may leave out."""
+    items = []
+    for i, job in enumerate(cv.get("work_experience") or []):
+        if isinstance(job, dict) and isinstance(job.get("achievements"), list):
+            role = job.get("role") or ""
+            for j, achievement in enumerate(job["achievements"]):
+                text = str(achievement)
+                items.append((
+                    ("work_experience", i, j),
+                    f"{role}: {text}"[:MAX_ITEM_TEXT_CHARS],
+                    count_tokens(text) + ITEM_OVERHEAD_TOKENS,
+                ))
+    for section in RANKED_SECTIONS:
+        entries = cv.get(section)
+        if not isinstance(entries, list):
+            continue
+        for i, entry in enumerate(entries):
+            rendered = to_toon(entry) if isinstance(entry, (dict, list)) else str(entry)
+            items.append(((section, i), rendered[:MAX_ITEM_TEXT_CHARS], count_tokens(rendered) + ITEM_OVERHEAD_TOKENS))
+    return items
+
+
+def _requirement_texts(jd: dict) -> List[str]:
+    """JD responsibilities and hard skill names (the texts the similarity stage embeds)."""
+    texts = [text for text in jd.get("responsibilities") or [] if isinstance(text, str) and text.strip()]
+    for skill in jd.get("hard_skills_required") or []:
+        name = skill.get("skill") if isinstance(skill, dict) else skill
+        if isinstance(name, str) and name.strip():
+            texts.append(name)
+    return texts
+
+
+def _with_items(cv: dict, kept: set, total: int) -> dict:
+    """Copy of the CV with only the kept rankable items (and a note on the rest)."""
+    selected = dict(cv)
+    if isinstance(cv.get("work_experience"), list):
+        selected["work_experience"] = [
+            {**job, "achievements": [a for j, a in enumerate(job["achievements"]) if ("work_experience", i, j) in kept]}
+            if isinstance(job, dict) and isinstance(job.get("achievements"), list) else job
+            for i, job in enumerate(cv["work_experience"])
+        ]
+    for section in RANKED_SECTIONS:
+        if isinstance(cv.get(section), list):
+            selected[section] = [entry for i, entry in enumerate(cv[section]) if (section, i) in kept]
+    if len(kept) < total:
+        selected[OMITTED_NOTE_KEY] = (
+            f"{total - len(kept)} of {total} achievements/projects less relevant to this job left out for length"
+        )
+    return selected
+
+
+def select_cv_items(cv: dict, jd: dict, budget: int) -> Tuple[dict, dict]:
+    """
+    Most JD-relevant version of a CV whose TOON text fits the token budget.
+
+    Args:
+        cv: Parsed CV
+        jd: Parsed JD (its requirements rank the CV's items)
+        budget: Token budget for the CV's TOON text
+
+    Returns:
+        (selected CV, report with tokens_before / tokens_after / items / items_kept)
+    """
+    tokens_before = count_tokens(to_toon(cv))
+    items = _rankable_items(cv)
+    report = {"tokens_before": tokens_before, "tokens_after": tokens_before, "items": len(items), "items_kept": len(items)}
+    if tokens_before <= budget or not items:
+        return cv, report
+
+    requirements = _requirement_texts(jd)
+    if requirements:
+        similarity = calculate_cosine_similarity_matrix(
+            get_embeddings_batch([text for _, text, _ in items]),
+            get_embeddings_batch(requirements)
+        )
+        relevance = similarity.max(axis=1).tolist()
+    else:
+        relevance = [0.0] * len(items)
+    # Most relevant first; ties keep CV order (most recent roles first)
+    ranked = sorted(range(len(items)), key=lambda k: -relevance[k])
+
+    # Greedy fill on per-item estimates...
+    used = count_tokens(to_toon(_with_items(cv, set(), len(items))))
+    kept_ranked = []
+    for k in ranked:
+        if used + items[k][2] <= budget:
+            kept_ranked.append(k)
+            used += items[k][2]
+
+    # ...then drop the least relevant until the real text fits (quoting, note length)
+    kept = {items[k][0] for k in kept_ranked}
+    selected = _with_items(cv, kept, len(items))
+    tokens_after = count_tokens(to_toon(selected))
+    while tokens_after > budget and kept_ranked:
+        kept.discard(items[kept_ranked.pop()][0])
+        selected = _with_items(cv, kept, len(items))
+        tokens_after = count_tokens(to_toon(selected))
+
+    report.update(tokens_after=tokens_after, items_kept=len(kept))
+    return selected, report
+
+
+def _selected_cv_toon(prompt: str, cv: dict, jd: dict, budget: int) -> str:
+    start_time = time.time()
+    selected, report = select_cv_items(cv, jd, budget)
+    duration_ms = (time.time() - start_time) * 1000
+    logger.info(
+        f"Context selection for {prompt}: CV {report['tokens_before']} -> {report['tokens_after']} tokens "
+        f"(budget {budget}, kept {report['items_kept']}/{report['items']} items, {duration_ms:.0f}ms)"
+    )
+    get_metrics_collector().record_performance(
+        operation="context_selection",
+        duration_ms=duration_ms,
+        metadata={"prompt": prompt, "budget": budget, **report}
+    )
+    return to_toon(selected)
+
+
+def budget_cv_context(
+    prompt: str,
+    cv_toon: str,
+    parsed_cv: dict,
+    parsed_jd: dict,
+    cv_id: Optional[str] = None,
+    jd_id: Optional[str] = None,
+) -> str:
+    """
+    CV TOON text for a prompt: the full text when it fits the prompt's budget,
+    else the memoized relevance-based selection (blocking: may embed CV items).
+    NON-BLOCKING: Selection failures fall back to the full CV.
+
+    Args:
+        prompt: Budget name in settings.prompt_context_budgets (e.g. "gap_analysis")
+        cv_toon: Full TOON text of the CV
+        parsed_cv, parsed_jd: Parsed documents
+        cv_id, jd_id: doc_ids when known (skip re-hashing the documents)
+    """
+    budget = settings.prompt_context_budgets.get(prompt)
+    if not settings.prompt_context_selection_enabled or not budget or not isinstance(parsed_cv, dict):
+        return cv_toon
+    try:
+        if count_tokens(cv_toon) <= budget:
+            return cv_toon
+        jd_hash = doc_id_hash(jd_id) if jd_id and is_valid_doc_id(jd_id) else content_hash(parsed_jd)
+        return get_document_store().content_artifact(
+            parsed_cv,
+            f"context:{jd_hash}:{budget}",
+            lambda: _selected_cv_toon(prompt, parsed_cv, parsed_jd, budget),
+            cv_id
+        )
+    except Exception as e:
+        logger.warning(f"Context selection for {prompt} failed: {e}. Using the full CV.")
+        return cv_toon
+
+
+__all__ = [
+    'budget_cv_context',
+    'select_cv_items',
+]
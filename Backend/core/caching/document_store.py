@@ -0,0 +1,151 @@
+"""
+Content-Addressed Document Store for parsed CVs and JDs.
+
+The parse endpoints store each canonical parsed document under a content hash
+and return its doc_id ("cv_<md5>" / "jd_<md5>"). Downstream endpoints accept
+cv_id / jd_id instead of the full parsed_cv / parsed_jd dicts, so request
+payloads stay small and the document is hashed once (at parse time) instead
+of on every scoring call.
+
+The hash is the MD5 of json.dumps(document, sort_keys=True), the same digest
+the score cache key has always used, so score cache entries written before
+doc_ids existed stay valid.
+
+Artifacts derived from a document (e.g. its TOON text) are memoized under the
+doc_id as "doc:<doc_id>:<artifact>". Documents sent inline (no doc_id) are
+memoized under their content hash instead, so the same artifact is shared by
+every request carrying that content.
+
+Storage is the shared two-tier cache (L1 in-memory + Redis) with the result
+cache TTL. Documents are stored as serialized JSON bytes, so callers always
+get a private copy they may mutate.
+"""
+
+import hashlib
+import json
+import re
+from typing import Any, Callable, Optional
+
+from core.caching.cache import get_cache
+from core.config.logging_config import logger
+from core.config.settings import settings
+from core.utils import fast_json
+
+DOCUMENT_KINDS = ("cv", "jd")
+DOC_ID_PATTERN = re.compile(r"^(cv|jd)_[0-9a-f]{32}$")
+
+
+def content_hash(document: dict) -> str:
+    """MD5 of the canonical (sorted-keys) JSON form of a document."""
+    return hashlib.md5(json.dumps(document, sort_keys=True).encode()).hexdigest()
+
+
+def make_doc_id(kind: str, document: dict) -> str:
+    """doc_id for a parsed document, e.g. 'cv_3f2a...'."""
+    if kind not in DOCUMENT_KINDS:
+        raise ValueError(f"Unknown document kind '{kind}' (expected one of {DOCUMENT_KINDS})")
+    return f"{kind}_{content_hash(document)}"
+
+
+def doc_id_hash(doc_id: str) -> str:
+    """Content hash part of a doc_id."""
+    return doc_id.split("_", 1)[1]
+
+
+def is_valid_doc_id(doc_id: str, kind: Optional[str] = None) -> bool:
+    """True if doc_id is well formed (and of the given kind)."""
+    match = DOC_ID_PATTERN.match(doc_id or "")
+    return bool(match) and (kind is None or match.group(1) == kind)
+
+
+class DocumentStore:
+    """Content-addressed storage for parsed documents and their derived artifacts."""
+
+    def __init__(self, ttl: Optional[int] = None):
+        self.cache = get_cache()
+        self.ttl = ttl or settings.result_cache_ttl
+
+    def put(self, kind: str, document: dict) -> str:
+        """
+        Store a parsed document.
+
+        Args:
+            kind: "cv" or "jd"
+            document: Parsed document
+
+        Returns:
+            doc_id (deterministic: storing the same content twice returns the same ID)
+        """
+        doc_id = make_doc_id(kind, document)
+        self.cache.set_raw(f"doc:{doc_id}", fast_json.dumpb(document), ttl=self.ttl)
+        return doc_id
+
+    def get(self, doc_id: str) -> Optional[dict]:
+        """Stored document (a fresh copy), or None if unknown or expired."""
+        if not is_valid_doc_id(doc_id):
+            return None
+        stored = self.cache.get_raw(f"doc:{doc_id}")
+        return fast_json.loads(stored) if stored is not None else None
+
+    def get_artifact(self, doc_id: str, name: str) -> Optional[Any]:
+        """Memoized artifact derived from a document, or None."""
+        return self.cache.get(f"doc:{doc_id}:{name}")
+
+    def set_artifact(self, doc_id: str, name: str, value: Any) -> None:
+        """Memoize a JSON-serializable artifact derived from a document."""
+        self.cache.set(f"doc:{doc_id}:{name}", value, ttl=self.ttl)
+
+    def artifact(self, doc_id: str, name: str, compute: Callable[[], Any]) -> Any:
+        """
+        Artifact from the store, computed and stored on a miss.
+        NON-BLOCKING: Store failures fall back to computing the artifact.
+        """
+        try:
+            cached = self.get_artifact(doc_id, name)
+            if cached is not None:
+                return cached
+        except Exception as e:
+            logger.debug(f"Document artifact lookup failed for {doc_id}:{name}: {e}")
+
+        value = compute()
+        try:
+            self.set_artifact(doc_id, name, value)
+        except Exception as e:
+            logger.debug(f"Document artifact not stored for {doc_id}:{name}: {e}")
+        return value
+
+    def content_artifact(
+        self,
+        document: dict,
+        name: str,
+        compute: Callable[[], Any],
+        doc_id: Optional[str] = None,
+    ) -> Any:
+        """
+        Artifact keyed by content: the doc_id's hash when known (no re-hashing),
+        else the document's content hash.
+        """
+        digest = doc_id_hash(doc_id) if doc_id and is_valid_doc_id(doc_id) else content_hash(document)
+        return self.artifact(digest, name, compute)
+
+
+_document_store: Optional[DocumentStore] = None
+
+
+def get_document_store() -> DocumentStore:
+    """Get the global document store."""
+    global _document_store
+    if _document_store is None:
+        _document_store = DocumentStore()
+    return _document_store
+
+
+__all__ = [
+    'DOCUMENT_KINDS',
+    'DocumentStore',
+    'content_hash',
+    'doc_id_hash',
+    'get_document_store',
+    'is_valid_doc_id',
+    'make_doc_id',
+]
@@ -10,11 +10,12 @@ Uses Google's text-embedding-004 model with multiple optimizations:
 """
 
 import numpy as np
-from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from concurrent.futures import ThreadPoolExecutor, wait
 from typing import List, Dict, Tuple, Optional
 
 from core.config.logging_config import logger
 from core.config.settings import settings
+from core.config.deadline import bounded_timeout
 from core.caching.cache import get_cache
 from core.caching.embeddings_fallback import get_embedding_with_fallback
 
@@ -83,7 +84,9 @@ def get_embedding(text: str, use_cache: bool = True) -> list[float]:
 def get_embeddings_batch(texts: List[str], use_cache: bool = True, timeout: float = None) -> List[list[float]]:
     """
     Generate multiple embeddings in parallel (3-4x faster than sequential).
-    Uses ThreadPoolExecutor with configurable timeout.
+    Uses ThreadPoolExecutor with configurable timeout, bounded by the remaining
+    request deadline. Embeddings that finish in time are kept; only the
+    stragglers fall back to zero vectors.
 
     Args:
         texts: List of texts to embed
@@ -96,30 +99,33 @@ def get_embeddings_batch(texts: List[str], use_cache: bool = True, timeout: floa
     if not texts:
         return []
 
-    timeout = timeout or settings.embedding_timeout
+    timeout = bounded_timeout(timeout or settings.embedding_timeout)
     max_workers = min(len(texts), settings.max_workers)
 
+    executor = ThreadPoolExecutor(max_workers=max_workers)
     try:
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Use map with timeout
-            future_results = executor.map(
-                lambda text: get_embedding(text, use_cache=use_cache),
-                texts,
-                timeout=timeout
-            )
-            embeddings = list(future_results)
+        futures = [executor.submit(get_embedding, text, use_cache) for text in texts]
+        _, not_done = wait(futures, timeout=timeout)
 
-        return embeddings
+        if not_done:
+            logger.warning(
+                f"Embedding batch timeout after {timeout:.1f}s, "
+                f"{len(not_done)}/{len(texts)} texts fall back to zero vectors"
+            )
 
-    except FuturesTimeoutError:
-        logger.warning(f"Embedding batch timeout after {timeout}s, returning partial results with zero vectors")
-        # Return zero vectors for any texts that didn't complete
-        return [[0.0] * 768 for _ in texts]
+        return [
+            future.result() if future not in not_done else [0.0] * 768
+            for future in futures
+        ]
 
     except Exception as e:
         logger.error(f"Batch embedding error: {e}", exc_info=True)
         return [[0.0] * 768 for _ in texts]
 
+    finally:
+        # Don't hold the request hostage to stragglers: drop queued work, let running calls finish in the background
+        executor.shutdown(wait=False, cancel_futures=True)
+
 
 def calculate_cosine_similarity(vec1: list[float], vec2: list[float]) -> float:
     """
@@ -506,18 +512,77 @@ def calculate_overall_compatibility(parsed_cv: dict, parsed_jd: dict) -> dict:
     Returns:
         Dictionary with comprehensive similarity metrics and cache statistics
     """
-    cv_skills = parsed_cv.get("technical_skills", [])
-    jd_skills = parsed_jd.get("hard_skills_required", [])
-
-    cv_experience = parsed_cv.get("work_experience", [])
-    jd_responsibilities = parsed_jd.get("responsibilities", [])
-
     # Calculate skills similarity (with hybrid matching + vectorized)
-    skills_metrics = calculate_skills_similarity(cv_skills, jd_skills)
+    skills_metrics = calculate_skills_similarity(
+        parsed_cv.get("technical_skills", []),
+        parsed_jd.get("hard_skills_required", [])
+    )
 
     # Calculate experience similarity (with recency weighting + vectorized)
-    experience_metrics = calculate_experience_similarity(cv_experience, jd_responsibilities)
+    experience_metrics = calculate_experience_similarity(
+        parsed_cv.get("work_experience", []),
+        parsed_jd.get("responsibilities", [])
+    )
+
+    return _assemble_compatibility(skills_metrics, experience_metrics)
+
+
+def update_overall_compatibility(
+    previous_metrics: dict,
+    parsed_cv: dict,
+    parsed_jd: dict,
+    changed_sections: set
+) -> dict:
+    """
+    Incrementally recompute compatibility after a CV edit.
+
+    Only the halves whose CV inputs changed are recomputed (technical_skills ->
+    skills similarity, work_experience -> experience similarity); the other half
+    is reused from `previous_metrics` as returned by calculate_overall_compatibility.
+
+    Args:
+        previous_metrics: Metrics for the CV before the edit (same JD)
+        parsed_cv: Updated CV
+        parsed_jd: Parsed JD data
+        changed_sections: Top-level CV keys whose values changed
+
+    Returns:
+        Dictionary in the calculate_overall_compatibility format
+    """
+    if "technical_skills" in changed_sections:
+        skills_metrics = calculate_skills_similarity(
+            parsed_cv.get("technical_skills", []),
+            parsed_jd.get("hard_skills_required", [])
+        )
+    else:
+        skills_metrics = {
+            "overall_similarity": previous_metrics["skills_cosine_similarity"],
+            "critical_skills_match": previous_metrics["critical_skills_match"],
+            "important_skills_match": previous_metrics["important_skills_match"],
+            "exact_match_score": previous_metrics["exact_keyword_match"],
+            "fuzzy_match_score": previous_metrics["fuzzy_keyword_match"],
+            "semantic_match_score": previous_metrics["semantic_skills_match"],
+            "matched_skills": previous_metrics["matched_skills"],
+            "missing_critical": previous_metrics["missing_critical_skills"],
+            "missing_important": previous_metrics["missing_important_skills"],
+        }
+
+    if "work_experience" in changed_sections:
+        experience_metrics = calculate_experience_similarity(
+            parsed_cv.get("work_experience", []),
+            parsed_jd.get("responsibilities", [])
+        )
+    else:
+        experience_metrics = {
+            "overall_similarity": previous_metrics["experience_cosine_similarity"],
+            "weighted_similarity": previous_metrics["experience_weighted_similarity"],
+        }
+
+    return _assemble_compatibility(skills_metrics, experience_metrics)
+
 
+def _assemble_compatibility(skills_metrics: dict, experience_metrics: dict) -> dict:
+    """Combine skills and experience metrics into the overall compatibility dict."""
     # Weighted overall similarity
     overall_similarity = (
         0.40 * skills_metrics["overall_similarity"] +
@@ -564,6 +629,7 @@ __all__ = [
     'calculate_skills_similarity',
     'calculate_experience_similarity',
     'calculate_overall_compatibility',
+    'update_overall_compatibility',
     'get_cache_statistics',
     'clear_cache'
 ]
@@ -3,17 +3,10 @@ Embeddings Fallback Module
 Provides Gemini text-embedding-004 → OpenAI text-embedding-3-small fallback.
 """
 
-import os
 from typing import List
-from google import genai
-from openai import OpenAI
-from dotenv import load_dotenv
 
-load_dotenv()
+from core.config.clients import get_gemini_client, get_openai_client
 
-# Initialize clients
-gemini_client = genai.Client(api_key=os.getenv("GEMINI_API_KEY"))
-openai_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 
 def get_embedding_with_fallback(text: str) -> tuple[List[float], str]:
     """
@@ -26,7 +19,7 @@ def get_embedding_with_fallback(text: str) -> tuple[List[float], str]:
     """
     # Try Gemini first (768 dimensions)
     try:
-        response = gemini_client.models.embed_content(
+        response = get_gemini_client().models.embed_content(
             model="text-embedding-004",
             contents=[text]
         )
@@ -37,7 +30,7 @@ def get_embedding_with_fallback(text: str) -> tuple[List[float], str]:
 
         # Fall back to OpenAI (1536 dimensions)
         try:
-            response = openai_client.embeddings.create(
+            response = get_openai_client().embeddings.create(
                 model="text-embedding-3-small",
                 input=text,
                 dimensions=768  # Match Gemini's dimension for compatibility
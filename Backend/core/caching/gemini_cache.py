@@ -15,26 +15,26 @@ Cost Savings:
 - With explicit caching: $0.01 per 1M cached tokens (90% off)
 """
 
-import os
 import time
 import hashlib
 from typing import Optional, Dict, Any
-from google import genai
-from google.genai import types
-from core.config.llm_fallback import generate_with_fallback
-
-# Initialize Gemini client
-gemini_client = genai.Client(api_key=os.getenv("GEMINI_API_KEY"))
+from core.config.clients import get_gemini_client
+from core.config.llm_fallback import generate_with_fallback, generate_with_fallback_async
+from core.config.deadline import DeadlineExceededError, run_within_deadline
+from core.monitoring.metrics_collector import get_metrics_collector
+from core.monitoring.token_usage import TokenUsage, record_token_usage
 
 # Cache statistics
+# Cached token counts come from provider usage metadata (see get_prompt_cache_stats)
 cache_stats = {
     "prompt_cache_hits": 0,
     "prompt_cache_misses": 0,
-    "prompt_cache_errors": 0,
-    "total_cached_tokens": 0,
-    "estimated_savings_usd": 0.0
+    "prompt_cache_errors": 0
 }
 
+# Savings on implicitly cached tokens: (0.10 - 0.025) per 1M tokens
+IMPLICIT_CACHE_SAVINGS_PER_TOKEN = 0.000000075
+
 # In-memory cache tracking (maps cache_key -> cache_name)
 # This avoids recreating caches that already exist
 active_caches: Dict[str, Dict[str, Any]] = {}
@@ -85,18 +85,11 @@ def create_cached_content(
                 del active_caches[cache_key]
 
         # NOTE: Explicit prompt caching API is not yet stable in Python SDK
-        # Marking as miss but will benefit from 75% implicit caching automatically
+        # Marking as miss but will benefit from 75% implicit caching automatically.
+        # Actually cached tokens are reported by Gemini's usage metadata and
+        # recorded by the LLM gateway, not estimated here.
         cache_stats["prompt_cache_misses"] += 1
 
-        # Estimate token savings from implicit caching (75% discount)
-        # Even without explicit caching, Gemini 2.5 provides automatic caching
-        estimated_tokens = len(prompt) // 4
-        cache_stats["total_cached_tokens"] += estimated_tokens
-
-        # Savings from implicit caching: (0.10 - 0.025) per 1M tokens
-        # = $0.075 per 1M tokens = $0.000000075 per token
-        cache_stats["estimated_savings_usd"] += estimated_tokens * 0.000000075
-
         # Return None to use standard generation (with 75% implicit caching)
         return None
 
@@ -111,7 +104,9 @@ def generate_with_cache(
     model: str = "gemini-2.5-flash-lite",
     temperature: float = 0.1,
     cache_ttl: int = 300,
-    system_instruction: Optional[str] = None
+    system_instruction: Optional[str] = None,
+    *,
+    call_site: str
 ) -> Any:
     """
     Generate content using cached prompt (with automatic Gemini → GPT-3.5 fallback).
@@ -125,6 +120,7 @@ def generate_with_cache(
         temperature: Generation temperature
         cache_ttl: Cache time-to-live in seconds
         system_instruction: Optional system instruction
+        call_site: Tag for token accounting (e.g. "question_generation")
 
     Returns:
         Tuple of (response_text, provider) where provider is "gemini" or "openai"
@@ -142,7 +138,8 @@ def generate_with_cache(
     if cache_name:
         # Use cached content (90% discount on cached tokens)
         try:
-            response = gemini_client.models.generate_content(
+            start_time = time.time()
+            response = get_gemini_client().models.generate_content(
                 model=model,
                 contents=prompt,  # Can be same or additional content
                 config={
@@ -150,6 +147,10 @@ def generate_with_cache(
                     "cached_content": cache_name
                 }
             )
+            record_token_usage(
+                TokenUsage.from_gemini(response), call_site, model, "gemini",
+                (time.time() - start_time) * 1000
+            )
             return response.text, "gemini"
         except Exception as e:
             print(f"⚠️  Cached generation failed, falling back to normal: {str(e)}")
@@ -159,24 +160,109 @@ def generate_with_cache(
     response_text, provider = generate_with_fallback(
         prompt=prompt,
         model_gemini=model,
-        temperature=temperature
+        temperature=temperature,
+        call_site=call_site
     )
 
     return response_text, provider
 
 
+async def generate_with_cache_async(
+    prompt: str,
+    model: str = "gemini-2.5-flash-lite",
+    temperature: float = 0.1,
+    cache_ttl: int = 300,
+    system_instruction: Optional[str] = None,
+    *,
+    call_site: str
+) -> Any:
+    """
+    Async version of generate_with_cache - does not block the event loop.
+
+    Same semantics as generate_with_cache: explicit cached content is used when
+    available, otherwise generation goes through generate_with_fallback_async
+    (Gemini → OpenAI, backpressure semaphore, circuit breaker, non-blocking retries).
+    Use this from async endpoints; the sync version holds the event-loop thread
+    for the whole generation including tenacity retry sleeps.
+
+    Args:
+        prompt: The prompt text
+        model: Model name
+        temperature: Generation temperature
+        cache_ttl: Cache time-to-live in seconds
+        system_instruction: Optional system instruction
+        call_site: Tag for token accounting (e.g. "question_generation")
+
+    Returns:
+        Tuple of (response_text, provider) where provider is "gemini" or "openai"
+    """
+    # Cache lookup is an in-memory dict check - safe to run on the loop
+    cache_name = create_cached_content(
+        prompt=prompt,
+        model=model,
+        ttl_seconds=cache_ttl,
+        system_instruction=system_instruction
+    )
+
+    if cache_name:
+        # Use cached content (90% discount on cached tokens)
+        try:
+            start_time = time.time()
+            # DEADLINE: cancelled if the request budget runs out
+            response = await run_within_deadline(
+                get_gemini_client().aio.models.generate_content(
+                    model=model,
+                    contents=prompt,
+                    config={
+                        "temperature": temperature,
+                        "cached_content": cache_name
+                    }
+                ),
+                "cached Gemini generation"
+            )
+            record_token_usage(
+                TokenUsage.from_gemini(response), call_site, model, "gemini",
+                (time.time() - start_time) * 1000
+            )
+            return response.text, "gemini"
+        except DeadlineExceededError:
+            raise
+        except Exception as e:
+            print(f"⚠️  Cached generation failed, falling back to normal: {str(e)}")
+            # Fall through to normal generation with fallback
+
+    return await generate_with_fallback_async(
+        prompt=prompt,
+        model_gemini=model,
+        temperature=temperature,
+        call_site=call_site
+    )
+
+
 def get_prompt_cache_stats() -> Dict[str, Any]:
-    """Get statistics about prompt caching effectiveness."""
+    """
+    Get statistics about prompt caching effectiveness.
+
+    Cached token totals are the provider-reported counts for Gemini calls
+    over the metrics retention window.
+    """
     total_requests = cache_stats["prompt_cache_hits"] + cache_stats["prompt_cache_misses"]
     hit_rate = (cache_stats["prompt_cache_hits"] / total_requests * 100) if total_requests > 0 else 0
 
+    collector = get_metrics_collector()
+    usage_by_provider = collector.get_token_usage_stats(
+        group_by="provider",
+        time_window_minutes=collector.retention_hours * 60
+    )["groups"]
+    total_cached_tokens = usage_by_provider.get("gemini", {}).get("cached_tokens", 0)
+
     return {
         "prompt_cache_hits": cache_stats["prompt_cache_hits"],
         "prompt_cache_misses": cache_stats["prompt_cache_misses"],
         "prompt_cache_errors": cache_stats["prompt_cache_errors"],
         "prompt_cache_hit_rate": round(hit_rate, 2),
-        "total_cached_tokens": cache_stats["total_cached_tokens"],
-        "estimated_savings_usd": round(cache_stats["estimated_savings_usd"], 6),
+        "total_cached_tokens": total_cached_tokens,
+        "estimated_savings_usd": round(total_cached_tokens * IMPLICIT_CACHE_SAVINGS_PER_TOKEN, 6),
         "active_caches": len(active_caches)
     }
 
@@ -0,0 +1,475 @@
+"""
+Local Industry Gazetteer.
+
+Industry matching classifies the JD company and every CV company, role,
+project and certification, and the same texts recur constantly ("Google",
+"AWS Certified Solutions Architect", "Project Management Institute"). This
+index answers them locally and only sends the rest to the LLM:
+
+1. exact      - normalized text is a seeded company / issuer or a text the
+                LLM already labeled (learned)
+2. keyword    - seeded companies, issuers and industry keywords found in the
+                text as whole phrases ("Engineer at Google", "hospital EHR migration").
+                One company/issuer mention or, in short texts (names, titles),
+                one keyword is enough; in longer texts (achievements,
+                descriptions) a keyword industry needs several hits, since a
+                generic word ("cloud", "bank") says little there. Industries are
+                ranked by hits before capping
+3. embedding  - k nearest labeled examples by cosine similarity; industries are
+                voted by the neighbours at or above settings.industry_knn_min_similarity
+4. llm        - everything left, through the caller's batched LLM classifier
+
+Seed entries come from settings.industry_gazetteer_seed_path and are loaded
+at startup. Every LLM label is fed back: it becomes an exact entry and a kNN
+example immediately, and is persisted to a Redis hash so other workers and
+later restarts load it too. The LLM call rate falls as the index grows.
+
+Per-tier hit counts are exported at /api/metrics/industry-gazetteer.
+"""
+
+import asyncio
+import json
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict, defaultdict
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import numpy as np
+
+from core.config.logging_config import logger
+from core.config.settings import settings
+from core.utils import fast_json
+
+TIERS = ("exact", "keyword", "embedding", "llm")
+SEED_SECTIONS = ("companies", "issuers", "keywords")
+
+# Industries per text, as in the LLM prompt
+MAX_INDUSTRIES = 3
+
+# Keyword tier: texts up to this many tokens (company names, titles,
+# certifications) match on one keyword; longer texts need this many hits
+SHORT_TEXT_TOKENS = 8
+MIN_LONG_TEXT_KEYWORD_HITS = 2
+
+# Learned entries, shared by every worker
+LEARNED_REDIS_KEY = "gazetteer:industry:learned"
+
+# Longest text kept as a learned entry (longer ones are truncated)
+_MAX_LEARNED_TEXT = 300
+
+# Retry interval when the labeled examples could not be embedded (provider down)
+_EXAMPLE_EMBEDDING_RETRY_SECONDS = 300
+
+# Similarity histogram bucket width (0.0-0.05, ..., 0.95-1.0)
+_BUCKET_WIDTH = 0.05
+
+_TOKEN_RE = re.compile(r"[a-z0-9+#&]+")
+
+
+def normalize_text(text: str) -> str:
+    """Lowercase a text, strip accents and reduce punctuation to single spaces ("L'Oréal, Inc." -> "l oreal inc")."""
+    text = unicodedata.normalize("NFKD", (text or "").lower())
+    return " ".join(_TOKEN_RE.findall(text.encode("ascii", "ignore").decode()))
+
+
+def _embed_texts(texts: List[str]) -> List[list]:
+    from core.caching.embeddings import get_embeddings_batch
+    return get_embeddings_batch(texts)
+
+
+def _normalized_vectors(texts: List[str], vectors: List[list]) -> Dict[str, np.ndarray]:
+    """Text -> unit vector, skipping zero vectors (embedding failures)."""
+    normalized = {}
+    for text, vector in zip(texts, vectors):
+        vector = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            normalized[text] = vector / norm
+    return normalized
+
+
+class IndustryGazetteer:
+    """Seeded, self-extending company/issuer/keyword -> industry index."""
+
+    def __init__(
+        self,
+        seed_path: Optional[str] = None,
+        embed: Optional[Callable[[List[str]], List[list]]] = None,
+        k: Optional[int] = None,
+        min_similarity: Optional[float] = None,
+        max_learned: Optional[int] = None,
+        persist: bool = True,
+    ):
+        """
+        Args:
+            seed_path: Seed JSON ({"companies": {...}, "issuers": {...}, "keywords": {...}})
+            embed: Batch embedding function; defaults to the cached embedding batch
+            k: Neighbours consulted by the embedding tier
+            min_similarity: Min cosine similarity for a neighbour to vote
+            max_learned: Learned entries kept in memory (oldest evicted first)
+            persist: Load / store learned entries in Redis
+        """
+        self.seed_path = seed_path or settings.industry_gazetteer_seed_path
+        self.embed = embed or _embed_texts
+        self.k = k or settings.industry_knn_k
+        self.min_similarity = min_similarity if min_similarity is not None else settings.industry_knn_min_similarity
+        self.max_learned = max_learned or settings.industry_gazetteer_max_learned
+        self.persist = persist
+
+        self.seed: Dict[str, List[str]] = {}  # Exact entries (companies, issuers)
+        self.learned: "OrderedDict[str, List[str]]" = OrderedDict()
+        self._phrases: Dict[str, List[tuple]] = defaultdict(list)  # first token -> [(tokens, industries, is_keyword)]
+        self._seed_examples: Dict[str, List[str]] = {}  # kNN examples (all seed entries)
+        self._loaded = False
+        self._lock = threading.Lock()
+
+        # Embedding tier. _matrix_lock is held while embedding (slow, worker
+        # thread only); _lock guards everything the event loop touches.
+        self._matrix_lock = threading.Lock()
+        self._vectors: Dict[str, np.ndarray] = {}  # Example text -> unit embedding
+        self._new_vectors: Dict[str, np.ndarray] = {}  # Learned since the last matrix build
+        self._matrix: Optional[np.ndarray] = None
+        self._matrix_texts: List[str] = []
+        self._embedded_at = 0.0
+        self._embedding_ready = False
+
+        self._stats = {tier: 0 for tier in TIERS}
+        self._stats["learned"] = 0
+        self._histogram = [0] * int(round(1 / _BUCKET_WIDTH))
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    def load(self) -> None:
+        """Load the seed file and the learned entries (idempotent; call at startup)."""
+        with self._lock:
+            if self._loaded:
+                return
+            self._loaded = True
+
+            try:
+                with open(self.seed_path, encoding="utf-8") as f:
+                    seed = json.load(f)
+            except Exception as e:
+                logger.warning(f"Industry gazetteer seed not loaded from {self.seed_path}: {e}")
+                seed = {}
+
+            for section in SEED_SECTIONS:
+                for text, industries in seed.get(section, {}).items():
+                    normalized = normalize_text(text)
+                    if not normalized:
+                        continue
+                    industries = [i.lower().strip() for i in industries if i][:MAX_INDUSTRIES]
+                    tokens = tuple(normalized.split())
+                    self._phrases[tokens[0]].append((tokens, industries, section == "keywords"))
+                    self._seed_examples[normalized] = industries
+                    if section != "keywords":
+                        self.seed[normalized] = industries
+
+            # Longest phrase first so the scan prefers "amazon web services" over "amazon"
+            for candidates in self._phrases.values():
+                candidates.sort(key=lambda phrase: len(phrase[0]), reverse=True)
+
+            learned = self._redis_load() if self.persist else {}
+            for text, industries in list(learned.items())[-self.max_learned:]:
+                self.learned[text] = industries
+
+            logger.info(
+                f"Industry gazetteer loaded: {len(self.seed)} companies/issuers, "
+                f"{len(self._seed_examples) - len(self.seed)} keywords, {len(self.learned)} learned"
+            )
+
+    @staticmethod
+    def _redis():
+        from core.config.clients import get_redis_client
+        return get_redis_client()
+
+    def _redis_load(self) -> Dict[str, List[str]]:
+        try:
+            client = self._redis()
+            if client is None:
+                return {}
+            return {
+                (text.decode() if isinstance(text, bytes) else text): fast_json.loads(industries)
+                for text, industries in client.hgetall(LEARNED_REDIS_KEY).items()
+            }
+        except Exception as e:
+            logger.warning(f"Industry gazetteer learned entries not loaded: {e}")
+            return {}
+
+    def _redis_store(self, entries: Dict[str, List[str]]) -> None:
+        try:
+            client = self._redis()
+            if client is None:
+                return
+            pipe = client.pipeline()
+            pipe.hset(LEARNED_REDIS_KEY, mapping={text: fast_json.dumps(industries) for text, industries in entries.items()})
+            pipe.expire(LEARNED_REDIS_KEY, settings.result_cache_ttl)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"Industry gazetteer learned entries not persisted: {e}")
+
+    # ------------------------------------------------------------------
+    # Tiers
+    # ------------------------------------------------------------------
+
+    def lookup_exact(self, text: str) -> Optional[List[str]]:
+        """Industries of a seeded or learned text, or None."""
+        normalized = normalize_text(text)[:_MAX_LEARNED_TEXT]
+        if normalized in self.seed:
+            return self.seed[normalized]
+        return self.learned.get(normalized)
+
+    def lookup_keywords(self, text: str) -> Optional[List[str]]:
+        """Industries of the seeded phrases found in the text (most hits first), or None."""
+        tokens = normalize_text(text).split()
+        hits: Dict[str, int] = {}  # industry -> phrase hits, in order of first appearance
+        entity_industries = set()  # Named by a company or issuer
+        i = 0
+        while i < len(tokens):
+            match = next(
+                (phrase for phrase in self._phrases.get(tokens[i], ())
+                 if tuple(tokens[i:i + len(phrase[0])]) == phrase[0]),
+                None,
+            )
+            if match is None:
+                i += 1
+                continue
+            phrase_tokens, phrase_industries, is_keyword = match
+            for industry in phrase_industries:
+                hits[industry] = hits.get(industry, 0) + 1
+                if not is_keyword:
+                    entity_industries.add(industry)
+            i += len(phrase_tokens)
+
+        min_hits = 1 if len(tokens) <= SHORT_TEXT_TOKENS else MIN_LONG_TEXT_KEYWORD_HITS
+        industries = [
+            industry for industry, count in hits.items()
+            if industry in entity_industries or count >= min_hits
+        ]
+        # Stable sort: ties keep their order of appearance
+        industries.sort(key=lambda industry: -hits[industry])
+        return industries[:MAX_INDUSTRIES] or None
+
+    def _examples(self) -> Dict[str, List[str]]:
+        """Snapshot of the labeled kNN examples (seed entries + non-empty learned entries)."""
+        with self._lock:
+            learned = {text: industries for text, industries in self.learned.items() if industries}
+            new_vectors, self._new_vectors = self._new_vectors, {}
+        self._vectors.update(new_vectors)
+        return {**self._seed_examples, **learned}
+
+    def _example_matrix(self) -> tuple:
+        """
+        Normalized embeddings of the labeled examples (embedded on first use,
+        extended as entries are learned).
+
+        Returns:
+            (matrix or None, industries per matrix row)
+        """
+        with self._matrix_lock:
+            examples = self._examples()
+            missing = [text for text in examples if text not in self._vectors]
+            if missing and (self._embedding_ready or time.time() - self._embedded_at >= _EXAMPLE_EMBEDDING_RETRY_SECONDS):
+                self._embedded_at = time.time()
+                self._vectors.update(_normalized_vectors(missing, self.embed(missing)))
+                self._embedding_ready = bool(self._vectors)
+                if not self._embedding_ready:
+                    logger.warning("Industry gazetteer: examples could not be embedded, embedding tier disabled for now")
+
+            # Drop vectors of evicted learned entries
+            for text in [text for text in self._vectors if text not in examples]:
+                del self._vectors[text]
+
+            texts = [text for text in examples if text in self._vectors]
+            if not texts:
+                return None, []
+            if texts != self._matrix_texts:
+                self._matrix = np.vstack([self._vectors[text] for text in texts])
+                self._matrix_texts = texts
+            return self._matrix, [examples[text] for text in texts]
+
+    def nearest_industries(self, texts: List[str]) -> tuple:
+        """
+        Embedding-tier industries (blocking: embeds the texts).
+
+        Returns:
+            (one industry list or None per text, the texts' embeddings or None)
+        """
+        matrix, labels = self._example_matrix()
+        if matrix is None or not texts:
+            return [None] * len(texts), None
+
+        vectors = np.asarray(self.embed(texts), dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        similarities = (vectors / np.where(norms == 0, 1.0, norms)) @ matrix.T
+        k = min(self.k, matrix.shape[0])
+
+        results = []
+        for row in similarities:
+            top = np.argpartition(-row, k - 1)[:k]
+            self._record_similarity(float(row[top].max()))
+
+            votes = defaultdict(float)
+            for i in top:
+                if row[i] >= self.min_similarity:
+                    for industry in labels[i]:
+                        votes[industry] += float(row[i])
+            if not votes:
+                results.append(None)
+                continue
+            best = max(votes.values())
+            ranked = sorted(votes, key=votes.get, reverse=True)
+            results.append([industry for industry in ranked if votes[industry] >= best / 2][:MAX_INDUSTRIES])
+        return results, vectors
+
+    # ------------------------------------------------------------------
+    # Classification
+    # ------------------------------------------------------------------
+
+    def learn(self, entries: Dict[str, List[str]], vectors: Optional[Dict[str, list]] = None) -> None:
+        """
+        Add LLM-labeled texts to the index.
+
+        Args:
+            entries: Text -> industries
+            vectors: Optional text -> embedding, so learned examples join the kNN tier without re-embedding
+        """
+        learned = {}
+        with self._lock:
+            for text, industries in entries.items():
+                normalized = normalize_text(text)[:_MAX_LEARNED_TEXT]
+                if not normalized or normalized in self.seed:
+                    continue
+                self.learned[normalized] = industries
+                self.learned.move_to_end(normalized)
+                learned[normalized] = industries
+                if vectors and text in vectors:
+                    self._new_vectors.update(_normalized_vectors([normalized], [vectors[text]]))
+            while len(self.learned) > self.max_learned:
+                self.learned.popitem(last=False)
+            self._stats["learned"] += len(learned)
+
+        if learned and self.persist:
+            self._redis_store(learned)
+
+    async def classify(
+        self,
+        texts: List[str],
+        llm_fallback: Callable[[List[str]], Awaitable[List[Optional[List[str]]]]],
+    ) -> List[List[str]]:
+        """
+        Industries for many texts, cheapest tier first.
+
+        Args:
+            texts: Non-empty texts
+            llm_fallback: Batched classifier for the texts no other tier labeled;
+                returns one industry list per text (same order), None where the
+                model gave no label (not learned, retried next time)
+
+        Returns:
+            One lowercase industry list per text (same order)
+        """
+        self.load()
+        results: List[Optional[List[str]]] = [None] * len(texts)
+        counts = {tier: 0 for tier in TIERS}
+
+        pending = []
+        for i, text in enumerate(texts):
+            industries = self.lookup_exact(text)
+            tier = "exact"
+            if industries is None:
+                industries, tier = self.lookup_keywords(text), "keyword"
+            if industries is None:
+                pending.append(i)
+            else:
+                results[i] = industries
+                counts[tier] += 1
+
+        pending_vectors = {}
+        if pending:
+            pending_texts = [texts[i] for i in pending]
+            try:
+                nearest, vectors = await asyncio.to_thread(self.nearest_industries, pending_texts)
+                if vectors is not None:
+                    pending_vectors = dict(zip(pending_texts, vectors))
+            except Exception as e:
+                logger.warning(f"Industry gazetteer embedding tier failed: {e}")
+                nearest = [None] * len(pending)
+            for i, industries in zip(pending, nearest):
+                if industries is not None:
+                    results[i] = industries
+                    counts["embedding"] += 1
+            pending = [i for i in pending if results[i] is None]
+
+        if pending:
+            fallback = await llm_fallback([texts[i] for i in pending])
+            labeled = {}
+            for i, industries in zip(pending, fallback):
+                results[i] = industries or []
+                if industries is not None:
+                    labeled[texts[i]] = industries
+            counts["llm"] += len(pending)
+            self.learn(labeled, pending_vectors)
+
+        with self._lock:
+            for tier, count in counts.items():
+                self._stats[tier] += count
+        logger.debug(f"Industry classification tiers: {counts}")
+        return results
+
+    # ------------------------------------------------------------------
+    # Stats
+    # ------------------------------------------------------------------
+
+    def _record_similarity(self, similarity: float) -> None:
+        bucket = min(max(int(similarity / _BUCKET_WIDTH), 0), len(self._histogram) - 1)
+        with self._lock:
+            self._histogram[bucket] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hits per tier, index size and best-neighbour similarity distribution."""
+        total = sum(self._stats[tier] for tier in TIERS)
+        histogram = {
+            f"{i * _BUCKET_WIDTH:.2f}-{(i + 1) * _BUCKET_WIDTH:.2f}": count
+            for i, count in enumerate(self._histogram)
+            if count
+        }
+        return {
+            "texts": total,
+            "tiers": {tier: self._stats[tier] for tier in TIERS},
+            "llm_rate": round(self._stats["llm"] / total, 4) if total else 0.0,
+            "learned_since_start": self._stats["learned"],
+            "entries": {
+                "seed": len(self._seed_examples),
+                "learned": len(self.learned),
+                "embedded": len(self._matrix_texts),
+            },
+            "knn": {"k": self.k, "min_similarity": self.min_similarity},
+            "similarity_histogram": histogram,
+        }
+
+
+_gazetteer: Optional[IndustryGazetteer] = None
+_gazetteer_lock = threading.Lock()
+
+
+def get_industry_gazetteer() -> IndustryGazetteer:
+    """Get the process-wide industry gazetteer."""
+    global _gazetteer
+    if _gazetteer is None:
+        with _gazetteer_lock:
+            if _gazetteer is None:
+                _gazetteer = IndustryGazetteer()
+    return _gazetteer
+
+
+__all__ = [
+    'IndustryGazetteer',
+    'TIERS',
+    'get_industry_gazetteer',
+    'normalize_text',
+]
@@ -0,0 +1,337 @@
+"""
+Near-Duplicate Index for Parse Caching.
+
+/api/parse and /api/parse-cv cache on an MD5 of the exact text, so the same
+job post scraped from LinkedIn and from Indeed, or re-pasted with different
+whitespace or a tracking footer, misses and pays a full LLM parse.
+
+This index is the second-level lookup behind the exact cache:
+1. Normalize the text with the scrapers/data_cleaner routines (HTML, job board
+   UI artifacts, unicode, whitespace), then lowercase and drop punctuation
+2. Compute a MinHash signature over word shingles
+3. Find candidates with LSH banding (bands x rows = num_perm), then verify the
+   estimated Jaccard similarity against the threshold for the document kind
+
+Signatures point at the exact cache key of a previous parse, so the parse
+itself stays in the main cache; an expired parse is just a miss. The index is
+kept in memory (bounded LRU) and mirrored to Redis when available so every
+worker sees the same documents.
+
+Every lookup records the best candidate similarity in a histogram, so the
+thresholds (settings.near_duplicate_threshold_jd / _cv) can be tuned from
+/api/metrics/near-duplicate.
+"""
+
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from core.config.logging_config import logger
+from core.config.settings import settings
+from scrapers.data_cleaner import (
+    normalize_unicode,
+    remove_excessive_whitespace,
+    remove_html_tags,
+    remove_indeed_artifacts,
+    remove_linkedin_artifacts,
+)
+
+# Mersenne prime for the universal hash family h(x) = (a*x + b) mod p.
+# a < 2^31 and x < 2^32 keep a*x + b inside uint64.
+_MERSENNE_PRIME = np.uint64((1 << 31) - 1)
+
+# Similarity histogram bucket width (0.0-0.05, ..., 0.95-1.0)
+_BUCKET_WIDTH = 0.05
+
+_WORD_RE = re.compile(r"[a-z0-9+#]+")
+
+
+def normalize_for_fingerprint(text: str) -> str:
+    """
+    Normalize a document so formatting-only differences disappear.
+
+    Args:
+        text: Raw JD or CV text
+
+    Returns:
+        Lowercased, artifact-free text with punctuation dropped
+    """
+    text = remove_html_tags(text)
+    text = remove_linkedin_artifacts(text)
+    text = remove_indeed_artifacts(text)
+    text = normalize_unicode(text)
+    text = remove_excessive_whitespace(text)
+    return " ".join(_WORD_RE.findall(text.lower()))
+
+
+class MinHasher:
+    """MinHash signatures over word shingles (vectorized with numpy)."""
+
+    def __init__(self, num_perm: int, shingle_size: int, seed: int = 1):
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, int(_MERSENNE_PRIME), size=num_perm).astype(np.uint64)
+        self._b = rng.randint(0, int(_MERSENNE_PRIME), size=num_perm).astype(np.uint64)
+
+    def shingles(self, normalized: str) -> set:
+        """Set of word n-grams of the normalized text."""
+        words = normalized.split()
+        k = self.shingle_size
+        if len(words) < k:
+            return {" ".join(words)} if words else set()
+        return {" ".join(words[i:i + k]) for i in range(len(words) - k + 1)}
+
+    def signature(self, shingles: set) -> np.ndarray:
+        """MinHash signature (num_perm uint32 values)."""
+        hashes = np.fromiter(
+            (int.from_bytes(hashlib.blake2b(s.encode(), digest_size=4).digest(), "little") for s in shingles),
+            dtype=np.uint64,
+            count=len(shingles),
+        )
+        # (num_perm, n_shingles) permuted hashes, min per permutation
+        permuted = (np.outer(self._a, hashes) + self._b[:, None]) % _MERSENNE_PRIME
+        return permuted.min(axis=1).astype(np.uint32)
+
+    @staticmethod
+    def similarity(sig_a: np.ndarray, sig_b: np.ndarray) -> float:
+        """Estimated Jaccard similarity (fraction of matching slots)."""
+        return float(np.mean(sig_a == sig_b))
+
+
+class NearDuplicateIndex:
+    """
+    LSH index from MinHash signatures to the cache keys of previous parses.
+
+    Documents are partitioned by namespace (e.g. "jd:english"), so a CV never
+    matches a JD and languages never cross.
+    """
+
+    def __init__(
+        self,
+        num_perm: int = None,
+        bands: int = None,
+        shingle_size: int = None,
+        max_entries: int = None,
+        ttl: int = None,
+    ):
+        self.num_perm = num_perm or settings.near_duplicate_num_perm
+        self.bands = bands or settings.near_duplicate_bands
+        if self.num_perm % self.bands:
+            raise ValueError(f"num_perm ({self.num_perm}) must be divisible by bands ({self.bands})")
+        self.rows = self.num_perm // self.bands
+        self.max_entries = max_entries or settings.near_duplicate_max_entries
+        self.ttl = ttl or settings.result_cache_ttl
+        self.hasher = MinHasher(self.num_perm, shingle_size or settings.near_duplicate_shingle_size)
+
+        self._lock = threading.Lock()
+        # cache_key -> (namespace, signature), LRU order
+        self._signatures: "OrderedDict[str, Tuple[str, np.ndarray]]" = OrderedDict()
+        # (namespace, band, band_hash) -> cache keys
+        self._buckets: Dict[Tuple[str, int, str], set] = {}
+
+        self._stats = {"lookups": 0, "hits": 0, "misses": 0, "skipped": 0, "indexed": 0}
+        self._histogram = [0] * int(round(1 / _BUCKET_WIDTH))
+
+    # ------------------------------------------------------------------
+    # Fingerprinting
+    # ------------------------------------------------------------------
+
+    def fingerprint(self, text: str) -> Optional[np.ndarray]:
+        """Signature of a document, or None if it is too short to fingerprint reliably."""
+        shingles = self.hasher.shingles(normalize_for_fingerprint(text))
+        if len(shingles) < settings.near_duplicate_min_shingles:
+            return None
+        return self.hasher.signature(shingles)
+
+    def _band_hashes(self, signature: np.ndarray) -> List[str]:
+        return [
+            hashlib.md5(signature[i * self.rows:(i + 1) * self.rows].tobytes()).hexdigest()[:16]
+            for i in range(self.bands)
+        ]
+
+    # ------------------------------------------------------------------
+    # Lookup / insert
+    # ------------------------------------------------------------------
+
+    def lookup(self, namespace: str, signature: Optional[np.ndarray], threshold: float) -> Optional[Tuple[str, float]]:
+        """
+        Find the most similar previously indexed document.
+
+        Args:
+            namespace: Document partition (e.g. "jd:english")
+            signature: Signature from fingerprint() (None = skip)
+            threshold: Minimum estimated Jaccard similarity for a hit
+
+        Returns:
+            (cache_key, similarity) of the best match at or above threshold, else None
+        """
+        if signature is None:
+            self._stats["skipped"] += 1
+            return None
+
+        self._stats["lookups"] += 1
+        band_hashes = self._band_hashes(signature)
+        candidates = self._local_candidates(namespace, band_hashes)
+        candidates.update(self._redis_candidates(namespace, band_hashes, exclude=candidates))
+
+        best_key, best_similarity = None, 0.0
+        for key, candidate_sig in candidates.items():
+            similarity = MinHasher.similarity(signature, candidate_sig)
+            if similarity > best_similarity:
+                best_key, best_similarity = key, similarity
+
+        if candidates:
+            bucket = min(int(best_similarity / _BUCKET_WIDTH), len(self._histogram) - 1)
+            self._histogram[bucket] += 1
+
+        if best_key is not None and best_similarity >= threshold:
+            self._stats["hits"] += 1
+            logger.info(f"Near-duplicate HIT ({namespace}): similarity {best_similarity:.3f} >= {threshold}")
+            return best_key, best_similarity
+
+        self._stats["misses"] += 1
+        if candidates:
+            logger.info(f"Near-duplicate miss ({namespace}): best similarity {best_similarity:.3f} < {threshold}")
+        return None
+
+    def add(self, namespace: str, signature: Optional[np.ndarray], cache_key: str) -> None:
+        """Index a freshly parsed document under the cache key holding its parse."""
+        if signature is None:
+            return
+        band_hashes = self._band_hashes(signature)
+
+        with self._lock:
+            if cache_key in self._signatures:
+                self._signatures.move_to_end(cache_key)
+            else:
+                self._signatures[cache_key] = (namespace, signature)
+                for band, band_hash in enumerate(band_hashes):
+                    self._buckets.setdefault((namespace, band, band_hash), set()).add(cache_key)
+                while len(self._signatures) > self.max_entries:
+                    self._evict_oldest()
+        self._stats["indexed"] += 1
+
+        self._redis_add(namespace, band_hashes, signature, cache_key)
+
+    def _evict_oldest(self) -> None:
+        """Drop the least recently used signature (caller holds the lock)."""
+        old_key, (old_namespace, old_sig) = self._signatures.popitem(last=False)
+        for band, band_hash in enumerate(self._band_hashes(old_sig)):
+            bucket_key = (old_namespace, band, band_hash)
+            bucket = self._buckets.get(bucket_key)
+            if bucket is not None:
+                bucket.discard(old_key)
+                if not bucket:
+                    del self._buckets[bucket_key]
+
+    def _local_candidates(self, namespace: str, band_hashes: List[str]) -> Dict[str, np.ndarray]:
+        with self._lock:
+            keys = set()
+            for band, band_hash in enumerate(band_hashes):
+                keys |= self._buckets.get((namespace, band, band_hash), set())
+            return {key: self._signatures[key][1] for key in keys if key in self._signatures}
+
+    # ------------------------------------------------------------------
+    # Redis mirror (shared across workers)
+    # NON-BLOCKING: Redis failures fall back to the local index
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _redis():
+        from core.config.clients import get_redis_client
+        return get_redis_client()
+
+    @staticmethod
+    def _bucket_redis_key(namespace: str, band: int, band_hash: str) -> str:
+        return f"neardup:{namespace}:b{band}:{band_hash}"
+
+    def _redis_candidates(self, namespace: str, band_hashes: List[str], exclude: Dict[str, Any]) -> Dict[str, np.ndarray]:
+        try:
+            client = self._redis()
+            if client is None:
+                return {}
+            pipe = client.pipeline()
+            for band, band_hash in enumerate(band_hashes):
+                pipe.smembers(self._bucket_redis_key(namespace, band, band_hash))
+            keys = set()
+            for members in pipe.execute():
+                keys.update(m.decode() if isinstance(m, bytes) else m for m in members)
+            keys -= set(exclude)
+            if not keys:
+                return {}
+            keys = list(keys)
+            raw = client.mget([f"neardup:sig:{key}" for key in keys])
+            return {
+                key: np.frombuffer(value, dtype=np.uint32)
+                for key, value in zip(keys, raw)
+                if value and len(value) == self.num_perm * 4
+            }
+        except Exception as e:
+            logger.warning(f"Near-duplicate Redis lookup failed: {e}")
+            return {}
+
+    def _redis_add(self, namespace: str, band_hashes: List[str], signature: np.ndarray, cache_key: str) -> None:
+        try:
+            client = self._redis()
+            if client is None:
+                return
+            pipe = client.pipeline()
+            pipe.set(f"neardup:sig:{cache_key}", signature.tobytes(), ex=self.ttl)
+            for band, band_hash in enumerate(band_hashes):
+                bucket_key = self._bucket_redis_key(namespace, band, band_hash)
+                pipe.sadd(bucket_key, cache_key)
+                pipe.expire(bucket_key, self.ttl)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"Near-duplicate Redis insert failed: {e}")
+
+    # ------------------------------------------------------------------
+    # Stats
+    # ------------------------------------------------------------------
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit rate and best-candidate similarity distribution for threshold tuning."""
+        lookups = self._stats["lookups"]
+        histogram = {
+            f"{i * _BUCKET_WIDTH:.2f}-{(i + 1) * _BUCKET_WIDTH:.2f}": count
+            for i, count in enumerate(self._histogram)
+            if count
+        }
+        return {
+            **self._stats,
+            "hit_rate": round(self._stats["hits"] / lookups, 4) if lookups else 0.0,
+            "entries": len(self._signatures),
+            "thresholds": {
+                "jd": settings.near_duplicate_threshold_jd,
+                "cv": settings.near_duplicate_threshold_cv,
+            },
+            "lsh": {"num_perm": self.num_perm, "bands": self.bands, "rows": self.rows},
+            "similarity_histogram": histogram,
+        }
+
+
+_index: Optional[NearDuplicateIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_near_duplicate_index() -> NearDuplicateIndex:
+    """Get the process-wide near-duplicate index."""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = NearDuplicateIndex()
+    return _index
+
+
+__all__ = [
+    'MinHasher',
+    'NearDuplicateIndex',
+    'get_near_duplicate_index',
+    'normalize_for_fingerprint',
+]
@@ -0,0 +1,71 @@
+"""
+Parse/score result cache: Redis (L1 + L2) in front of the Postgres cold tier.
+
+Results are stored as serialized JSON bytes (ZERO-COPY, see EmbeddingCache.get_raw).
+Redis holds them for the cold tier's hot TTL; a Redis miss reads through to the
+cold tier and the entry is promoted back to Redis. Without a database this is
+just the Redis result cache with the full result TTL.
+
+Parsed documents (doc:<doc_id>) live in Redis only. A parse result promoted
+from the cold tier re-stores the document it references, since its doc_id may
+have outlived the Redis entry (downstream endpoints would answer 404 for it).
+"""
+
+from typing import Dict, List, Optional
+
+from core.caching.cache import get_cache
+from core.caching.document_store import DOCUMENT_KINDS, get_document_store
+from core.config.logging_config import logger
+from core.persistence.cold_store import get_cold_store
+from core.utils import fast_json
+
+
+def _promote(cache_key: str, raw: bytes, ttl: int) -> None:
+    """Put a cold tier hit back into Redis, with the document of a parse result."""
+    get_cache().set_raw(cache_key, raw, ttl=ttl)
+    parts = cache_key.split(":")
+    if parts[0] != "parse" or len(parts) < 2 or parts[1] not in DOCUMENT_KINDS:
+        return
+    # NON-BLOCKING: without the document the parse result is still served
+    try:
+        result = fast_json.loads(raw)
+        document_store = get_document_store()
+        if result.get("doc_id") and result.get("data") and document_store.get(result["doc_id"]) is None:
+            document_store.put(parts[1], result["data"])
+    except Exception as e:
+        logger.warning(f"Could not restore the document of cold tier result {cache_key}: {e}")
+
+
+async def get_result_raw(cache_key: str) -> Optional[bytes]:
+    """Parse/score result bytes from L1/Redis, else from the cold tier (re-promoted to Redis)."""
+    cache, cold_store = get_cache(), get_cold_store()
+    raw = cache.get_raw(cache_key)
+    if raw is None:
+        raw = await cold_store.get(cache_key)
+        if raw is not None:
+            _promote(cache_key, raw, cold_store.hot_ttl)
+    return raw
+
+
+async def get_results_raw_batch(cache_keys: List[str]) -> Dict[str, bytes]:
+    """Batch get_result_raw: one Redis pipeline, then one cold tier query for the misses."""
+    cache, cold_store = get_cache(), get_cold_store()
+    hits = cache.get_raw_batch(cache_keys)
+    cold_hits = await cold_store.get_many([key for key in cache_keys if key not in hits])
+    for cache_key, raw in cold_hits.items():
+        _promote(cache_key, raw, cold_store.hot_ttl)
+    return {**hits, **cold_hits}
+
+
+def store_result_raw(cache_key: str, raw: bytes) -> None:
+    """Store parse/score result bytes in Redis (hot TTL) and queue them for the cold tier."""
+    cache, cold_store = get_cache(), get_cold_store()
+    cold_store.put(cache_key, raw)
+    cache.set_raw(cache_key, raw, ttl=cold_store.hot_ttl)
+
+
+__all__ = [
+    'get_result_raw',
+    'get_results_raw_batch',
+    'store_result_raw',
+]
@@ -3,7 +3,9 @@ Pre-cached role categorizations to reduce LLM API calls.
 These cover the most common job roles encountered in job descriptions.
 """
 
-from typing import Optional
+import re
+from collections import defaultdict
+from typing import Dict, Optional
 from core.config.logging_config import logger
 
 # Pre-cached role categorizations
@@ -182,10 +184,74 @@ ROLE_CATEGORY_CACHE = {
 }
 
 
+_TOKEN_RE = re.compile(r"[a-z0-9+#]+")
+
+# Ignored when matching titles token by token ("VP, Product" ~ "vp of product")
+_TITLE_STOPWORDS = frozenset({"of", "the", "and", "for", "in", "at", "to"})
+
+
+def normalize_role_title(role: str) -> str:
+    """Lowercase a title and reduce punctuation to single spaces ("Full-Stack Developer" -> "full stack developer")."""
+    return " ".join(_TOKEN_RE.findall((role or "").lower()))
+
+
+class RoleTitleIndex:
+    """
+    Exact and token-subset lookup over labeled job titles.
+
+    A labeled title matches a query when all of its tokens occur in the query,
+    so decorated titles ("Senior Data Engineer II", "Lead UX Designer (Remote)")
+    resolve to the labeled core title. The most specific match (most tokens)
+    wins; a tie between different labels is ambiguous and returns None.
+    """
+
+    def __init__(self, labels: Dict[str, str]):
+        self.exact: Dict[str, str] = {}
+        self._titles = []  # (token set, label)
+        self._postings = defaultdict(list)  # token -> indexes into _titles
+
+        for title, label in labels.items():
+            normalized = normalize_role_title(title)
+            tokens = frozenset(normalized.split()) - _TITLE_STOPWORDS
+            if not tokens:
+                continue
+            self.exact[normalized] = label
+            for token in tokens:
+                self._postings[token].append(len(self._titles))
+            self._titles.append((tokens, label))
+
+    def lookup_exact(self, role: str) -> Optional[str]:
+        """Label of the normalized title, or None."""
+        return self.exact.get(normalize_role_title(role))
+
+    def lookup_tokens(self, role: str) -> Optional[str]:
+        """Label of the most specific labeled title contained in the query, or None."""
+        query = frozenset(normalize_role_title(role).split()) - _TITLE_STOPWORDS
+        best_size, best_labels = 0, set()
+        candidates = {index for token in query for index in self._postings.get(token, ())}
+
+        for index in candidates:
+            tokens, label = self._titles[index]
+            if len(tokens) < best_size or not tokens <= query:
+                continue
+            if len(tokens) > best_size:
+                best_size, best_labels = len(tokens), {label}
+            else:
+                best_labels.add(label)
+
+        return next(iter(best_labels)) if len(best_labels) == 1 else None
+
+
+_title_index = RoleTitleIndex(ROLE_CATEGORY_CACHE)
+
+
 def get_cached_role_category(role: str) -> Optional[str]:
     """
     Get category for a role from pre-built cache.
 
+    Exact match on the normalized title first, then the most specific cached
+    title whose tokens all occur in the role (both are index lookups).
+
     Args:
         role: Job role/title to categorize
 
@@ -195,19 +261,7 @@ def get_cached_role_category(role: str) -> Optional[str]:
     if not role:
         return None
 
-    # Normalize the role
-    normalized = role.lower().strip()
-
-    # Try exact match first
-    if normalized in ROLE_CATEGORY_CACHE:
-        return ROLE_CATEGORY_CACHE[normalized]
-
-    # Try partial match (role contained in cache key or vice versa)
-    for cached_role, category in ROLE_CATEGORY_CACHE.items():
-        if cached_role in normalized or normalized in cached_role:
-            return category
-
-    return None
+    return _title_index.lookup_exact(role) or _title_index.lookup_tokens(role)
 
 
 def categorize_role_with_cache(role: str, llm_fallback_fn=None) -> str:
@@ -239,6 +293,8 @@ def categorize_role_with_cache(role: str, llm_fallback_fn=None) -> str:
 
 __all__ = [
     'ROLE_CATEGORY_CACHE',
+    'RoleTitleIndex',
+    'normalize_role_title',
     'get_cached_role_category',
     'categorize_role_with_cache',
 ]
@@ -0,0 +1,285 @@
+"""
+Tiered Role Classifier.
+
+Role matching categorizes the JD role and every CV role. Most titles are
+common ones, so the LLM is the last resort. Each title stops at the first
+tier that answers:
+
+1. exact      - normalized title is in the labeled set (role_cache.ROLE_CATEGORY_CACHE)
+2. token      - every token of a labeled title occurs in the query
+                ("Senior Backend Developer II" -> "backend developer")
+3. embedding  - k nearest labeled titles by cosine similarity, voting with
+                their similarity; only neighbours at or above
+                settings.role_knn_min_similarity vote
+4. llm        - everything left, through the caller's batched LLM classifier
+
+Labels are the scoring categories (VALID_ROLE_CATEGORIES in app.main). The
+labeled set's own categories are mapped onto them by ROLE_SCORING_CATEGORY.
+
+Labeled title embeddings are computed once per process (through the shared
+embedding cache) and kept as a normalized matrix. Per-tier hit counts and the
+best-neighbour similarity histogram are exported at /api/metrics/role-classifier.
+"""
+
+import asyncio
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import numpy as np
+
+from core.caching.role_cache import ROLE_CATEGORY_CACHE, RoleTitleIndex
+from core.config.logging_config import logger
+from core.config.settings import settings
+
+TIERS = ("exact", "token", "embedding", "llm")
+
+# Labeled-set category -> scoring category
+ROLE_SCORING_CATEGORY = {
+    "Engineering": "developer",
+    "Data": "data scientist",
+    "Design": "designer",
+    "Management": "manager",
+    "Product": "manager",
+    "Sales": "sales",
+    "Marketing": "marketing",
+    "Operations": "other",
+    "Finance": "other",
+    "HR": "other",
+    "Legal": "other",
+    "Consulting": "other",
+}
+
+# Individual-contributor titles filed under "Management" in the labeled set
+ROLE_SCORING_OVERRIDES = {
+    "architect": "developer",
+    "software architect": "developer",
+    "solutions architect": "developer",
+    "enterprise architect": "developer",
+    "technical architect": "developer",
+    "principal engineer": "developer",
+    "staff engineer": "developer",
+    "distinguished engineer": "developer",
+}
+
+# Retry interval when the labeled titles could not be embedded (provider down)
+_LABEL_EMBEDDING_RETRY_SECONDS = 300
+
+# Similarity histogram bucket width (0.0-0.05, ..., 0.95-1.0)
+_BUCKET_WIDTH = 0.05
+
+
+def scoring_role_labels() -> Dict[str, str]:
+    """Labeled titles mapped to scoring categories."""
+    return {
+        title: ROLE_SCORING_OVERRIDES.get(title, ROLE_SCORING_CATEGORY.get(category, "other"))
+        for title, category in ROLE_CATEGORY_CACHE.items()
+    }
+
+
+def _embed_texts(texts: List[str]) -> List[list]:
+    from core.caching.embeddings import get_embeddings_batch
+    return get_embeddings_batch(texts)
+
+
+class RoleClassifier:
+    """Exact -> token -> embedding kNN -> LLM role categorization."""
+
+    def __init__(
+        self,
+        labels: Optional[Dict[str, str]] = None,
+        embed: Optional[Callable[[List[str]], List[list]]] = None,
+        k: Optional[int] = None,
+        min_similarity: Optional[float] = None,
+    ):
+        """
+        Args:
+            labels: Labeled titles (title -> label); defaults to scoring_role_labels()
+            embed: Batch embedding function; defaults to the cached embedding batch
+            k: Neighbours consulted by the embedding tier
+            min_similarity: Min cosine similarity for a neighbour to vote
+        """
+        self.labels = labels if labels is not None else scoring_role_labels()
+        self.index = RoleTitleIndex(self.labels)
+        self.embed = embed or _embed_texts
+        self.k = k or settings.role_knn_k
+        self.min_similarity = min_similarity if min_similarity is not None else settings.role_knn_min_similarity
+
+        self._matrix: Optional[np.ndarray] = None
+        self._matrix_labels: List[str] = []
+        self._matrix_attempted_at = 0.0
+        self._matrix_lock = threading.Lock()
+
+        self._stats = {tier: 0 for tier in TIERS}
+        self._histogram = [0] * int(round(1 / _BUCKET_WIDTH))
+        self._stats_lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Tiers
+    # ------------------------------------------------------------------
+
+    def classify_local(self, role: str) -> Optional[tuple]:
+        """(label, tier) from the exact or token tier, or None."""
+        label = self.index.lookup_exact(role)
+        if label is not None:
+            return label, "exact"
+        label = self.index.lookup_tokens(role)
+        if label is not None:
+            return label, "token"
+        return None
+
+    def _label_matrix(self) -> Optional[np.ndarray]:
+        """Normalized embeddings of the labeled titles (built on first use)."""
+        if self._matrix is not None:
+            return self._matrix
+        with self._matrix_lock:
+            if self._matrix is not None:
+                return self._matrix
+            if time.time() - self._matrix_attempted_at < _LABEL_EMBEDDING_RETRY_SECONDS:
+                return None
+            self._matrix_attempted_at = time.time()
+
+            titles = list(self.labels)
+            vectors = np.asarray(self.embed(titles), dtype=np.float32)
+            norms = np.linalg.norm(vectors, axis=1)
+            usable = norms > 0  # Zero vectors are embedding failures
+            if not usable.any():
+                logger.warning("Role classifier: labeled titles could not be embedded, embedding tier disabled for now")
+                return None
+
+            self._matrix = vectors[usable] / norms[usable][:, None]
+            self._matrix_labels = [self.labels[title] for title, ok in zip(titles, usable) if ok]
+            logger.info(f"Role classifier: embedded {len(self._matrix_labels)}/{len(titles)} labeled titles")
+            return self._matrix
+
+    def nearest_labels(self, roles: List[str]) -> List[Optional[str]]:
+        """
+        Embedding-tier labels (blocking: embeds the roles).
+
+        Returns:
+            One label per role, None where no neighbour reaches min_similarity
+        """
+        matrix = self._label_matrix()
+        if matrix is None or not roles:
+            return [None] * len(roles)
+
+        vectors = np.asarray(self.embed(roles), dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        similarities = (vectors / np.where(norms == 0, 1.0, norms)) @ matrix.T
+        k = min(self.k, matrix.shape[0])
+
+        results = []
+        for row in similarities:
+            top = np.argpartition(-row, k - 1)[:k]
+            self._record_similarity(float(row[top].max()))
+
+            votes = defaultdict(float)
+            for i in top:
+                if row[i] >= self.min_similarity:
+                    votes[self._matrix_labels[i]] += float(row[i])
+            results.append(max(votes, key=votes.get) if votes else None)
+        return results
+
+    async def classify(
+        self,
+        roles: List[str],
+        llm_fallback: Callable[[List[str]], Awaitable[List[str]]],
+    ) -> List[str]:
+        """
+        Categorize roles, cheapest tier first.
+
+        Args:
+            roles: Non-empty job titles
+            llm_fallback: Batched classifier for the roles no other tier labeled;
+                returns one label per role (same order)
+
+        Returns:
+            One label per role (same order)
+        """
+        labels: List[Optional[str]] = [None] * len(roles)
+        counts = {tier: 0 for tier in TIERS}
+
+        pending = []
+        for i, role in enumerate(roles):
+            local = self.classify_local(role)
+            if local is None:
+                pending.append(i)
+            else:
+                labels[i] = local[0]
+                counts[local[1]] += 1
+
+        if pending:
+            try:
+                nearest = await asyncio.to_thread(self.nearest_labels, [roles[i] for i in pending])
+            except Exception as e:
+                logger.warning(f"Role classifier embedding tier failed: {e}")
+                nearest = [None] * len(pending)
+            for i, label in zip(pending, nearest):
+                if label is not None:
+                    labels[i] = label
+                    counts["embedding"] += 1
+            pending = [i for i in pending if labels[i] is None]
+
+        if pending:
+            fallback = await llm_fallback([roles[i] for i in pending])
+            for i, label in zip(pending, fallback):
+                labels[i] = label
+            counts["llm"] += len(pending)
+
+        with self._stats_lock:
+            for tier, count in counts.items():
+                self._stats[tier] += count
+        logger.debug(f"Role classification tiers: {counts}")
+        return labels
+
+    # ------------------------------------------------------------------
+    # Stats
+    # ------------------------------------------------------------------
+
+    def _record_similarity(self, similarity: float) -> None:
+        bucket = min(max(int(similarity / _BUCKET_WIDTH), 0), len(self._histogram) - 1)
+        with self._stats_lock:
+            self._histogram[bucket] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hits per tier and best-neighbour similarity distribution for threshold tuning."""
+        total = sum(self._stats.values())
+        histogram = {
+            f"{i * _BUCKET_WIDTH:.2f}-{(i + 1) * _BUCKET_WIDTH:.2f}": count
+            for i, count in enumerate(self._histogram)
+            if count
+        }
+        return {
+            "titles": total,
+            "tiers": dict(self._stats),
+            "llm_rate": round(self._stats["llm"] / total, 4) if total else 0.0,
+            "labeled_titles": len(self.labels),
+            "embedded_titles": len(self._matrix_labels),
+            "knn": {"k": self.k, "min_similarity": self.min_similarity},
+            "similarity_histogram": histogram,
+        }
+
+
+_classifier: Optional[RoleClassifier] = None
+_classifier_lock = threading.Lock()
+
+
+def get_role_classifier() -> RoleClassifier:
+    """Get the process-wide role classifier."""
+    global _classifier
+    if _classifier is None:
+        with _classifier_lock:
+            if _classifier is None:
+                _classifier = RoleClassifier()
+    return _classifier
+
+
+__all__ = [
+    'ROLE_SCORING_CATEGORY',
+    'ROLE_SCORING_OVERRIDES',
+    'RoleClassifier',
+    'TIERS',
+    'get_role_classifier',
+    'scoring_role_labels',
+]
@@ -7,13 +7,11 @@ import os
 from typing import List, Dict, Any
 from qdrant_client import QdrantClient
 from qdrant_client.models import Distance, VectorParams, PointStruct
-from google import genai
 from dotenv import load_dotenv
 
-load_dotenv()
+from core.config.clients import get_gemini_client
 
-# Initialize Gemini client for embeddings
-gemini_client = genai.Client(api_key=os.getenv("GEMINI_API_KEY"))
+load_dotenv()
 
 # Qdrant configuration
 QDRANT_URL = os.getenv("QDRANT_URL", ":memory:")  # Use in-memory if not configured
@@ -68,7 +66,7 @@ class QdrantManager:
     def generate_embedding(self, text: str) -> List[float]:
         """Generate embedding vector for text using Gemini text-embedding-004"""
         try:
-            response = gemini_client.models.embed_content(
+            response = get_gemini_client().models.embed_content(
                 model="text-embedding-004",
                 contents=[text]
             )
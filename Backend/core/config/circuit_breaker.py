@@ -9,23 +9,33 @@ States:
 
 Features:
 - Async-native implementation
-- Per-service circuit breakers
-- Automatic recovery with exponential backoff
-- Metrics tracking for monitoring
+- Failure-RATE tripping over a sliding window (time + count bounded), so a
+  handful of failures under heavy traffic doesn't trip, while a real outage does
+- Lock-free outcome recording on the hot path (single event-loop thread, no awaits
+  inside state transitions; window appends are atomic deque operations)
+- Per-service / per-model circuit breakers (e.g. "gemini:gemini-2.5-flash-lite")
+- Optional state shared across workers through Redis: one worker's trip opens
+  the circuit for all of them (counted once, by the worker that tripped)
+- Trip and recovery timings exported to the metrics collector
 """
 
 import asyncio
 import time
+from collections import deque
 from enum import Enum
-from typing import Callable, TypeVar, Optional, Dict, Any
+from typing import Callable, TypeVar, Optional, Dict, Any, Deque, Tuple
 from functools import wraps
 from dataclasses import dataclass, field
 
 from core.config.logging_config import logger
 from core.config.settings import settings
+from core.monitoring.metrics_collector import get_metrics_collector
 
 T = TypeVar('T')
 
+# Redis key prefix for shared circuit state (value: epoch seconds the circuit opened)
+SHARED_STATE_PREFIX = "cb:open:"
+
 
 class CircuitState(Enum):
     """Circuit breaker states."""
@@ -45,25 +55,43 @@ class CircuitStats:
     last_success_time: Optional[float] = None
     consecutive_failures: int = 0
     consecutive_successes: int = 0
+    trip_count: int = 0
+    last_trip_time: Optional[float] = None
+    last_recovery_time: Optional[float] = None
+    last_open_duration_seconds: Optional[float] = None
 
 
 @dataclass
 class CircuitBreaker:
     """
-    Circuit breaker for a single service.
-    Thread-safe implementation using asyncio locks.
+    Circuit breaker for a single service (or service:model pair).
+
+    Trips when, within the sliding window, at least `failure_threshold` calls
+    failed AND the failure rate is at least `failure_rate_threshold`.
     """
     name: str
     failure_threshold: int = field(default_factory=lambda: settings.circuit_breaker_failure_threshold)
+    failure_rate_threshold: float = field(default_factory=lambda: settings.circuit_breaker_failure_rate_threshold)
+    window_seconds: float = field(default_factory=lambda: settings.circuit_breaker_window_seconds)
+    window_size: int = field(default_factory=lambda: settings.circuit_breaker_window_size)
     recovery_timeout: float = field(default_factory=lambda: settings.circuit_breaker_recovery_timeout)
     half_open_requests: int = field(default_factory=lambda: settings.circuit_breaker_half_open_requests)
+    shared_state: bool = field(default_factory=lambda: settings.circuit_breaker_shared_state)
 
     # Internal state
     _state: CircuitState = field(default=CircuitState.CLOSED, init=False)
     _stats: CircuitStats = field(default_factory=CircuitStats, init=False)
     _last_state_change: float = field(default_factory=time.time, init=False)
     _half_open_successes: int = field(default=0, init=False)
-    _lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False)
+    _half_open_in_flight: int = field(default=0, init=False)
+    # Sliding window of (timestamp, succeeded) outcomes
+    _window: Deque[Tuple[float, bool]] = field(default=None, init=False)
+    # Shared-state sync bookkeeping
+    _last_shared_sync: float = field(default=0.0, init=False)
+    _shared_sync_task: Optional[asyncio.Task] = field(default=None, init=False)
+
+    def __post_init__(self):
+        self._window = deque(maxlen=self.window_size)
 
     @property
     def state(self) -> CircuitState:
@@ -73,6 +101,7 @@ class CircuitBreaker:
     @property
     def stats(self) -> Dict[str, Any]:
         """Get circuit statistics for monitoring."""
+        window_calls, window_failures = self._window_counts(time.time())
         return {
             "name": self.name,
             "state": self._state.value,
@@ -83,77 +112,231 @@ class CircuitBreaker:
             "consecutive_failures": self._stats.consecutive_failures,
             "last_failure_time": self._stats.last_failure_time,
             "last_success_time": self._stats.last_success_time,
+            "window_calls": window_calls,
+            "window_failures": window_failures,
+            "window_failure_rate": round(window_failures / window_calls, 3) if window_calls else 0.0,
+            "trip_count": self._stats.trip_count,
+            "last_trip_time": self._stats.last_trip_time,
+            "last_recovery_time": self._stats.last_recovery_time,
+            "last_open_duration_seconds": self._stats.last_open_duration_seconds,
         }
 
-    async def _should_allow_request(self) -> bool:
-        """Determine if a request should be allowed through."""
-        async with self._lock:
-            if self._state == CircuitState.CLOSED:
-                return True
-
-            if self._state == CircuitState.OPEN:
-                # Check if recovery timeout has elapsed
-                elapsed = time.time() - self._last_state_change
-                if elapsed >= self.recovery_timeout:
-                    self._state = CircuitState.HALF_OPEN
-                    self._half_open_successes = 0
-                    self._last_state_change = time.time()
-                    logger.info(f"Circuit breaker '{self.name}' transitioned to HALF_OPEN")
-                    return True
-                return False
+    # ------------------------------------------------------------------
+    # Sliding window
+    # ------------------------------------------------------------------
+
+    def _window_counts(self, now: float) -> Tuple[int, int]:
+        """Count (calls, failures) in the window, dropping expired outcomes."""
+        cutoff = now - self.window_seconds
+        while self._window and self._window[0][0] < cutoff:
+            self._window.popleft()
+        calls = len(self._window)
+        failures = sum(1 for _, succeeded in self._window if not succeeded)
+        return calls, failures
+
+    # ------------------------------------------------------------------
+    # State transitions (synchronous: no awaits, so atomic on the event loop)
+    # ------------------------------------------------------------------
+
+    def _open(self, opened_at: float) -> None:
+        """Transition to OPEN (no bookkeeping)."""
+        self._state = CircuitState.OPEN
+        self._last_state_change = opened_at
+        self._half_open_successes = 0
+        self._half_open_in_flight = 0
+        self._stats.last_trip_time = opened_at
 
-            if self._state == CircuitState.HALF_OPEN:
-                # Allow limited requests in half-open state
-                return True
+    def _trip(self, reason: str) -> None:
+        """Transition to OPEN, record the trip and publish it to the other workers."""
+        self._open(time.time())
+        self._stats.trip_count += 1
+        logger.warning(f"Circuit breaker '{self.name}' OPENED: {reason}")
 
-            return False
+        if settings.enable_metrics:
+            get_metrics_collector().record_error(f"circuit_breaker:{self.name}", "tripped")
 
-    async def _record_success(self) -> None:
+        if self.shared_state:
+            self._schedule(self._publish_open(self._last_state_change))
+
+    def _adopt_open(self, opened_at: float) -> None:
+        """
+        Transition to OPEN because another worker tripped. The trip is that
+        worker's: it is not counted, reported or published again here.
+        """
+        self._open(opened_at)
+        logger.info(f"Circuit breaker '{self.name}' OPENED by another worker")
+
+    def _close(self) -> None:
+        """Transition to CLOSED after a successful recovery and record its timing."""
+        now = time.time()
+        opened_at = self._stats.last_trip_time or self._last_state_change
+        self._state = CircuitState.CLOSED
+        self._last_state_change = now
+        self._window.clear()
+        self._stats.last_recovery_time = now
+        self._stats.last_open_duration_seconds = round(now - opened_at, 3)
+        logger.info(
+            f"Circuit breaker '{self.name}' CLOSED after successful recovery "
+            f"({self._stats.last_open_duration_seconds}s open)"
+        )
+
+        if settings.enable_metrics:
+            get_metrics_collector().record_performance(
+                "circuit_breaker_recovery",
+                (now - opened_at) * 1000,
+                {"breaker": self.name, "trip_count": self._stats.trip_count}
+            )
+
+        if self.shared_state:
+            self._schedule(self._publish_closed())
+
+    def _should_allow_request(self) -> bool:
+        """Determine if a request should be allowed through."""
+        if self.shared_state:
+            self._maybe_sync_shared_state()
+
+        if self._state == CircuitState.CLOSED:
+            return True
+
+        if self._state == CircuitState.OPEN:
+            # Check if recovery timeout has elapsed
+            elapsed = time.time() - self._last_state_change
+            if elapsed < self.recovery_timeout:
+                return False
+            self._state = CircuitState.HALF_OPEN
+            self._half_open_successes = 0
+            self._half_open_in_flight = 0
+            self._last_state_change = time.time()
+            logger.info(f"Circuit breaker '{self.name}' transitioned to HALF_OPEN")
+
+        # HALF_OPEN: allow a limited number of concurrent probe requests
+        if self._half_open_in_flight < self.half_open_requests:
+            self._half_open_in_flight += 1
+            return True
+        return False
+
+    def _record_success(self, probe: bool) -> None:
         """Record a successful call."""
-        async with self._lock:
-            self._stats.total_calls += 1
-            self._stats.successful_calls += 1
-            self._stats.consecutive_successes += 1
-            self._stats.consecutive_failures = 0
-            self._stats.last_success_time = time.time()
-
-            if self._state == CircuitState.HALF_OPEN:
-                self._half_open_successes += 1
-                if self._half_open_successes >= self.half_open_requests:
-                    self._state = CircuitState.CLOSED
-                    self._last_state_change = time.time()
-                    logger.info(f"Circuit breaker '{self.name}' CLOSED after successful recovery")
-
-    async def _record_failure(self, error: Exception) -> None:
-        """Record a failed call."""
-        async with self._lock:
-            self._stats.total_calls += 1
-            self._stats.failed_calls += 1
-            self._stats.consecutive_failures += 1
-            self._stats.consecutive_successes = 0
-            self._stats.last_failure_time = time.time()
-
-            if self._state == CircuitState.HALF_OPEN:
-                # Immediately open circuit on failure in half-open state
-                self._state = CircuitState.OPEN
-                self._last_state_change = time.time()
-                logger.warning(
-                    f"Circuit breaker '{self.name}' OPENED after half-open failure: {error}"
+        now = time.time()
+        self._window.append((now, True))
+        self._stats.total_calls += 1
+        self._stats.successful_calls += 1
+        self._stats.consecutive_successes += 1
+        self._stats.consecutive_failures = 0
+        self._stats.last_success_time = now
+
+        if probe and self._state == CircuitState.HALF_OPEN:
+            self._half_open_in_flight = max(self._half_open_in_flight - 1, 0)
+            self._half_open_successes += 1
+            if self._half_open_successes >= self.half_open_requests:
+                self._close()
+
+    def _record_failure(self, error: Exception, probe: bool) -> None:
+        """Record a failed call and trip if the window failure rate is exceeded."""
+        now = time.time()
+        self._window.append((now, False))
+        self._stats.total_calls += 1
+        self._stats.failed_calls += 1
+        self._stats.consecutive_failures += 1
+        self._stats.consecutive_successes = 0
+        self._stats.last_failure_time = now
+
+        if self._state == CircuitState.HALF_OPEN:
+            if probe:
+                # Immediately re-open circuit on failure in half-open state
+                self._trip(f"half-open probe failed: {error}")
+            return
+
+        if self._state == CircuitState.CLOSED:
+            calls, failures = self._window_counts(now)
+            failure_rate = failures / calls if calls else 0.0
+            if failures >= self.failure_threshold and failure_rate >= self.failure_rate_threshold:
+                self._trip(
+                    f"{failures}/{calls} calls failed ({failure_rate:.0%}) in the last "
+                    f"{self.window_seconds:.0f}s: {error}"
                 )
-            elif self._state == CircuitState.CLOSED:
-                if self._stats.consecutive_failures >= self.failure_threshold:
-                    self._state = CircuitState.OPEN
-                    self._last_state_change = time.time()
-                    logger.warning(
-                        f"Circuit breaker '{self.name}' OPENED after {self.failure_threshold} "
-                        f"consecutive failures: {error}"
-                    )
 
-    async def _record_rejection(self) -> None:
+    def _record_rejection(self) -> None:
         """Record a rejected call (circuit open)."""
-        async with self._lock:
-            self._stats.total_calls += 1
-            self._stats.rejected_calls += 1
+        self._stats.total_calls += 1
+        self._stats.rejected_calls += 1
+
+    # ------------------------------------------------------------------
+    # Shared state (Redis)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _schedule(coro) -> Optional[asyncio.Task]:
+        """Run a background coroutine if there is a running loop (fire-and-forget)."""
+        try:
+            return asyncio.get_running_loop().create_task(coro)
+        except RuntimeError:
+            coro.close()
+            return None
+
+    def _maybe_sync_shared_state(self) -> None:
+        """Refresh shared state in the background at most once per sync interval."""
+        now = time.time()
+        if now - self._last_shared_sync < settings.circuit_breaker_sync_interval:
+            return
+        if self._shared_sync_task is not None and not self._shared_sync_task.done():
+            return
+        self._last_shared_sync = now
+        self._shared_sync_task = self._schedule(self._sync_shared_state())
+
+    async def _sync_shared_state(self) -> None:
+        """
+        Adopt an OPEN state published by another worker.
+        NON-BLOCKING: Redis errors leave local state untouched.
+        """
+        try:
+            from core.config.clients import get_redis_client
+
+            def _read():
+                client = get_redis_client()
+                return client.get(f"{SHARED_STATE_PREFIX}{self.name}") if client else None
+
+            opened_at = await asyncio.to_thread(_read)
+            if opened_at and self._state == CircuitState.CLOSED:
+                self._adopt_open(float(opened_at))
+        except Exception as e:
+            logger.debug(f"Circuit breaker '{self.name}' shared state sync failed: {e}")
+
+    async def _publish_open(self, opened_at: float) -> None:
+        """Publish OPEN state so other workers fail fast too (expires with recovery timeout)."""
+        try:
+            from core.config.clients import get_redis_client
+
+            def _write():
+                client = get_redis_client()
+                if client:
+                    client.set(
+                        f"{SHARED_STATE_PREFIX}{self.name}",
+                        str(opened_at),
+                        px=int(self.recovery_timeout * 1000)
+                    )
+
+            await asyncio.to_thread(_write)
+        except Exception as e:
+            logger.debug(f"Circuit breaker '{self.name}' shared state publish failed: {e}")
+
+    async def _publish_closed(self) -> None:
+        """Clear shared OPEN state after recovery."""
+        try:
+            from core.config.clients import get_redis_client
+
+            def _delete():
+                client = get_redis_client()
+                if client:
+                    client.delete(f"{SHARED_STATE_PREFIX}{self.name}")
+
+            await asyncio.to_thread(_delete)
+        except Exception as e:
+            logger.debug(f"Circuit breaker '{self.name}' shared state clear failed: {e}")
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
 
     async def call(self, func: Callable[..., T], *args, **kwargs) -> T:
         """
@@ -174,27 +357,35 @@ class CircuitBreaker:
             # Circuit breaker disabled, pass through
             return await func(*args, **kwargs)
 
-        if not await self._should_allow_request():
-            await self._record_rejection()
+        if not self._should_allow_request():
+            self._record_rejection()
             raise CircuitBreakerOpenError(
                 f"Circuit breaker '{self.name}' is OPEN. "
                 f"Service unavailable, try again in {self.recovery_timeout}s"
             )
 
+        probe = self._state == CircuitState.HALF_OPEN
         try:
             result = await func(*args, **kwargs)
-            await self._record_success()
-            return result
+        except asyncio.CancelledError:
+            # Cancellation says nothing about service health; free the probe slot
+            if probe:
+                self._half_open_in_flight = max(self._half_open_in_flight - 1, 0)
+            raise
         except Exception as e:
-            await self._record_failure(e)
+            self._record_failure(e, probe)
             raise
+        self._record_success(probe)
+        return result
 
     def reset(self) -> None:
         """Manually reset the circuit breaker to closed state."""
         self._state = CircuitState.CLOSED
         self._stats = CircuitStats()
+        self._window.clear()
         self._last_state_change = time.time()
         self._half_open_successes = 0
+        self._half_open_in_flight = 0
         logger.info(f"Circuit breaker '{self.name}' manually reset to CLOSED")
 
 
@@ -205,30 +396,30 @@ class CircuitBreakerOpenError(Exception):
 
 # Global circuit breaker registry
 _circuit_breakers: Dict[str, CircuitBreaker] = {}
-_registry_lock = asyncio.Lock()
 
 
 async def get_circuit_breaker(name: str) -> CircuitBreaker:
     """
     Get or create a circuit breaker for a service.
 
+    Creation has no awaits, so it is atomic on the event loop without a lock.
+
     Args:
-        name: Service name (e.g., "gemini", "openai", "redis")
+        name: Service name, optionally per model (e.g., "gemini:gemini-2.5-flash-lite", "openai", "redis")
 
     Returns:
         CircuitBreaker instance for the service
     """
-    if name not in _circuit_breakers:
-        async with _registry_lock:
-            if name not in _circuit_breakers:
-                _circuit_breakers[name] = CircuitBreaker(name=name)
-                logger.debug(f"Created circuit breaker for service: {name}")
-    return _circuit_breakers[name]
+    breaker = _circuit_breakers.get(name)
+    if breaker is None:
+        breaker = _circuit_breakers.setdefault(name, CircuitBreaker(name=name))
+        logger.debug(f"Created circuit breaker for service: {name}")
+    return breaker
 
 
 def get_all_circuit_breaker_stats() -> Dict[str, Dict[str, Any]]:
     """Get statistics for all circuit breakers."""
-    return {name: cb.stats for name, cb in _circuit_breakers.items()}
+    return {name: cb.stats for name, cb in list(_circuit_breakers.items())}
 
 
 def circuit_breaker(service_name: str):
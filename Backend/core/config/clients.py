@@ -1,16 +1,24 @@
 """
 Centralized API client factory with singleton pattern.
 Provides thread-safe, connection-pooled clients for all external services.
+
+Every provider client (Gemini sync/async, OpenAI sync/async) and every plain
+HTTP consumer is built on the SAME two httpx pools (one sync, one async), sized
+from settings. httpx pools per origin, so sharing one pool lets TLS sessions and
+keep-alive sockets be reused across every subsystem instead of each module
+opening its own.
 """
 
 import threading
-from typing import Optional
+from typing import Optional, Dict, Any
 import httpx
 from google import genai
+from google.genai import types as genai_types
 from openai import OpenAI, AsyncOpenAI
 
 from core.config.logging_config import logger
 from core.config.settings import settings
+from core.config.provider_stub import get_provider_stub, wrap_transport, wrap_async_transport
 
 # Try to import Redis, fall back gracefully if not available
 try:
@@ -44,10 +52,20 @@ class ClientFactory:
         "async_http": False
     }
 
+    @staticmethod
+    def _pool_limits() -> httpx.Limits:
+        """Connection pool limits shared by every pooled client."""
+        return httpx.Limits(
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_max_keepalive_connections,
+            keepalive_expiry=settings.http_keepalive_expiry
+        )
+
     @classmethod
     def get_gemini(cls) -> genai.Client:
         """
-        Get Gemini API client (thread-safe singleton).
+        Get Gemini API client on the shared HTTP pools (thread-safe singleton).
+        Serves both `client.models` (sync pool) and `client.aio.models` (async pool).
 
         Returns:
             Configured Gemini client instance
@@ -55,15 +73,22 @@ class ClientFactory:
         if not cls._initialized["gemini"]:
             with cls._lock:
                 if not cls._initialized["gemini"]:
-                    cls._gemini_client = genai.Client(api_key=settings.gemini_api_key)
+                    cls._gemini_client = genai.Client(
+                        api_key=settings.gemini_api_key,
+                        http_options=genai_types.HttpOptions(
+                            timeout=int(settings.llm_timeout * 1000),  # milliseconds
+                            httpx_client=cls.get_http_client(),
+                            httpx_async_client=cls.get_async_http_client()
+                        )
+                    )
                     cls._initialized["gemini"] = True
-                    logger.info("Gemini client initialized")
+                    logger.info("Gemini client initialized on shared HTTP pools")
         return cls._gemini_client
 
     @classmethod
     def get_openai(cls) -> OpenAI:
         """
-        Get OpenAI API client with HTTP/2 connection pooling (thread-safe singleton).
+        Get OpenAI API client on the shared sync HTTP pool (thread-safe singleton).
 
         Returns:
             Configured OpenAI client instance
@@ -71,27 +96,19 @@ class ClientFactory:
         if not cls._initialized["openai"]:
             with cls._lock:
                 if not cls._initialized["openai"]:
-                    # Create HTTP/2 client with connection pooling
-                    http_client = httpx.Client(
-                        http2=True,
-                        timeout=settings.llm_timeout,
-                        limits=httpx.Limits(
-                            max_keepalive_connections=10,
-                            keepalive_expiry=30.0
-                        )
-                    )
                     cls._openai_client = OpenAI(
                         api_key=settings.openai_api_key,
-                        http_client=http_client
+                        timeout=settings.llm_timeout,
+                        http_client=cls.get_http_client()
                     )
                     cls._initialized["openai"] = True
-                    logger.info("OpenAI client initialized with HTTP/2 pooling")
+                    logger.info("OpenAI client initialized on shared HTTP pool")
         return cls._openai_client
 
     @classmethod
     def get_async_openai(cls) -> AsyncOpenAI:
         """
-        Get async OpenAI API client with HTTP/2 connection pooling (thread-safe singleton).
+        Get async OpenAI API client on the shared async HTTP pool (thread-safe singleton).
         For use in async contexts to avoid blocking the event loop.
 
         Returns:
@@ -100,21 +117,13 @@ class ClientFactory:
         if not cls._initialized["async_openai"]:
             with cls._lock:
                 if not cls._initialized["async_openai"]:
-                    # Create async HTTP/2 client with connection pooling
-                    http_client = httpx.AsyncClient(
-                        http2=True,
-                        timeout=settings.llm_timeout,
-                        limits=httpx.Limits(
-                            max_keepalive_connections=10,
-                            keepalive_expiry=30.0
-                        )
-                    )
                     cls._async_openai_client = AsyncOpenAI(
                         api_key=settings.openai_api_key,
-                        http_client=http_client
+                        timeout=settings.llm_timeout,
+                        http_client=cls.get_async_http_client()
                     )
                     cls._initialized["async_openai"] = True
-                    logger.info("Async OpenAI client initialized with HTTP/2 pooling")
+                    logger.info("Async OpenAI client initialized on shared HTTP pool")
         return cls._async_openai_client
 
     @classmethod
@@ -150,7 +159,8 @@ class ClientFactory:
     @classmethod
     def get_http_client(cls) -> httpx.Client:
         """
-        Get synchronous HTTP client with connection pooling (thread-safe singleton).
+        Get the shared synchronous HTTP pool (thread-safe singleton).
+        Also backs the sync Gemini and OpenAI clients.
 
         Returns:
             Configured httpx.Client instance
@@ -158,13 +168,18 @@ class ClientFactory:
         if not cls._initialized["http"]:
             with cls._lock:
                 if not cls._initialized["http"]:
+                    extra = {}
+                    if get_provider_stub():
+                        # Record/replay stand-in for provider hosts (offline perf testing)
+                        extra["transport"] = wrap_transport(httpx.HTTPTransport(
+                            http2=settings.http2_enabled,
+                            limits=cls._pool_limits()
+                        ))
                     cls._http_client = httpx.Client(
-                        http2=True,
+                        http2=settings.http2_enabled,
                         timeout=settings.http_timeout,
-                        limits=httpx.Limits(
-                            max_keepalive_connections=20,
-                            keepalive_expiry=30.0
-                        )
+                        limits=cls._pool_limits(),
+                        **extra
                     )
                     cls._initialized["http"] = True
                     logger.debug("HTTP client initialized with connection pooling")
@@ -173,7 +188,8 @@ class ClientFactory:
     @classmethod
     def get_async_http_client(cls) -> httpx.AsyncClient:
         """
-        Get asynchronous HTTP client with connection pooling (thread-safe singleton).
+        Get the shared asynchronous HTTP pool (thread-safe singleton).
+        Also backs the async Gemini (client.aio) and AsyncOpenAI clients.
 
         Returns:
             Configured httpx.AsyncClient instance
@@ -181,18 +197,71 @@ class ClientFactory:
         if not cls._initialized["async_http"]:
             with cls._lock:
                 if not cls._initialized["async_http"]:
+                    extra = {}
+                    if get_provider_stub():
+                        extra["transport"] = wrap_async_transport(httpx.AsyncHTTPTransport(
+                            http2=settings.http2_enabled,
+                            limits=cls._pool_limits()
+                        ))
                     cls._async_http_client = httpx.AsyncClient(
-                        http2=True,
+                        http2=settings.http2_enabled,
                         timeout=settings.http_timeout,
-                        limits=httpx.Limits(
-                            max_keepalive_connections=20,
-                            keepalive_expiry=30.0
-                        )
+                        limits=cls._pool_limits(),
+                        **extra
                     )
                     cls._initialized["async_http"] = True
                     logger.debug("Async HTTP client initialized with connection pooling")
         return cls._async_http_client
 
+    @staticmethod
+    def _pool_stats(client) -> Optional[Dict[str, Any]]:
+        """
+        Snapshot a shared pool's utilization from httpcore's connection pool.
+        httpx has no public pool API, so every attribute is read defensively.
+        """
+        if client is None:
+            return None
+
+        pool = getattr(getattr(client, "_transport", None), "_pool", None)
+        connections = list(getattr(pool, "connections", None) or [])
+        requests = list(getattr(pool, "_requests", None) or [])
+
+        idle = sum(1 for conn in connections if conn.is_idle())
+        http2 = sum(
+            1 for conn in connections
+            if type(getattr(conn, "_connection", None)).__name__ == "HTTP2Connection"
+        )
+        queued = sum(1 for req in requests if getattr(req, "is_queued", lambda: False)())
+        max_connections = settings.http_max_connections
+
+        return {
+            "connections": len(connections),
+            "active": len(connections) - idle,
+            "idle": idle,
+            "http2_connections": http2,
+            "in_flight_requests": len(requests) - queued,
+            "queued_requests": queued,
+            "max_connections": max_connections,
+            "utilization": round((len(connections) - idle) / max_connections, 3) if max_connections else 0.0,
+        }
+
+    @classmethod
+    def get_pool_stats(cls) -> Dict[str, Any]:
+        """
+        Get utilization of the shared HTTP pools and which clients are built on them.
+
+        Returns:
+            Dictionary with per-pool connection/request counts and initialized clients
+        """
+        stub = get_provider_stub()
+        return {
+            "sync_pool": cls._pool_stats(cls._http_client),
+            "async_pool": cls._pool_stats(cls._async_http_client),
+            "http2_enabled": settings.http2_enabled,
+            "clients_initialized": [name for name, ready in cls._initialized.items() if ready],
+            "provider_stub": {"mode": stub.mode, **stub.stats} if stub else None,
+        }
+
     @classmethod
     def health_check(cls) -> dict:
         """
@@ -238,6 +307,11 @@ class ClientFactory:
     def close_all(cls):
         """Close all client connections gracefully."""
         with cls._lock:
+            # Provider clients are built on the shared pools; drop them with the pools
+            for name in ("gemini", "openai", "async_openai"):
+                setattr(cls, f"_{name}_client", None)
+                cls._initialized[name] = False
+
             if cls._http_client:
                 cls._http_client.close()
                 cls._http_client = None
@@ -277,10 +351,22 @@ def get_redis_client() -> Optional["redis.Redis"]:
     return ClientFactory.get_redis()
 
 
+def get_http_client() -> httpx.Client:
+    """Get the shared synchronous HTTP pool."""
+    return ClientFactory.get_http_client()
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """Get the shared asynchronous HTTP pool."""
+    return ClientFactory.get_async_http_client()
+
+
 __all__ = [
     'ClientFactory',
     'get_gemini_client',
     'get_openai_client',
     'get_async_openai_client',
-    'get_redis_client'
+    'get_redis_client',
+    'get_http_client',
+    'get_async_http_client'
 ]
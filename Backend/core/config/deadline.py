@@ -0,0 +1,164 @@
+"""
+Request-Scoped Deadlines.
+
+A request gets one time budget, set by HTTP middleware from a per-endpoint
+default (settings.endpoint_budgets) or the client's X-Request-Timeout-Ms header,
+whichever is shorter. Every downstream stage reads the same deadline:
+
+- LLM semaphore waits and provider calls are bounded by the remaining budget
+  (queued work is cancelled instead of running after the client gave up)
+- Retries stop when the remaining budget can't cover another attempt
+- Embedding batches return what finished in time
+
+The deadline lives in a ContextVar, so it follows the request through awaits
+and asyncio.to_thread without threading it through call signatures. Code
+running outside a request (no deadline set) behaves exactly as before.
+"""
+
+import asyncio
+import time
+from contextvars import ContextVar, Token
+from typing import Awaitable, Optional, TypeVar
+
+from core.config.settings import settings
+
+T = TypeVar('T')
+
+# Header clients use to send their own budget (milliseconds)
+DEADLINE_HEADER = "X-Request-Timeout-Ms"
+
+# Absolute deadline (time.monotonic() seconds) of the request being served
+request_deadline: ContextVar[Optional[float]] = ContextVar("request_deadline", default=None)
+
+
+class DeadlineExceededError(Exception):
+    """Raised when the request's time budget is spent before a stage can run."""
+    pass
+
+
+def get_endpoint_budget(path: str, header_value: Optional[str] = None) -> Optional[float]:
+    """
+    Resolve the time budget (seconds) for a request.
+
+    Args:
+        path: Request path (looked up in settings.endpoint_budgets)
+        header_value: Raw X-Request-Timeout-Ms header value, if sent
+
+    Returns:
+        Budget in seconds, or None if the request has no deadline
+    """
+    budget = settings.endpoint_budgets.get(path)
+
+    if header_value:
+        try:
+            client_budget = float(header_value) / 1000
+        except ValueError:
+            client_budget = None
+        if client_budget and client_budget > 0:
+            # Clients may shorten the budget, never extend it past the endpoint's
+            budget = min(budget, client_budget) if budget else client_budget
+
+    return budget
+
+
+def set_deadline(budget_seconds: Optional[float]) -> Token:
+    """Start the deadline clock for the current context (None clears it)."""
+    deadline = time.monotonic() + budget_seconds if budget_seconds else None
+    return request_deadline.set(deadline)
+
+
+def reset_deadline(token: Token) -> None:
+    """Restore the previous deadline (used by middleware after the response)."""
+    request_deadline.reset(token)
+
+
+def remaining_budget() -> Optional[float]:
+    """Seconds left before the deadline (may be negative), or None without a deadline."""
+    deadline = request_deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def deadline_exceeded() -> bool:
+    """True if the current request's deadline has passed."""
+    remaining = remaining_budget()
+    return remaining is not None and remaining <= 0
+
+
+def can_afford(seconds: float) -> bool:
+    """True if the remaining budget covers `seconds` more work (always True without a deadline)."""
+    remaining = remaining_budget()
+    return remaining is None or remaining >= seconds
+
+
+def bounded_timeout(timeout: Optional[float]) -> Optional[float]:
+    """
+    Clamp a stage timeout to the remaining request budget.
+
+    Args:
+        timeout: The stage's own timeout (None = unbounded)
+
+    Returns:
+        min(timeout, remaining budget), never negative; None if both are unbounded
+    """
+    remaining = remaining_budget()
+    if remaining is None:
+        return timeout
+    remaining = max(remaining, 0.0)
+    return remaining if timeout is None else min(timeout, remaining)
+
+
+def check_deadline(stage: str) -> None:
+    """
+    Fail fast if the request's budget is already spent.
+
+    Raises:
+        DeadlineExceededError: If the deadline has passed
+    """
+    if deadline_exceeded():
+        raise DeadlineExceededError(f"Request deadline exceeded before {stage}")
+
+
+async def run_within_deadline(awaitable: Awaitable[T], stage: str) -> T:
+    """
+    Await `awaitable`, cancelling it if the request deadline passes first.
+
+    Args:
+        awaitable: Coroutine/future to run
+        stage: Stage name for the error message
+
+    Returns:
+        The awaitable's result
+
+    Raises:
+        DeadlineExceededError: If the deadline passes (the awaitable is cancelled)
+    """
+    remaining = remaining_budget()
+    if remaining is None:
+        return await awaitable
+    if remaining <= 0:
+        if asyncio.iscoroutine(awaitable):
+            awaitable.close()
+        raise DeadlineExceededError(f"Request deadline exceeded before {stage}")
+
+    try:
+        return await asyncio.wait_for(awaitable, timeout=remaining)
+    except asyncio.TimeoutError:
+        raise DeadlineExceededError(f"Request deadline exceeded during {stage}")
+
+
+__all__ = [
+    'DEADLINE_HEADER',
+    'DeadlineExceededError',
+    'request_deadline',
+    'get_endpoint_budget',
+    'set_deadline',
+    'reset_deadline',
+    'remaining_budget',
+    'deadline_exceeded',
+    'can_afford',
+    'bounded_timeout',
+    'check_deadline',
+    'run_within_deadline',
+]
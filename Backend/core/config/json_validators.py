@@ -5,7 +5,7 @@ Provides validation for all AI-generated JSON responses with retry support.
 
 import json
 from typing import Optional, List, Dict, Any, Type, TypeVar
-from pydantic import BaseModel, Field, ValidationError
+from pydantic import BaseModel, Field, ValidationError, field_validator
 
 
 # =============================================================================
@@ -119,6 +119,35 @@ class SkillGapAnalysisSchema(BaseModel):
     message: str
 
 
+# --- Batched Classification Schemas ---
+class IndustryLabel(BaseModel):
+    """Industries extracted for one input item (id echoes the request)."""
+    id: int
+    industries: List[str] = Field(default_factory=list)
+
+    @field_validator("industries")
+    @classmethod
+    def keep_top_three(cls, v: List[str]) -> List[str]:
+        # One over-long item must not fail the whole batch
+        return v[:3]
+
+
+class IndustryBatchResponse(BaseModel):
+    """Schema for batched industry extraction."""
+    results: List[IndustryLabel]
+
+
+class RoleLabel(BaseModel):
+    """Category assigned to one input role (id echoes the request)."""
+    id: int
+    category: str
+
+
+class RoleBatchResponse(BaseModel):
+    """Schema for batched role categorization."""
+    results: List[RoleLabel]
+
+
 # --- Domain Finder Schema ---
 class DomainMatchSchema(BaseModel):
     """Single domain match."""
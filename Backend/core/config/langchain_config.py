@@ -15,6 +15,9 @@ from langchain_openai import ChatOpenAI
 from qdrant_client import QdrantClient
 from dotenv import load_dotenv
 
+from core.monitoring.token_usage import TokenUsageCallbackHandler
+from core.config.clients import get_http_client, get_async_http_client
+
 # Load environment variables
 load_dotenv()
 
@@ -57,13 +60,18 @@ class LangChainConfig:
         self._init_langsmith()
 
     def _init_llms(self):
-        """Initialize Language Models."""
+        """
+        Initialize Language Models.
+        Each LLM carries a TokenUsageCallbackHandler so every chain run records
+        provider-reported token usage with the metrics collector.
+        """
         # Primary LLM: Google Gemini (for most operations)
         self.llm_fast = ChatGoogleGenerativeAI(
             model="gemini-2.5-flash-lite",
             temperature=0.1,
             google_api_key=self.gemini_api_key,
             convert_system_message_to_human=True,  # Gemini compatibility
+            callbacks=[TokenUsageCallbackHandler("fast", "gemini", "gemini-2.5-flash-lite")],
         )
 
         # Quality LLM: Gemini 2.5 Flash Lite (for quality evaluation - cost optimized)
@@ -72,6 +80,7 @@ class LangChainConfig:
             temperature=0.1,
             google_api_key=self.gemini_api_key,
             convert_system_message_to_human=True,
+            callbacks=[TokenUsageCallbackHandler("quality", "gemini", "gemini-2.5-flash-lite")],
         )
 
         # Creative LLM: For resume rewriting (slightly higher temperature)
@@ -80,14 +89,20 @@ class LangChainConfig:
             temperature=0.3,
             google_api_key=self.gemini_api_key,
             convert_system_message_to_human=True,
+            callbacks=[TokenUsageCallbackHandler("creative", "gemini", "gemini-2.5-flash-lite")],
         )
 
         # Fallback LLM: OpenAI GPT-4o-mini (optional, for comparison or fallback)
         if self.openai_api_key:
+            # Shared keep-alive pools from the client registry
+            # (Gemini chat models above use gRPC and keep their own channel)
             self.llm_openai = ChatOpenAI(
                 model="gpt-4o-mini",
                 temperature=0.1,
                 openai_api_key=self.openai_api_key,
+                http_client=get_http_client(),
+                http_async_client=get_async_http_client(),
+                callbacks=[TokenUsageCallbackHandler("openai", "openai", "gpt-4o-mini")],
             )
         else:
             self.llm_openai = None
@@ -5,9 +5,13 @@ Uses tenacity for exponential backoff retry on transient failures.
 Includes both sync and true async implementations for scalability.
 Implements semaphore-based backpressure to prevent overwhelming LLM APIs.
 Circuit breaker pattern for resilience against external service failures.
+Async paths honour the request deadline (core.config.deadline): queue waits,
+attempts and retries are bounded by the remaining request budget.
+Async paths accept a RoutingDecision (core.config.model_routing) that sets the
+models, output-token cap and provider order from the input's complexity.
 """
 
-from typing import Optional, Dict, Any, Tuple, Type
+from typing import Optional, Dict, Any, Tuple, Type, AsyncIterator
 from tenacity import (
     retry,
     stop_after_attempt,
@@ -19,17 +23,29 @@ from tenacity import (
 import httpx
 import asyncio
 import threading
+import time
 from pydantic import BaseModel
 
 from core.config.logging_config import logger
 from core.config.settings import settings
 from core.config.clients import get_gemini_client, get_openai_client, get_async_openai_client
 from core.config.circuit_breaker import get_circuit_breaker, CircuitBreakerOpenError
+from core.config.deadline import (
+    DeadlineExceededError,
+    bounded_timeout,
+    can_afford,
+    check_deadline,
+    deadline_exceeded,
+    run_within_deadline,
+)
+from core.monitoring.token_usage import TokenUsage, record_token_usage
 from core.config.json_validators import (
     JSONValidationError,
     validate_json_response,
     clean_json_response,
 )
+from core.config.streaming_json import IncrementalJSONParser, JSONPath
+from core.config.model_routing import RoutingDecision, record_invalid_output, record_route_call
 
 
 # Define transient exceptions that should trigger retry
@@ -82,12 +98,56 @@ class LLMBackpressureError(Exception):
     pass
 
 
+async def _acquire_llm_slot(semaphore: asyncio.Semaphore) -> None:
+    """
+    Wait for an LLM semaphore permit, bounded by llm_queue_timeout and the
+    remaining request budget (whichever is shorter).
+
+    Raises:
+        DeadlineExceededError: If the request deadline passes while queued
+        LLMBackpressureError: If the queue timeout passes while queued
+    """
+    try:
+        await asyncio.wait_for(
+            semaphore.acquire(),
+            timeout=bounded_timeout(settings.llm_queue_timeout)
+        )
+    except asyncio.TimeoutError:
+        if deadline_exceeded():
+            raise DeadlineExceededError("Request deadline exceeded while queued for an LLM slot")
+        logger.error(
+            f"LLM backpressure timeout: queue full for {settings.llm_queue_timeout}s "
+            f"(max concurrent: {settings.max_concurrent_llm_calls})"
+        )
+        raise LLMBackpressureError(
+            f"LLM API queue is full. Please try again later. "
+            f"(timeout: {settings.llm_queue_timeout}s)"
+        )
+
+
+_PROVIDER_LABELS = {"gemini": "Gemini", "openai": "OpenAI"}
+
+
+def _resolve_models(
+    model_gemini: Optional[str],
+    model_openai: Optional[str],
+    routing: Optional[RoutingDecision]
+) -> Dict[str, str]:
+    """Models per provider: routing decision first, then explicit args, then settings."""
+    if routing:
+        return {"gemini": routing.model_gemini, "openai": routing.model_openai}
+    return {
+        "gemini": model_gemini or settings.parsing_model,
+        "openai": model_openai or settings.fallback_model,
+    }
+
+
 def _call_gemini(
     prompt: str,
     model: str,
     temperature: float,
     **kwargs
-) -> str:
+) -> Tuple[str, TokenUsage]:
     """
     Call Gemini API with retry logic for transient failures.
 
@@ -98,7 +158,7 @@ def _call_gemini(
         **kwargs: Additional config options
 
     Returns:
-        Generated text response
+        tuple: (generated_text, token_usage)
 
     Raises:
         Exception: If all retries fail
@@ -121,7 +181,7 @@ def _call_gemini(
             contents=prompt,
             config={"temperature": temperature, **kwargs}
         )
-        return response.text
+        return response.text, TokenUsage.from_gemini(response)
 
     return _call_with_retry()
 
@@ -130,7 +190,7 @@ def _call_openai(
     prompt: str,
     model: str,
     temperature: float
-) -> str:
+) -> Tuple[str, TokenUsage]:
     """
     Call OpenAI API with retry logic for transient failures.
 
@@ -140,7 +200,7 @@ def _call_openai(
         temperature: Generation temperature
 
     Returns:
-        Generated text response
+        tuple: (generated_text, token_usage)
 
     Raises:
         Exception: If all retries fail
@@ -163,7 +223,7 @@ def _call_openai(
             messages=[{"role": "user", "content": prompt}],
             temperature=temperature
         )
-        return response.choices[0].message.content
+        return response.choices[0].message.content, TokenUsage.from_openai(response)
 
     return _call_with_retry()
 
@@ -173,17 +233,21 @@ def generate_with_fallback(
     model_gemini: str = None,
     model_openai: str = None,
     temperature: float = None,
+    *,
+    call_site: str,
     **kwargs
 ) -> Tuple[str, str]:
     """
     Generate text with Gemini, fall back to OpenAI GPT-4o-mini on any error.
     Includes retry logic with exponential backoff for transient failures.
+    Records provider-reported token usage with the metrics collector.
 
     Args:
         prompt: The prompt text to send
         model_gemini: Gemini model name (default from settings)
         model_openai: OpenAI model name (default from settings)
         temperature: Generation temperature (default from settings)
+        call_site: Tag for token accounting (e.g. "parse_jd")
         **kwargs: Additional config options for Gemini
 
     Returns:
@@ -201,8 +265,10 @@ def generate_with_fallback(
 
     # Try Gemini first (with retry)
     gemini_error = None
+    start_time = time.time()
     try:
-        response = _call_gemini(prompt, model_gemini, temperature, **kwargs)
+        response, usage = _call_gemini(prompt, model_gemini, temperature, **kwargs)
+        record_token_usage(usage, call_site, model_gemini, "gemini", (time.time() - start_time) * 1000)
         logger.debug(f"Gemini generation successful using {model_gemini}")
         return response, "gemini"
 
@@ -223,8 +289,10 @@ def generate_with_fallback(
         )
 
     # Fall back to OpenAI (with retry)
+    start_time = time.time()
     try:
-        response = _call_openai(prompt, model_openai, temperature)
+        response, usage = _call_openai(prompt, model_openai, temperature)
+        record_token_usage(usage, call_site, model_openai, "openai", (time.time() - start_time) * 1000)
         logger.info(f"OpenAI fallback successful using {model_openai}")
         return response, "openai"
 
@@ -255,7 +323,7 @@ async def _call_gemini_async(
     model: str,
     temperature: float,
     **kwargs
-) -> str:
+) -> Tuple[str, TokenUsage]:
     """
     Call Gemini API asynchronously using google-genai's async support.
     Uses asyncio.to_thread for Gemini (native async support limited).
@@ -268,13 +336,13 @@ async def _call_gemini_async(
         **kwargs: Additional config options
 
     Returns:
-        Generated text response
+        tuple: (generated_text, token_usage)
     """
     max_retries = settings.max_retries
     last_error = None
 
-    # Get circuit breaker for Gemini
-    circuit_breaker = await get_circuit_breaker("gemini")
+    # Get per-model circuit breaker for Gemini
+    circuit_breaker = await get_circuit_breaker(f"gemini:{model}")
 
     async def _make_request():
         client = get_gemini_client()
@@ -285,12 +353,14 @@ async def _call_gemini_async(
             contents=prompt,
             config={"temperature": temperature, **kwargs}
         )
-        return response.text
+        return response.text, TokenUsage.from_gemini(response)
 
     for attempt in range(max_retries):
+        attempt_start = time.time()
         try:
             # Use circuit breaker for the actual API call
-            return await circuit_breaker.call(_make_request)
+            # DEADLINE: the attempt is cancelled if the request budget runs out
+            return await run_within_deadline(circuit_breaker.call(_make_request), f"Gemini {model} call")
         except CircuitBreakerOpenError:
             # Don't retry if circuit is open, fail immediately to fallback
             raise
@@ -298,6 +368,10 @@ async def _call_gemini_async(
             last_error = e
             if attempt < max_retries - 1:
                 wait_time = min(settings.retry_max_wait, settings.retry_min_wait * (2 ** attempt))
+                # DEADLINE: stop if the budget can't cover the backoff plus another attempt this long
+                if not can_afford(wait_time + (time.time() - attempt_start)):
+                    logger.warning(f"Gemini async retry skipped, request budget too small: {e}")
+                    raise
                 logger.warning(f"Gemini async retry {attempt + 1}/{max_retries} after {wait_time}s: {e}")
                 await asyncio.sleep(wait_time)
             else:
@@ -309,8 +383,9 @@ async def _call_gemini_async(
 async def _call_openai_async(
     prompt: str,
     model: str,
-    temperature: float
-) -> str:
+    temperature: float,
+    max_tokens: Optional[int] = None
+) -> Tuple[str, TokenUsage]:
     """
     Call OpenAI API asynchronously using AsyncOpenAI client.
     True async - does not block the event loop.
@@ -320,29 +395,33 @@ async def _call_openai_async(
         prompt: The prompt text
         model: OpenAI model name
         temperature: Generation temperature
+        max_tokens: Output-token cap (None = provider default)
 
     Returns:
-        Generated text response
+        tuple: (generated_text, token_usage)
     """
     max_retries = settings.max_retries
     last_error = None
 
-    # Get circuit breaker for OpenAI
-    circuit_breaker = await get_circuit_breaker("openai")
+    # Get per-model circuit breaker for OpenAI
+    circuit_breaker = await get_circuit_breaker(f"openai:{model}")
 
     async def _make_request():
         client = get_async_openai_client()
         response = await client.chat.completions.create(
             model=model,
             messages=[{"role": "user", "content": prompt}],
-            temperature=temperature
+            temperature=temperature,
+            **({"max_tokens": max_tokens} if max_tokens else {})
         )
-        return response.choices[0].message.content
+        return response.choices[0].message.content, TokenUsage.from_openai(response)
 
     for attempt in range(max_retries):
+        attempt_start = time.time()
         try:
             # Use circuit breaker for the actual API call
-            return await circuit_breaker.call(_make_request)
+            # DEADLINE: the attempt is cancelled if the request budget runs out
+            return await run_within_deadline(circuit_breaker.call(_make_request), f"OpenAI {model} call")
         except CircuitBreakerOpenError:
             # Don't retry if circuit is open, fail immediately
             raise
@@ -350,6 +429,10 @@ async def _call_openai_async(
             last_error = e
             if attempt < max_retries - 1:
                 wait_time = min(settings.retry_max_wait, settings.retry_min_wait * (2 ** attempt))
+                # DEADLINE: stop if the budget can't cover the backoff plus another attempt this long
+                if not can_afford(wait_time + (time.time() - attempt_start)):
+                    logger.warning(f"OpenAI async retry skipped, request budget too small: {e}")
+                    raise
                 logger.warning(f"OpenAI async retry {attempt + 1}/{max_retries} after {wait_time}s: {e}")
                 await asyncio.sleep(wait_time)
             else:
@@ -363,18 +446,25 @@ async def generate_with_fallback_async(
     model_gemini: str = None,
     model_openai: str = None,
     temperature: float = None,
+    *,
+    call_site: str,
+    routing: Optional[RoutingDecision] = None,
     **kwargs
 ) -> Tuple[str, str]:
     """
     Generate text asynchronously with Gemini, fall back to OpenAI GPT-4o-mini on any error.
     True async implementation - does not block the event loop (critical for scalability).
     Implements backpressure via semaphore to limit concurrent LLM API calls.
+    Records provider-reported token usage with the metrics collector.
 
     Args:
         prompt: The prompt text to send
         model_gemini: Gemini model name (default from settings)
         model_openai: OpenAI model name (default from settings)
         temperature: Generation temperature (default from settings)
+        call_site: Tag for token accounting (e.g. "parse_jd")
+        routing: Complexity routing decision; overrides models, output cap and
+            provider order, and records per-route metrics
         **kwargs: Additional config options for Gemini
 
     Returns:
@@ -384,66 +474,348 @@ async def generate_with_fallback_async(
 
     Raises:
         LLMBackpressureError: If semaphore acquisition times out (system overloaded)
+        DeadlineExceededError: If the request budget runs out before a response
         Exception: If both providers fail after all retries
     """
     # Use settings defaults if not specified
-    model_gemini = model_gemini or settings.parsing_model
-    model_openai = model_openai or settings.fallback_model
+    models = _resolve_models(model_gemini, model_openai, routing)
     temperature = temperature if temperature is not None else settings.parsing_temperature
-
-    # BACKPRESSURE: Acquire semaphore with timeout
+    max_tokens = routing.max_output_tokens if routing else None
+    if max_tokens:
+        kwargs.setdefault("max_output_tokens", max_tokens)
+    if routing and routing.thinking_budget is not None:
+        kwargs.setdefault("thinking_config", {"thinking_budget": routing.thinking_budget})
+    order = routing.provider_order if routing else ("gemini", "openai")
+
+    # BACKPRESSURE: Acquire semaphore with timeout (bounded by the request deadline)
     semaphore = _get_llm_semaphore()
+    await _acquire_llm_slot(semaphore)
+
+    call_start = time.time()
+    errors: Dict[str, Exception] = {}
     try:
-        # Try to acquire semaphore with timeout
-        acquired = await asyncio.wait_for(
-            semaphore.acquire(),
-            timeout=settings.llm_queue_timeout
-        )
-    except asyncio.TimeoutError:
+        # Providers in routing order (Gemini first by default), each with retry
+        for provider in order:
+            if errors:
+                check_deadline(f"{_PROVIDER_LABELS[provider]} fallback")
+            start_time = time.time()
+            try:
+                if provider == "gemini":
+                    response, usage = await _call_gemini_async(prompt, models["gemini"], temperature, **kwargs)
+                else:
+                    response, usage = await _call_openai_async(prompt, models["openai"], temperature, max_tokens)
+                record_token_usage(usage, call_site, models[provider], provider, (time.time() - start_time) * 1000)
+                if errors:
+                    logger.info(f"{_PROVIDER_LABELS[provider]} async fallback successful using {models[provider]}")
+                else:
+                    logger.debug(f"{_PROVIDER_LABELS[provider]} async generation successful using {models[provider]}")
+                if routing:
+                    record_route_call(routing, provider, (time.time() - call_start) * 1000, len(errors))
+                return response, provider
+
+            except DeadlineExceededError:
+                # No budget left for a fallback either
+                raise
+
+            except Exception as e:
+                errors[provider] = e
+                logger.warning(f"{_PROVIDER_LABELS[provider]} async API failed: {e}")
+
         logger.error(
-            f"LLM backpressure timeout: queue full for {settings.llm_queue_timeout}s "
-            f"(max concurrent: {settings.max_concurrent_llm_calls})"
+            f"Both Gemini and OpenAI async failed. "
+            f"Gemini: {errors.get('gemini')}. OpenAI: {errors.get('openai')}"
         )
-        raise LLMBackpressureError(
-            f"LLM API queue is full. Please try again later. "
-            f"(timeout: {settings.llm_queue_timeout}s)"
+        if routing:
+            record_route_call(routing, None, (time.time() - call_start) * 1000, len(errors))
+        raise Exception(
+            f"Both Gemini and OpenAI failed. "
+            f"Gemini: {errors.get('gemini')}. OpenAI: {errors.get('openai')}"
         )
+    finally:
+        # ALWAYS release semaphore
+        semaphore.release()
 
-    try:
-        # Try Gemini first (with retry)
-        gemini_error = None
+
+# =============================================================================
+# STREAMING GENERATION
+# Relays provider token streams; fallback is decided before the first token
+# =============================================================================
+
+async def _open_gemini_stream(
+    prompt: str,
+    model: str,
+    temperature: float,
+    usage: TokenUsage,
+    **kwargs
+) -> Tuple[str, AsyncIterator[str]]:
+    """
+    Open a Gemini token stream and pull its first non-empty chunk.
+
+    Pulling the first chunk here (inside the circuit breaker) means connection
+    errors, quota errors and empty streams all surface before anything has been
+    sent to the client, so the caller can still fall back.
+
+    Args:
+        prompt: The prompt text
+        model: Gemini model name
+        temperature: Generation temperature
+        usage: Updated in place from each chunk's cumulative usage metadata
+        **kwargs: Additional config options
+
+    Returns:
+        tuple: (first_chunk, remaining_chunks_iterator)
+    """
+    circuit_breaker = await get_circuit_breaker(f"gemini:{model}")
+
+    async def _make_request():
+        client = get_gemini_client()
+        stream = await client.aio.models.generate_content_stream(
+            model=model,
+            contents=prompt,
+            config={"temperature": temperature, **kwargs}
+        )
+
+        async def _texts():
+            try:
+                async for chunk in stream:
+                    if chunk.usage_metadata:
+                        chunk_usage = TokenUsage.from_gemini(chunk)
+                        usage.input_tokens = chunk_usage.input_tokens
+                        usage.output_tokens = chunk_usage.output_tokens
+                        usage.cached_tokens = chunk_usage.cached_tokens
+                    if chunk.text:
+                        yield chunk.text
+            finally:
+                # Release the underlying HTTP connection on early exit
+                await stream.aclose()
+
+        texts = _texts()
         try:
-            response = await _call_gemini_async(prompt, model_gemini, temperature, **kwargs)
-            logger.debug(f"Gemini async generation successful using {model_gemini}")
-            return response, "gemini"
+            first = await texts.__anext__()
+        except StopAsyncIteration:
+            raise ValueError(f"Gemini stream for {model} returned no content")
+        return first, texts
 
-        except Exception as e:
-            gemini_error = e
-            logger.warning(
-                f"Gemini async API failed: {e}. "
-                f"Falling back to OpenAI {model_openai}..."
-            )
+    return await circuit_breaker.call(_make_request)
+
+
+async def _open_openai_stream(
+    prompt: str,
+    model: str,
+    temperature: float,
+    usage: TokenUsage,
+    max_tokens: Optional[int] = None
+) -> Tuple[str, AsyncIterator[str]]:
+    """
+    Open an OpenAI token stream and pull its first non-empty chunk.
 
-        # Fall back to OpenAI (with retry)
+    Args:
+        prompt: The prompt text
+        model: OpenAI model name
+        temperature: Generation temperature
+        usage: Updated in place from the final usage chunk
+        max_tokens: Output-token cap (None = provider default)
+
+    Returns:
+        tuple: (first_chunk, remaining_chunks_iterator)
+    """
+    circuit_breaker = await get_circuit_breaker(f"openai:{model}")
+
+    async def _make_request():
+        client = get_async_openai_client()
+        stream = await client.chat.completions.create(
+            model=model,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=temperature,
+            stream=True,
+            stream_options={"include_usage": True},
+            **({"max_tokens": max_tokens} if max_tokens else {})
+        )
+
+        async def _texts():
+            try:
+                async for chunk in stream:
+                    if chunk.usage:
+                        chunk_usage = TokenUsage.from_openai(chunk)
+                        usage.input_tokens = chunk_usage.input_tokens
+                        usage.output_tokens = chunk_usage.output_tokens
+                        usage.cached_tokens = chunk_usage.cached_tokens
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+            finally:
+                # Release the underlying HTTP connection on early exit
+                await stream.close()
+
+        texts = _texts()
         try:
-            response = await _call_openai_async(prompt, model_openai, temperature)
-            logger.info(f"OpenAI async fallback successful using {model_openai}")
-            return response, "openai"
+            first = await texts.__anext__()
+        except StopAsyncIteration:
+            raise ValueError(f"OpenAI stream for {model} returned no content")
+        return first, texts
+
+    return await circuit_breaker.call(_make_request)
+
+
+async def stream_with_fallback_async(
+    prompt: str,
+    model_gemini: str = None,
+    model_openai: str = None,
+    temperature: float = None,
+    *,
+    call_site: str,
+    routing: Optional[RoutingDecision] = None,
+    **kwargs
+) -> AsyncIterator[Tuple[str, str]]:
+    """
+    Stream generated text with Gemini, falling back to OpenAI before the first token.
+
+    Once the first chunk has been yielded the provider is fixed: a mid-stream
+    failure is raised to the caller rather than restarting on another provider,
+    since the client has already received partial output.
 
-        except Exception as openai_error:
+    The backpressure semaphore is held for the lifetime of the stream and is
+    released when the generator finishes or is closed (e.g. client disconnect).
+
+    Args:
+        prompt: The prompt text to send
+        model_gemini: Gemini model name (default from settings)
+        model_openai: OpenAI model name (default from settings)
+        temperature: Generation temperature (default from settings)
+        call_site: Tag for token accounting (e.g. "parse_jd")
+        routing: Complexity routing decision; overrides models, output cap and
+            provider order, and records per-route metrics
+        **kwargs: Additional config options for Gemini
+
+    Yields:
+        tuple: (text_chunk, provider_used)
+
+    Raises:
+        LLMBackpressureError: If semaphore acquisition times out (system overloaded)
+        Exception: If both providers fail before producing a token
+    """
+    models = _resolve_models(model_gemini, model_openai, routing)
+    temperature = temperature if temperature is not None else settings.parsing_temperature
+    max_tokens = routing.max_output_tokens if routing else None
+    if max_tokens:
+        kwargs.setdefault("max_output_tokens", max_tokens)
+    if routing and routing.thinking_budget is not None:
+        kwargs.setdefault("thinking_config", {"thinking_budget": routing.thinking_budget})
+    order = routing.provider_order if routing else ("gemini", "openai")
+
+    semaphore = _get_llm_semaphore()
+    await _acquire_llm_slot(semaphore)
+
+    texts = None
+    provider = None
+    usage = TokenUsage()
+    call_start = start_time = time.time()
+    errors: Dict[str, Exception] = {}
+    stream_error = None
+    try:
+        # Providers in routing order; fallback is only possible before the first token
+        for candidate in order:
+            start_time = time.time()
+            try:
+                if candidate == "gemini":
+                    first, texts = await _open_gemini_stream(prompt, models["gemini"], temperature, usage, **kwargs)
+                else:
+                    first, texts = await _open_openai_stream(prompt, models["openai"], temperature, usage, max_tokens)
+                provider = candidate
+                if errors:
+                    logger.info(f"{_PROVIDER_LABELS[provider]} stream fallback opened using {models[provider]}")
+                else:
+                    logger.debug(f"{_PROVIDER_LABELS[provider]} stream opened using {models[provider]}")
+                break
+            except Exception as e:
+                errors[candidate] = e
+                logger.warning(f"{_PROVIDER_LABELS[candidate]} stream failed before first token: {e}")
+
+        if provider is None:
             logger.error(
-                f"Both Gemini and OpenAI async failed. "
-                f"Gemini: {gemini_error}. OpenAI: {openai_error}"
+                f"Both Gemini and OpenAI streams failed. "
+                f"Gemini: {errors.get('gemini')}. OpenAI: {errors.get('openai')}"
             )
             raise Exception(
                 f"Both Gemini and OpenAI failed. "
-                f"Gemini: {gemini_error}. OpenAI: {openai_error}"
+                f"Gemini: {errors.get('gemini')}. OpenAI: {errors.get('openai')}"
             )
+
+        yield first, provider
+        async for chunk in texts:
+            yield chunk, provider
+    except BaseException as e:
+        stream_error = e
+        raise
     finally:
+        if texts is not None:
+            await texts.aclose()
+            # Usage is reported even for streams closed early: those tokens were billed
+            record_token_usage(
+                usage, call_site, models[provider],
+                provider, (time.time() - start_time) * 1000
+            )
+        if routing:
+            # A stream cut short after the first token still counts as answered
+            # by its provider unless it ended in an error
+            answered = provider if provider is not None and not isinstance(stream_error, Exception) else None
+            record_route_call(routing, answered, (time.time() - call_start) * 1000, len(errors))
         # ALWAYS release semaphore
         semaphore.release()
 
 
+async def stream_json_sections_async(
+    prompt: str,
+    model_gemini: str = None,
+    model_openai: str = None,
+    temperature: float = None,
+    max_depth: int = 1,
+    *,
+    call_site: str,
+    routing: Optional[RoutingDecision] = None,
+    **kwargs
+) -> AsyncIterator[Tuple[JSONPath, Any, str]]:
+    """
+    Stream a JSON completion and yield each object member as soon as it closes.
+
+    Built on stream_with_fallback_async (same fallback, backpressure and usage
+    accounting) with Gemini JSON mode on. Members are emitted down to
+    `max_depth` levels, e.g. ("gaps", "critical") with max_depth=2.
+
+    If the stream is cut short, every member closed before the cut has
+    already been yielded; the stream error is then re-raised.
+
+    Args:
+        prompt: The prompt text to send
+        model_gemini: Gemini model name (default from settings)
+        model_openai: OpenAI model name (default from settings)
+        temperature: Generation temperature (default from settings)
+        max_depth: Deepest member path to emit
+        call_site: Tag for token accounting (e.g. "parse_jd")
+        routing: Complexity routing decision (see stream_with_fallback_async)
+        **kwargs: Additional config options for Gemini
+
+    Yields:
+        tuple: (path, value, provider_used)
+    """
+    parser = IncrementalJSONParser(max_depth=max_depth)
+    stream = stream_with_fallback_async(
+        prompt,
+        model_gemini=model_gemini,
+        model_openai=model_openai,
+        temperature=temperature,
+        call_site=call_site,
+        routing=routing,
+        response_mime_type="application/json",
+        **kwargs
+    )
+    try:
+        async for chunk, provider in stream:
+            for path, value in parser.feed(chunk):
+                yield path, value, provider
+    finally:
+        await stream.aclose()
+
+
 # =============================================================================
 # VALIDATED JSON GENERATION WITH RETRY
 # =============================================================================
@@ -455,6 +827,8 @@ async def generate_validated_json_async(
     model_openai: str = None,
     temperature: float = None,
     max_validation_retries: int = 2,
+    *,
+    call_site: str,
     **kwargs
 ) -> Tuple[dict, str]:
     """
@@ -472,6 +846,7 @@ async def generate_validated_json_async(
         model_openai: OpenAI model name (default from settings)
         temperature: Generation temperature (default from settings)
         max_validation_retries: Max attempts on validation failure (default: 2)
+        call_site: Tag for token accounting (e.g. "parse_jd")
         **kwargs: Additional config options for Gemini
 
     Returns:
@@ -495,6 +870,7 @@ async def generate_validated_json_async(
                 model_gemini=model_gemini,
                 model_openai=model_openai,
                 temperature=temperature,
+                call_site=call_site,
                 response_mime_type="application/json",  # Force JSON output
                 **kwargs
             )
@@ -514,12 +890,13 @@ async def generate_validated_json_async(
 
             # Validation failed
             last_error = error
+            record_invalid_output(kwargs.get("routing"))
             logger.warning(
                 f"JSON validation failed (attempt {attempt + 1}/{max_validation_retries}): {error}"
             )
 
-        except (LLMBackpressureError, CircuitBreakerOpenError):
-            # Don't retry on backpressure/circuit breaker - re-raise immediately
+        except (LLMBackpressureError, CircuitBreakerOpenError, DeadlineExceededError):
+            # Don't retry on backpressure/circuit breaker/deadline - re-raise immediately
             raise
 
         except Exception as e:
@@ -545,9 +922,12 @@ __all__ = [
     'generate_with_fallback',
     'generate_with_fallback_async',
     'generate_validated_json_async',
+    'stream_with_fallback_async',
+    'stream_json_sections_async',
     'gemini_client',
     'openai_client',
     'LLMBackpressureError',
     'CircuitBreakerOpenError',
+    'DeadlineExceededError',
     'JSONValidationError',
 ]
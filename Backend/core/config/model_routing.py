@@ -0,0 +1,281 @@
+"""
+Complexity-Aware Model Routing for the LLM Gateway.
+
+Each routed call site (JD/CV parsing, gap analysis, domain finder) scores its
+input (0-100) and picks the first tier of its route whose max_complexity
+covers the score. JDs are scored with
+scrapers/complexity_scorer.calculate_complexity_score; CVs with
+cv_complexity_score (length, dated entries, skills, layout noise), since
+funding and jargon signals say little about how hard a CV is to extract:
+
+- simple:   short postings, few skills -> cheapest model, small output cap
+- standard: typical inputs
+- complex:  long, jargon-heavy inputs that fail JSON on the cheap model
+            -> stronger model, larger output cap
+
+A tier sets the Gemini and OpenAI models, the output-token cap, the Gemini
+thinking budget and the provider order. Thinking tokens count against the
+output cap on Gemini thinking models, so a tier on one sets both. Routes are configured in settings.model_routes (keyed by
+route name, "default" applies to any route without its own entry).
+
+Per route/tier latency, provider errors, fallbacks and invalid outputs are
+tracked so the policy can be tuned (GET /api/metrics/model-routing).
+"""
+
+import re
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from core.config.logging_config import logger
+from core.config.settings import settings
+from scrapers.complexity_scorer import TECH_KEYWORDS, calculate_complexity_score
+
+# Latency samples kept per route/tier for percentiles
+LATENCY_WINDOW = 500
+
+# Years in CV text: each role, degree and certification usually carries one or two
+_YEAR_RE = re.compile(r"\b(?:19|20)\d{2}\b")
+
+
+@dataclass(frozen=True)
+class RoutingDecision:
+    """Models, output cap and provider order chosen for one call."""
+    route: str
+    tier: str
+    complexity: int
+    model_gemini: str
+    model_openai: str
+    max_output_tokens: Optional[int] = None
+    thinking_budget: Optional[int] = None
+    provider_order: Tuple[str, ...] = ("gemini", "openai")
+
+
+def _tiers_for(route: str) -> list:
+    routes = settings.model_routes
+    return routes.get(route) or routes.get("default") or []
+
+
+def cv_complexity_score(cv_text: str) -> int:
+    """
+    Score CV extraction complexity (0-100): how much structured output the
+    parse needs and how messy the extracted text is.
+
+    Args:
+        cv_text: Raw CV text (or its TOON text)
+
+    Returns:
+        Complexity score (0-100)
+    """
+    if not cv_text or not cv_text.strip():
+        return 0
+
+    score = 0
+
+    # 1. Length (+30)
+    word_count = len(cv_text.split())
+    if word_count >= 1200:
+        score += 30
+    elif word_count >= 700:
+        score += 20
+    elif word_count >= 350:
+        score += 10
+
+    # 2. Dated entries: roles, degrees, certifications to extract (+25)
+    years = len(_YEAR_RE.findall(cv_text))
+    if years >= 16:
+        score += 25
+    elif years >= 8:
+        score += 15
+    elif years >= 4:
+        score += 5
+
+    # 3. Technical skills (+20)
+    lowered = cv_text.lower()
+    skill_count = sum(1 for kw in TECH_KEYWORDS if kw.lower() in lowered)
+    if skill_count >= 15:
+        score += 20
+    elif skill_count >= 8:
+        score += 10
+
+    # 4. Layout noise from multi-column / table PDFs (+15)
+    lines = [line for line in cv_text.splitlines() if line.strip()]
+    fragments = sum(1 for line in lines if len(line.split()) <= 2)
+    if cv_text.count("|") + cv_text.count("\t") >= 10 or (len(lines) >= 20 and fragments / len(lines) >= 0.5):
+        score += 15
+
+    # 5. Non-English text (accents, other scripts) (+10)
+    letters = [c for c in cv_text if c.isalpha()]
+    if letters and sum(1 for c in letters if not c.isascii()) / len(letters) >= 0.05:
+        score += 10
+
+    return min(score, 100)
+
+
+def complexity_score(text: str, document: str = "jd") -> int:
+    """Complexity of a routed input with the measure for its document kind ("jd" or "cv")."""
+    return cv_complexity_score(text) if document == "cv" else calculate_complexity_score(text)
+
+
+def select_route(route: str, text: str, document: str = "jd") -> RoutingDecision:
+    """
+    Pick the tier for a routed call from the complexity of its input.
+
+    Args:
+        route: Route name (e.g. "parse_jd", "gap_analysis")
+        text: Input the complexity is scored on (JD, CV or TOON text)
+        document: Kind of document the text is ("jd" or "cv"), picks the measure
+
+    Returns:
+        RoutingDecision (the settings defaults when routing is disabled)
+    """
+    if not settings.model_routing_enabled:
+        return RoutingDecision(
+            route=route,
+            tier="disabled",
+            complexity=-1,
+            model_gemini=settings.parsing_model,
+            model_openai=settings.fallback_model,
+        )
+
+    complexity = complexity_score(text, document)
+    tiers = sorted(_tiers_for(route), key=lambda t: t.get("max_complexity", 100))
+    tier = next((t for t in tiers if complexity <= t.get("max_complexity", 100)), tiers[-1] if tiers else {})
+
+    decision = RoutingDecision(
+        route=route,
+        tier=tier.get("tier", "default"),
+        complexity=complexity,
+        model_gemini=tier.get("model_gemini") or settings.parsing_model,
+        model_openai=tier.get("model_openai") or settings.fallback_model,
+        max_output_tokens=tier.get("max_output_tokens"),
+        thinking_budget=tier.get("thinking_budget"),
+        provider_order=tuple(tier.get("provider_order") or ("gemini", "openai")),
+    )
+    logger.debug(
+        f"Routed {route} (complexity {complexity}) to {decision.tier}: "
+        f"{decision.model_gemini} / {decision.model_openai}"
+    )
+    return decision
+
+
+class _RouteStats:
+    """Counters and latency window for one route/tier."""
+
+    def __init__(self):
+        self.calls = 0
+        self.provider_errors = 0
+        self.fallbacks = 0
+        self.failures = 0
+        self.invalid_outputs = 0
+        self.complexity_total = 0
+        self.by_provider: Dict[str, int] = {}
+        self.latencies_ms: deque = deque(maxlen=LATENCY_WINDOW)
+
+    def to_dict(self) -> Dict[str, Any]:
+        latencies = sorted(self.latencies_ms)
+
+        def _pct(p: float) -> Optional[float]:
+            if not latencies:
+                return None
+            return round(latencies[min(int(len(latencies) * p), len(latencies) - 1)], 1)
+
+        return {
+            "calls": self.calls,
+            "by_provider": dict(self.by_provider),
+            "provider_errors": self.provider_errors,
+            "fallbacks": self.fallbacks,
+            "failures": self.failures,
+            "failure_rate": round(self.failures / self.calls, 4) if self.calls else 0.0,
+            "invalid_outputs": self.invalid_outputs,
+            "invalid_output_rate": round(self.invalid_outputs / self.calls, 4) if self.calls else 0.0,
+            "avg_complexity": round(self.complexity_total / self.calls, 1) if self.calls else None,
+            "latency_ms": {"p50": _pct(0.5), "p95": _pct(0.95), "p99": _pct(0.99)},
+        }
+
+
+_stats: Dict[Tuple[str, str], _RouteStats] = {}
+_stats_lock = threading.Lock()
+
+
+def _get_stats(decision: RoutingDecision) -> _RouteStats:
+    key = (decision.route, decision.tier)
+    stats = _stats.get(key)
+    if stats is None:
+        with _stats_lock:
+            stats = _stats.setdefault(key, _RouteStats())
+    return stats
+
+
+def record_route_call(
+    decision: RoutingDecision,
+    provider: Optional[str],
+    latency_ms: float,
+    provider_errors: int = 0,
+) -> None:
+    """
+    Record the outcome of a routed gateway call.
+
+    Args:
+        decision: The routing decision used
+        provider: Provider that answered, or None if every provider failed
+        latency_ms: Wall time of the call including fallbacks
+        provider_errors: Providers that failed before the answer
+    """
+    stats = _get_stats(decision)
+    stats.calls += 1
+    stats.complexity_total += max(decision.complexity, 0)
+    stats.provider_errors += provider_errors
+    stats.latencies_ms.append(latency_ms)
+    if provider is None:
+        stats.failures += 1
+    else:
+        stats.by_provider[provider] = stats.by_provider.get(provider, 0) + 1
+        if provider != decision.provider_order[0]:
+            stats.fallbacks += 1
+
+    try:
+        from core.monitoring.metrics_collector import get_metrics_collector
+        metrics = get_metrics_collector()
+        metrics.record_performance(
+            operation=f"route:{decision.route}:{decision.tier}",
+            duration_ms=latency_ms,
+            metadata={"success": provider is not None, "provider": provider, "complexity": decision.complexity}
+        )
+        if provider is None:
+            metrics.record_error(f"route:{decision.route}:{decision.tier}", "all_providers_failed")
+    except Exception:
+        pass  # Metrics never fail the call
+
+
+def record_invalid_output(decision: Optional[RoutingDecision]) -> None:
+    """Record a response the call site could not parse/validate (e.g. broken JSON)."""
+    if decision is None:
+        return
+    _get_stats(decision).invalid_outputs += 1
+
+
+def get_route_stats() -> Dict[str, Any]:
+    """Per route, per tier stats plus the active policy."""
+    with _stats_lock:
+        items = list(_stats.items())
+    routes: Dict[str, Dict[str, Any]] = {}
+    for (route, tier), stats in sorted(items):
+        routes.setdefault(route, {})[tier] = stats.to_dict()
+    return {
+        "enabled": settings.model_routing_enabled,
+        "routes": routes,
+        "policy": settings.model_routes,
+    }
+
+
+__all__ = [
+    'RoutingDecision',
+    'complexity_score',
+    'cv_complexity_score',
+    'select_route',
+    'record_route_call',
+    'record_invalid_output',
+    'get_route_stats',
+]
@@ -0,0 +1,339 @@
+"""
+Record/Replay Stand-In for LLM and Embedding Providers.
+
+Plugs into the shared HTTP pools in core.config.clients as an httpx transport,
+so every Gemini / OpenAI call (generation, streaming, embeddings) made by the
+app, LangChain's ChatOpenAI or the benchmark scripts goes through it.
+
+Modes (settings.llm_stub_mode):
+- "off":    Real network, no interception (default)
+- "record": Forward to the real provider and save each request/response pair
+            plus its latency to settings.llm_stub_dir (one file per request key)
+- "replay": Serve saved responses with no network, keyed by a hash of the
+            request (method + path + canonical JSON body, i.e. model + prompt).
+            Latency is replayed from the recorded distribution, and errors
+            and 429s can be injected at configurable rates
+
+Only provider hosts are intercepted; other HTTP traffic passes through.
+
+Usage (offline load test of the full app):
+    LLM_STUB_MODE=record uvicorn app.main:app --port 8001   # once, with real keys
+    python tests/reliability/test_concurrent_parsing.py
+    LLM_STUB_MODE=replay uvicorn app.main:app --port 8001   # afterwards, no network
+    python tests/reliability/test_concurrent_parsing.py
+"""
+
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from core.config.logging_config import logger
+from core.config.settings import settings
+
+# Provider API hosts served by the stand-in
+STUB_HOSTS = {
+    "generativelanguage.googleapis.com",
+    "api.openai.com",
+}
+
+# Only these response headers are replayed (content framing is rebuilt by httpx)
+REPLAYED_HEADERS = ("content-type",)
+
+
+def get_request_key(request: httpx.Request, body: bytes) -> str:
+    """
+    Key a provider request by method, path and canonical JSON body.
+    Query strings and auth headers are excluded so recordings are key-independent.
+    """
+    try:
+        canonical = json.dumps(json.loads(body), sort_keys=True, separators=(",", ":")).encode()
+    except (ValueError, UnicodeDecodeError):
+        canonical = body
+    digest = hashlib.sha256(canonical).hexdigest()
+    return hashlib.sha256(f"{request.method} {request.url.path} {digest}".encode()).hexdigest()[:32]
+
+
+class RecordingStore:
+    """On-disk store of recorded exchanges, one JSON file per request key."""
+
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._by_path: Dict[str, List[str]] = {}
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Index every recording in the directory (once)."""
+        if self._entries is None:
+            with self._lock:
+                if self._entries is None:
+                    entries = {}
+                    if self.directory.exists():
+                        for file in self.directory.glob("*.json"):
+                            try:
+                                entries[file.stem] = json.loads(file.read_text())
+                            except (OSError, ValueError) as e:
+                                logger.warning(f"Skipping unreadable recording {file.name}: {e}")
+                    for key, entry in entries.items():
+                        self._by_path.setdefault(entry["path"], []).append(key)
+                    self._entries = entries
+                    logger.info(f"Provider stub loaded {len(entries)} recordings from {self.directory}")
+        return self._entries
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        return self._load().get(key)
+
+    def any_for_path(self, path: str) -> Optional[Dict[str, Any]]:
+        """A random recording for the same endpoint (for prompts never recorded)."""
+        entries = self._load()
+        keys = self._by_path.get(path)
+        return entries[random.choice(keys)] if keys else None
+
+    def save(self, key: str, request: httpx.Request, response: httpx.Response, body: bytes, latency_ms: float) -> None:
+        """Save (or add a latency sample to) a recording. Atomic file replace."""
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            file = self.directory / f"{key}.json"
+            try:
+                entry = json.loads(file.read_text()) if file.exists() else None
+            except (OSError, ValueError):
+                entry = None
+
+            if entry is None:
+                try:
+                    encoded, encoding = body.decode("utf-8"), "utf-8"
+                except UnicodeDecodeError:
+                    encoded, encoding = base64.b64encode(body).decode(), "base64"
+                entry = {
+                    "method": request.method,
+                    "host": request.url.host,
+                    "path": request.url.path,
+                    "status_code": response.status_code,
+                    "headers": {h: response.headers[h] for h in REPLAYED_HEADERS if h in response.headers},
+                    "body": encoded,
+                    "body_encoding": encoding,
+                    "latencies_ms": [],
+                }
+            entry["latencies_ms"].append(round(latency_ms, 1))
+
+            tmp = file.with_suffix(".tmp")
+            tmp.write_text(json.dumps(entry))
+            os.replace(tmp, file)
+
+            if self._entries is not None:
+                self._entries[key] = entry
+                if key not in self._by_path.setdefault(entry["path"], []):
+                    self._by_path[entry["path"]].append(key)
+
+
+class ProviderStub:
+    """Record/replay logic shared by the sync and async transports."""
+
+    def __init__(self, mode: str, store: RecordingStore):
+        self.mode = mode
+        self.store = store
+        self.stats = {
+            "recorded": 0,
+            "replay_hits": 0,
+            "replay_misses": 0,
+            "injected_errors": 0,
+            "injected_rate_limits": 0,
+        }
+
+    @staticmethod
+    def intercepts(request: httpx.Request) -> bool:
+        return request.url.host in STUB_HOSTS
+
+    def replay(self, request: httpx.Request, body: bytes) -> tuple:
+        """
+        Resolve a replayed response.
+
+        Returns:
+            tuple: (httpx.Response, delay_seconds)
+        """
+        # Fault injection first, so failure rates are independent of recordings
+        roll = random.random()
+        if roll < settings.llm_stub_rate_limit_rate:
+            self.stats["injected_rate_limits"] += 1
+            return self._error_response(request, 429, "RESOURCE_EXHAUSTED", "Injected rate limit"), 0.0
+        if roll < settings.llm_stub_rate_limit_rate + settings.llm_stub_error_rate:
+            self.stats["injected_errors"] += 1
+            return self._error_response(request, 503, "UNAVAILABLE", "Injected provider error"), 0.0
+
+        entry = self.store.get(get_request_key(request, body))
+        if entry is None:
+            self.stats["replay_misses"] += 1
+            if settings.llm_stub_miss_policy == "any":
+                entry = self.store.any_for_path(request.url.path)
+            if entry is None:
+                logger.warning(f"Provider stub has no recording for {request.method} {request.url.path}")
+                return self._error_response(request, 404, "NOT_FOUND", "No recording for this request"), 0.0
+        else:
+            self.stats["replay_hits"] += 1
+
+        body_bytes = (
+            base64.b64decode(entry["body"]) if entry.get("body_encoding") == "base64"
+            else entry["body"].encode("utf-8")
+        )
+        response = httpx.Response(
+            status_code=entry["status_code"],
+            headers=entry.get("headers", {}),
+            content=body_bytes,
+            request=request,
+        )
+        return response, self._delay_seconds(entry)
+
+    @staticmethod
+    def _delay_seconds(entry: Dict[str, Any]) -> float:
+        """Sample the recorded latency distribution, scaled, plus fixed extra latency."""
+        latencies = entry.get("latencies_ms") or [0.0]
+        sampled = random.choice(latencies) * settings.llm_stub_latency_scale
+        return max(sampled + settings.llm_stub_extra_latency_ms, 0.0) / 1000
+
+    @staticmethod
+    def _error_response(request: httpx.Request, status_code: int, status: str, message: str) -> httpx.Response:
+        headers = {"content-type": "application/json"}
+        if status_code == 429:
+            headers["retry-after"] = "1"
+        return httpx.Response(
+            status_code=status_code,
+            headers=headers,
+            json={"error": {"code": status_code, "status": status, "message": message}},
+            request=request,
+        )
+
+    def record(self, request: httpx.Request, body: bytes, response: httpx.Response, latency_ms: float) -> None:
+        """Save a real exchange. NON-BLOCKING: recording failures never fail the call."""
+        if response.status_code >= 500 or response.status_code == 429:
+            return  # Transient failures are injected at replay time instead
+        try:
+            self.store.save(get_request_key(request, body), request, response, response.content, latency_ms)
+            self.stats["recorded"] += 1
+        except Exception as e:
+            logger.warning(f"Provider stub failed to record {request.url.path}: {e}")
+
+    @staticmethod
+    def rebuild(response: httpx.Response, request: httpx.Request) -> httpx.Response:
+        """Fresh response around an already-read body (the original stream is consumed)."""
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=[(k, v) for k, v in response.headers.items() if k.lower() not in ("content-encoding", "content-length", "transfer-encoding")],
+            content=response.content,
+            request=request,
+        )
+
+
+class StubTransport(httpx.BaseTransport):
+    """Sync transport: record through `inner`, or replay from disk."""
+
+    def __init__(self, stub: ProviderStub, inner: httpx.BaseTransport):
+        self.stub = stub
+        self.inner = inner
+        # Expose the real pool so pool metrics keep working
+        self._pool = getattr(inner, "_pool", None)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        if not self.stub.intercepts(request):
+            return self.inner.handle_request(request)
+
+        body = request.read()
+        if self.stub.mode == "replay":
+            response, delay = self.stub.replay(request, body)
+            if delay:
+                time.sleep(delay)
+            return response
+
+        start = time.time()
+        response = self.inner.handle_request(request)
+        try:
+            response.read()  # Streams are buffered while recording
+        finally:
+            response.close()
+        self.stub.record(request, body, response, (time.time() - start) * 1000)
+        return self.stub.rebuild(response, request)
+
+    def close(self) -> None:
+        self.inner.close()
+
+
+class AsyncStubTransport(httpx.AsyncBaseTransport):
+    """Async transport: record through `inner`, or replay from disk."""
+
+    def __init__(self, stub: ProviderStub, inner: httpx.AsyncBaseTransport):
+        self.stub = stub
+        self.inner = inner
+        self._pool = getattr(inner, "_pool", None)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        if not self.stub.intercepts(request):
+            return await self.inner.handle_async_request(request)
+
+        body = await request.aread()
+        if self.stub.mode == "replay":
+            response, delay = self.stub.replay(request, body)
+            if delay:
+                await asyncio.sleep(delay)
+            return response
+
+        start = time.time()
+        response = await self.inner.handle_async_request(request)
+        try:
+            await response.aread()  # Streams are buffered while recording
+        finally:
+            await response.aclose()
+        # Disk write off the event loop
+        await asyncio.to_thread(self.stub.record, request, body, response, (time.time() - start) * 1000)
+        return self.stub.rebuild(response, request)
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+
+
+_stub: Optional[ProviderStub] = None
+_stub_lock = threading.Lock()
+
+
+def get_provider_stub() -> Optional[ProviderStub]:
+    """The process-wide stub, or None when llm_stub_mode is "off"."""
+    global _stub
+    if settings.llm_stub_mode not in ("record", "replay"):
+        return None
+    if _stub is None:
+        with _stub_lock:
+            if _stub is None:
+                _stub = ProviderStub(settings.llm_stub_mode, RecordingStore(settings.llm_stub_dir))
+                logger.warning(f"Provider stub active: {settings.llm_stub_mode} ({settings.llm_stub_dir})")
+    return _stub
+
+
+def wrap_transport(inner: httpx.BaseTransport) -> httpx.BaseTransport:
+    """Wrap a sync transport with the stub if enabled."""
+    stub = get_provider_stub()
+    return StubTransport(stub, inner) if stub else inner
+
+
+def wrap_async_transport(inner: httpx.AsyncBaseTransport) -> httpx.AsyncBaseTransport:
+    """Wrap an async transport with the stub if enabled."""
+    stub = get_provider_stub()
+    return AsyncStubTransport(stub, inner) if stub else inner
+
+
+__all__ = [
+    'ProviderStub',
+    'RecordingStore',
+    'StubTransport',
+    'AsyncStubTransport',
+    'get_provider_stub',
+    'get_request_key',
+    'wrap_transport',
+    'wrap_async_transport',
+]
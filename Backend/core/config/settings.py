@@ -3,7 +3,7 @@ Centralized application settings using pydantic-settings.
 All configuration is loaded from environment variables with sensible defaults.
 """
 
-from typing import Optional, List
+from typing import Any, Optional, List, Dict
 from pydantic_settings import BaseSettings
 from pydantic import Field
 from functools import lru_cache
@@ -34,6 +34,25 @@ class Settings(BaseSettings):
     fallback_model: str = Field("gpt-4o-mini", description="OpenAI fallback model")
     embedding_model: str = Field("text-embedding-004", description="Embedding model")
 
+    # Complexity-Aware Model Routing (see core.config.model_routing)
+    # Tiers are matched in order of max_complexity against the 0-100 input complexity score
+    model_routing_enabled: bool = Field(True, description="Pick model/output cap per call from input complexity")
+    model_routes: Dict[str, List[Dict[str, Any]]] = Field(
+        default_factory=lambda: {
+            "default": [
+                {"tier": "simple", "max_complexity": 30, "model_gemini": "gemini-2.5-flash-lite",
+                 "model_openai": "gpt-4o-mini", "max_output_tokens": 4096},
+                {"tier": "standard", "max_complexity": 65, "model_gemini": "gemini-2.5-flash-lite",
+                 "model_openai": "gpt-4o-mini", "max_output_tokens": 8192},
+                # gemini-2.5-flash thinks, and thinking tokens count against the cap:
+                # bound the thinking and keep 8192 tokens for the answer
+                {"tier": "complex", "max_complexity": 100, "model_gemini": "gemini-2.5-flash",
+                 "model_openai": "gpt-4o-mini", "max_output_tokens": 10240, "thinking_budget": 2048},
+            ],
+        },
+        description="Routing tiers per route (parse_jd, parse_cv, gap_analysis, domain_finder); 'default' applies to unlisted routes. thinking_budget caps Gemini thinking tokens, which count against max_output_tokens"
+    )
+
     # Temperature Settings
     parsing_temperature: float = Field(0.2, description="Temperature for parsing")
     analysis_temperature: float = Field(0.3, description="Temperature for analysis")
@@ -44,6 +63,23 @@ class Settings(BaseSettings):
     result_cache_ttl: int = Field(2592000, description="Result cache TTL in seconds (30d)")
     l1_cache_size: int = Field(1000, description="L1 in-memory cache max entries")
 
+    # Cache Value Compression (Redis / cold tier values, see core.caching.compression)
+    cache_compression_enabled: bool = Field(True, description="Compress large cached values in Redis")
+    cache_compression_min_bytes: int = Field(1024, description="Values smaller than this are stored uncompressed")
+    cache_compression_level: int = Field(3, description="zstd level (zlib falls back to level 6)")
+    cache_compression_dict_samples: int = Field(200, description="Values sampled per namespace to train a zstd dictionary (0 disables)")
+    cache_compression_dict_size: int = Field(16384, description="Trained zstd dictionary size in bytes")
+
+    # Near-Duplicate Parse Cache (second-level lookup behind the exact MD5 key)
+    near_duplicate_enabled: bool = Field(True, description="Reuse parses of near-identical JDs/CVs")
+    near_duplicate_threshold_jd: float = Field(0.85, description="Min estimated Jaccard similarity to reuse a JD parse")
+    near_duplicate_threshold_cv: float = Field(0.95, description="Min estimated Jaccard similarity to reuse a CV parse")
+    near_duplicate_num_perm: int = Field(128, description="MinHash permutations per signature")
+    near_duplicate_bands: int = Field(32, description="LSH bands (num_perm must be divisible by bands)")
+    near_duplicate_shingle_size: int = Field(3, description="Words per shingle")
+    near_duplicate_min_shingles: int = Field(20, description="Shorter documents are not fingerprinted")
+    near_duplicate_max_entries: int = Field(20000, description="Signatures kept in the in-memory index")
+
     # Redis Connection Pool Configuration (for 10,000+ concurrent users)
     # Formula: max_connections = (concurrent_users / workers) * 2 = (10000 / 8) * 2 ≈ 200
     redis_max_connections: int = Field(200, description="Redis connection pool max connections")
@@ -55,6 +91,14 @@ class Settings(BaseSettings):
     db_max_overflow: int = Field(50, description="DB max overflow connections")
     db_pool_recycle: int = Field(1800, description="Recycle DB connections after N seconds")
 
+    # Cold Tier (parse/score results in Postgres behind Redis, see core.persistence.cold_store)
+    cold_tier_enabled: bool = Field(True, description="Keep parse/score results in Postgres when database_url is set")
+    result_hot_ttl: int = Field(259200, description="Redis TTL of parse/score results while the cold tier is active (3d)")
+    cold_tier_flush_interval: float = Field(2.0, description="Seconds between batched cold tier writes")
+    cold_tier_batch_size: int = Field(200, description="Pending writes that trigger an early flush")
+    cold_tier_max_pending: int = Field(5000, description="Pending writes kept while Postgres is unreachable")
+    cold_tier_read_timeout: float = Field(0.5, description="Max seconds a Redis miss waits on Postgres")
+
     # Retry Configuration
     max_retries: int = Field(3, description="Maximum retry attempts for API calls")
     retry_min_wait: float = Field(2.0, description="Minimum wait between retries (seconds)")
@@ -65,6 +109,69 @@ class Settings(BaseSettings):
     embedding_timeout: float = Field(10.0, description="Timeout for embedding operations (seconds)")
     http_timeout: float = Field(15.0, description="Default HTTP request timeout (seconds)")
 
+    # Shared HTTP Connection Pools (all Gemini / OpenAI / HTTP consumers)
+    http_max_connections: int = Field(100, description="Max open connections per shared HTTP pool")
+    http_max_keepalive_connections: int = Field(20, description="Idle keep-alive connections kept per shared HTTP pool")
+    http_keepalive_expiry: float = Field(30.0, description="Seconds an idle pooled connection is kept alive")
+    http2_enabled: bool = Field(True, description="Negotiate HTTP/2 on shared pools where the server supports it")
+
+    # Provider Stand-In (record/replay for offline performance testing)
+    llm_stub_mode: str = Field("off", description="Provider stand-in mode: off | record | replay")
+    llm_stub_dir: str = Field("data/llm_recordings", description="Directory of recorded provider exchanges")
+    llm_stub_latency_scale: float = Field(1.0, description="Multiplier on recorded latency when replaying (0 = instant)")
+    llm_stub_extra_latency_ms: float = Field(0.0, description="Fixed latency added to every replayed response")
+    llm_stub_error_rate: float = Field(0.0, description="Fraction of replayed calls answered with a 503")
+    llm_stub_rate_limit_rate: float = Field(0.0, description="Fraction of replayed calls answered with a 429")
+    llm_stub_miss_policy: str = Field("error", description="Unrecorded request: error (404) | any (random recording for the endpoint)")
+
+    # Request Deadlines (end-to-end budget per endpoint, seconds)
+    endpoint_budgets: Dict[str, float] = Field(
+        default_factory=lambda: {
+            "/api/calculate-score": 30.0,
+            "/api/parse": 30.0,
+            "/api/parse-cv": 30.0,
+            "/api/generate-questions": 30.0,
+            "/api/evaluate-answer": 20.0,
+            "/api/rewrite-resume": 45.0,
+            "/api/generate-cover-letter": 45.0,
+        },
+        description="Per-endpoint request budget; X-Request-Timeout-Ms may only shorten it"
+    )
+
+    # calculate-score stage graph: per-stage timeouts (seconds, clamped to the request deadline)
+    score_stage_timeouts: Dict[str, float] = Field(
+        default_factory=lambda: {
+            "toon": 5.0,
+            "similarity": 20.0,
+            "prompt_context": 3.0,
+            "industry": 10.0,
+            "role": 10.0,
+            "score_message": 10.0,
+        },
+        description="Timeout per calculate-score stage; stages with a fallback degrade instead of failing"
+    )
+
+    # Bulk Jobs (background queue, see core.workflow.job_queue)
+    bulk_job_concurrency: int = Field(8, description="Bulk job items processed concurrently per worker process")
+    bulk_job_max_items: int = Field(500, description="Maximum items per bulk job")
+    bulk_job_ttl: int = Field(604800, description="Bulk job data TTL after the last write in Redis, after finishing in memory (seconds, 7d)")
+    bulk_job_lease_seconds: float = Field(30.0, description="Runner lease; jobs of a dead runner resume after it expires")
+
+    # Parse Batches (/api/parse/batch, /api/parse-cv/batch)
+    parse_batch_max_items: int = Field(100, description="Maximum documents per parse batch request")
+    parse_batch_concurrency: int = Field(8, description="Cache-miss parses run concurrently per batch")
+
+    # Prompt Context Selection (see core.caching.context_selection)
+    prompt_context_selection_enabled: bool = Field(True, description="Fit long CVs into per-prompt token budgets by JD relevance")
+    prompt_context_budgets: Dict[str, int] = Field(
+        default_factory=lambda: {
+            "gap_analysis": 2500,
+            "question_generation": 2500,
+            "answer_analysis": 2000,
+        },
+        description="CV context tokens per prompt; longer CVs keep their most JD-relevant achievements and projects"
+    )
+
     # Concurrency Control (Backpressure)
     max_concurrent_llm_calls: int = Field(50, description="Maximum concurrent LLM API calls (backpressure)")
     llm_queue_timeout: float = Field(60.0, description="Timeout waiting for LLM semaphore (seconds)")
@@ -80,6 +187,20 @@ class Settings(BaseSettings):
     circuit_breaker_failure_threshold: int = Field(5, description="Failures before opening circuit")
     circuit_breaker_recovery_timeout: float = Field(30.0, description="Seconds before half-open state")
     circuit_breaker_half_open_requests: int = Field(3, description="Test requests in half-open state")
+    circuit_breaker_failure_rate_threshold: float = Field(0.5, description="Failure rate in the window that opens the circuit")
+    circuit_breaker_window_seconds: float = Field(60.0, description="Sliding window length for failure rate")
+    circuit_breaker_window_size: int = Field(100, description="Max outcomes kept in the sliding window")
+    circuit_breaker_shared_state: bool = Field(False, description="Share open circuits across workers via Redis")
+    circuit_breaker_sync_interval: float = Field(1.0, description="Seconds between shared state refreshes")
+
+    # Batched Classification (industry / role extraction)
+    classification_batch_size: int = Field(40, description="Max items per batched classification prompt")
+    role_knn_k: int = Field(5, description="Labeled titles consulted by the role classifier's embedding tier")
+    role_knn_min_similarity: float = Field(0.85, description="Min cosine similarity for an embedding-tier role label (below: LLM)")
+    industry_gazetteer_seed_path: str = Field("seed_data/industry_gazetteer.json", description="Seed companies/issuers/keywords for the industry gazetteer")
+    industry_gazetteer_max_learned: int = Field(5000, description="LLM-labeled texts kept in the industry gazetteer")
+    industry_knn_k: int = Field(5, description="Labeled examples consulted by the industry gazetteer's embedding tier")
+    industry_knn_min_similarity: float = Field(0.88, description="Min cosine similarity for an embedding-tier industry label (below: LLM)")
 
     # Feature Flags
     enable_metrics: bool = Field(True, description="Enable metrics collection")
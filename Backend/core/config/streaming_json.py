@@ -0,0 +1,185 @@
+"""
+Incremental JSON Parser for Streamed LLM Output.
+
+Feeds on raw text chunks as they arrive from a token stream and emits each
+object member as soon as its value is fully closed, down to `max_depth`
+levels of nesting. For a gap analysis shaped like
+
+    {"gaps": {"critical": [...], "important": [...]}, "strengths": [...], ...}
+
+a max_depth of 2 emits ("gaps", "critical") as soon as that array closes,
+long before the final token arrives.
+
+A truncated stream (max tokens, dropped connection) still yields every
+member that was fully closed before the cut. Leading markdown fences and
+prose before the first '{' are skipped.
+"""
+
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from core.config.logging_config import logger
+
+# Path of an emitted member: object keys from the root, e.g. ("gaps", "critical")
+JSONPath = Tuple[str, ...]
+
+
+@dataclass
+class _Frame:
+    """An open JSON container being scanned."""
+    kind: str                         # "{" or "["
+    path: Optional[JSONPath]          # None inside arrays (elements are not emitted)
+    key: Optional[str] = None         # Current member key (objects only)
+    expect: str = "key"               # "key" | "colon" | "value" | "scalar" | "comma"
+    value_start: Optional[int] = None
+
+
+@dataclass
+class IncrementalJSONParser:
+    """
+    Streaming parser emitting completed object members up to `max_depth`.
+
+    Usage:
+        parser = IncrementalJSONParser(max_depth=2)
+        for chunk in stream:
+            for path, value in parser.feed(chunk):
+                ...
+        parser.document  # Everything closed so far, assembled by path
+    """
+    max_depth: int = 1
+
+    document: Dict[str, Any] = field(default_factory=dict, init=False)
+    complete: bool = field(default=False, init=False)
+
+    _buf: str = field(default="", init=False)
+    _pos: int = field(default=0, init=False)
+    _stack: List[_Frame] = field(default_factory=list, init=False)
+    _started: bool = field(default=False, init=False)
+    _in_string: bool = field(default=False, init=False)
+    _escaped: bool = field(default=False, init=False)
+    _string_start: int = field(default=0, init=False)
+
+    def feed(self, chunk: str) -> List[Tuple[JSONPath, Any]]:
+        """
+        Consume a chunk of streamed text.
+
+        Args:
+            chunk: Next piece of the model output
+
+        Returns:
+            List of (path, value) for members that closed within this chunk
+        """
+        self._buf += chunk
+        emitted: List[Tuple[JSONPath, Any]] = []
+        buf = self._buf
+
+        while self._pos < len(buf) and not self.complete:
+            i = self._pos
+            ch = buf[i]
+            self._pos += 1
+
+            if not self._started:
+                # Skip fences/prose until the root object opens
+                if ch == "{":
+                    self._started = True
+                    self._stack.append(_Frame(kind="{", path=()))
+                continue
+
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == "\\":
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+                    self._end_string(i, emitted)
+                continue
+
+            frame = self._stack[-1]
+
+            if ch == '"':
+                self._in_string = True
+                self._string_start = i
+                if frame.expect == "value":
+                    frame.value_start = i
+            elif ch in "{[":
+                if frame.kind == "{" and frame.expect == "value" and frame.path is not None:
+                    frame.value_start = i
+                    path = frame.path + (frame.key,)
+                else:
+                    # Array elements (and anything below them) are emitted with their array
+                    path = None
+                self._stack.append(_Frame(kind=ch, path=path, expect="key" if ch == "{" else "value"))
+            elif ch in "}]":
+                self._close_scalar(frame, i, emitted)
+                self._stack.pop()
+                if not self._stack:
+                    self.complete = True
+                    break
+                parent = self._stack[-1]
+                if parent.kind == "{" and parent.value_start is not None:
+                    self._emit(parent, buf[parent.value_start:i + 1], emitted)
+            elif ch == ":":
+                if frame.kind == "{":
+                    frame.expect = "value"
+            elif ch == ",":
+                self._close_scalar(frame, i, emitted)
+                frame.key = None
+                frame.value_start = None
+                frame.expect = "key" if frame.kind == "{" else "value"
+            elif not ch.isspace() and frame.kind == "{" and frame.expect == "value":
+                # Start of a number / true / false / null
+                frame.value_start = i
+                frame.expect = "scalar"
+
+        return emitted
+
+    def _end_string(self, end: int, emitted: List[Tuple[JSONPath, Any]]) -> None:
+        """Handle a closed string token: either a member key or a string value."""
+        frame = self._stack[-1]
+        if frame.kind != "{":
+            return
+        if frame.expect == "key":
+            frame.key = json.loads(self._buf[self._string_start:end + 1])
+            frame.expect = "colon"
+        elif frame.expect == "value" and frame.value_start is not None:
+            self._emit(frame, self._buf[frame.value_start:end + 1], emitted)
+
+    def _close_scalar(self, frame: _Frame, end: int, emitted: List[Tuple[JSONPath, Any]]) -> None:
+        """Emit a pending number/bool/null value terminated at `end`."""
+        if frame.kind == "{" and frame.expect == "scalar" and frame.value_start is not None:
+            self._emit(frame, self._buf[frame.value_start:end].strip(), emitted)
+
+    def _emit(self, frame: _Frame, raw: str, emitted: List[Tuple[JSONPath, Any]]) -> None:
+        """Decode a closed member value and record it if within max_depth."""
+        frame.value_start = None
+        frame.expect = "comma"
+        if frame.path is None:
+            return
+        path = frame.path + (frame.key,)
+        if len(path) > self.max_depth:
+            return
+        try:
+            value = json.loads(raw)
+        except json.JSONDecodeError as e:
+            logger.debug(f"Streamed JSON member {'.'.join(path)} is not valid JSON: {e}")
+            return
+        self._assign(path, value)
+        emitted.append((path, value))
+
+    def _assign(self, path: JSONPath, value: Any) -> None:
+        """Place a closed value into the partial document."""
+        target = self.document
+        for key in path[:-1]:
+            child = target.get(key)
+            if not isinstance(child, dict):
+                child = target[key] = {}
+            target = child
+        target[path[-1]] = value
+
+
+__all__ = [
+    'IncrementalJSONParser',
+    'JSONPath',
+]
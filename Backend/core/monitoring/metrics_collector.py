@@ -40,6 +40,7 @@ class CostMetric:
     cost_usd: float
     timestamp: datetime
     metadata: Dict[str, Any] = field(default_factory=dict)
+    cached_tokens: int = 0
 
 
 @dataclass
@@ -182,17 +183,21 @@ class MetricsCollector:
         input_tokens: int,
         output_tokens: int,
         cache_hit: bool = False,
-        metadata: Optional[Dict[str, Any]] = None
+        metadata: Optional[Dict[str, Any]] = None,
+        cached_tokens: int = 0
     ):
         """
         Record LLM API cost.
 
         Args:
             operation: Operation name
-            input_tokens: Input token count
+            input_tokens: Input token count (including cached tokens)
             output_tokens: Output token count
             cache_hit: Whether prompt cache was used
-            metadata: Optional metadata
+            metadata: Optional metadata (call_site, endpoint, model, provider, latency_ms)
+            cached_tokens: Input tokens served from the provider's prompt cache.
+                When known, only these are discounted; otherwise a cache hit
+                discounts all input tokens.
         """
         # Gemini pricing (as of 2025)
         INPUT_COST_PER_1K = 0.001  # $0.001 per 1K input tokens
@@ -200,9 +205,13 @@ class MetricsCollector:
         CACHE_DISCOUNT = 0.5  # 50% discount on cached input tokens
 
         # Calculate cost
-        input_cost = (input_tokens / 1000) * INPUT_COST_PER_1K
-        if cache_hit:
-            input_cost *= CACHE_DISCOUNT
+        if cached_tokens:
+            uncached_tokens = max(input_tokens - cached_tokens, 0)
+            input_cost = ((uncached_tokens + cached_tokens * CACHE_DISCOUNT) / 1000) * INPUT_COST_PER_1K
+        else:
+            input_cost = (input_tokens / 1000) * INPUT_COST_PER_1K
+            if cache_hit:
+                input_cost *= CACHE_DISCOUNT
 
         output_cost = (output_tokens / 1000) * OUTPUT_COST_PER_1K
         total_cost = input_cost + output_cost
@@ -214,7 +223,8 @@ class MetricsCollector:
             cache_hit=cache_hit,
             cost_usd=total_cost,
             timestamp=datetime.utcnow(),
-            metadata=metadata or {}
+            metadata=metadata or {},
+            cached_tokens=cached_tokens
         )
 
         self._cost_metrics.append(metric)
@@ -253,6 +263,7 @@ class MetricsCollector:
         total_cost = sum(m.cost_usd for m in metrics)
         total_input_tokens = sum(m.input_tokens for m in metrics)
         total_output_tokens = sum(m.output_tokens for m in metrics)
+        total_cached_tokens = sum(m.cached_tokens for m in metrics)
         cache_hits = sum(1 for m in metrics if m.cache_hit)
         cache_hit_rate = (cache_hits / len(metrics)) * 100 if metrics else 0
 
@@ -265,11 +276,57 @@ class MetricsCollector:
             "total_input_tokens": total_input_tokens,
             "total_output_tokens": total_output_tokens,
             "total_tokens": total_input_tokens + total_output_tokens,
+            "total_cached_tokens": total_cached_tokens,
             "cache_hit_rate_percent": round(cache_hit_rate, 2),
             "projected_daily_cost_usd": round(total_cost * (1440 / time_window_minutes), 2),
             "projected_monthly_cost_usd": round(total_cost * (1440 / time_window_minutes) * 30, 2)
         }
 
+    def get_token_usage_stats(
+        self,
+        group_by: str = "endpoint",
+        time_window_minutes: int = 60
+    ) -> Dict[str, Any]:
+        """
+        Get token usage and latency aggregated by a metadata tag.
+
+        Args:
+            group_by: Metadata key to group on ("endpoint", "call_site", "model", "provider")
+            time_window_minutes: Time window (default 60min)
+
+        Returns:
+            Dict with per-group calls, tokens, cost and latency percentiles
+        """
+        cutoff = datetime.utcnow() - timedelta(minutes=time_window_minutes)
+
+        groups: Dict[str, List[CostMetric]] = defaultdict(list)
+        for m in self._cost_metrics:
+            if m.timestamp >= cutoff:
+                groups[m.metadata.get(group_by, "unknown")].append(m)
+
+        usage = {}
+        for key, metrics in groups.items():
+            latencies = [m.metadata["latency_ms"] for m in metrics if "latency_ms" in m.metadata]
+            input_tokens = sum(m.input_tokens for m in metrics)
+            cached_tokens = sum(m.cached_tokens for m in metrics)
+            usage[key] = {
+                "calls": len(metrics),
+                "input_tokens": input_tokens,
+                "output_tokens": sum(m.output_tokens for m in metrics),
+                "cached_tokens": cached_tokens,
+                "cached_input_percent": round((cached_tokens / input_tokens) * 100, 2) if input_tokens else 0,
+                "avg_input_tokens": round(input_tokens / len(metrics), 1),
+                "total_cost_usd": round(sum(m.cost_usd for m in metrics), 6),
+                "avg_latency_ms": round(statistics.mean(latencies), 2) if latencies else None,
+                "p95_latency_ms": round(self._percentile(latencies, 0.95), 2) if latencies else None,
+            }
+
+        return {
+            "group_by": group_by,
+            "time_window_minutes": time_window_minutes,
+            "groups": dict(sorted(usage.items(), key=lambda x: x[1]["input_tokens"], reverse=True))
+        }
+
     # ========================================
     # Quality Tracking
     # ========================================
@@ -478,6 +535,7 @@ class MetricsCollector:
                 "top_operations": self._get_top_operations(limit=5)
             },
             "costs": self.get_cost_stats(time_window_minutes=time_window_minutes),
+            "token_usage": self.get_token_usage_stats(time_window_minutes=time_window_minutes),
             "quality": self.get_quality_stats(time_window_minutes=time_window_minutes),
             "cache": self.get_cache_stats(),
             "errors": self.get_error_stats(),
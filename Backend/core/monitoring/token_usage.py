@@ -0,0 +1,166 @@
+"""
+Token Usage Accounting from Provider Usage Metadata.
+
+Every LLM call reports its real token counts back to the MetricsCollector,
+tagged with call site, endpoint, model and provider, so cost and latency
+budgets are based on what providers actually billed rather than estimates.
+
+Sources:
+- Gemini: response.usage_metadata (prompt / candidates / cached_content token counts)
+- OpenAI: response.usage (prompt / completion tokens, prompt_tokens_details.cached_tokens)
+- LangChain: AIMessage.usage_metadata via TokenUsageCallbackHandler
+
+The current endpoint is carried in a ContextVar set by HTTP middleware, so
+deep call sites do not need to thread request info through their signatures.
+"""
+
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+
+from core.config.logging_config import logger
+from core.config.settings import settings
+from core.monitoring.metrics_collector import get_metrics_collector
+
+
+# Endpoint path of the request currently being served (set by middleware)
+current_endpoint: ContextVar[Optional[str]] = ContextVar("current_endpoint", default=None)
+
+
+@dataclass
+class TokenUsage:
+    """Token counts reported by a provider for a single call."""
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cached_tokens: int = 0
+
+    @classmethod
+    def from_gemini(cls, response: Any) -> "TokenUsage":
+        """Extract usage from a google-genai GenerateContentResponse (or stream chunk)."""
+        meta = getattr(response, "usage_metadata", None)
+        if meta is None:
+            return cls()
+        return cls(
+            input_tokens=meta.prompt_token_count or 0,
+            output_tokens=meta.candidates_token_count or 0,
+            cached_tokens=meta.cached_content_token_count or 0,
+        )
+
+    @classmethod
+    def from_openai(cls, response: Any) -> "TokenUsage":
+        """Extract usage from an OpenAI ChatCompletion (or final stream chunk)."""
+        usage = getattr(response, "usage", None)
+        if usage is None:
+            return cls()
+        details = getattr(usage, "prompt_tokens_details", None)
+        return cls(
+            input_tokens=usage.prompt_tokens or 0,
+            output_tokens=usage.completion_tokens or 0,
+            cached_tokens=(getattr(details, "cached_tokens", None) or 0) if details else 0,
+        )
+
+    @classmethod
+    def from_langchain(cls, usage_metadata: Optional[Dict[str, Any]]) -> "TokenUsage":
+        """Extract usage from a LangChain AIMessage.usage_metadata dict."""
+        if not usage_metadata:
+            return cls()
+        details = usage_metadata.get("input_token_details") or {}
+        return cls(
+            input_tokens=usage_metadata.get("input_tokens", 0) or 0,
+            output_tokens=usage_metadata.get("output_tokens", 0) or 0,
+            cached_tokens=details.get("cache_read", 0) or 0,
+        )
+
+
+def record_token_usage(
+    usage: TokenUsage,
+    call_site: str,
+    model: str,
+    provider: str,
+    latency_ms: float,
+) -> None:
+    """
+    Record a completed LLM call with the MetricsCollector.
+
+    NON-BLOCKING: metrics failures are logged and never affect the LLM call.
+
+    Args:
+        usage: Token counts reported by the provider
+        call_site: Tag of the call site that issued the call (e.g. "parse_jd")
+        model: Model name
+        provider: "gemini" or "openai"
+        latency_ms: Wall time of the call including retries
+    """
+    if not settings.enable_metrics:
+        return
+
+    try:
+        get_metrics_collector().record_llm_cost(
+            operation=call_site,
+            input_tokens=usage.input_tokens,
+            output_tokens=usage.output_tokens,
+            cache_hit=usage.cached_tokens > 0,
+            cached_tokens=usage.cached_tokens,
+            metadata={
+                "call_site": call_site,
+                "endpoint": current_endpoint.get() or "background",
+                "model": model,
+                "provider": provider,
+                "latency_ms": round(latency_ms, 2),
+            },
+        )
+    except Exception as e:
+        logger.warning(f"Failed to record token usage for {call_site}: {e}")
+
+
+class TokenUsageCallbackHandler(BaseCallbackHandler):
+    """
+    LangChain callback that records provider usage for every chat model run.
+
+    The call site defaults to the LLM mode (e.g. "langchain:fast"); chains can
+    override it with `config={"metadata": {"call_site": "..."}}`.
+    """
+
+    # Run synchronously in the caller's context so current_endpoint is visible
+    run_inline = True
+
+    def __init__(self, mode: str, provider: str, model: str):
+        self.mode = mode
+        self.provider = provider
+        self.model = model
+        self._runs: Dict[UUID, tuple] = {}
+
+    def on_chat_model_start(self, serialized, messages, *, run_id: UUID, metadata=None, **kwargs) -> None:
+        call_site = (metadata or {}).get("call_site") or f"langchain:{self.mode}"
+        self._runs[run_id] = (time.time(), call_site)
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs) -> None:
+        start_time, call_site = self._runs.pop(run_id, (None, f"langchain:{self.mode}"))
+        latency_ms = (time.time() - start_time) * 1000 if start_time else 0.0
+
+        usage = TokenUsage()
+        for generations in response.generations:
+            for generation in generations:
+                message = getattr(generation, "message", None)
+                run_usage = TokenUsage.from_langchain(getattr(message, "usage_metadata", None))
+                usage.input_tokens += run_usage.input_tokens
+                usage.output_tokens += run_usage.output_tokens
+                usage.cached_tokens += run_usage.cached_tokens
+
+        record_token_usage(usage, call_site, self.model, self.provider, latency_ms)
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs) -> None:
+        self._runs.pop(run_id, None)
+
+
+__all__ = [
+    'TokenUsage',
+    'TokenUsageCallbackHandler',
+    'current_endpoint',
+    'record_token_usage',
+]
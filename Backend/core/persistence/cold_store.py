@@ -0,0 +1,275 @@
+"""
+Postgres Cold Tier for parse and score results.
+
+Parse and score results used to live in Redis for 30 days, which made Redis
+the most expensive memory in the stack. With a database configured they are
+also kept here, so Redis only needs to hold the hot set (settings.result_hot_ttl):
+
+- Writes are write-behind: put() only buffers the entry; a background task
+  upserts the buffer in batches every cold_tier_flush_interval seconds (or
+  sooner once cold_tier_batch_size entries are pending).
+- A Redis miss reads through to Postgres (read_session, bounded by
+  cold_tier_read_timeout) and the caller re-promotes the entry to Redis.
+- Values are the cached JSON bytes, compressed by cache.compressor above its
+  size threshold but never with a zstd dictionary (dictionaries live in Redis,
+  these rows outlive it), in a BYTEA column keyed by
+  (namespace, cache_key). Rows older than result_cache_ttl are ignored and
+  pruned at startup, so results stay valid exactly as long as before.
+- Parsed documents (doc:<doc_id>) are not tiered: a parse result read back
+  from here re-stores its document (core.caching.result_cache), so the
+  doc_id it returns resolves again.
+
+Without a database (or when it is unreachable) every call is a no-op and
+Redis keeps the full result_cache_ttl, as before.
+"""
+
+import asyncio
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import bindparam, text
+
+from core.caching.cache import get_cache
+from core.config.logging_config import logger
+from core.config.settings import settings
+from core.persistence.async_database import get_db_manager
+
+TABLE = "result_cold_store"
+
+_CREATE_TABLE = f"""
+CREATE TABLE IF NOT EXISTS {TABLE} (
+    namespace TEXT NOT NULL,
+    cache_key TEXT NOT NULL,
+    value BYTEA NOT NULL,
+    created_at TIMESTAMPTZ NOT NULL,
+    PRIMARY KEY (namespace, cache_key)
+)
+"""
+_CREATE_INDEX = f"CREATE INDEX IF NOT EXISTS {TABLE}_created_at_idx ON {TABLE} (created_at)"
+
+_UPSERT = text(f"""
+INSERT INTO {TABLE} (namespace, cache_key, value, created_at)
+VALUES (:namespace, :cache_key, :value, :created_at)
+ON CONFLICT (namespace, cache_key) DO UPDATE SET value = EXCLUDED.value, created_at = EXCLUDED.created_at
+""")
+
+# namespace leads the primary key: constraining it keeps reads on the index
+_SELECT = text(
+    f"SELECT cache_key, value FROM {TABLE} "
+    f"WHERE namespace = :namespace AND cache_key IN :keys AND created_at > :cutoff"
+).bindparams(bindparam("keys", expanding=True))
+
+_PRUNE = text(f"DELETE FROM {TABLE} WHERE created_at <= :cutoff")
+
+
+def key_namespace(cache_key: str) -> str:
+    """Namespace of a cache key ("parse:jd:<md5>:english" -> "parse")."""
+    return cache_key.split(":", 1)[0]
+
+
+class ColdResultStore:
+    """Write-behind, read-through Postgres tier behind the Redis result cache."""
+
+    def __init__(self, db_manager=None):
+        """
+        Args:
+            db_manager: AsyncDatabaseManager (default: the global one, resolved in start())
+        """
+        self._db = db_manager
+        self._compressor = get_cache().compressor
+        self._enabled = False
+        self._pending: "OrderedDict[str, bytes]" = OrderedDict()  # cache_key -> stored (encoded) value
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._stats = {
+            "reads": 0,
+            "hits": 0,
+            "read_errors": 0,
+            "writes": 0,
+            "flushes": 0,
+            "write_errors": 0,
+            "dropped": 0,
+        }
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    @property
+    def hot_ttl(self) -> int:
+        """Redis TTL for parse/score results: short while the cold tier holds them, else the full result TTL."""
+        return settings.result_hot_ttl if self._enabled else settings.result_cache_ttl
+
+    def _cutoff(self) -> datetime:
+        return datetime.now(timezone.utc) - timedelta(seconds=settings.result_cache_ttl)
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    async def start(self) -> bool:
+        """Create the table, prune expired rows and start the flush loop (no-op without a database)."""
+        if self._enabled or not settings.cold_tier_enabled or not settings.database_url:
+            return self._enabled
+
+        try:
+            self._db = self._db or await get_db_manager()
+            if not self._db.is_initialized:
+                return False
+            async with self._db.session() as session:
+                await session.execute(text(_CREATE_TABLE))
+                await session.execute(text(_CREATE_INDEX))
+                pruned = await session.execute(_PRUNE, {"cutoff": self._cutoff()})
+            self._enabled = True
+            self._task = asyncio.create_task(self._flush_loop())
+            logger.info(f"Cold tier enabled (pruned {pruned.rowcount} expired results, Redis TTL {settings.result_hot_ttl}s)")
+        except Exception as e:
+            logger.warning(f"Cold tier disabled, Redis keeps the full result TTL: {e}")
+            self._enabled = False
+        return self._enabled
+
+    async def stop(self) -> None:
+        """Stop the flush loop and write what is still pending."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._enabled:
+            await self.flush()
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def put(self, cache_key: str, raw: bytes) -> None:
+        """Queue a result for the next batched write (never blocks, never raises)."""
+        if not self._enabled:
+            return
+        self._pending[cache_key] = self._compressor.encode(key_namespace(cache_key), raw, dictionary=False)
+        self._pending.move_to_end(cache_key)
+        while len(self._pending) > settings.cold_tier_max_pending:
+            self._pending.popitem(last=False)
+            self._stats["dropped"] += 1
+        if len(self._pending) >= settings.cold_tier_batch_size:
+            self._wake.set()
+
+    async def flush(self) -> int:
+        """Upsert every pending result in one batch. Returns the number written."""
+        if not self._pending:
+            return 0
+        batch, self._pending = self._pending, OrderedDict()
+        created_at = datetime.now(timezone.utc)
+        rows = [
+            {"namespace": key_namespace(key), "cache_key": key, "value": value, "created_at": created_at}
+            for key, value in batch.items()
+        ]
+        try:
+            async with self._db.session() as session:
+                await session.execute(_UPSERT, rows)
+            self._stats["writes"] += len(rows)
+            self._stats["flushes"] += 1
+            return len(rows)
+        except Exception as e:
+            # Put the batch back (newer puts for the same keys win) and retry next flush
+            self._stats["write_errors"] += 1
+            logger.warning(f"Cold tier flush of {len(rows)} results failed: {e}")
+            for key, value in batch.items():
+                self._pending.setdefault(key, value)
+            while len(self._pending) > settings.cold_tier_max_pending:
+                self._pending.popitem(last=False)
+                self._stats["dropped"] += 1
+            return 0
+
+    async def _flush_loop(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=settings.cold_tier_flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            await self.flush()
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    async def get(self, cache_key: str) -> Optional[bytes]:
+        """Stored result bytes, or None (also when disabled, slow or failing)."""
+        return (await self.get_many([cache_key])).get(cache_key)
+
+    async def get_many(self, cache_keys: List[str]) -> Dict[str, bytes]:
+        """
+        Stored result bytes for many keys in one query.
+
+        Returns:
+            Dictionary mapping cache key to JSON bytes (only found items)
+        """
+        if not self._enabled or not cache_keys:
+            return {}
+        self._stats["reads"] += len(cache_keys)
+
+        # Written but not flushed yet
+        found = {key: self._pending[key] for key in cache_keys if key in self._pending}
+        remaining = [key for key in cache_keys if key not in found]
+
+        if remaining:
+            try:
+                found.update(await asyncio.wait_for(self._select(remaining), timeout=settings.cold_tier_read_timeout))
+            except Exception as e:
+                self._stats["read_errors"] += 1
+                logger.debug(f"Cold tier read failed: {e}")
+
+        decoded = {key: self._compressor.decode(key_namespace(key), value) for key, value in found.items()}
+        decoded = {key: value for key, value in decoded.items() if value is not None}
+        self._stats["hits"] += len(decoded)
+        return decoded
+
+    async def _select(self, cache_keys: List[str]) -> Dict[str, bytes]:
+        """One primary-key lookup per namespace (a batch is normally a single namespace)."""
+        by_namespace: Dict[str, List[str]] = {}
+        for key in cache_keys:
+            by_namespace.setdefault(key_namespace(key), []).append(key)
+        found = {}
+        cutoff = self._cutoff()
+        async with self._db.read_session() as session:
+            for namespace, keys in by_namespace.items():
+                result = await session.execute(_SELECT, {"namespace": namespace, "keys": keys, "cutoff": cutoff})
+                found.update({row.cache_key: bytes(row.value) for row in result})
+        return found
+
+    # ------------------------------------------------------------------
+    # Stats
+    # ------------------------------------------------------------------
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Read hit rate, write volume and buffer state."""
+        reads = self._stats["reads"]
+        return {
+            "enabled": self._enabled,
+            **self._stats,
+            "hit_rate": round(self._stats["hits"] / reads, 4) if reads else 0.0,
+            "pending": len(self._pending),
+            "redis_ttl": self.hot_ttl,
+        }
+
+
+_cold_store: Optional[ColdResultStore] = None
+
+
+def get_cold_store() -> ColdResultStore:
+    """Get the global cold result store (call start() once the event loop runs)."""
+    global _cold_store
+    if _cold_store is None:
+        _cold_store = ColdResultStore()
+    return _cold_store
+
+
+__all__ = [
+    'ColdResultStore',
+    'get_cold_store',
+    'key_namespace',
+]
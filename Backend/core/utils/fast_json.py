@@ -0,0 +1,43 @@
+"""
+Fast JSON encoding for cache values and raw cached responses.
+
+Uses orjson when it is installed (several times faster than the standard
+library, and it encodes straight to bytes, which is what Redis and HTTP
+responses need). Falls back to the standard json module otherwise, so the
+output is valid JSON either way and both sides can read each other's values.
+
+Content hashes (cache keys, doc_ids) keep using json.dumps(sort_keys=True);
+they must stay byte-identical across versions, so they never go through here.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumpb(obj: Any) -> bytes:
+    """Serialize to JSON bytes (UTF-8)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def dumps(obj: Any) -> str:
+    """Serialize to a JSON string."""
+    return dumpb(obj).decode("utf-8")
+
+
+def loads(data: Union[str, bytes, bytearray, memoryview]) -> Any:
+    """Deserialize JSON from str or bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(bytes(data) if isinstance(data, memoryview) else data)
+
+
+__all__ = ['ORJSON_AVAILABLE', 'dumpb', 'dumps', 'loads']
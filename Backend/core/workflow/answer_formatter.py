@@ -86,8 +86,25 @@ def format_answer(
     model = genai.GenerativeModel('gemini-2.0-flash-exp')
     response = model.generate_content(prompt)
 
+    return parse_formatted_answer(response.text, answer_text)
+
+
+def parse_formatted_answer(response_text: str, answer_text: str) -> FormattedAnswer:
+    """
+    Parse the model's JSON output into a FormattedAnswer.
+
+    Shared by the blocking and streaming formatters so both apply the same
+    markdown stripping and validation to the assembled response.
+
+    Args:
+        response_text: Raw model output (may be wrapped in a markdown code block)
+        answer_text: User's refined answer, stored as raw_answer
+
+    Returns:
+        FormattedAnswer object with type, name, bullet points, etc.
+    """
     # Extract JSON from response
-    response_text = response.text.strip()
+    response_text = response_text.strip()
 
     # Remove markdown code blocks if present
     if response_text.startswith("```json"):
@@ -0,0 +1,473 @@
+"""
+Background Job Queue for bulk work (e.g. scoring many CV/JD pairs).
+
+A job is a list of items processed by a handler registered for the job's kind.
+The client submits once, gets a job_id and polls progress, pages results or
+streams them, instead of looping over a rate-limited endpoint.
+
+- Worker pool: one asyncio.Semaphore per process bounds the items in flight
+  across all jobs (settings.bulk_job_concurrency). LLM calls made by the
+  handler still go through the gateway semaphore, so bulk work never exceeds
+  the provider concurrency interactive requests rely on.
+- Persistence: job metadata, items and per-item results live in Redis when
+  it is configured, otherwise in memory (single node). A result is written as
+  soon as its item finishes.
+- Resume: unfinished jobs stay in an "active" set. A runner holds a renewable
+  lease on its job; on startup, and periodically after that, every process
+  picks up active jobs whose lease expired (process restarted or died) and
+  continues with the items that have no result yet.
+- Cancel: marks the job cancelled; the runner stops at its next check and
+  in-flight items are cancelled.
+"""
+
+import asyncio
+import threading
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from core.config.logging_config import logger
+from core.config.settings import settings
+from core.utils import fast_json
+
+# Job states
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+CANCELLED = "cancelled"
+FINISHED_STATES = (COMPLETED, CANCELLED)
+
+JobHandler = Callable[[Dict[str, Any], Dict[str, Any]], Awaitable[Any]]
+
+# Extend a lease only if we still hold it (atomic: it cannot lapse and change hands in between)
+RENEW_LEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('pexpire', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+
+class InMemoryJobStore:
+    """Job storage for a single process (lost on restart); finished jobs are evicted settings.bulk_job_ttl later."""
+
+    def __init__(self, ttl: Optional[int] = None):
+        self.ttl = ttl or settings.bulk_job_ttl
+        self._meta: Dict[str, Dict[str, Any]] = {}
+        self._items: Dict[str, List[Dict[str, Any]]] = {}
+        self._results: Dict[str, Dict[int, Dict[str, Any]]] = {}
+        self._leases: Dict[str, tuple] = {}
+        self._expires: Dict[str, float] = {}  # Finished job -> time.monotonic() it is evicted at
+        self._lock = threading.Lock()
+
+    def _evict(self, job_id: str) -> None:
+        for entries in (self._meta, self._items, self._results, self._leases, self._expires):
+            entries.pop(job_id, None)
+
+    def create(self, meta: Dict[str, Any], items: List[Dict[str, Any]]) -> None:
+        with self._lock:
+            self._meta[meta["job_id"]] = dict(meta)
+            self._items[meta["job_id"]] = list(items)
+            self._results[meta["job_id"]] = {}
+
+    def get_meta(self, job_id: str) -> Optional[Dict[str, Any]]:
+        expires = self._expires.get(job_id)
+        if expires is not None and expires <= time.monotonic():
+            with self._lock:
+                self._evict(job_id)
+            return None
+        meta = self._meta.get(job_id)
+        return dict(meta) if meta is not None else None
+
+    def update_meta(self, job_id: str, **fields: Any) -> None:
+        with self._lock:
+            if job_id in self._meta:
+                self._meta[job_id].update(fields, updated_at=time.time())
+
+    def increment(self, job_id: str, field: str) -> None:
+        with self._lock:
+            if job_id in self._meta:
+                self._meta[job_id][field] += 1
+                self._meta[job_id]["updated_at"] = time.time()
+
+    def get_items(self, job_id: str) -> List[Dict[str, Any]]:
+        return list(self._items.get(job_id, []))
+
+    def set_result(self, job_id: str, index: int, result: Dict[str, Any]) -> None:
+        self._results.setdefault(job_id, {})[index] = result
+
+    def get_results(self, job_id: str, indexes: List[int]) -> Dict[int, Dict[str, Any]]:
+        results = self._results.get(job_id, {})
+        return {index: results[index] for index in indexes if index in results}
+
+    def result_indexes(self, job_id: str) -> set:
+        return set(self._results.get(job_id, {}))
+
+    def active_job_ids(self) -> List[str]:
+        return [job_id for job_id, meta in self._meta.items() if meta["status"] not in FINISHED_STATES]
+
+    def acquire_lease(self, job_id: str, owner: str, ttl: float) -> bool:
+        with self._lock:
+            holder = self._leases.get(job_id)
+            if holder and holder[0] != owner and holder[1] > time.time():
+                return False
+            self._leases[job_id] = (owner, time.time() + ttl)
+            return True
+
+    def release_lease(self, job_id: str, owner: str) -> None:
+        with self._lock:
+            if self._leases.get(job_id, (None,))[0] == owner:
+                self._leases.pop(job_id, None)
+
+    def finish(self, job_id: str) -> None:
+        now = time.monotonic()
+        with self._lock:
+            if job_id in self._meta:
+                self._expires[job_id] = now + self.ttl
+            for expired in [job for job, expires in self._expires.items() if expires <= now]:
+                self._evict(expired)
+
+
+class RedisJobStore:
+    """
+    Job storage shared by all workers and surviving restarts.
+
+    Keys (all expire settings.bulk_job_ttl after the last write):
+        bulkjob:{id}          hash of metadata fields (counters via HINCRBY)
+        bulkjob:{id}:items    list of JSON items
+        bulkjob:{id}:results  hash index -> JSON result
+        bulkjob:{id}:lease    owner of the running job (SET NX PX)
+        bulkjob:active        set of unfinished job IDs
+    """
+
+    ACTIVE_KEY = "bulkjob:active"
+    INT_FIELDS = ("total", "completed", "failed")
+    FLOAT_FIELDS = ("created_at", "updated_at")
+
+    def __init__(self, client, ttl: Optional[int] = None):
+        self.client = client
+        self.ttl = ttl or settings.bulk_job_ttl
+        self._renew_lease = client.register_script(RENEW_LEASE_SCRIPT)
+
+    def _expire(self, job_id: str) -> None:
+        pipe = self.client.pipeline()
+        for key in (f"bulkjob:{job_id}", f"bulkjob:{job_id}:items", f"bulkjob:{job_id}:results"):
+            pipe.expire(key, self.ttl)
+        pipe.execute()
+
+    def create(self, meta: Dict[str, Any], items: List[Dict[str, Any]]) -> None:
+        job_id = meta["job_id"]
+        pipe = self.client.pipeline()
+        pipe.hset(f"bulkjob:{job_id}", mapping={
+            key: fast_json.dumps(value) if isinstance(value, dict) else value for key, value in meta.items()
+        })
+        if items:
+            pipe.rpush(f"bulkjob:{job_id}:items", *[fast_json.dumps(item) for item in items])
+        pipe.sadd(self.ACTIVE_KEY, job_id)
+        pipe.execute()
+        self._expire(job_id)
+
+    def get_meta(self, job_id: str) -> Optional[Dict[str, Any]]:
+        raw = self.client.hgetall(f"bulkjob:{job_id}")
+        if not raw:
+            return None
+        meta = {k.decode(): v.decode() for k, v in raw.items()}
+        for key in self.INT_FIELDS:
+            meta[key] = int(meta.get(key, 0))
+        for key in self.FLOAT_FIELDS:
+            meta[key] = float(meta.get(key, 0))
+        meta["params"] = fast_json.loads(meta.get("params") or "{}")
+        return meta
+
+    def update_meta(self, job_id: str, **fields: Any) -> None:
+        self.client.hset(f"bulkjob:{job_id}", mapping={**fields, "updated_at": time.time()})
+
+    def increment(self, job_id: str, field: str) -> None:
+        pipe = self.client.pipeline()
+        pipe.hincrby(f"bulkjob:{job_id}", field, 1)
+        pipe.hset(f"bulkjob:{job_id}", "updated_at", time.time())
+        pipe.execute()
+
+    def get_items(self, job_id: str) -> List[Dict[str, Any]]:
+        return [fast_json.loads(item) for item in self.client.lrange(f"bulkjob:{job_id}:items", 0, -1)]
+
+    def set_result(self, job_id: str, index: int, result: Dict[str, Any]) -> None:
+        self.client.hset(f"bulkjob:{job_id}:results", index, fast_json.dumps(result))
+
+    def get_results(self, job_id: str, indexes: List[int]) -> Dict[int, Dict[str, Any]]:
+        if not indexes:
+            return {}
+        values = self.client.hmget(f"bulkjob:{job_id}:results", indexes)
+        return {index: fast_json.loads(value) for index, value in zip(indexes, values) if value is not None}
+
+    def result_indexes(self, job_id: str) -> set:
+        return {int(index) for index in self.client.hkeys(f"bulkjob:{job_id}:results")}
+
+    def active_job_ids(self) -> List[str]:
+        return [job_id.decode() for job_id in self.client.smembers(self.ACTIVE_KEY)]
+
+    def acquire_lease(self, job_id: str, owner: str, ttl: float) -> bool:
+        key = f"bulkjob:{job_id}:lease"
+        # Milliseconds: sub-second leases would round to an invalid EX of 0
+        ttl_ms = max(int(ttl * 1000), 1)
+        if self.client.set(key, owner, nx=True, px=ttl_ms):
+            return True
+        return bool(self._renew_lease(keys=[key], args=[owner, ttl_ms]))  # Renew our own lease
+
+    def release_lease(self, job_id: str, owner: str) -> None:
+        key = f"bulkjob:{job_id}:lease"
+        holder = self.client.get(key)
+        if holder is not None and holder.decode() == owner:
+            self.client.delete(key)
+
+    def finish(self, job_id: str) -> None:
+        self.client.srem(self.ACTIVE_KEY, job_id)
+        self._expire(job_id)
+
+
+class JobQueue:
+    """
+    Runs submitted jobs on a bounded worker pool.
+
+    Usage:
+        queue = get_job_queue()
+        queue.register_handler("score", score_item)   # async (item, params) -> JSON result
+        await queue.start()                             # resume unfinished jobs
+        job_id = await queue.submit("score", items, {"language": "english"})
+        queue.get_job(job_id)["completed"]
+    """
+
+    def __init__(self, store=None, concurrency: Optional[int] = None, lease_seconds: Optional[float] = None):
+        self.store = store if store is not None else self._default_store()
+        self.concurrency = concurrency or settings.bulk_job_concurrency
+        self.lease_seconds = lease_seconds or settings.bulk_job_lease_seconds
+        self.owner = uuid.uuid4().hex
+        self._handlers: Dict[str, JobHandler] = {}
+        self._runners: Dict[str, asyncio.Task] = {}
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._sweeper: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def _default_store():
+        from core.config.clients import get_redis_client
+        client = get_redis_client()
+        if client is not None:
+            logger.info("Bulk jobs persisted in Redis (shared, resumable)")
+            return RedisJobStore(client)
+        logger.info("Bulk jobs kept in memory (single node, lost on restart)")
+        return InMemoryJobStore()
+
+    def register_handler(self, kind: str, handler: JobHandler) -> None:
+        """Register the coroutine that processes one item of a job kind."""
+        self._handlers[kind] = handler
+
+    async def start(self) -> None:
+        """Resume unfinished jobs and keep taking over jobs whose runner died."""
+        self._resume_orphaned()
+        if self._sweeper is None or self._sweeper.done():
+            self._sweeper = asyncio.create_task(self._sweep(), name="job-queue-sweeper")
+
+    async def stop(self) -> None:
+        """Stop local runners (jobs stay active and resume elsewhere or on restart)."""
+        tasks = [task for task in (self._sweeper, *self._runners.values()) if task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._sweeper = None
+
+    async def submit(self, kind: str, items: List[Dict[str, Any]], params: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Create a job and start processing it in the background.
+
+        Returns:
+            job_id
+
+        Raises:
+            ValueError: Unknown job kind
+        """
+        if kind not in self._handlers:
+            raise ValueError(f"No handler registered for job kind '{kind}'")
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        self.store.create({
+            "job_id": job_id,
+            "kind": kind,
+            "status": QUEUED,
+            "total": len(items),
+            "completed": 0,
+            "failed": 0,
+            "created_at": now,
+            "updated_at": now,
+            "params": params or {},
+        }, items)
+        self._start_runner(job_id)
+        return job_id
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Job metadata with progress, or None if unknown/expired."""
+        meta = self.store.get_meta(job_id)
+        if meta is None:
+            return None
+        done = meta["completed"] + meta["failed"]
+        meta["progress"] = round(done / meta["total"], 4) if meta["total"] else 1.0
+        return meta
+
+    def get_results(self, job_id: str, offset: int = 0, limit: int = 50) -> List[Dict[str, Any]]:
+        """Per-item results for items offset..offset+limit (unfinished items are 'pending')."""
+        meta = self.store.get_meta(job_id)
+        if meta is None:
+            return []
+        indexes = list(range(max(offset, 0), min(offset + limit, meta["total"])))
+        results = self.store.get_results(job_id, indexes)
+        return [results.get(index, {"index": index, "status": "pending"}) for index in indexes]
+
+    def finished_results(self, job_id: str, exclude: set) -> List[Dict[str, Any]]:
+        """Results of finished items not in `exclude`, in item order (for streaming)."""
+        new_indexes = sorted(self.store.result_indexes(job_id) - exclude)
+        results = self.store.get_results(job_id, new_indexes)
+        return [results[index] for index in new_indexes if index in results]
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a job. Returns False if it is unknown or already finished."""
+        meta = self.store.get_meta(job_id)
+        if meta is None or meta["status"] in FINISHED_STATES:
+            return False
+        self.store.update_meta(job_id, status=CANCELLED)
+        self.store.finish(job_id)
+        runner = self._runners.get(job_id)
+        if runner is not None:
+            runner.cancel()
+        return True
+
+    def _start_runner(self, job_id: str) -> None:
+        if job_id in self._runners or not self.store.acquire_lease(job_id, self.owner, self.lease_seconds):
+            return
+        task = asyncio.create_task(self._run(job_id), name=f"job:{job_id}")
+        self._runners[job_id] = task
+        task.add_done_callback(lambda _: self._runners.pop(job_id, None))
+
+    def _resume_orphaned(self) -> None:
+        for job_id in self.store.active_job_ids():
+            if job_id not in self._runners:
+                meta = self.store.get_meta(job_id)
+                if meta is None or meta["kind"] not in self._handlers:
+                    continue
+                before = len(self._runners)
+                self._start_runner(job_id)
+                if len(self._runners) > before:
+                    logger.info(f"Resuming bulk job {job_id} ({meta['completed'] + meta['failed']}/{meta['total']} done)")
+
+    async def _sweep(self) -> None:
+        while True:
+            await asyncio.sleep(self.lease_seconds)
+            try:
+                self._resume_orphaned()
+            except Exception as e:
+                logger.warning(f"Bulk job sweep failed: {e}")
+
+    async def _run(self, job_id: str) -> None:
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.concurrency)
+        meta = self.store.get_meta(job_id)
+        if meta is None:
+            # Expired or deleted between scheduling and start
+            logger.warning(f"Bulk job {job_id} no longer exists, not running it")
+            self.store.finish(job_id)
+            self.store.release_lease(job_id, self.owner)
+            return
+        handler = self._handlers[meta["kind"]]
+        items = self.store.get_items(job_id)
+        done = self.store.result_indexes(job_id)
+        pending = [index for index in range(len(items)) if index not in done]
+        self.store.update_meta(job_id, status=RUNNING)
+        start = time.time()
+
+        async def _process(index: int) -> None:
+            async with self._slots:
+                try:
+                    result = {"index": index, "status": "ok", "result": await handler(items[index], meta["params"])}
+                    counter = "completed"
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    result = {"index": index, "status": "error", "error": str(e) or type(e).__name__}
+                    counter = "failed"
+                self.store.set_result(job_id, index, result)
+                self.store.increment(job_id, counter)
+
+        released = False  # Set when the heartbeat stops the workers (job gone, cancelled or lease lost)
+
+        async def _heartbeat(workers: asyncio.Task) -> None:
+            # Renew the lease and notice cancellation requested through another worker
+            nonlocal released
+            while True:
+                await asyncio.sleep(self.lease_seconds / 3)
+                current = self.store.get_meta(job_id)
+                if current is None or current["status"] == CANCELLED or \
+                        not self.store.acquire_lease(job_id, self.owner, self.lease_seconds):
+                    released = True
+                    workers.cancel()
+                    return
+
+        workers = asyncio.ensure_future(asyncio.gather(*(_process(index) for index in pending)))
+        heartbeat = asyncio.create_task(_heartbeat(workers))
+        try:
+            await workers
+            # Another process may have cancelled it since the last heartbeat: keep CANCELLED
+            current = self.store.get_meta(job_id)
+            if current is None or current["status"] == CANCELLED:
+                logger.info(f"Bulk job {job_id} was cancelled while its last items finished")
+                return
+            self.store.update_meta(job_id, status=COMPLETED)
+            self.store.finish(job_id)
+            self._record_metrics(job_id, len(pending), time.time() - start)
+        except asyncio.CancelledError:
+            workers.cancel()
+            logger.info(f"Bulk job {job_id} stopped")
+            # Only the heartbeat's own stop ends here; stop() / cancel() must see the cancellation
+            if not released:
+                raise
+        finally:
+            heartbeat.cancel()
+            self.store.release_lease(job_id, self.owner)
+
+    def _record_metrics(self, job_id: str, processed: int, elapsed: float) -> None:
+        """One performance sample per finished job. Metrics never fail the job."""
+        try:
+            from core.monitoring.metrics_collector import get_metrics_collector
+            meta = self.store.get_meta(job_id)
+            get_metrics_collector().record_performance(
+                operation=f"bulk_job.{meta['kind']}",
+                duration_ms=elapsed * 1000,
+                metadata={
+                    "success": meta["failed"] == 0,
+                    "items": processed,
+                    "failed": meta["failed"],
+                    "items_per_second": round(processed / elapsed, 2) if elapsed > 0 else None,
+                }
+            )
+        except Exception as e:
+            logger.debug(f"Bulk job metrics not recorded: {e}")
+
+
+_job_queue: Optional[JobQueue] = None
+
+
+def get_job_queue() -> JobQueue:
+    """Get the process-wide job queue."""
+    global _job_queue
+    if _job_queue is None:
+        _job_queue = JobQueue()
+    return _job_queue
+
+
+__all__ = [
+    'CANCELLED',
+    'COMPLETED',
+    'InMemoryJobStore',
+    'JobQueue',
+    'QUEUED',
+    'RUNNING',
+    'RedisJobStore',
+    'get_job_queue',
+]
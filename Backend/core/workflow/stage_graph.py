@@ -0,0 +1,254 @@
+"""
+Async Stage Graph Executor.
+
+Runs a pipeline expressed as a dependency graph of stages. Every stage starts
+as soon as the stages it depends on have finished, so independent work
+(e.g. TOON conversion, embedding similarity and industry/role classification
+in calculate-score) overlaps instead of running in sequence.
+
+Each stage carries:
+- deps:     names of stages whose results it receives as keyword arguments
+- timeout:  its own limit, clamped to the request deadline
+- fallback: value (or zero-arg callable) used if it fails or times out;
+            without one, the failure cancels the run and is raised (a
+            timeout as DeadlineExceededError when the request deadline
+            cut it short, else as a TimeoutError naming the stage)
+- blocking: sync function run in a worker thread instead of the event loop
+
+Every run produces a timing span per stage (start/end offset from the run
+start, time spent waiting on dependencies, outcome) and the critical path:
+the dependency chain that determined the total duration. Spans are recorded
+with the metrics collector as "<graph>.stage.<name>" so the critical path is
+visible in the performance metrics.
+"""
+
+import asyncio
+import inspect
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from core.config.deadline import DeadlineExceededError, bounded_timeout, deadline_exceeded
+from core.config.logging_config import logger
+
+# Sentinel: the stage has no fallback and its failure fails the run
+NO_FALLBACK = object()
+
+
+@dataclass
+class Stage:
+    """One node of a StageGraph."""
+    name: str
+    fn: Callable[..., Any]
+    deps: Tuple[str, ...] = ()
+    timeout: Optional[float] = None
+    fallback: Any = NO_FALLBACK
+    blocking: bool = False
+
+
+@dataclass
+class StageSpan:
+    """Timing of one stage within a run (offsets in ms from the run start)."""
+    name: str
+    deps: Tuple[str, ...]
+    ready_ms: float = 0.0       # All dependencies finished
+    end_ms: float = 0.0
+    status: str = "pending"     # ok | fallback | timeout | error | cancelled
+    error: Optional[str] = None
+
+    @property
+    def duration_ms(self) -> float:
+        return max(self.end_ms - self.ready_ms, 0.0)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "ready_ms": round(self.ready_ms, 1),
+            "end_ms": round(self.end_ms, 1),
+            "duration_ms": round(self.duration_ms, 1),
+            "status": self.status,
+            **({"error": self.error} if self.error else {}),
+        }
+
+
+@dataclass
+class StageGraphRun:
+    """Results and timing of one graph execution."""
+    results: Dict[str, Any]
+    spans: Dict[str, StageSpan]
+    total_ms: float
+    critical_path: List[str] = field(default_factory=list)
+
+    @property
+    def degraded(self) -> bool:
+        """True if any stage fell back instead of producing its own result."""
+        return any(span.status != "ok" for span in self.spans.values())
+
+    def summary(self) -> str:
+        """One-line critical path, e.g. 'similarity 1840ms -> category_scores 2ms -> ...'."""
+        return " -> ".join(f"{name} {self.spans[name].duration_ms:.0f}ms" for name in self.critical_path)
+
+
+class StageGraph:
+    """
+    Dependency graph of async (or blocking) stages.
+
+    Usage:
+        graph = StageGraph("calculate_score")
+        graph.add("toon", to_toon_both, blocking=True)
+        graph.add("similarity", compute_similarity, blocking=True, timeout=20)
+        graph.add("scores", build_scores, deps=("similarity",))
+        run = await graph.run()
+        run.results["scores"]
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.stages: Dict[str, Stage] = {}
+
+    def add(
+        self,
+        name: str,
+        fn: Callable[..., Any],
+        deps: Tuple[str, ...] = (),
+        timeout: Optional[float] = None,
+        fallback: Any = NO_FALLBACK,
+        blocking: bool = False,
+    ) -> "StageGraph":
+        """Register a stage. Dependencies must be registered first (keeps the graph acyclic)."""
+        if name in self.stages:
+            raise ValueError(f"Stage '{name}' already registered in {self.name}")
+        missing = [dep for dep in deps if dep not in self.stages]
+        if missing:
+            raise ValueError(f"Stage '{name}' depends on unknown stages: {missing}")
+        self.stages[name] = Stage(name, fn, tuple(deps), timeout, fallback, blocking)
+        return self
+
+    async def run(self, on_stage_complete: Optional[Callable[[str, Any], None]] = None) -> StageGraphRun:
+        """
+        Execute every stage as early as its dependencies allow.
+
+        Args:
+            on_stage_complete: Called with (name, result) as each stage finishes
+                (including fallbacks), e.g. to stream partial results
+
+        Returns:
+            StageGraphRun with per-stage results, spans and the critical path
+
+        Raises:
+            Exception: The first failure of a stage without a fallback
+                (all other running stages are cancelled)
+        """
+        run_start = time.time()
+        spans = {name: StageSpan(name, stage.deps) for name, stage in self.stages.items()}
+        tasks: Dict[str, asyncio.Task] = {}
+
+        def _offset_ms() -> float:
+            return (time.time() - run_start) * 1000
+
+        async def _run_stage(stage: Stage) -> Any:
+            result = await _execute(stage)
+            if on_stage_complete is not None:
+                on_stage_complete(stage.name, result)
+            return result
+
+        async def _execute(stage: Stage) -> Any:
+            dep_results = {dep: await tasks[dep] for dep in stage.deps}
+            span = spans[stage.name]
+            span.ready_ms = _offset_ms()
+            try:
+                if stage.blocking:
+                    call = asyncio.to_thread(stage.fn, **dep_results)
+                else:
+                    call = stage.fn(**dep_results)
+                    if not inspect.isawaitable(call):
+                        span.status = "ok"
+                        return call
+                timeout = bounded_timeout(stage.timeout)
+                result = await (asyncio.wait_for(call, timeout) if timeout is not None else call)
+                span.status = "ok"
+                return result
+            except asyncio.CancelledError:
+                span.status = "cancelled"
+                raise
+            except Exception as e:
+                timed_out = isinstance(e, asyncio.TimeoutError)
+                span.status = "timeout" if timed_out else "error"
+                span.error = str(e) or type(e).__name__
+                if stage.fallback is NO_FALLBACK:
+                    if not timed_out:
+                        raise
+                    # Name the stage instead of re-raising a bare TimeoutError
+                    if deadline_exceeded():
+                        raise DeadlineExceededError(f"Request deadline exceeded during stage '{stage.name}'") from None
+                    raise asyncio.TimeoutError(f"Stage '{stage.name}' timed out after {stage.timeout}s") from None
+                logger.warning(f"{self.name}: stage '{stage.name}' {span.status} ({span.error}), using fallback")
+                span.status = "fallback"
+                return stage.fallback() if callable(stage.fallback) else stage.fallback
+            finally:
+                span.end_ms = _offset_ms()
+
+        # Registration order is a topological order (deps are registered first)
+        for name, stage in self.stages.items():
+            tasks[name] = asyncio.create_task(_run_stage(stage), name=f"{self.name}:{name}")
+
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+
+        run = StageGraphRun(
+            results={name: task.result() for name, task in tasks.items()},
+            spans=spans,
+            total_ms=_offset_ms(),
+        )
+        run.critical_path = self._critical_path(spans)
+        self._record_metrics(run)
+        return run
+
+    @staticmethod
+    def _critical_path(spans: Dict[str, StageSpan]) -> List[str]:
+        """Walk back from the last stage to finish through the dependency that finished last."""
+        if not spans:
+            return []
+        current = max(spans.values(), key=lambda s: s.end_ms)
+        path = [current.name]
+        while current.deps:
+            current = max((spans[dep] for dep in current.deps), key=lambda s: s.end_ms)
+            path.append(current.name)
+        return list(reversed(path))
+
+    def _record_metrics(self, run: StageGraphRun) -> None:
+        """Record one performance sample per stage plus the run. Metrics never fail the run."""
+        try:
+            from core.monitoring.metrics_collector import get_metrics_collector
+            metrics = get_metrics_collector()
+            for name, span in run.spans.items():
+                metrics.record_performance(
+                    operation=f"{self.name}.stage.{name}",
+                    duration_ms=span.duration_ms,
+                    metadata={
+                        "success": span.status == "ok",
+                        "status": span.status,
+                        "critical": name in run.critical_path,
+                        "ready_ms": round(span.ready_ms, 1),
+                    }
+                )
+            metrics.record_performance(
+                operation=f"{self.name}.graph",
+                duration_ms=run.total_ms,
+                metadata={"success": not run.degraded, "critical_path": run.critical_path}
+            )
+        except Exception as e:
+            logger.debug(f"{self.name}: stage metrics not recorded: {e}")
+
+
+__all__ = [
+    'NO_FALLBACK',
+    'Stage',
+    'StageGraph',
+    'StageGraphRun',
+    'StageSpan',
+]
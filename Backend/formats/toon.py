@@ -1,9 +1,21 @@
 """
 TOON format utilities for LLM token optimization
+
+to_toon() renders plain JSON data (parsed CVs/JDs, answers) with a
+specialized encoder for the shapes our documents use: str keys and
+str/int/float/bool/None/list/dict values, comma delimiter, 2-space indent.
+It skips toon_format's generic normalization pass (type dispatch, copying,
+circular-reference tracking) and produces the same text as
+toon_format.encode (verified by scripts/benchmark_toon.py --encoder and
+tests/test_toon_encoder.py). Anything else falls back to toon_format.encode.
 """
 
+import math
+import re
+from functools import lru_cache
+
 try:
-    from toon_format import encode, decode, estimate_savings, compare_formats
+    from toon_format import encode, decode
     TOON_AVAILABLE = True
 except ImportError:
     TOON_AVAILABLE = False
@@ -17,6 +29,224 @@ except ImportError:
     print("Warning: tiktoken not installed. Install with: pip install tiktoken")
 
 
+# Lexical rules of the TOON spec (quoting §7.2, keys §7.3, escaping §7.1)
+_UNQUOTED_KEY = re.compile(r"[A-Za-z_][A-Za-z0-9_.]*")
+_NUMERIC_LIKE = re.compile(r"[+-]?[0-9]+(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?")
+_STRUCTURAL = re.compile(r'[:"\\\[\]{},\x00-\x1f]')  # includes the comma delimiter
+_NEEDS_ESCAPE = re.compile(r'[\\"\x00-\x1f]')
+_SURROGATE = re.compile("[\ud800-\udfff]")
+_SPECIAL = re.compile(r'[:"\\\[\]{},\x00-\x1f\ud800-\udfff]')  # _STRUCTURAL or _SURROGATE
+_ESCAPES = {"\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r", "\t": "\\t"}
+_INDENT = "  "
+
+
+class _Unsupported(Exception):
+    """Value outside the fast encoder's plain-JSON subset (use toon_format.encode)."""
+
+
+def _quote(value: str) -> str:
+    return '"' + _NEEDS_ESCAPE.sub(lambda m: _ESCAPES.get(m.group()) or f"\\u{ord(m.group()):04x}", value) + '"'
+
+
+def _needs_quotes(value: str) -> bool:
+    return bool(
+        not value
+        or value[0] in " \t-#"
+        or value[-1] in " \t"
+        or value in ("true", "false", "null")
+        or _STRUCTURAL.search(value)
+        or _NUMERIC_LIKE.fullmatch(value)
+    )
+
+
+def _key(key) -> str:
+    if type(key) is not str:
+        raise _Unsupported
+    return key if _UNQUOTED_KEY.fullmatch(key) else _quote(key)
+
+
+def _primitive(value) -> str:
+    cls = type(value)
+    if cls is str:
+        # Common case first: one scan proves the string is safe unquoted
+        if (
+            value
+            and value[0] not in " \t-#\ufeff"
+            and value[-1] not in " \t"
+            and not _SPECIAL.search(value)
+            and value not in ("true", "false", "null")
+            and not _NUMERIC_LIKE.fullmatch(value)
+        ):
+            return value
+        if _SURROGATE.search(value) or not _needs_quotes(value):
+            raise _Unsupported  # Leading BOM / lone surrogates: toon_format's own handling
+        return _quote(value)
+    if value is None:
+        return "null"
+    if cls is bool:
+        return "true" if value else "false"
+    if cls is int:
+        return str(value)
+    if cls is float:
+        if not math.isfinite(value):
+            return "null"
+        if value.is_integer() and abs(value) < 1e21:
+            return str(int(value))
+        text = repr(value)
+        if "e" in text:
+            raise _Unsupported  # Exponent forms follow the spec's decimal canonicalization
+        return text
+    raise _Unsupported
+
+
+def _is_primitive(value) -> bool:
+    return not isinstance(value, (dict, list))
+
+
+def _shape(objects: list):
+    """Shared field list of uniform objects (tabular form §9.3), or None."""
+    first = objects[0]
+    if type(first) is not dict or not first:
+        return None
+    keys = first.keys()
+    for obj in objects:
+        if type(obj) is not dict or len(obj) != len(keys) or obj.keys() != keys:
+            return None
+    fields = []
+    for key in keys:
+        column = [obj[key] for obj in objects]
+        if all(map(_is_primitive, column)):
+            fields.append((key, None))
+            continue
+        nested = _shape(column)
+        if nested is None:
+            return None
+        fields.append((key, nested))
+    return tuple(fields)
+
+
+def _leaves(obj: dict, shape: tuple) -> list:
+    values = []
+    for key, nested in shape:
+        if nested is None:
+            values.append(obj[key])
+        else:
+            values.extend(_leaves(obj[key], nested))
+    return values
+
+
+def _field_list(shape: tuple) -> str:
+    return "{" + ",".join(_key(key) + ("" if nested is None else _field_list(nested)) for key, nested in shape) + "}"
+
+
+def _row(values) -> str:
+    return ",".join(map(_primitive, values))
+
+
+class _DocumentEncoder:
+    """Line renderer mirroring toon_format's encoder for plain JSON data."""
+
+    __slots__ = ("lines",)
+
+    def __init__(self):
+        self.lines = []
+
+    def root(self, value) -> str:
+        cls = type(value)
+        if cls is dict:
+            shape = _shape(list(value.values())) if len(value) >= 2 else None
+            if shape is not None:
+                self.keyed("", value, shape, "")
+            else:
+                self.fields(value, "")
+        elif cls is list:
+            if value:
+                self.array("", value, "", tabular=True)
+            else:
+                self.lines.append("[]")
+        else:
+            self.lines.append(_primitive(value))
+        return "\n".join(self.lines)
+
+    def fields(self, obj: dict, indent: str) -> None:
+        for key, value in obj.items():
+            self.field(_key(key), value, indent)
+
+    def field(self, key: str, value, indent: str) -> None:
+        cls = type(value)
+        if cls is dict:
+            shape = _shape(list(value.values())) if len(value) >= 2 else None
+            if shape is not None:
+                self.keyed(key, value, shape, indent)
+            else:
+                self.lines.append(f"{indent}{key}:")
+                self.fields(value, indent + _INDENT)
+        elif cls is list:
+            if value:
+                self.array(key, value, indent, tabular=True)
+            else:
+                self.lines.append(f"{indent}{key}: []")
+        elif cls is tuple or isinstance(value, (dict, list)):
+            raise _Unsupported  # Subclasses and tuples: leave to the generic encoder
+        else:
+            self.lines.append(f"{indent}{key}: {_primitive(value)}")
+
+    def array(self, prefix: str, array: list, indent: str, *, tabular: bool) -> None:
+        head = f"{prefix}[{len(array)}]"
+        if all(map(_is_primitive, array)):
+            self.lines.append(f"{indent}{head}: {_row(array)}")
+            return
+        shape = _shape(array) if tabular else None
+        if shape is not None:
+            self.lines.append(f"{indent}{head}{_field_list(shape)}:")
+            row_indent = indent + _INDENT
+            self.lines.extend(row_indent + _row(_leaves(element, shape)) for element in array)
+            return
+        self.lines.append(f"{indent}{head}:")
+        for element in array:
+            self.item(element, indent + _INDENT)
+
+    def keyed(self, key: str, obj: dict, shape: tuple, indent: str) -> None:
+        self.lines.append(f"{indent}{key}[{len(obj)}:]{_field_list(shape)}:")
+        row_indent = indent + _INDENT
+        for entry, value in obj.items():
+            self.lines.append(f"{row_indent}{_key(entry)}: {_row(_leaves(value, shape))}")
+
+    def item(self, value, indent: str) -> None:
+        cls = type(value)
+        if cls is dict:
+            if not value:
+                self.lines.append(f"{indent}-")
+                return
+            # First field moves onto the hyphen line
+            first = len(self.lines)
+            self.fields(value, indent + _INDENT)
+            self.lines[first] = indent + "- " + self.lines[first][len(indent) + len(_INDENT):]
+        elif cls is list:
+            if value:
+                self.array("- ", value, indent, tabular=False)
+            else:
+                self.lines.append(f"{indent}- [0]:")
+        elif isinstance(value, (dict, list, tuple)):
+            raise _Unsupported
+        else:
+            self.lines.append(f"{indent}- {_primitive(value)}")
+
+
+def encode_document(data: dict | list) -> str:
+    """
+    TOON text of plain JSON data with the specialized encoder.
+
+    Raises:
+        ValueError: If data contains values outside the plain-JSON subset
+            (tuples, sets, models, non-str keys, exponent floats, ...)
+    """
+    try:
+        return _DocumentEncoder().root(data)
+    except (_Unsupported, RecursionError):
+        raise ValueError("Not plain JSON data, use toon_format.encode") from None
+
+
 def to_toon(data: dict | list | str) -> str:
     """
     Convert Python data structure to TOON format.
@@ -27,13 +257,18 @@ def to_toon(data: dict | list | str) -> str:
     Returns:
         TOON-formatted string
     """
-    if not TOON_AVAILABLE:
-        raise ImportError("toon-format not installed")
-
     if isinstance(data, str):
         # If already a string, return as-is
         return data
 
+    try:
+        return encode_document(data)
+    except ValueError:
+        pass
+
+    if not TOON_AVAILABLE:
+        raise ImportError("toon-format not installed")
+
     return encode(data)
 
 
@@ -53,6 +288,23 @@ def from_toon(toon_str: str) -> dict | list:
     return decode(toon_str)
 
 
+@lru_cache(maxsize=8)
+def _encoding(model: str):
+    """
+    tiktoken encoder for a model, built once per process (loading the BPE ranks is slow).
+    None if it can't be loaded (e.g. the BPE file can't be downloaded).
+    """
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            # Fallback to cl100k_base (GPT-4/ChatGPT)
+            return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        print(f"Warning: tiktoken encoding for {model} unavailable ({e}), estimating token counts")
+        return None
+
+
 def count_tokens(text: str, model: str = "gpt-4") -> int:
     """
     Count tokens in text using tiktoken.
@@ -64,17 +316,12 @@ def count_tokens(text: str, model: str = "gpt-4") -> int:
     Returns:
         Token count
     """
-    if not TIKTOKEN_AVAILABLE:
+    encoding = _encoding(model) if TIKTOKEN_AVAILABLE else None
+    if encoding is None:
         # Rough estimate: ~4 characters per token
         return len(text) // 4
 
-    try:
-        encoding = tiktoken.encoding_for_model(model)
-        return len(encoding.encode(text))
-    except:
-        # Fallback to cl100k_base (GPT-4/ChatGPT)
-        encoding = tiktoken.get_encoding("cl100k_base")
-        return len(encoding.encode(text))
+    return len(encoding.encode(text, disallowed_special=()))
 
 
 def compare_json_vs_toon(data: dict | list) -> dict:
@@ -2,37 +2,92 @@ import time
 import json
 import os
 import hashlib
-import httpx
-from google import genai
-from openai import OpenAI
+import sys
 from dotenv import load_dotenv
-from formats.toon import to_toon, from_toon
+from formats.toon import to_toon, from_toon, encode_document
 from app.config import job_description, TOON_EXAMPLE as TOON_EXAMPLE_SHARED, get_toon_prompt
+from core.config.clients import get_gemini_client, get_openai_client
 
 # Load environment variables
 load_dotenv()
 
+# ========== ENCODER BENCHMARK (no API calls) ==========
+# python -m scripts.benchmark_toon --encoder
+# Specialized document encoder vs toon_format.encode on parsed CV/JD shapes:
+# identical output is required, throughput is reported
+if "--encoder" in sys.argv:
+    from toon_format import encode as reference_encode
+
+    sample_cv = {
+        "personal_info": {"name": "Jane Doe", "email": "jane@example.com", "phone": "+1 555 0100",
+                          "location": "Berlin, Germany", "linkedin": None, "github": "https://github.com/jdoe",
+                          "portfolio": None},
+        "professional_summary": "Backend engineer with 8 years of Python, Postgres and Kubernetes experience.",
+        "technical_skills": ["Python", "FastAPI", "PostgreSQL", "Redis", "Kubernetes", "AWS", "C++", "Node.js"],
+        "tools": ["Docker", "Terraform", "Grafana", "GitHub Actions"],
+        "soft_skills": ["Mentoring", "Clear written communication", "Ownership"],
+        "work_experience": [
+            {"role": "Senior Backend Engineer", "company": "Acme Corp", "location": "Berlin",
+             "start_date": "2021-03", "end_date": "Present", "duration": "3 years 7 months",
+             "achievements": ["Cut p95 latency by 40%", "Led migration to Kubernetes, 120 services"]},
+            {"role": "Backend Engineer", "company": "Globex", "location": None,
+             "start_date": "2016-09", "end_date": "2021-02", "duration": "4 years 6 months",
+             "achievements": ["Built the billing pipeline: 2M events/day"]},
+        ],
+        "education": [
+            {"degree": "MSc Computer Science", "institution": "TU Munich", "year": "2016"},
+            {"degree": "BSc Computer Science", "institution": "TU Munich", "year": "2014"},
+        ],
+        "certifications": ["AWS Solutions Architect", "CKA"],
+        "languages": [{"language": "English", "proficiency": "fluent"}, {"language": "German", "proficiency": "native"}],
+        "total_years_experience": 8,
+    }
+    sample_jd = {
+        "company_name": "Initech", "position_title": "Staff Platform Engineer", "location": "Remote (EU)",
+        "work_mode": "remote", "salary_range": "€90k - €120k", "experience_years_required": 7,
+        "experience_level": "senior",
+        "hard_skills_required": [{"skill": "Python", "priority": "critical"}, {"skill": "Kubernetes", "priority": "critical"},
+                                 {"skill": "Terraform", "priority": "important"}, {"skill": "Go", "priority": "nice"}],
+        "soft_skills_required": ["Drives cross-team technical decisions", "Writes clear design docs"],
+        "responsibilities": ["Own the internal developer platform", "Reduce deploy time from 30 to 5 minutes"],
+        "tech_stack": ["Python", "Go", "Kubernetes", "ArgoCD", "PostgreSQL"],
+        "domain_expertise": {"industry": ["SaaS", "Fintech"], "specific_knowledge": ["PCI DSS", "multi-region failover"]},
+        "implicit_requirements": ["On-call rotation", "Comfortable with ambiguity"],
+        "company_culture_signals": ["Async-first", "4-day work week"],
+        "ats_keywords": ["platform", "SRE", "Kubernetes", "Terraform", "Python", "CI/CD"],
+    }
+
+    iterations = 2000
+    print("=" * 70)
+    print("🧪 TOON ENCODER BENCHMARK (encode_document vs toon_format.encode)")
+    print("=" * 70)
+    for label, document in (("CV", sample_cv), ("JD", sample_jd)):
+        identical = encode_document(document) == reference_encode(document)
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            reference_encode(document)
+        reference_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            encode_document(document)
+        fast_time = time.perf_counter() - start
+
+        print(f"\n{label}: {'✅ identical output' if identical else '❌ OUTPUT DIFFERS'}")
+        print(f"   toon_format.encode: {iterations / reference_time:,.0f} docs/s")
+        print(f"   encode_document:    {iterations / fast_time:,.0f} docs/s ({reference_time / fast_time:.1f}x)")
+    sys.exit(0)
+
 # Create output directory for JSON files
 OUTPUT_DIR = "json_outputs"
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
-# Create persistent HTTP/2 client with connection pooling for performance
-# This reuses connections and enables HTTP/2 for 30-50% speed improvement
-http_client = httpx.Client(
-    http2=True,  # Enable HTTP/2 for faster requests
-    timeout=30.0,  # Longer timeout for LLM requests
-    limits=httpx.Limits(
-        max_keepalive_connections=10,  # Connection pool size
-        keepalive_expiry=30.0  # Keep connections alive for 30 seconds
-    )
-)
-
-# Initialize clients with optimized HTTP client
-gemini_client = genai.Client(api_key=os.getenv("GEMINI_API_KEY"))
-openai_client = OpenAI(
-    api_key=os.getenv("OPENAI_API_KEY"),
-    http_client=http_client  # Use persistent HTTP/2 client
-)
+# Shared pooled clients from the registry (HTTP/2 keep-alive). Honours
+# LLM_STUB_MODE=record|replay, so the benchmark can run against recorded
+# provider responses with no network (see core/config/provider_stub.py)
+gemini_client = get_gemini_client()
+openai_client = get_openai_client()
 
 # Response caching for faster repeated requests
 # Cache key: (model_name, prompt_hash) -> (response_text, timestamp)
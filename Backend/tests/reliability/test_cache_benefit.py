@@ -9,6 +9,11 @@ Tests if subsequent DIFFERENT CV/JD pairs are faster than the first due to:
 Usage:
     python tests/reliability/test_cache_benefit.py
 
+Offline (no provider keys or network; measures our code, not provider variance):
+    LLM_STUB_MODE=record uvicorn app.main:app --port 8001   # one run with real keys
+    LLM_STUB_MODE=replay uvicorn app.main:app --port 8001   # then replay from disk
+    (see core/config/provider_stub.py for latency/error/429 injection settings)
+
 Expected Output:
     PAIR 1: computer_science (COLD START)
       time=18.5s  score=62%
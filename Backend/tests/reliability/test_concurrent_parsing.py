@@ -6,6 +6,11 @@ Measures timing at different concurrency levels (1, 2, 5, 10 concurrent requests
 Usage:
     python tests/reliability/test_concurrent_parsing.py
 
+Offline (no provider keys or network; measures our code, not provider variance):
+    LLM_STUB_MODE=record uvicorn app.main:app --port 8001   # one run with real keys
+    LLM_STUB_MODE=replay uvicorn app.main:app --port 8001   # then replay from disk
+    (see core/config/provider_stub.py for latency/error/429 injection settings)
+
 Output:
     Concurrency Level 1:  avg=2.3s  min=2.1s  max=2.5s  success=10/10
     Concurrency Level 2:  avg=2.8s  min=2.2s  max=3.4s  success=10/10
@@ -0,0 +1,99 @@
+"""
+Tests for cached value compression.
+
+Usage:
+    python -m pytest tests/test_cache_compression.py -q
+"""
+
+import json
+import time
+
+from core.caching.compression import ValueCompressor
+
+
+class FakeDictStore:
+    """Redis stand-in for the shared dictionaries (get / set with nx)."""
+
+    def __init__(self):
+        self.values = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value, nx=False):
+        if nx and key in self.values:
+            return False
+        self.values[key] = value
+        return True
+
+
+def _score_json(i: int) -> bytes:
+    return json.dumps({
+        "success": True,
+        "overall_score": 50 + i % 50,
+        "category_scores": {
+            name: {"score": (i * 7 + n) % 100, "status": "good", "explanation": f"Candidate {i} shows {name} evidence."}
+            for n, name in enumerate(["skills", "experience", "education", "industry", "seniority"])
+        },
+        "gaps": {"critical": [{"title": f"Missing tool {i}", "description": "Not mentioned in the CV."}]},
+        "time_seconds": 1.234,
+    }).encode()
+
+
+def test_large_values_roundtrip_and_old_entries_still_decode():
+    compressor = ValueCompressor(enabled=True, min_bytes=200, dict_samples=0)
+    large, small = _score_json(1), b'{"success": true}'
+
+    stored = compressor.encode("score", large)
+    assert stored[:1] == b"\x00" and len(stored) < len(large)
+    assert compressor.decode("score", stored) == large
+
+    # Below the threshold, or written before compression existed: stored as-is
+    assert compressor.encode("score", small) == small
+    assert compressor.decode("score", small) == small
+
+    stats = compressor.get_stats()["namespaces"]["score"]
+    assert stats["compressed"] == 1 and stats["skipped"] == 1 and stats["ratio"] > 1
+
+
+def test_trained_dictionary_is_shared_between_workers():
+    store = FakeDictStore()
+    worker_a = ValueCompressor(enabled=True, min_bytes=200, dict_samples=50, dict_size=4096, dict_store=store)
+    worker_b = ValueCompressor(enabled=True, min_bytes=200, dict_samples=50, dict_size=4096, dict_store=store)
+
+    for i in range(50):
+        worker_a.encode("score", _score_json(i))
+    deadline = time.time() + 10
+    while not worker_a.get_stats()["namespaces"]["score"]["dictionary"] and time.time() < deadline:
+        time.sleep(0.01)
+    assert worker_a.get_stats()["namespaces"]["score"]["dictionary"]
+
+    # Worker B never trained: it loads the shared dictionary to decode A's values
+    value = _score_json(999)
+    assert worker_b.decode("score", worker_a.encode("score", value)) == value
+    # ...and unknown dictionaries decode to a miss instead of garbage
+    assert ValueCompressor(enabled=True).decode("score", worker_a.encode("score", value)) is None
+
+
+def test_no_private_dictionaries_and_cold_values_decode_anywhere():
+    # No shared store: never trains a dictionary other workers couldn't read
+    private = ValueCompressor(enabled=True, min_bytes=200, dict_samples=5, dict_size=4096)
+    for i in range(20):
+        private.encode("score", _score_json(i))
+    assert not private.get_stats()["namespaces"]["score"]["dictionary"]
+
+    # Dictionary trained and shared through Redis...
+    store = FakeDictStore()
+    worker = ValueCompressor(enabled=True, min_bytes=200, dict_samples=50, dict_size=4096, dict_store=store)
+    for i in range(50):
+        worker.encode("score", _score_json(i))
+    deadline = time.time() + 10
+    while not worker.get_stats()["namespaces"]["score"]["dictionary"] and time.time() < deadline:
+        time.sleep(0.01)
+    assert worker.get_stats()["namespaces"]["score"]["dictionary"]
+
+    # ...but cold tier values don't use it: they decode after Redis lost the dictionary
+    value = _score_json(999)
+    cold = worker.encode("score", value, dictionary=False)
+    assert cold[:1] == b"\x00" and len(cold) < len(value)
+    assert ValueCompressor(enabled=True).decode("score", cold) == value
@@ -0,0 +1,132 @@
+"""
+Tests for the failure-rate circuit breaker and its shared (cross-worker) state.
+
+Usage:
+    python -m pytest tests/test_circuit_breaker.py -q
+"""
+
+import asyncio
+import time
+
+import pytest
+
+import core.config.circuit_breaker as circuit_breaker_module
+import core.config.clients as clients
+from core.config.circuit_breaker import CircuitBreaker, CircuitBreakerOpenError, CircuitState
+from core.config.settings import settings
+
+
+class RecordingMetrics:
+    def __init__(self):
+        self.errors = []
+
+    def record_error(self, *args, **kwargs):
+        self.errors.append(args)
+
+    def record_performance(self, *args, **kwargs):
+        pass
+
+
+@pytest.fixture
+def metrics(monkeypatch):
+    recorder = RecordingMetrics()
+    monkeypatch.setattr(settings, "enable_circuit_breaker", True)
+    monkeypatch.setattr(settings, "enable_metrics", True)
+    monkeypatch.setattr(circuit_breaker_module, "get_metrics_collector", lambda: recorder)
+    return recorder
+
+
+def _breaker(**overrides):
+    options = dict(
+        name="test", failure_threshold=3, failure_rate_threshold=0.5, window_seconds=60,
+        window_size=20, recovery_timeout=0.05, half_open_requests=1, shared_state=False,
+    )
+    return CircuitBreaker(**{**options, **overrides})
+
+
+async def _ok():
+    return "ok"
+
+
+async def _fail():
+    raise ConnectionError("provider down")
+
+
+async def _outcome(breaker, func):
+    try:
+        return await breaker.call(func)
+    except Exception as e:
+        return type(e)
+
+
+
+@pytest.mark.asyncio
+async def test_failure_rate_trips_and_open_circuit_fails_fast(metrics):
+    breaker = _breaker()
+    # 2 failures out of 6 calls: below both thresholds
+    for func in (_ok, _fail, _ok, _fail, _ok, _ok):
+        await _outcome(breaker, func)
+    assert breaker.state == CircuitState.CLOSED
+
+    for _ in range(2):
+        await _outcome(breaker, _fail)
+    assert breaker.state == CircuitState.OPEN
+    assert await _outcome(breaker, _ok) is CircuitBreakerOpenError
+    assert breaker.stats["trip_count"] == 1
+    assert breaker.stats["rejected_calls"] == 1
+    assert len(metrics.errors) == 1
+
+
+@pytest.mark.asyncio
+async def test_half_open_probe_closes_or_reopens(metrics):
+    breaker = _breaker()
+    for _ in range(3):
+        await _outcome(breaker, _fail)
+    await asyncio.sleep(0.06)
+
+    # Failed probe: straight back to OPEN, a second trip
+    assert await _outcome(breaker, _fail) is ConnectionError
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.stats["trip_count"] == 2
+    await asyncio.sleep(0.06)
+
+    # Successful probe closes the circuit and records the recovery
+    assert await _outcome(breaker, _ok) == "ok"
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.stats["last_open_duration_seconds"] is not None
+    assert breaker.stats["window_calls"] == 0
+
+
+@pytest.mark.asyncio
+async def test_shared_open_state_is_adopted_without_counting_a_trip(metrics, monkeypatch):
+    opened_at = time.time()
+
+    class FakeRedis:
+        def get(self, key):
+            return str(opened_at).encode() if key == "cb:open:test" else None
+
+    monkeypatch.setattr(clients, "get_redis_client", lambda: FakeRedis())
+
+    breaker = _breaker(shared_state=True, recovery_timeout=60)
+    await breaker._sync_shared_state()
+
+    assert breaker.state == CircuitState.OPEN
+    assert await _outcome(breaker, _ok) is CircuitBreakerOpenError
+    # The other worker's trip is not counted, reported or republished here
+    assert breaker.stats["trip_count"] == 0
+    assert breaker.stats["last_trip_time"] == opened_at
+    assert metrics.errors == []
+
+
+@pytest.mark.asyncio
+async def test_reset_closes_and_clears_stats(metrics):
+    breaker = _breaker()
+    for _ in range(3):
+        await _outcome(breaker, _fail)
+    assert breaker.state == CircuitState.OPEN
+
+    breaker.reset()
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.stats["trip_count"] == 0
+    assert breaker.stats["window_calls"] == 0
+    assert await _outcome(breaker, _ok) == "ok"
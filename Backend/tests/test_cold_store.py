@@ -0,0 +1,121 @@
+"""
+Tests for the Postgres cold tier behind the Redis result cache.
+
+Usage:
+    python -m pytest tests/test_cold_store.py -q
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import core.caching.result_cache as result_cache
+from core.caching.cache import get_cache
+from core.caching.document_store import get_document_store, make_doc_id
+from core.config.settings import settings
+from core.persistence.cold_store import ColdResultStore, key_namespace
+from core.utils import fast_json
+
+
+class FakeDatabase:
+    """In-memory stand-in for AsyncDatabaseManager: records upserts, answers selects."""
+
+    is_initialized = True
+
+    def __init__(self):
+        self.rows = {}
+        self.upserts = []
+        self.selects = []
+        self.fail_writes = False
+
+    async def execute(self, statement, params=None):
+        sql = str(statement)
+        if sql.lstrip().startswith("INSERT"):
+            if self.fail_writes:
+                raise ConnectionError("database unavailable")
+            self.upserts.append(len(params))
+            self.rows.update({row["cache_key"]: row["value"] for row in params})
+        elif sql.lstrip().startswith("SELECT"):
+            self.selects.append(params["namespace"])
+            return [
+                SimpleNamespace(cache_key=key, value=self.rows[key])
+                for key in params["keys"]
+                if key in self.rows and key_namespace(key) == params["namespace"]
+            ]
+        return SimpleNamespace(rowcount=0)
+
+    @asynccontextmanager
+    async def session(self):
+        yield self
+
+    read_session = session
+
+
+def _run(monkeypatch, scenario):
+    monkeypatch.setattr(settings, "database_url", "postgresql://test")
+    monkeypatch.setattr(settings, "cold_tier_flush_interval", 3600)
+
+    async def run():
+        database = FakeDatabase()
+        store = ColdResultStore(db_manager=database)
+        assert await store.start()
+        try:
+            await scenario(store, database)
+        finally:
+            await store.stop()
+
+    asyncio.run(run())
+
+
+def test_writes_are_batched_and_read_back(monkeypatch):
+    async def scenario(store, database):
+        store.put("parse:jd:a:english", b'{"success": true}')
+        store.put("score:b:c:english", b'{"overall_score": 80}')
+
+        # Not flushed yet: served from the write buffer
+        assert await store.get("parse:jd:a:english") == b'{"success": true}'
+        assert database.upserts == []
+
+        assert await store.flush() == 2
+        assert database.upserts == [2]
+        assert await store.get_many(["score:b:c:english", "parse:jd:missing:english"]) == {
+            "score:b:c:english": b'{"overall_score": 80}'
+        }
+        assert store.hot_ttl == settings.result_hot_ttl
+        # Reads constrain the leading primary key column, one lookup per namespace
+        assert database.selects == ["score", "parse"]
+
+    _run(monkeypatch, scenario)
+
+
+def test_failed_flush_keeps_results_for_the_next_one(monkeypatch):
+    async def scenario(store, database):
+        database.fail_writes = True
+        store.put("parse:cv:a:english", b'{"success": true}')
+        assert await store.flush() == 0
+        assert store.get_stats()["pending"] == 1
+
+        database.fail_writes = False
+        assert await store.flush() == 1
+        assert database.rows.keys() == {"parse:cv:a:english"}
+
+    _run(monkeypatch, scenario)
+
+
+def test_cold_parse_hit_restores_its_document(monkeypatch):
+    async def scenario(store, database):
+        monkeypatch.setattr(result_cache, "get_cold_store", lambda: store)
+        document = {"job_title": "Cold Tier Engineer", "responsibilities": ["Keep rows"]}
+        doc_id = make_doc_id("jd", document)
+        cache_key = f"parse:jd:{doc_id[3:]}:english"
+        store.put(cache_key, fast_json.dumpb({"success": True, "data": document, "doc_id": doc_id}))
+        await store.flush()
+
+        # Only the cold tier holds the result; Redis has neither it nor its document
+        assert get_cache().get_raw(cache_key) is None
+        assert get_document_store().get(doc_id) is None
+
+        assert fast_json.loads(await result_cache.get_result_raw(cache_key))["doc_id"] == doc_id
+        assert get_document_store().get(doc_id) == document
+
+    _run(monkeypatch, scenario)
@@ -0,0 +1,78 @@
+"""
+Tests for token-budgeted, relevance-based CV context selection.
+
+Usage:
+    python -m pytest tests/test_context_selection.py -q
+"""
+
+import core.caching.context_selection as context_selection
+from formats.toon import count_tokens, to_toon
+
+TOPICS = ("kubernetes", "python", "marketing", "sales")
+
+JD = {
+    "responsibilities": ["Run our Kubernetes platform", "Build Python services"],
+    "hard_skills_required": [{"skill": "Kubernetes", "priority": "critical"}, {"skill": "Python", "priority": "critical"}],
+}
+
+SENIOR_CV = {
+    "personal_info": {"name": "Jane Doe"},
+    "technical_skills": ["Python", "Kubernetes"],
+    "work_experience": [
+        {
+            "role": f"Engineer {i}",
+            "company": f"Company {i}",
+            "achievements": [
+                f"Led the {topic} initiative number {i} and delivered it across several teams on time"
+                for topic in TOPICS
+            ],
+        }
+        for i in range(10)
+    ],
+    "projects": [{"name": "Campaign site", "description": "A marketing and sales landing page"}],
+}
+
+
+def fake_embeddings_batch(texts, use_cache=True, timeout=None):
+    """One dimension per topic keyword: similarity = shared topics."""
+    return [[1.0 if topic in text.lower() else 0.0 for topic in TOPICS] + [0.1] for text in texts]
+
+
+def test_long_cv_keeps_the_most_relevant_items_within_budget(monkeypatch):
+    monkeypatch.setattr(context_selection, "get_embeddings_batch", fake_embeddings_batch)
+    budget = count_tokens(to_toon(SENIOR_CV)) // 2
+
+    selected, report = context_selection.select_cv_items(SENIOR_CV, JD, budget)
+
+    assert report["tokens_after"] <= budget < report["tokens_before"]
+    assert report["tokens_after"] == count_tokens(to_toon(selected))
+    kept = [a for job in selected["work_experience"] for a in job["achievements"]]
+    assert kept and all("kubernetes" in a or "python" in a for a in kept)
+    # Role headers are always kept; the CV says what was left out
+    assert len(selected["work_experience"]) == 10
+    assert selected[context_selection.OMITTED_NOTE_KEY].startswith(f"{report['items'] - report['items_kept']} of 41")
+
+
+def test_short_cvs_pass_through_and_selections_are_memoized(monkeypatch):
+    calls = []
+
+    def counting_embeddings(texts, use_cache=True, timeout=None):
+        calls.append(len(texts))
+        return fake_embeddings_batch(texts)
+
+    monkeypatch.setattr(context_selection, "get_embeddings_batch", counting_embeddings)
+    monkeypatch.setitem(context_selection.settings.prompt_context_budgets, "test_prompt", 300)
+    full = to_toon(SENIOR_CV)
+
+    short_cv = {"personal_info": {"name": "Jane Doe"}, "technical_skills": ["Python"]}
+    assert context_selection.budget_cv_context("test_prompt", to_toon(short_cv), short_cv, JD) == to_toon(short_cv)
+    assert calls == []
+
+    first = context_selection.budget_cv_context("test_prompt", full, SENIOR_CV, JD)
+    assert count_tokens(first) <= 300 < count_tokens(full)
+    assert context_selection.budget_cv_context("test_prompt", full, SENIOR_CV, JD) == first
+    assert len(calls) == 2  # CV items + JD requirements, once
+
+    # NON-BLOCKING: a failing selection falls back to the full CV
+    monkeypatch.setattr(context_selection, "get_embeddings_batch", None)
+    assert context_selection.budget_cv_context("test_prompt", full, SENIOR_CV, {"responsibilities": ["Sales"]}) == full
@@ -0,0 +1,39 @@
+"""
+Tests for the content-addressed document store.
+
+Usage:
+    python -m pytest tests/test_document_store.py -q
+"""
+
+import hashlib
+import json
+
+from core.caching.document_store import DocumentStore, is_valid_doc_id, make_doc_id
+
+CV = {"technical_skills": ["Python", "React"], "work_experience": [{"role": "Developer"}]}
+
+
+def test_doc_id_is_content_addressed_and_matches_legacy_score_hash():
+    reordered = {"work_experience": [{"role": "Developer"}], "technical_skills": ["Python", "React"]}
+
+    doc_id = make_doc_id("cv", CV)
+    assert doc_id == make_doc_id("cv", reordered)
+    assert doc_id != make_doc_id("cv", {**CV, "technical_skills": ["Python"]})
+    # Same digest the score cache key has always used
+    assert doc_id == "cv_" + hashlib.md5(json.dumps(CV, sort_keys=True).encode()).hexdigest()
+    assert is_valid_doc_id(doc_id, "cv") and not is_valid_doc_id(doc_id, "jd")
+
+
+def test_put_get_returns_private_copies_and_memoizes_artifacts():
+    store = DocumentStore()
+    doc_id = store.put("cv", CV)
+
+    first = store.get(doc_id)
+    first["technical_skills"].append("Docker")
+    assert store.get(doc_id) == CV
+    assert store.get("cv_" + "0" * 32) is None
+
+    calls = []
+    compute = lambda: calls.append(1) or "technical_skills: Python, React"
+    assert store.artifact(doc_id, "toon", compute) == store.artifact(doc_id, "toon", compute)
+    assert len(calls) == 1
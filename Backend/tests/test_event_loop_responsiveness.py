@@ -0,0 +1,120 @@
+"""
+Regression test: LLM generation for gap analysis must not block the event loop.
+
+generate_with_cache used to run the provider call (and tenacity retry sleeps)
+on the event-loop thread inside async endpoints, freezing the whole worker for
+the duration of the generation. The provider SDK call here blocks its thread
+for GENERATION_SECONDS; the event loop must keep ticking meanwhile.
+
+Usage:
+    python -m pytest tests/test_event_loop_responsiveness.py -q
+"""
+
+import os
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+os.environ.setdefault("GEMINI_API_KEY", "test-key")
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from core.caching import gemini_cache
+from core.config import llm_fallback
+
+GENERATION_SECONDS = 0.5
+TICK_SECONDS = 0.01
+MAX_ALLOWED_LAG_SECONDS = 0.2
+PING_AFTER_SECONDS = 0.1
+
+
+class BlockingGeminiModels:
+    """Stands in for client.models: generate_content blocks its thread like the real SDK."""
+
+    def generate_content(self, model, contents, config):
+        time.sleep(GENERATION_SECONDS)
+        return SimpleNamespace(text='{"gaps": {}, "strengths": []}', usage_metadata=None)
+
+
+async def _max_loop_lag_during(coro) -> tuple[float, object]:
+    """Run coro while a ticker measures the longest gap between event-loop ticks."""
+    max_lag = 0.0
+    done = asyncio.Event()
+
+    async def ticker():
+        nonlocal max_lag
+        last = time.perf_counter()
+        while not done.is_set():
+            await asyncio.sleep(TICK_SECONDS)
+            now = time.perf_counter()
+            max_lag = max(max_lag, now - last - TICK_SECONDS)
+            last = now
+
+    ticker_task = asyncio.create_task(ticker())
+    await asyncio.sleep(TICK_SECONDS)  # Let the ticker start before the work begins
+    try:
+        result = await coro
+    finally:
+        done.set()
+        await ticker_task
+    return max_lag, result
+
+
+@pytest.mark.asyncio
+async def test_gap_analysis_generation_keeps_event_loop_responsive():
+    fake_client = SimpleNamespace(models=BlockingGeminiModels())
+
+    with mock.patch.object(llm_fallback, "get_gemini_client", return_value=fake_client):
+        start = time.perf_counter()
+        max_lag, (response_text, provider) = await _max_loop_lag_during(
+            gemini_cache.generate_with_cache_async(
+                prompt="Analyze gaps between this CV and JD",
+                model="gemini-2.5-flash-lite",
+                temperature=0.1,
+                call_site="calculate_score"
+            )
+        )
+        elapsed = time.perf_counter() - start
+
+    assert provider == "gemini"
+    assert response_text.startswith("{")
+    assert elapsed >= GENERATION_SECONDS
+    assert max_lag < MAX_ALLOWED_LAG_SECONDS, (
+        f"Event loop stalled for {max_lag:.3f}s while gap analysis was in flight"
+    )
+
+
+@pytest.mark.asyncio
+async def test_endpoints_answer_pings_while_a_generation_is_in_flight():
+    """A health ping sent during a resume rewrite must not wait for the provider call."""
+    import httpx
+    from app import main
+
+    fake_client = SimpleNamespace(models=BlockingGeminiModels())
+    rewrite_body = {
+        "updated_cv": {"personal_info": {"name": "Jane Doe"}, "technical_skills": ["Python"]},
+        "questions": [],
+        "answers": [],
+        "parsed_jd": {"job_title": "Platform Engineer", "nonce": time.time()},
+    }
+
+    transport = httpx.ASGITransport(app=main.app)
+    with mock.patch.object(llm_fallback, "get_gemini_client", return_value=fake_client):
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            start = time.perf_counter()
+            rewrite = asyncio.create_task(client.post("/api/rewrite-resume", json=rewrite_body))
+            await asyncio.sleep(PING_AFTER_SECONDS)  # The provider call is now blocking its thread
+            ping = await client.get("/health")
+            # Measured from the rewrite's start: a blocked loop delays the ping itself
+            ping_seconds = time.perf_counter() - start - PING_AFTER_SECONDS
+            rewrite_done_first = rewrite.done()
+            response = await rewrite
+
+    assert ping.status_code == 200
+    assert response.status_code == 200
+    assert not rewrite_done_first
+    assert ping_seconds < MAX_ALLOWED_LAG_SECONDS, (
+        f"Health ping took {ping_seconds:.3f}s while a resume rewrite was generating"
+    )
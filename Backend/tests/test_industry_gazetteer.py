@@ -0,0 +1,67 @@
+"""
+Tests for the local industry gazetteer.
+
+Usage:
+    python -m pytest tests/test_industry_gazetteer.py -q
+"""
+
+import json
+
+from core.caching.industry_gazetteer import IndustryGazetteer
+from toy_embeddings import classify_with_fake_llm, make_embed
+
+SEED = {
+    "companies": {"google": ["technology"], "amazon web services": ["technology", "cloud computing"]},
+    "issuers": {"project management institute": ["project management"]},
+    "keywords": {"hospital": ["healthcare"], "bank": ["finance"]},
+}
+
+# Toy embedding space: one axis per concept
+AXES = {"google": 0, "alphabet": 0, "hospital": 1, "clinic": 1, "bakery": 2, "pastry": 2, "mystery": 4}
+
+_embed = make_embed(AXES, default_axis=3)
+
+
+def _gazetteer(tmp_path):
+    seed_path = tmp_path / "seed.json"
+    seed_path.write_text(json.dumps(SEED))
+    return IndustryGazetteer(seed_path=str(seed_path), embed=_embed, k=3, min_similarity=0.9, persist=False)
+
+
+def _classify(gazetteer, texts, llm_labels):
+    return classify_with_fake_llm(gazetteer, texts, llm_labels.get)
+
+
+def test_tiers_answer_in_order_and_only_leftovers_reach_llm(tmp_path):
+    gazetteer = _gazetteer(tmp_path)
+    texts = ["Google", "Built triage tools for a Hospital network", "Alphabet", "Bakery"]
+
+    industries, llm_calls = _classify(gazetteer, texts, {"Bakery": ["food & beverage"]})
+
+    assert industries == [["technology"], ["healthcare"], ["technology"], ["food & beverage"]]
+    assert llm_calls == [["Bakery"]]
+    assert gazetteer.get_stats()["tiers"] == {"exact": 1, "keyword": 1, "embedding": 1, "llm": 1}
+
+
+def test_llm_labels_are_learned_but_failures_are_retried(tmp_path):
+    gazetteer = _gazetteer(tmp_path)
+    _classify(gazetteer, ["Bakery", "Mystery Corp"], {"Bakery": ["food & beverage"]})
+
+    # Exact repeat, a kNN neighbour of the learned example, and the unlabeled text again
+    industries, llm_calls = _classify(gazetteer, ["bakery", "Pastry", "Mystery Corp"], {})
+
+    assert industries[:2] == [["food & beverage"], ["food & beverage"]]
+    assert llm_calls == [["Mystery Corp"]]
+
+
+def test_long_texts_need_several_keyword_hits_ranked_by_count(tmp_path):
+    gazetteer = _gazetteer(tmp_path)
+    one_mention = "Rewrote the reporting pipeline and moved the nightly jobs off a hospital server"
+    ranked = "Hospital wing rollout, then bank loans, bank audits, hospital audits and bank transfers"
+    google = "Spent four years building search ranking infrastructure at Google"
+    gazetteer.load()
+
+    assert gazetteer.lookup_keywords(one_mention) is None
+    assert gazetteer.lookup_keywords(ranked) == ["finance", "healthcare"]
+    # A company or issuer mention still counts once, whatever the length
+    assert gazetteer.lookup_keywords(google) == ["technology"]
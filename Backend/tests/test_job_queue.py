@@ -0,0 +1,116 @@
+"""
+Tests for the background job queue behind bulk scoring.
+
+Usage:
+    python -m pytest tests/test_job_queue.py -q
+"""
+
+import asyncio
+
+import pytest
+
+from core.workflow.job_queue import InMemoryJobStore, JobQueue
+
+
+async def _double(item, params):
+    await asyncio.sleep(0.01)
+    if item["value"] < 0:
+        raise ValueError("negative")
+    return item["value"] * params["factor"]
+
+
+async def _wait_finished(queue, job_id):
+    while queue.get_job(job_id)["status"] not in ("completed", "cancelled"):
+        await asyncio.sleep(0.01)
+    return queue.get_job(job_id)
+
+
+@pytest.mark.asyncio
+async def test_job_runs_bounded_and_isolates_item_errors():
+    queue = JobQueue(store=InMemoryJobStore(), concurrency=2, lease_seconds=1)
+    queue.register_handler("double", _double)
+    job_id = await queue.submit("double", [{"value": v} for v in (1, 2, -1, 4)], {"factor": 10})
+    job = await _wait_finished(queue, job_id)
+    results = queue.get_results(job_id, offset=1, limit=10)
+
+    assert (job["status"], job["completed"], job["failed"], job["progress"]) == ("completed", 3, 1, 1.0)
+    assert [r.get("result") for r in results] == [20, None, 40]
+    assert results[1]["status"] == "error"
+
+
+@pytest.mark.asyncio
+async def test_unfinished_job_resumes_with_pending_items_only():
+    store = InMemoryJobStore()
+    processed = []
+
+    async def _record(item, params):
+        processed.append(item["value"])
+        return item["value"]
+
+    queue = JobQueue(store=store, concurrency=1, lease_seconds=0.05)
+    queue.register_handler("record", _record)
+    store.create({"job_id": "j1", "kind": "record", "status": "running", "total": 3,
+                  "completed": 1, "failed": 0, "created_at": 0, "updated_at": 0, "params": {}},
+                 [{"value": 1}, {"value": 2}, {"value": 3}])
+    store.set_result("j1", 0, {"index": 0, "status": "ok", "result": 1})
+    store.acquire_lease("j1", "dead-worker", 0.05)  # Previous runner died holding the lease
+
+    await queue.start()
+    assert "j1" not in queue._runners  # Lease still held
+    await asyncio.sleep(0.1)           # Lease expires, sweeper takes over
+    job = await _wait_finished(queue, "j1")
+    await queue.stop()
+
+    assert job["status"] == "completed"
+    assert sorted(processed) == [2, 3]
+
+
+@pytest.mark.asyncio
+async def test_stop_propagates_cancellation_and_missing_jobs_are_skipped():
+    store = InMemoryJobStore()
+
+    async def _slow(item, params):
+        await asyncio.sleep(10)
+
+    queue = JobQueue(store=store, concurrency=1, lease_seconds=0.5)
+    queue.register_handler("slow", _slow)
+    job_id = await queue.submit("slow", [{"value": 1}], {})
+    runner = queue._runners[job_id]
+    await asyncio.sleep(0.05)
+
+    await queue.stop()
+    assert runner.cancelled()
+    # Stopped, not finished: the job stays active for another worker to resume
+    assert queue.get_job(job_id)["status"] == "running"
+    assert store.acquire_lease(job_id, "other-worker", 0.5)
+
+    # A job that expired before its runner started is skipped, not crashed on
+    store.acquire_lease("gone", queue.owner, 0.5)
+    await queue._run("gone")
+    assert store.acquire_lease("gone", "other-worker", 0.5)
+
+
+@pytest.mark.asyncio
+async def test_cancel_from_another_process_is_kept_and_finished_jobs_expire():
+    store = InMemoryJobStore(ttl=0.2)
+    release = asyncio.Event()
+
+    async def _gated(item, params):
+        await release.wait()
+        return item["value"]
+
+    queue = JobQueue(store=store, concurrency=1, lease_seconds=30)
+    queue.register_handler("gated", _gated)
+    job_id = await queue.submit("gated", [{"value": 1}], {})
+    await asyncio.sleep(0.01)
+
+    # Cancelled through another process (no local runner.cancel()), then the item finishes
+    store.update_meta(job_id, status="cancelled")
+    store.finish(job_id)
+    release.set()
+    await asyncio.sleep(0.05)
+    assert queue.get_job(job_id)["status"] == "cancelled"
+
+    await asyncio.sleep(0.2)
+    assert queue.get_job(job_id) is None
+    assert store.get_items(job_id) == [] and store.result_indexes(job_id) == set()
@@ -0,0 +1,57 @@
+"""
+Tests for complexity-aware model routing.
+
+Usage:
+    python -m pytest tests/test_model_routing.py -q
+"""
+
+import core.config.model_routing as model_routing
+from core.config.model_routing import complexity_score, get_route_stats, record_invalid_output, select_route
+from core.config.settings import settings
+
+SHORT_JD = "We are hiring a Python developer to build internal tools."
+
+SENIOR_CV = "\n".join(
+    [f"Senior Engineer, Company {i} ({2000 + i} - {2001 + i})" for i in range(12)]
+    + ["Skills: " + ", ".join(["Python", "Go", "Rust", "Kafka", "Docker", "Kubernetes", "Terraform", "AWS",
+                                "GCP", "PostgreSQL", "Redis", "React", "TypeScript", "GraphQL", "Spark"])]
+    + ["Led platform migrations and cut infrastructure cost across several teams. " * 120]
+)
+
+
+def test_tiers_follow_complexity_and_cvs_use_their_own_measure(monkeypatch):
+    monkeypatch.setattr(settings, "model_routing_enabled", True)
+
+    simple = select_route("parse_jd", SHORT_JD)
+    assert (simple.tier, simple.model_gemini, simple.max_output_tokens) == ("simple", "gemini-2.5-flash-lite", 4096)
+    assert simple.thinking_budget is None
+
+    # The same CV text scores differently under the JD and CV measures
+    assert complexity_score(SENIOR_CV, "cv") != complexity_score(SENIOR_CV, "jd")
+    complex_cv = select_route("parse_cv", SENIOR_CV, document="cv")
+    assert complex_cv.complexity == complexity_score(SENIOR_CV, "cv") > 65
+    assert complex_cv.tier == "complex"
+    # The thinking model keeps room for its answer under the output cap
+    assert complex_cv.max_output_tokens - complex_cv.thinking_budget >= 8192
+
+    monkeypatch.setattr(settings, "model_routing_enabled", False)
+    disabled = select_route("parse_cv", SENIOR_CV, document="cv")
+    assert (disabled.tier, disabled.model_gemini) == ("disabled", settings.parsing_model)
+
+
+def test_invalid_outputs_are_counted_per_route_and_tier(monkeypatch):
+    monkeypatch.setattr(settings, "model_routing_enabled", True)
+    monkeypatch.setattr(model_routing, "_stats", {})
+    monkeypatch.setattr(settings, "model_routes", {
+        "test_route": [{"tier": "only", "max_complexity": 100, "model_gemini": "g", "model_openai": "o"}],
+    })
+    decision = select_route("test_route", SHORT_JD)
+
+    model_routing.record_route_call(decision, "gemini", 120.0)
+    record_invalid_output(decision)
+    record_invalid_output(None)  # Unrouted call sites: no-op
+
+    stats = get_route_stats()["routes"]["test_route"]["only"]
+    assert stats["calls"] == 1
+    assert stats["invalid_outputs"] == 1
+    assert stats["invalid_output_rate"] == 1.0
@@ -0,0 +1,52 @@
+"""
+Tests for the near-duplicate parse cache index.
+
+Usage:
+    python -m pytest tests/test_near_duplicate.py -q
+"""
+
+import random
+
+from core.caching.near_duplicate import NearDuplicateIndex
+
+WORDS = [f"skill{i}" for i in range(2000)]
+
+
+def _random_post(seed):
+    rng = random.Random(seed)  # Local generator: never touches the global random state
+    return " ".join(rng.choice(WORDS) for _ in range(400))
+
+
+JOB_POST = _random_post(7)
+
+
+def _index():
+    index = NearDuplicateIndex(num_perm=128, bands=32, shingle_size=3, max_entries=10)
+    index._redis = lambda: None  # Local index only
+    return index
+
+
+def test_reformatted_repost_hits_prior_parse():
+    index = _index()
+    index.add("jd:english", index.fingerprint(JOB_POST), "parse:jd:original:english")
+
+    repost = "<div>" + JOB_POST.replace(" ", "  ").upper() + "</div>\nApply now\nReport job"
+    match = index.lookup("jd:english", index.fingerprint(repost), threshold=0.85)
+
+    assert match is not None
+    assert match[0] == "parse:jd:original:english"
+    # Same text in another namespace never matches
+    assert index.lookup("cv:english", index.fingerprint(repost), threshold=0.85) is None
+
+
+def test_different_document_misses_and_is_counted():
+    index = _index()
+    index.add("jd:english", index.fingerprint(JOB_POST), "parse:jd:original:english")
+
+    other = _random_post(8)
+    assert index.lookup("jd:english", index.fingerprint(other), threshold=0.85) is None
+    assert index.lookup("jd:english", index.fingerprint("too short"), threshold=0.85) is None
+
+    stats = index.get_stats()
+    assert stats["misses"] == 1
+    assert stats["skipped"] == 1
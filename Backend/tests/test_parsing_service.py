@@ -0,0 +1,71 @@
+"""
+Tests for the shared JD/CV parsing service.
+
+Usage:
+    python -m pytest tests/test_parsing_service.py -q
+"""
+
+import asyncio
+
+import pytest
+
+import app.services.parsing as parsing
+from app.utils.markdown import parse_json_response
+
+CV_TEXT = "Jane Doe, backend engineer with eight years of Python, Postgres and Kubernetes experience."
+
+
+def test_json_fast_path_and_fallbacks():
+    assert parse_json_response('{"a": 1}') == {"a": 1}
+    assert parse_json_response('```json\n{"a": 1}\n```') == {"a": 1}
+    assert parse_json_response('Here is the result: {"a": 1} Hope it helps!') == {"a": 1}
+    with pytest.raises(ValueError):
+        parse_json_response("no json here")
+
+
+def test_fresh_parse_is_cached_for_the_next_request(monkeypatch):
+    calls = []
+
+    async def generate(prompt, **kwargs):
+        calls.append(kwargs["response_mime_type"])
+        return '{"name": "Jane", "skills": [], "experience": [], "education": []}', "gemini"
+
+    monkeypatch.setattr(parsing, "generate_with_fallback_async", generate)
+    monkeypatch.setattr(parsing.settings, "near_duplicate_enabled", False)
+    text = CV_TEXT + " test_fresh_parse_is_cached_for_the_next_request"
+
+    source, result = asyncio.run(parsing.run_parse("cv", text, "english"))
+    assert (source, result.success, result.data["name"]) == ("llm", True, "Jane")
+    assert result.doc_id
+
+    # Second request: stored bytes, no LLM call
+    source, cached = asyncio.run(parsing.run_parse("cv", text, "english"))
+    assert source == "cache" and isinstance(cached, bytes)
+    assert calls == ["application/json"]
+
+
+def test_near_duplicate_cv_must_be_the_same_person(monkeypatch):
+    calls = []
+
+    async def generate(prompt, **kwargs):
+        calls.append(1)
+        await asyncio.sleep(0.3)
+        return '{"personal_info": {"name": "Jane Doe"}, "skills": [], "experience": [], "education": []}', "gemini"
+
+    monkeypatch.setattr(parsing, "generate_with_fallback_async", generate)
+    monkeypatch.setattr(parsing.near_duplicate_index, "_redis", lambda: None)
+    monkeypatch.setattr(parsing.settings, "near_duplicate_enabled", True)
+    body = " ".join(f"Delivered project {i} with Python, Postgres and Kubernetes for client {i}." for i in range(60))
+    cv = f"Jane Doe\njane.doe@example.com\n+49 151 2345 6789\n{body}"
+
+    asyncio.run(parsing.run_parse("cv", cv, "english"))
+    # Same CV with another email: never served the first person's parse
+    asyncio.run(parsing.run_parse("cv", cv.replace("jane.doe@", "john.roe@"), "english"))
+    # ...or with the same contact details under another name
+    asyncio.run(parsing.run_parse("cv", cv.replace("Jane Doe", "Mary Major"), "english"))
+    assert len(calls) == 3
+
+    # Reformatted copy of the same person's CV: reused, with this request's time
+    source, result = asyncio.run(parsing.run_parse("cv", cv.replace("\n", "\n\n") + "\nPage 1 of 1", "english"))
+    assert source == "near_duplicate" and len(calls) == 3
+    assert result.time_seconds < 0.3
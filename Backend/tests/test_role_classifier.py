@@ -0,0 +1,46 @@
+"""
+Tests for the tiered role classifier.
+
+Usage:
+    python -m pytest tests/test_role_classifier.py -q
+"""
+
+from core.caching.role_classifier import RoleClassifier
+from toy_embeddings import classify_with_fake_llm, make_embed
+
+LABELS = {
+    "backend developer": "developer",
+    "data engineer": "data scientist",
+    "product manager": "manager",
+    "marketing manager": "marketing",
+}
+
+# Toy embedding space: one axis per concept
+AXES = {"backend": 0, "developer": 0, "software": 0, "programmer": 0,
+        "data": 1, "engineer": 1, "product": 2, "marketing": 3}
+
+_embed = make_embed(AXES, default_axis=4)
+
+
+def _classify(classifier, roles):
+    return classify_with_fake_llm(classifier, roles, lambda role: "other")
+
+
+def test_tiers_answer_in_order_and_only_leftovers_reach_llm():
+    classifier = RoleClassifier(labels=LABELS, embed=_embed, k=2, min_similarity=0.9)
+    roles = ["Backend-Developer", "Senior Data Engineer II", "Software Programmer", "Chef"]
+
+    labels, llm_calls = _classify(classifier, roles)
+
+    assert labels == ["developer", "data scientist", "developer", "other"]
+    assert llm_calls == [["Chef"]]
+    assert classifier.get_stats()["tiers"] == {"exact": 1, "token": 1, "embedding": 1, "llm": 1}
+
+
+def test_ambiguous_token_match_falls_through():
+    classifier = RoleClassifier(labels=LABELS, embed=_embed, k=2, min_similarity=0.99)
+
+    # Both "product manager" and "marketing manager" are contained: no token answer
+    assert classifier.classify_local("Product Marketing Manager") is None
+    _, llm_calls = _classify(classifier, ["Product Marketing Manager"])
+    assert llm_calls == [["Product Marketing Manager"]]
@@ -0,0 +1,66 @@
+"""
+Tests that the early-started score message never outlives its calculate-score run.
+
+Usage:
+    python -m pytest tests/test_score_message_cleanup.py -q
+"""
+
+import asyncio
+import os
+
+os.environ.setdefault("GEMINI_API_KEY", "test-key")
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+import pytest
+
+import app.main as main
+from core.workflow.stage_graph import StageGraph
+
+
+async def _never_finishes(**kwargs):
+    await asyncio.sleep(60)
+
+
+@pytest.mark.asyncio
+async def test_failed_run_cancels_in_flight_score_message(monkeypatch):
+    started = []
+
+    async def _gap_analysis():
+        started.append(asyncio.create_task(_never_finishes()))
+        return {"score_message_task": started[0]}
+
+    def _fail(gap_analysis):
+        raise RuntimeError("boom")
+
+    graph = StageGraph("calculate_score")
+    graph.add("gap_analysis", _gap_analysis)
+    graph.add("fail", _fail, deps=("gap_analysis",))
+    monkeypatch.setattr(main, "build_score_graph", lambda body: graph)
+
+    with pytest.raises(RuntimeError):
+        await main.run_score_graph(body=None)
+    assert started[0].cancelled()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_gap_stream_cancels_score_message(monkeypatch):
+    strengths_sent = asyncio.Event()
+
+    async def _stream(**kwargs):
+        yield ("strengths",), [], "gemini"
+        strengths_sent.set()
+        await asyncio.sleep(60)
+
+    monkeypatch.setattr(main, "stream_json_sections_async", _stream)
+    monkeypatch.setattr(main, "generate_score_message", lambda **kwargs: _never_finishes())
+    scores = {"overall_score": 70, "overall_status": "good"}
+    gap_task = asyncio.create_task(main.run_gap_analysis(
+        {"cv": "cv", "jd": "jd"}, main.get_fallback_similarity(), scores, "english"
+    ))
+    await asyncio.wait_for(strengths_sent.wait(), 5)
+    message_tasks = [task for task in asyncio.all_tasks() if task.get_coro().__name__ == "_never_finishes"]
+
+    gap_task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await gap_task
+    assert len(message_tasks) == 1 and message_tasks[0].cancelled()
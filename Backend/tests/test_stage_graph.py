@@ -0,0 +1,79 @@
+"""
+Tests for the async stage graph executor behind calculate-score.
+
+Usage:
+    python -m pytest tests/test_stage_graph.py -q
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from core.config.deadline import DeadlineExceededError, reset_deadline, set_deadline
+from core.workflow.stage_graph import StageGraph
+
+
+async def _sleep_return(seconds, value):
+    await asyncio.sleep(seconds)
+    return value
+
+
+def test_independent_stages_overlap_and_critical_path():
+    graph = StageGraph("test")
+    graph.add("slow", lambda: _sleep_return(0.2, 2))
+    graph.add("fast", lambda: _sleep_return(0.05, 3))
+    graph.add("blocking", lambda: time.sleep(0.1) or 5, blocking=True)
+    graph.add("sum", lambda slow, fast, blocking: slow + fast + blocking, deps=("slow", "fast", "blocking"))
+
+    start = time.time()
+    run = asyncio.run(graph.run())
+
+    assert run.results["sum"] == 10
+    assert time.time() - start < 0.3  # Not 0.35s of sequential work
+    assert run.critical_path == ["slow", "sum"]
+    assert not run.degraded
+
+
+def test_fallback_on_timeout_and_failure_without_fallback():
+    graph = StageGraph("test")
+    graph.add("flaky", lambda: _sleep_return(1.0, 1), timeout=0.05, fallback=50)
+    graph.add("double", lambda flaky: flaky * 2, deps=("flaky",))
+
+    run = asyncio.run(graph.run())
+    assert run.results["double"] == 100
+    assert run.spans["flaky"].status == "fallback"
+    assert run.degraded
+
+    def _boom():
+        raise ValueError("no fallback")
+
+    failing = StageGraph("test")
+    failing.add("boom", _boom, blocking=True)
+    failing.add("after", lambda boom: boom, deps=("boom",))
+    with pytest.raises(ValueError):
+        asyncio.run(failing.run())
+
+
+def test_timeout_without_fallback_names_the_stage():
+    def slow_graph():
+        graph = StageGraph("test")
+        graph.add("slow", lambda: _sleep_return(1.0, 1), timeout=0.05)
+        graph.add("neutral", lambda: _sleep_return(1.0, 1), timeout=0.05, fallback=50)
+        return graph
+
+    with pytest.raises(asyncio.TimeoutError, match="Stage 'slow' timed out"):
+        asyncio.run(slow_graph().run())
+
+    # Cut short by the request deadline: surfaces as DeadlineExceededError (504), not a bare TimeoutError
+    async def run_with_deadline():
+        token = set_deadline(0.05)
+        try:
+            return await slow_graph().run()
+        finally:
+            reset_deadline(token)
+
+    start = time.time()
+    with pytest.raises(DeadlineExceededError, match="during stage 'slow'"):
+        asyncio.run(run_with_deadline())
+    assert time.time() - start < 0.5
@@ -0,0 +1,80 @@
+"""
+Tests for the SSE streaming endpoints: live token relay and cached replay.
+
+Usage:
+    python -m pytest tests/test_stream_endpoints.py -q
+"""
+
+import json
+import os
+import uuid
+
+os.environ.setdefault("GEMINI_API_KEY", "test-key")
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+
+from fastapi.testclient import TestClient
+
+import app.main as main
+
+CHUNKS = ["Dear hiring team, ", "I would love to bring eight years of platform work ", "to your infrastructure group. " * 3]
+
+
+def _body():
+    # Unique per test so cached results never leak between tests
+    return {
+        "parsed_resume": {"personal_info": {"name": "Jane Doe"}},
+        "parsed_jd": {"job_title": "Platform Engineer", "company_name": f"Acme {uuid.uuid4().hex}"},
+    }
+
+
+def _events(text: str) -> list:
+    events = []
+    for frame in text.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in frame.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+def _fake_stream(calls):
+    async def stream(prompt, **kwargs):
+        calls.append(prompt)
+        for chunk in CHUNKS:
+            yield chunk, "gemini"
+    return stream
+
+
+def test_live_stream_relays_tokens_then_caches_the_result(monkeypatch):
+    calls = []
+    monkeypatch.setattr(main, "stream_with_fallback_async", _fake_stream(calls))
+    body = _body()
+
+    response = TestClient(main.app).post("/api/generate-cover-letter/stream", json=body)
+
+    assert response.status_code == 200
+    events = _events(response.text)
+    assert events[0] == ("meta", {"provider": "gemini", "cached": False})
+    assert [data["text"] for event, data in events if event == "token"] == CHUNKS
+    event, done = events[-1]
+    assert event == "done" and done["cover_letter"] == "".join(CHUNKS).strip()
+    assert len(calls) == 1
+    assert main.cache.get_raw(main.get_stream_cache_key("cover", main.CoverLetterRequest(**body).model_dump()))
+
+
+def test_cached_replay_reports_the_replay_time(monkeypatch):
+    calls = []
+    monkeypatch.setattr(main, "stream_with_fallback_async", _fake_stream(calls))
+    body = _body()
+    stored = main.CoverLetterResponse(
+        success=True, cover_letter="Stored letter", word_count=2, time_seconds=42.0, model="gemini-2.5-flash-lite"
+    )
+    cache_key = main.get_stream_cache_key("cover", main.CoverLetterRequest(**body).model_dump())
+    main.cache.set_raw(cache_key, stored.model_dump_json().encode(), ttl=60)
+
+    response = TestClient(main.app).post("/api/generate-cover-letter/stream", json=body)
+
+    events = _events(response.text)
+    assert [event for event, _ in events] == ["meta", "done"]
+    assert events[0][1] == {"provider": None, "cached": True}
+    assert events[1][1]["cover_letter"] == "Stored letter"
+    assert events[1][1]["time_seconds"] < 42.0
+    assert calls == []
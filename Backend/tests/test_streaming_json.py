@@ -0,0 +1,57 @@
+"""
+Tests for the incremental JSON parser used on streamed gap analysis output.
+
+Usage:
+    python -m pytest tests/test_streaming_json.py -q
+"""
+
+import json
+
+from core.config.streaming_json import IncrementalJSONParser
+
+GAP_ANALYSIS = {
+    "gaps": {
+        "critical": [{"id": "gap_001", "title": "Kubernetes \"K8s\" {prod}", "impact": "-10%"}],
+        "important": [],
+        "nice_to_have": [{"id": "gap_002", "tags": ["a", "b"]}],
+        "logistical": [],
+    },
+    "strengths": [{"title": "Python", "evidence": "Led migration, 3 years"}],
+    "application_viability": {"current_likelihood": "medium", "confidence": 0.7, "key_blockers": []},
+}
+
+
+def _feed_in_chunks(parser, text, size):
+    events = []
+    for i in range(0, len(text), size):
+        events.extend(parser.feed(text[i:i + size]))
+    return events
+
+
+def test_emits_sections_in_order_for_any_chunking():
+    text = "```json\n" + json.dumps(GAP_ANALYSIS, indent=2) + "\n```"
+
+    for size in (1, 7, 64, len(text)):
+        parser = IncrementalJSONParser(max_depth=2)
+        events = _feed_in_chunks(parser, text, size)
+        paths = [path for path, _ in events]
+
+        assert parser.complete
+        assert parser.document == GAP_ANALYSIS
+        assert paths.index(("gaps", "critical")) < paths.index(("strengths",))
+        assert paths.index(("strengths",)) < paths.index(("application_viability",))
+        # Array elements are delivered with their array, never on their own
+        assert not any(path[0] == "strengths" and len(path) > 1 for path in paths)
+
+
+def test_truncated_stream_keeps_closed_sections():
+    text = json.dumps(GAP_ANALYSIS)
+    cut = text.index('"application_viability"') + 30
+
+    parser = IncrementalJSONParser(max_depth=2)
+    events = _feed_in_chunks(parser, text[:cut], 16)
+
+    assert not parser.complete
+    assert parser.document["gaps"] == GAP_ANALYSIS["gaps"]
+    assert parser.document["strengths"] == GAP_ANALYSIS["strengths"]
+    assert ("application_viability",) not in [path for path, _ in events]
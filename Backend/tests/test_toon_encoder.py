@@ -0,0 +1,54 @@
+"""
+Tests for the specialized TOON document encoder and memoized TOON rendering.
+
+Usage:
+    python -m pytest tests/test_toon_encoder.py -q
+"""
+
+import pytest
+
+import formats.toon as toon
+from core.caching.document_store import DocumentStore
+from formats.toon import encode_document, to_toon
+
+CV = {
+    "personal_info": {"name": "Jane Doe", "email": "jane@example.com", "linkedin": None},
+    "technical_skills": ["Python", "C++", "Node.js", "a, b", "true", "05", " padded", "-dash"],
+    "work_experience": [
+        {"role": "Senior Engineer", "company": "Acme: Labs", "years": 3.5,
+         "achievements": ["Cut latency by 40%", 'Shipped "v2"\nin 3 months']},
+        {"role": "Engineer", "company": "Globex", "years": 2, "achievements": []},
+    ],
+    "languages": [{"language": "English", "level": "fluent"}, {"language": "German", "level": "native"}],
+    "mixed": [1, [2, 3], {"a": {}}, []],
+    "weird key": {"1st": True, "": False},
+    "total_years_experience": 8,
+}
+
+
+def test_document_encoder_matches_toon_format():
+    toon_format = pytest.importorskip("toon_format")
+
+    assert encode_document(CV) == toon_format.encode(CV)
+    assert encode_document([CV, CV]) == toon_format.encode([CV, CV])
+
+
+def test_unsupported_values_fall_back_and_rendering_is_memoized_by_content(monkeypatch):
+    # Exponent floats / tuples are outside the fast subset
+    with pytest.raises(ValueError):
+        encode_document({"score": 1e-7})
+    with pytest.raises(ValueError):
+        encode_document({"pair": (1, 2)})
+    pytest.importorskip("toon_format")
+    assert to_toon({"pair": (1, 2)}) == "pair[2]: 1,2"
+
+    store = DocumentStore()
+    calls = []
+    monkeypatch.setattr(toon, "encode_document", lambda data: calls.append(data) or encode_document(data))
+    doc_id = store.put("cv", CV)
+
+    first = store.content_artifact(dict(CV), "toon", lambda: to_toon(CV))
+    assert len(calls) == 1
+    # The by-doc_id request reuses the inline rendering without calling the encoder again
+    assert store.content_artifact(CV, "toon", lambda: to_toon(CV), doc_id) == first
+    assert len(calls) == 1
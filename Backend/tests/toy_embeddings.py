@@ -0,0 +1,33 @@
+"""
+Toy embedding space and fake LLM shared by the tiered classifier tests.
+
+Usage:
+    from toy_embeddings import make_embed, classify_with_fake_llm
+"""
+
+import asyncio
+
+
+def make_embed(axes, default_axis, dims=5):
+    """Embed each text as word counts over one axis per concept; unknown words land on default_axis."""
+    def embed(texts):
+        vectors = []
+        for text in texts:
+            vector = [0.0] * dims
+            for word in text.lower().split():
+                vector[axes.get(word, default_axis)] += 1.0
+            vectors.append(vector)
+        return vectors
+
+    return embed
+
+
+def classify_with_fake_llm(classifier, texts, answer):
+    """Run classifier.classify with a fake LLM that labels each pending text via answer(text)."""
+    llm_calls = []
+
+    async def llm(pending):
+        llm_calls.append(pending)
+        return [answer(text) for text in pending]
+
+    return asyncio.run(classifier.classify(texts, llm)), llm_calls